@@ -1,3 +1,7 @@
-from .orchestrator.conscious_organism_v99 import ConsciousOrganismV99_0
-
-ConsciousOrganismOrchestrator = ConsciousOrganismV99_0
+# The organism is resolved on first access (PEP 562), so importing any agentic_core
+# submodule does not pull in every subsystem.
+def __getattr__(name):
+    if name in ("ConsciousOrganismV99_0", "ConsciousOrganismOrchestrator"):
+        from .orchestrator.conscious_organism_v99 import ConsciousOrganismV99_0
+        return ConsciousOrganismV99_0
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
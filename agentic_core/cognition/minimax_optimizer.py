@@ -1,40 +1,99 @@
 import logging
 import numpy as np
-from typing import List, Dict, Any, Callable
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Hashable, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Default stress scenarios (minimizers)
+STRESSORS = ["hypoxia", "oxidative_burst", "high_load", "thermal_stress"]
+
+# Transposition table entry bounds
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def state_key(state: Any) -> Hashable:
+    """Hashable, order-independent snapshot of a (nested) state for memoisation."""
+    if isinstance(state, dict):
+        return tuple(sorted((str(k), state_key(v)) for k, v in state.items()))
+    if isinstance(state, (list, tuple)):
+        return tuple(state_key(v) for v in state)
+    if isinstance(state, (set, frozenset)):
+        return frozenset(state_key(v) for v in state)
+    if isinstance(state, np.ndarray):
+        return (state.dtype.str, state.shape, state.tobytes())
+    if isinstance(state, np.generic):
+        return state.item()
+    return state
+
+
 class MinimaxOptimizer:
     """
     ARTICLE 78: Minimax Adversarial Optimization.
     Evaluates decisions against worst-case environmental stressors.
+    Scalar utility functions are evaluated with alpha-beta style pruning (an action is
+    abandoned as soon as one stressor pushes it below the best worst case found so far)
+    and memoised by (state, action, stressor) in a bounded LRU cache. evaluate_batch()
+    takes vectorised utility functions returning an actions x stressors matrix, and
+    evaluate_sequence() searches several decision steps with a transposition table.
     """
-    def __init__(self, threshold: float = 0.85):
+    def __init__(self, threshold: float = 0.85, stressors: Optional[Sequence[Any]] = None,
+                 cache_size: int = 65536):
         self.threshold = threshold
+        self.stressors = list(stressors) if stressors is not None else list(STRESSORS)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, float]" = OrderedDict()
+        self.evaluations = 0  # utility function calls that missed the cache
+
+    def _consistency(self, worst_case: float) -> float:
+        return 1.0 if worst_case >= self.threshold else (worst_case / self.threshold)
+
+    def _utility(self, utility_func: Callable, key: Hashable, state: Dict[str, Any], action: Any, stressor: Any) -> float:
+        cache_key = (utility_func, key, action, stressor)
+        try:
+            utility = self._cache.get(cache_key)
+        except TypeError:  # unhashable action or stressor: no memoisation
+            self.evaluations += 1
+            return utility_func(state, action, stressor)
+        if utility is not None:
+            self._cache.move_to_end(cache_key)
+            return utility
+        self.evaluations += 1
+        utility = utility_func(state, action, stressor)
+        if self.cache_size > 0:
+            self._cache[cache_key] = utility
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return utility
 
-    def evaluate_strategy(self, state: Dict[str, Any], actions: List[str], utility_func: Callable) -> Dict[str, Any]:
+    def clear_cache(self):
+        self._cache.clear()
+
+    def evaluate_strategy(self, state: Dict[str, Any], actions: List[str], utility_func: Callable,
+                          stressors: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
         """
         Evaluates the best action while assuming the environment acts as a minimizer.
         """
+        stressors = self.stressors if stressors is None else stressors
+        key = state_key(state)
         best_action = None
         max_min_utility = -float('inf')
 
-        # Simulated Stress Scenarios (Minimizers)
-        stressors = ["hypoxia", "oxidative_burst", "high_load", "thermal_stress"]
-
         for action in actions:
             min_utility = float('inf')
             for stressor in stressors:
                 # Calculate utility under stress
-                utility = utility_func(state, action, stressor)
+                utility = self._utility(utility_func, key, state, action, stressor)
                 if utility < min_utility:
                     min_utility = utility
+                    if min_utility <= max_min_utility:
+                        break  # cannot beat the current best worst case
 
             if min_utility > max_min_utility:
                 max_min_utility = min_utility
                 best_action = action
 
-        consistency = 1.0 if max_min_utility >= self.threshold else (max_min_utility / self.threshold)
+        consistency = self._consistency(max_min_utility)
 
         logger.info(f"Minimax Optimization: Action '{best_action}' selected with consistency {consistency:.2f}")
         return {
@@ -43,9 +102,104 @@ class MinimaxOptimizer:
             "worst_case_utility": max_min_utility
         }
 
+    def evaluate_batch(self, state: Dict[str, Any], actions: Sequence[Any], utility_matrix_func: Callable,
+                       stressors: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
+        """
+        Vectorised evaluation: `utility_matrix_func(state, actions, stressors)` returns the
+        (len(actions), len(stressors)) utility matrix in one call. Actions and stressors are
+        passed through unchanged, so they may be arrays of sampled scenarios.
+        """
+        stressors = self.stressors if stressors is None else stressors
+        utilities = np.asarray(utility_matrix_func(state, actions, stressors), dtype=np.float64)
+        if utilities.shape != (len(actions), len(stressors)):
+            raise ValueError(f"Utility matrix has shape {utilities.shape}, expected {(len(actions), len(stressors))}")
+        if not utilities.size:
+            return {"selected_action": None, "consistency_score": self._consistency(-float('inf')),
+                    "worst_case_utility": -float('inf'), "binding_stressor": None}
+        worst = utilities.min(axis=1)
+        best = int(np.argmax(worst))  # first maximum, as in evaluate_strategy
+        binding = int(np.argmin(utilities[best]))
+        consistency = self._consistency(float(worst[best]))
+
+        logger.info(f"Minimax Optimization: Action '{actions[best]}' selected from {len(actions)}x{len(stressors)} "
+                    f"batch with consistency {consistency:.2f}")
+        return {
+            "selected_action": actions[best],
+            "consistency_score": consistency,
+            "worst_case_utility": float(worst[best]),
+            "binding_stressor": stressors[binding]
+        }
+
+    def evaluate_sequence(self, state: Dict[str, Any], actions: List[Any], utility_func: Callable,
+                          transition: Callable, depth: int = 2,
+                          stressors: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
+        """
+        Multi-step minimax: the agent picks an action, the environment a stressor, and
+        `transition(state, action, stressor)` gives the next state, `depth` times. A plan
+        is worth its worst utility along the way, so scores stay on the threshold's scale.
+        Alpha-beta bounds prune the search; states reached through different histories
+        share one transposition table entry per (state, remaining depth).
+        """
+        stressors = self.stressors if stressors is None else stressors
+        table: Dict[Tuple[Hashable, int], Tuple[float, int]] = {}
+        stats = {"nodes": 0, "table_hits": 0}
+
+        def action_value(node, key, action, remaining, alpha, beta):
+            worst = float('inf')
+            for stressor in stressors:
+                utility = self._utility(utility_func, key, node, action, stressor)
+                if utility > alpha and remaining > 1:
+                    # Only future values below min(worst, utility, beta) can still matter.
+                    future = best_value(transition(node, action, stressor), remaining - 1,
+                                        alpha, min(worst, utility, beta))[0]
+                    utility = min(utility, future)
+                worst = min(worst, utility)
+                if worst <= alpha:
+                    break
+            return worst
+
+        def best_value(node, remaining, alpha, beta):
+            key = state_key(node)
+            entry = table.get((key, remaining))
+            if entry is not None:
+                value, bound = entry
+                if bound == EXACT or (bound == LOWER and value >= beta) or (bound == UPPER and value <= alpha):
+                    stats["table_hits"] += 1
+                    return value, None
+            stats["nodes"] += 1
+            best, best_action, floor = -float('inf'), None, alpha
+            for action in actions:
+                value = action_value(node, key, action, remaining, max(floor, best), beta)
+                if value > best:
+                    best, best_action = value, action
+                    if best >= beta:
+                        break
+            bound = UPPER if best <= floor else LOWER if best >= beta else EXACT
+            table[(key, remaining)] = (best, bound)
+            return best, best_action
+
+        worst_case, selected = best_value(state, max(1, depth), -float('inf'), float('inf'))
+        consistency = self._consistency(worst_case)
+
+        logger.info(f"Minimax Optimization: Action '{selected}' selected at depth {depth} with consistency "
+                    f"{consistency:.2f} ({stats['nodes']} nodes, {stats['table_hits']} table hits)")
+        return {
+            "selected_action": selected,
+            "consistency_score": consistency,
+            "worst_case_utility": worst_case,
+            "nodes": stats["nodes"],
+            "table_hits": stats["table_hits"]
+        }
+
 def default_utility_func(state: Dict[str, Any], action: str, stressor: str) -> float:
     """Default utility calculator based on Survival Instinct Hierarchy."""
     base = state.get("base_stability", 0.9)
     if stressor == "hypoxia": base -= 0.3
     if stressor == "high_load": base -= 0.1
     return max(0.0, base)
+
+def default_utility_matrix(state: Dict[str, Any], actions: Sequence[str], stressors: Sequence[str]) -> np.ndarray:
+    """Vectorised default_utility_func: the (actions x stressors) utility matrix."""
+    penalty = np.array([0.3 if s == "hypoxia" else 0.1 if s == "high_load" else 0.0 for s in stressors])
+    row = np.maximum(0.0, state.get("base_stability", 0.9) - penalty)
+    return np.broadcast_to(row, (len(actions), len(stressors)))
@@ -1,7 +1,8 @@
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone
+from agentic_core.collaboration.delta_crdt import DeltaDocument, decode_delta, encode_delta
 
 logger = logging.getLogger(__name__)
 
@@ -62,16 +63,35 @@ class CRDTState:
                         logger.debug(f"CRDT merge collision for {key}. Keeping local version.")
 
 class CollaborationManager:
-    """Manages real-time multi-user collaboration sessions."""
-    def __init__(self):
+    """
+    Manages real-time multi-user collaboration sessions.
+    Dict payloads are merged into the per-field LWW CRDTState. Binary payloads are encoded
+    deltas (see delta_crdt.encode_delta) for the project's DeltaDocument; the reply is the
+    encoded delta the sender is missing, so every sync exchanges only new operations.
+    """
+    def __init__(self, replica_id: Optional[str] = None):
         self.sessions: Dict[str, CRDTState] = {}
+        self.documents: Dict[str, DeltaDocument] = {}
+        self.replica_id = replica_id
 
     def get_or_create_session(self, project_id: str) -> CRDTState:
         if project_id not in self.sessions:
             self.sessions[project_id] = CRDTState(project_id)
         return self.sessions[project_id]
 
-    async def sync_project(self, project_id: str, remote_payload: Dict[str, Any]):
+    def get_or_create_document(self, project_id: str) -> DeltaDocument:
+        if project_id not in self.documents:
+            self.documents[project_id] = DeltaDocument(self.replica_id, relay=True)
+            self.replica_id = self.documents[project_id].replica_id
+        return self.documents[project_id]
+
+    async def sync_project(self, project_id: str, remote_payload: Union[Dict[str, Any], bytes]):
+        if isinstance(remote_payload, (bytes, bytearray)):
+            document = self.get_or_create_document(project_id)
+            delta = decode_delta(remote_payload)
+            document.merge(delta)
+            document.collect_garbage()
+            return encode_delta(document.delta_since(delta.context.vv))
         session = self.get_or_create_session(project_id)
         session.merge(remote_payload)
         return session.data
@@ -0,0 +1,600 @@
+import json
+import logging
+import uuid
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Dot = Tuple[str, int]  # (replica id, per-replica counter)
+ROOT: Dot = ("", 0)    # origin of elements inserted at the start of a text
+
+FORMAT_VERSION = 1
+
+
+class CausalContext:
+    """
+    Dotted version vector: a compact version vector (every dot up to vv[replica] has been
+    delivered) plus a cloud of dots delivered out of order, folded into the vector as the
+    gaps close.
+    """
+    def __init__(self, vv: Optional[Dict[str, int]] = None, cloud: Optional[Set[Dot]] = None):
+        self.vv: Dict[str, int] = dict(vv or {})
+        self.cloud: Set[Dot] = set(cloud or ())
+
+    def contains(self, dot: Dot) -> bool:
+        return dot[1] <= self.vv.get(dot[0], 0) or dot in self.cloud
+
+    def reserve(self, replica: str, count: int = 1) -> int:
+        """Allocates `count` consecutive dots for a local operation; returns the first counter."""
+        first = self.vv.get(replica, 0) + 1
+        self.vv[replica] = first + count - 1
+        return first
+
+    def add(self, dot: Dot):
+        replica, counter = dot
+        if counter == self.vv.get(replica, 0) + 1:
+            self.vv[replica] = counter
+            self._compact()
+        elif counter > self.vv.get(replica, 0):
+            self.cloud.add(dot)
+
+    def merge(self, other: "CausalContext"):
+        for replica, counter in other.vv.items():
+            if counter > self.vv.get(replica, 0):
+                self.vv[replica] = counter
+        self.cloud |= other.cloud
+        self._compact()
+
+    def _compact(self):
+        if not self.cloud:
+            return
+        for replica, counter in sorted(self.cloud):
+            if counter == self.vv.get(replica, 0) + 1:
+                self.vv[replica] = counter
+        self.cloud = {dot for dot in self.cloud if dot[1] > self.vv.get(dot[0], 0)}
+
+    def copy(self) -> "CausalContext":
+        return CausalContext(self.vv, self.cloud)
+
+
+class _Element:
+    __slots__ = ("dot", "lamport", "origin", "char", "deleted", "children", "next")
+
+    def __init__(self, dot: Dot, lamport: int, origin: Dot, char: str):
+        self.dot = dot
+        self.lamport = lamport
+        self.origin = origin
+        self.char = char
+        self.deleted: Optional[Dot] = None  # dot of the operation that deleted it
+        self.children = 0                   # elements inserted with this one as origin
+        self.next: Optional["_Element"] = None
+
+
+class TextSequence:
+    """
+    RGA sequence CRDT. Every character is an element identified by its dot and ordered
+    after its origin (the left neighbour when it was inserted); siblings with the same
+    origin are ordered by descending (lamport, replica). Deleted elements stay as
+    tombstones until collect() finds their deletion causally stable.
+    """
+    def __init__(self):
+        self.head = _Element(ROOT, 0, ROOT, "")
+        self.elements: Dict[Dot, _Element] = {ROOT: self.head}
+        self.length = 0
+        self.tombstones = 0
+
+    def __iter__(self) -> Iterator[_Element]:
+        element = self.head.next
+        while element is not None:
+            yield element
+            element = element.next
+
+    def __str__(self) -> str:
+        return "".join(e.char for e in self if e.deleted is None)
+
+    def visible_before(self, index: int) -> _Element:
+        """The visible element at position index - 1 (the head for index 0)."""
+        if index <= 0:
+            return self.head
+        seen = 0
+        for element in self:
+            if element.deleted is None:
+                seen += 1
+                if seen == index:
+                    return element
+        raise IndexError(f"Text index {index} out of range ({self.length})")
+
+    def integrate(self, dot: Dot, lamport: int, origin: Dot, char: str) -> Optional[_Element]:
+        """Places an element after its origin; returns None while the origin is unknown."""
+        anchor = self.elements.get(origin)
+        if anchor is None:
+            return None
+        key = (lamport, dot[0])
+        previous, current = anchor, anchor.next
+        # Skip younger siblings; their descendants always carry larger lamports too.
+        while current is not None and (current.lamport, current.dot[0]) > key:
+            previous, current = current, current.next
+        element = _Element(dot, lamport, origin, char)
+        element.next = current
+        previous.next = element
+        anchor.children += 1
+        self.elements[dot] = element
+        self.length += 1
+        return element
+
+    def delete(self, element: _Element, dot: Dot) -> bool:
+        if element.deleted is not None:
+            return False
+        element.deleted = dot
+        self.length -= 1
+        self.tombstones += 1
+        return True
+
+    def collect(self, stable: Dict[str, int]) -> int:
+        """
+        Unlinks tombstones whose deletion every replica has seen and that no element uses
+        as its origin; such a tombstone can no longer be referenced by any operation.
+        """
+        ordered = list(self)
+        removed = set()
+        for element in reversed(ordered):  # children before origins, so chains cascade
+            deleted = element.deleted
+            if deleted is not None and element.children == 0 and deleted[1] <= stable.get(deleted[0], 0):
+                removed.add(element.dot)
+                self.elements[element.origin].children -= 1
+        if not removed:
+            return 0
+        previous = self.head
+        for element in ordered:
+            if element.dot in removed:
+                del self.elements[element.dot]
+            else:
+                previous.next = element
+                previous = element
+        previous.next = None
+        self.tombstones -= len(removed)
+        return len(removed)
+
+
+@dataclass
+class Delta:
+    """
+    Operations one replica has that a peer lacks, with the sender's causal context and
+    stable version vector.
+    inserts: (key, first dot, lamport, origin, text) runs; the i-th character has dot
+        (replica, counter + i), lamport + i and the previous character as origin.
+    deletes: (key, dot, targets) with targets as (replica, first counter, count) runs.
+    writes: (key, [(dot, lamport, value), ...]) carrying every live entry of the field.
+    """
+    replica: str
+    context: CausalContext
+    stable: Dict[str, int] = field(default_factory=dict)
+    writes: List[Tuple[str, List[Tuple[Dot, int, Any]]]] = field(default_factory=list)
+    inserts: List[Tuple[str, Dot, int, Dot, str]] = field(default_factory=list)
+    deletes: List[Tuple[str, Dot, List[Tuple[str, int, int]]]] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.writes or self.inserts or self.deletes)
+
+
+class DeltaDocument:
+    """
+    ARTICLE 92: Delta-State Collaborative Document.
+    A replica of a project document holding register fields (multi-value registers resolved
+    by (lamport, replica), so concurrent writes converge without wall-clock timestamps) and
+    RGA text fields. Every operation is identified by a dot of the causal context, and a
+    per-replica log indexed by counter lets delta_since() return only what a peer's version
+    vector does not cover.
+    Causal stability needs to know every replica holding the document, so only a `relay`
+    (the replica all peers sync through, which hears from each of them before serving it
+    any state) derives the stable version vector from the versions its peers report; it
+    travels with every delta and the peers adopt it. collect_garbage() then drops stable
+    tombstones and log entries; peers whose version is older than the pruned log get the
+    full state instead of a log delta.
+    """
+    def __init__(self, replica_id: Optional[str] = None, relay: bool = False):
+        self.replica_id = replica_id or uuid.uuid4().hex[:8]
+        self.relay = relay
+        self.context = CausalContext()
+        self.lamport = 0
+        self.fields: Dict[str, Dict[Dot, Tuple[int, Any]]] = {}
+        self.texts: Dict[str, TextSequence] = {}
+        self.peer_versions: Dict[str, Dict[str, int]] = {}
+        self.stable: Dict[str, int] = {}
+        self._floor: Dict[str, int] = {}  # log entries up to here have been pruned
+        # replica -> [(first counter, last counter, kind, key, payload)], sorted by counter
+        self._log: Dict[str, List[Tuple[int, int, str, str, Any]]] = {}
+        self._pending: List[Tuple[str, Any]] = []
+
+    @property
+    def version(self) -> Dict[str, int]:
+        return dict(self.context.vv)
+
+    # --- Local operations ---
+
+    def set(self, key: str, value: Any):
+        counter = self.context.reserve(self.replica_id)
+        self.lamport += 1
+        self.fields[key] = {(self.replica_id, counter): (self.lamport, value)}
+        self._record(self.replica_id, counter, counter, "write", key, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entries = self.fields.get(key)
+        if not entries:
+            return default
+        dot = max(entries, key=lambda d: (entries[d][0], d[0]))
+        return entries[dot][1]
+
+    def conflicts(self, key: str) -> List[Any]:
+        """All concurrently written values of a field (one value unless writes raced)."""
+        return [value for _, value in self.fields.get(key, {}).values()]
+
+    def text(self, key: str) -> str:
+        sequence = self.texts.get(key)
+        return str(sequence) if sequence is not None else ""
+
+    def insert_text(self, key: str, index: int, text: str):
+        if not text:
+            return
+        sequence = self._sequence(key)
+        origin = sequence.visible_before(index).dot
+        first = self.context.reserve(self.replica_id, len(text))
+        lamport = self.lamport + 1
+        self.lamport += len(text)
+        run = self._integrate_run(sequence, (self.replica_id, first), lamport, origin, text)
+        self._record(self.replica_id, first, first + len(text) - 1, "insert", key, run)
+
+    def delete_text(self, key: str, index: int, length: int):
+        sequence = self._sequence(key)
+        element = sequence.visible_before(index).next
+        targets = []
+        while element is not None and len(targets) < length:
+            if element.deleted is None:
+                targets.append(element)
+            element = element.next
+        if not targets:
+            return
+        dot = (self.replica_id, self.context.reserve(self.replica_id))
+        self.lamport += 1
+        for target in targets:
+            sequence.delete(target, dot)
+        self._record(self.replica_id, dot[1], dot[1], "delete", key, [t.dot for t in targets])
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = {key: self.get(key) for key in self.fields}
+        state.update({key: str(sequence) for key, sequence in self.texts.items()})
+        return state
+
+    # --- Delta synchronisation ---
+
+    def delta_since(self, version: Optional[Dict[str, int]] = None) -> Delta:
+        """The operations not covered by `version` (a peer's version vector)."""
+        version = version or {}
+        if any(version.get(replica, 0) < counter for replica, counter in self._floor.items()):
+            return self.state_delta()
+        delta = Delta(self.replica_id, self.context.copy(), dict(self.stable))
+        written = []
+        for replica, entries in self._log.items():
+            known = version.get(replica, 0)
+            start = bisect_left(entries, (known + 1,))
+            if start and entries[start - 1][1] > known:
+                start -= 1  # a run that straddles the peer's version
+            for first, last, kind, key, payload in entries[start:]:
+                if kind == "write":
+                    written.append(key)
+                elif kind == "delete":
+                    delta.deletes.append((key, (replica, first), _runs(payload)))
+                else:
+                    run = payload[max(0, known + 1 - first):]
+                    head = run[0]
+                    delta.inserts.append((key, head.dot, head.lamport, head.origin, "".join(e.char for e in run)))
+        for key in dict.fromkeys(written):
+            entries = self.fields[key]
+            delta.writes.append((key, [(dot, lamport, value) for dot, (lamport, value) in entries.items()]))
+        # Origins always precede their children in lamport order.
+        delta.inserts.sort(key=lambda run: run[2])
+        return delta
+
+    def state_delta(self) -> Delta:
+        """The whole document as a delta, for peers older than the pruned log."""
+        delta = Delta(self.replica_id, self.context.copy(), dict(self.stable))
+        for key, entries in self.fields.items():
+            delta.writes.append((key, [(dot, lamport, value) for dot, (lamport, value) in entries.items()]))
+        for key, sequence in self.texts.items():
+            run: List[_Element] = []
+            deletes: Dict[Dot, List[Dot]] = {}
+            for element in sequence:
+                last = run[-1] if run else None
+                if last is None or element.origin != last.dot or element.lamport != last.lamport + 1 \
+                        or element.dot != (last.dot[0], last.dot[1] + 1):
+                    if run:
+                        delta.inserts.append((key, run[0].dot, run[0].lamport, run[0].origin, "".join(e.char for e in run)))
+                    run = []
+                run.append(element)
+                if element.deleted is not None:
+                    deletes.setdefault(element.deleted, []).append(element.dot)
+            if run:
+                delta.inserts.append((key, run[0].dot, run[0].lamport, run[0].origin, "".join(e.char for e in run)))
+            delta.deletes.extend((key, dot, _runs(targets)) for dot, targets in deletes.items())
+        delta.inserts.sort(key=lambda run: run[2])
+        return delta
+
+    def merge(self, delta: Delta) -> bool:
+        """
+        Joins a peer's delta. Returns False if some operations still wait for elements this
+        replica has not received (they are retried on the next merge).
+        """
+        applied: List[Dot] = []
+        for key, entries in delta.writes:
+            local = self.fields.get(key, {})
+            remote = {dot for dot, _, _ in entries}
+            # Keep local entries the sender also keeps or has never seen; add unseen remote ones.
+            merged = {dot: v for dot, v in local.items() if dot in remote or not delta.context.contains(dot)}
+            for dot, lamport, value in entries:
+                if not self.context.contains(dot):
+                    merged[dot] = (lamport, value)
+                    self.lamport = max(self.lamport, lamport)
+                    self._record(dot[0], dot[1], dot[1], "write", key, None)
+                    applied.append(dot)
+            self.fields[key] = merged
+
+        pending = self._pending + [("insert", run) for run in delta.inserts] + [("delete", op) for op in delta.deletes]
+        self._pending = []
+        progress = True
+        while pending and progress:
+            progress, waiting = False, []
+            for kind, op in pending:
+                done = self._apply_insert(*op, applied) if kind == "insert" else self._apply_delete(*op, applied)
+                if done:
+                    progress = True
+                else:
+                    waiting.append((kind, op))
+            pending = waiting
+        self._pending = pending
+
+        if pending:
+            logger.warning(f"CRDT: {len(pending)} operations from {delta.replica} wait for missing elements.")
+            for dot in applied:
+                self.context.add(dot)
+            return False
+        self.context.merge(delta.context)
+        self.peer_versions[delta.replica] = dict(delta.context.vv)
+        for replica, counter in delta.stable.items():
+            if counter > self.stable.get(replica, 0):
+                self.stable[replica] = counter
+        return True
+
+    def _apply_insert(self, key: str, dot: Dot, lamport: int, origin: Dot, text: str, applied: List[Dot]) -> bool:
+        replica, first = dot
+        known = 0
+        while known < len(text) and self.context.contains((replica, first + known)):
+            known += 1
+        if known == len(text):
+            return True
+        if known:
+            # Leading characters are already present: integrate the rest after the last of them.
+            origin = (replica, first + known - 1)
+            first, lamport, text = first + known, lamport + known, text[known:]
+        sequence = self._sequence(key)
+        if origin not in sequence.elements:
+            return False
+        run = self._integrate_run(sequence, (replica, first), lamport, origin, text)
+        self.lamport = max(self.lamport, lamport + len(text) - 1)
+        self._record(replica, first, first + len(text) - 1, "insert", key, run)
+        applied.extend(e.dot for e in run)
+        return True
+
+    def _apply_delete(self, key: str, dot: Dot, targets: List[Tuple[str, int, int]], applied: List[Dot]) -> bool:
+        if self.context.contains(dot):
+            return True
+        sequence = self._sequence(key)
+        dots = [(replica, counter) for replica, first, count in targets for counter in range(first, first + count)]
+        # Targets missing from a sequence are either not received yet or collected already.
+        if any(d not in sequence.elements and not self.context.contains(d) for d in dots):
+            return False
+        for target in dots:
+            element = sequence.elements.get(target)
+            if element is not None:
+                sequence.delete(element, dot)
+        self._record(dot[0], dot[1], dot[1], "delete", key, dots)
+        applied.append(dot)
+        return True
+
+    # --- Garbage collection ---
+
+    def stable_version(self) -> Dict[str, int]:
+        """
+        Operations every replica has applied. A relay advances it to the pointwise minimum
+        of its own version and those reported by its peers (an author that never synced
+        with it counts as version zero); other replicas adopt the relay's vector.
+        """
+        if self.relay and self.peer_versions:
+            replicas = (set(self.context.vv) | set(self.peer_versions)) - {self.replica_id}
+            for origin, counter in self.context.vv.items():
+                counter = min([counter] + [self.peer_versions.get(r, {}).get(origin, 0) for r in replicas])
+                if counter > self.stable.get(origin, 0):
+                    self.stable[origin] = counter
+        return self.stable
+
+    def collect_garbage(self) -> int:
+        """
+        Drops tombstones whose deletion is causally stable, and log entries every replica
+        already has (no delta will need them again). Returns the number of tombstones removed.
+        """
+        stable = self.stable_version()
+        removed = sum(sequence.collect(stable) for sequence in self.texts.values())
+        for replica, entries in self._log.items():
+            cut = bisect_left(entries, (stable.get(replica, 0) + 1,))
+            while cut and entries[cut - 1][1] > stable.get(replica, 0):
+                cut -= 1
+            if cut:
+                self._floor[replica] = entries[cut - 1][1]
+                del entries[:cut]
+        if removed:
+            logger.debug(f"CRDT: Collected {removed} tombstones on {self.replica_id}.")
+        return removed
+
+    # --- Internals ---
+
+    def _sequence(self, key: str) -> TextSequence:
+        sequence = self.texts.get(key)
+        if sequence is None:
+            sequence = self.texts[key] = TextSequence()
+        return sequence
+
+    @staticmethod
+    def _integrate_run(sequence: TextSequence, dot: Dot, lamport: int, origin: Dot, text: str) -> List[_Element]:
+        replica, first = dot
+        run = []
+        for i, char in enumerate(text):
+            element = sequence.integrate((replica, first + i), lamport + i, origin, char)
+            run.append(element)
+            origin = element.dot
+        return run
+
+    def _record(self, replica: str, first: int, last: int, kind: str, key: str, payload: Any):
+        entries = self._log.setdefault(replica, [])
+        if not entries or entries[-1][0] < first:
+            entries.append((first, last, kind, key, payload))
+        else:
+            insort(entries, (first, last, kind, key, payload), key=lambda entry: entry[0])
+
+
+def _runs(dots: List[Dot]) -> List[Tuple[str, int, int]]:
+    """Compresses dots into (replica, first counter, count) runs of consecutive counters."""
+    runs: List[List[Any]] = []
+    for replica, counter in dots:
+        if runs and runs[-1][0] == replica and runs[-1][1] + runs[-1][2] == counter:
+            runs[-1][2] += 1
+        else:
+            runs.append([replica, counter, 1])
+    return [tuple(run) for run in runs]
+
+
+# --- Binary encoding ---
+
+class _Writer:
+    def __init__(self):
+        self.buffer = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def uint(self, value: int):
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def blob(self, data: bytes):
+        self.uint(len(data))
+        self.buffer += data
+
+    def string(self, text: str):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        self.uint(index)
+
+    def dot(self, dot: Dot):
+        self.string(dot[0])
+        self.uint(dot[1])
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.strings: List[str] = []
+
+    def uint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def blob(self) -> bytes:
+        size = self.uint()
+        self.pos += size
+        return bytes(self.data[self.pos - size:self.pos])
+
+    def string(self) -> str:
+        return self.strings[self.uint()]
+
+    def dot(self) -> Dot:
+        return (self.string(), self.uint())
+
+
+def encode_delta(delta: Delta) -> bytes:
+    """
+    Compact binary form of a delta: LEB128 varints, a string table for replica ids and
+    keys, run-length text inserts and deletes; field values are JSON.
+    """
+    body = _Writer()
+    body.string(delta.replica)
+    body.uint(len(delta.context.vv))
+    for replica, counter in delta.context.vv.items():
+        body.dot((replica, counter))
+    body.uint(len(delta.context.cloud))
+    for dot in delta.context.cloud:
+        body.dot(dot)
+    body.uint(len(delta.stable))
+    for replica, counter in delta.stable.items():
+        body.dot((replica, counter))
+    body.uint(len(delta.writes))
+    for key, entries in delta.writes:
+        body.string(key)
+        body.uint(len(entries))
+        for dot, lamport, value in entries:
+            body.dot(dot)
+            body.uint(lamport)
+            body.blob(json.dumps(value, separators=(",", ":")).encode())
+    body.uint(len(delta.inserts))
+    for key, dot, lamport, origin, text in delta.inserts:
+        body.string(key)
+        body.dot(dot)
+        body.uint(lamport)
+        body.dot(origin)
+        body.blob(text.encode())
+    body.uint(len(delta.deletes))
+    for key, dot, targets in delta.deletes:
+        body.string(key)
+        body.dot(dot)
+        body.uint(len(targets))
+        for replica, first, count in targets:
+            body.dot((replica, first))
+            body.uint(count)
+
+    header = _Writer()
+    header.uint(FORMAT_VERSION)
+    header.uint(len(body.strings))
+    for text in body.strings:  # insertion order == index order
+        header.blob(text.encode())
+    return bytes(header.buffer + body.buffer)
+
+
+def decode_delta(data: bytes) -> Delta:
+    reader = _Reader(data)
+    if reader.uint() != FORMAT_VERSION:
+        raise ValueError("Unsupported CRDT delta format")
+    reader.strings = [reader.blob().decode() for _ in range(reader.uint())]
+    replica = reader.string()
+    vv = dict(reader.dot() for _ in range(reader.uint()))
+    cloud = {reader.dot() for _ in range(reader.uint())}
+    stable = dict(reader.dot() for _ in range(reader.uint()))
+    delta = Delta(replica, CausalContext(vv, cloud), stable)
+    for _ in range(reader.uint()):
+        key = reader.string()
+        delta.writes.append((key, [(reader.dot(), reader.uint(), json.loads(reader.blob()))
+                                   for _ in range(reader.uint())]))
+    for _ in range(reader.uint()):
+        delta.inserts.append((reader.string(), reader.dot(), reader.uint(), reader.dot(), reader.blob().decode()))
+    for _ in range(reader.uint()):
+        key, dot = reader.string(), reader.dot()
+        delta.deletes.append((key, dot, [(*reader.dot(), reader.uint()) for _ in range(reader.uint())]))
+    return delta
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def merkle_levels(leaves: List[str]) -> List[List[str]]:
+    """All levels of a SHA-256 Merkle tree (odd levels duplicate their last node), leaves first."""
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        if len(level) % 2:
+            level = level + [level[-1]]
+        levels.append([hashlib.sha256((level[i] + level[i + 1]).encode()).hexdigest() for i in range(0, len(level), 2)])
+    return levels
+
+
+def merkle_proof(levels: List[List[str]], index: int) -> List[Tuple[str, str]]:
+    """Sibling path for leaf `index` as (side, hash) pairs, side being where the sibling sits."""
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        sibling_hash = level[sibling] if sibling < len(level) else level[index]
+        proof.append(("L" if sibling < index else "R", sibling_hash))
+        index //= 2
+    return proof
+
+
+def fold_merkle_proof(leaf: str, proof: List[Tuple[str, str]]) -> str:
+    node = leaf
+    for side, sibling in proof:
+        pair = sibling + node if side == "L" else node + sibling
+        node = hashlib.sha256(pair.encode()).hexdigest()
+    return node
+
+
+class SigningFailedError(RuntimeError):
+    """A batch could not be sealed even after retries; later transactions are refused."""
+
+
+class BatchSigner:
+    """
+    ARTICLE 591: Pipelined transaction sealing for the TokenLedger.
+    Callers enqueue already-applied transactions; a background thread drains them in
+    FIFO order, `batch_size` at a time, and hands each batch to `seal`. The queue is
+    bounded, so producers block (backpressure) once `max_pending` entries are waiting.
+    A failing seal is retried `retries` times with exponential backoff; if it still
+    fails the signer enters a failed state: the batch and everything queued behind it
+    are kept in `unsealed`, and submit() and flush() raise SigningFailedError.
+    """
+    _STOP = object()
+
+    def __init__(self, seal: Callable[[List[Any]], None], batch_size: int = 256, max_pending: int = 10000,
+                 retries: int = 5, backoff: float = 0.05):
+        self.seal = seal
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.pending: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self.batches_sealed = 0
+        self.error: Optional[BaseException] = None
+        self.unsealed: List[Any] = []
+        self._thread = threading.Thread(target=self._run, name="token-batch-signer", daemon=True)
+        self._thread.start()
+
+    def check(self):
+        if self.error is not None:
+            raise SigningFailedError(f"BatchSigner: {len(self.unsealed)} transactions could not be sealed: {self.error}") \
+                from self.error
+
+    def submit(self, item: Any):
+        self.check()
+        self.pending.put(item)
+
+    def _seal_with_retry(self, batch: List[Any]):
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            try:
+                self.seal(batch)
+                self.batches_sealed += 1
+                return
+            except Exception as e:
+                if attempt == self.retries:
+                    logger.error(f"BatchSigner: Failed to seal batch of {len(batch)} transactions after "
+                                 f"{attempt + 1} attempts: {e}")
+                    self.error = e
+                    return
+                logger.warning(f"BatchSigner: Sealing failed ({e}); retrying in {delay:.2f}s.")
+                time.sleep(delay)
+                delay *= 2
+
+    def _run(self):
+        while True:
+            first = self.pending.get()
+            if first is self._STOP:
+                self.pending.task_done()
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                if self.error is None:
+                    self._seal_with_retry(batch)
+                if self.error is not None:
+                    # The chain cannot skip a batch: keep it, and everything after it, unsealed.
+                    self.unsealed.extend(batch)
+            finally:
+                for _ in range(len(batch) + int(stop)):
+                    self.pending.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Blocks until every submitted transaction has been sealed (raises if sealing failed)."""
+        self.pending.join()
+        self.check()
+
+    def close(self, timeout: Optional[float] = None):
+        if self._thread.is_alive():
+            self.pending.put(self._STOP)
+            self._thread.join(timeout)
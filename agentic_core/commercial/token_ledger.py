@@ -1,12 +1,18 @@
+import asyncio
 import logging
 import datetime
 import uuid
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, ExitStack
 from typing import Dict, Any, List, Optional
 from enum import Enum
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
+from agentic_core.commercial.token_store import TokenStore, InMemoryTokenStore
+from agentic_core.commercial.batch_signer import BatchSigner, SigningFailedError, merkle_levels, merkle_proof, fold_merkle_proof
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +21,111 @@ class UserTier(Enum):
     PRO = "PRO"
     ENTERPRISE = "ENTERPRISE"
 
+def _public_hex(public_key: ed25519.Ed25519PublicKey) -> str:
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    ).hex()
+
 class TokenLedger:
     """
     ARTICLE 591-595: Tokenisation & Tiered Pricing Infrastructure.
     Manages Workstation Tokens (WST) and usage tracking with a robust, cryptographically signed database ledger.
     Includes Merkle-tree style hashing for transaction history and non-repudiation.
+
+    Accounts and the transaction log live in a TokenStore (in-memory by default,
+    SQLiteTokenStore for durability); `ledgers` is the hot account cache.
+
+    With `sign_batch_size` > 0 the hot path only checks and applies the balance change;
+    hash-chaining, signing and persistence happen on a background BatchSigner, one
+    Ed25519 signature per Merkle root of up to `sign_batch_size` transactions. Call
+    `flush()` to wait for pending transactions and `close()` on shutdown. If a batch
+    cannot be persisted even after retries, the ledger fails closed: flush() and every
+    later transaction raise SigningFailedError instead of acknowledging updates that
+    would never reach the store.
+
+    Concurrency: each account has its own lock (transfers take both in sorted order),
+    and a single sequencer orders appends to the hash chain. Debits and credits accept
+    an `idempotency_key`; a retried request with the same key is not applied twice.
     """
-    def __init__(self):
+    def __init__(self, store: Optional[TokenStore] = None, system_private_key: Optional[ed25519.Ed25519PrivateKey] = None,
+                 sign_batch_size: int = 0, max_pending: int = 10000):
+        self.store = store or InMemoryTokenStore()
         self.ledgers: Dict[str, Dict[str, Any]] = {}
-        self.transactions: List[Dict[str, Any]] = []
         self._default_allowances = {
             UserTier.FREE: 1000,
             UserTier.PRO: 50000,
             UserTier.ENTERPRISE: 1000000
         }
         # Generate a system private key for signing transactions (simulating a central mint/validator)
-        self._system_private_key = ed25519.Ed25519PrivateKey.generate()
+        self._system_private_key = system_private_key or ed25519.Ed25519PrivateKey.generate()
         self._system_public_key = self._system_private_key.public_key()
-        self.last_tx_hash = hashlib.sha256(b"GENESIS").hexdigest()
+        self._signer = _public_hex(self._system_public_key)
+
+        # Signatures from earlier runs stay verifiable: every validator key that ever signed is trusted.
+        self._trusted_signers = set(json.loads(self.store.get_meta("trusted_signers", "[]")))
+        if self._signer not in self._trusted_signers:
+            self._trusted_signers.add(self._signer)
+            self.store.set_meta("trusted_signers", json.dumps(sorted(self._trusted_signers)))
+
+        self.last_tx_hash = self.store.get_meta("last_tx_hash") or hashlib.sha256(b"GENESIS").hexdigest()
+
+        # Per-account locks guard check-and-apply; the sequencer orders appends to the hash chain.
+        self._account_locks: Dict[str, threading.RLock] = {}
+        self._account_locks_guard = threading.Lock()
+        self._sequencer = threading.Lock()
+        # Idempotency keys of recent transactions. The store is authoritative once a transaction
+        # is persisted; the cache also covers transactions still queued for batch signing.
+        self._idempotency_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._idempotency_cache_size = max(100_000, 2 * max_pending)
+        self.batch_signer = BatchSigner(self._seal_batch, sign_batch_size, max_pending) if sign_batch_size > 0 else None
+
+    def _account_lock(self, user_id: str) -> threading.RLock:
+        lock = self._account_locks.get(user_id)
+        if lock is None:
+            with self._account_locks_guard:
+                lock = self._account_locks.setdefault(user_id, threading.RLock())
+        return lock
+
+    @contextmanager
+    def _locked(self, *user_ids: str):
+        """Holds the given accounts' locks, acquired in sorted order so concurrent transfers cannot deadlock."""
+        with ExitStack() as stack:
+            for user_id in sorted(set(user_ids)):
+                stack.enter_context(self._account_lock(user_id))
+            yield
+
+    @staticmethod
+    def _scoped_key(user_id: str, idempotency_key: Optional[str]) -> Optional[str]:
+        return f"{user_id}:{idempotency_key}" if idempotency_key else None
+
+    def _is_replay(self, scoped_key: Optional[str]) -> bool:
+        """Must be called with the owning account's lock held."""
+        if self.batch_signer is not None:
+            # A failed ledger must not report retries as applied either.
+            self.batch_signer.check()
+        if scoped_key is None:
+            return False
+        if scoped_key in self._idempotency_cache or self.store.find_idempotency_key(scoped_key) is not None:
+            logger.info(f"TokenLedger: Idempotency key {scoped_key} already applied; skipping retry.")
+            return True
+        return False
+
+    def _get_account(self, user_id: str) -> Optional[Dict[str, Any]]:
+        account = self.ledgers.get(user_id)
+        if account is None:
+            account = self.store.get_account(user_id)
+            if account is not None:
+                account["tier"] = UserTier(account["tier"])
+                self.ledgers[user_id] = account
+        return account
 
     def initialize_user(self, user_id: str, tier: UserTier = UserTier.FREE, airdrop_bonus: float = 100.0):
-        if user_id not in self.ledgers:
+        with self._account_lock(user_id):
+            self._initialize_user(user_id, tier, airdrop_bonus)
+
+    def _initialize_user(self, user_id: str, tier: UserTier, airdrop_bonus: float):
+        if self._get_account(user_id) is None:
             # In a real system, each user would have their own keypair
             user_private_key = ed25519.Ed25519PrivateKey.generate()
             user_public_key = user_private_key.public_key()
@@ -48,32 +138,42 @@ class TokenLedger:
                 "total_consumed": 0,
                 "last_refill": datetime.datetime.now().isoformat(),
                 "created_at": datetime.datetime.now().isoformat(),
-                "public_key": user_public_key.public_bytes(
-                    encoding=serialization.Encoding.Raw,
-                    format=serialization.PublicFormat.Raw
-                ).hex()
+                "public_key": _public_hex(user_public_key)
             }
+            self.store.save_account(user_id, self.ledgers[user_id])
             logger.info(f"TokenLedger: Initialized user {user_id} with {tier.value} tier and cryptographic identity.")
 
-    def consume_tokens(self, user_id: str, amount: float, activity: str) -> bool:
-        if user_id not in self.ledgers:
-            self.initialize_user(user_id)
-
-        ledger = self.ledgers[user_id]
-        if ledger["balance"] < amount:
-            logger.warning(f"TokenLedger: Insufficient balance for user {user_id}. Required: {amount}, Available: {ledger['balance']}")
-            return False
-
-        ledger["balance"] -= amount
-        ledger["total_consumed"] += amount
-
-        tx_data = {
-            "user_id": user_id,
-            "amount": -amount,
-            "activity": activity,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "prev_hash": self.last_tx_hash
-        }
+    def _record_transaction(self, tx_data: Dict[str, Any], changes: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+        """
+        Signs tx_data, links it into the hash chain and persists it with the parties' new balances;
+        `changes` maps each party to the deltas of its account fields. The cached accounts and the
+        chain tip only move once the transaction is written (or queued for batch signing), so a
+        failed store write leaves the ledger as it was.
+        Callers hold the parties' account locks; the sequencer serialises the chain itself.
+        """
+        accounts = {party: {**self.ledgers[party], **{field: self.ledgers[party][field] + delta
+                                                      for field, delta in deltas.items()}}
+                    for party, deltas in changes.items()}
+        with self._sequencer:
+            transaction = self._append_to_chain(tx_data, accounts)
+            for party, account in accounts.items():
+                self.ledgers[party].update(account)
+            scoped_key = tx_data.get("idempotency_key")
+            if scoped_key:
+                self._idempotency_cache[scoped_key] = transaction
+                if len(self._idempotency_cache) > self._idempotency_cache_size:
+                    self._idempotency_cache.popitem(last=False)
+        return transaction
+
+    def _append_to_chain(self, tx_data: Dict[str, Any], accounts: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if self.batch_signer is not None:
+            # tx_id, hash and batch proof are filled in by the signer thread.
+            transaction = {"data": tx_data, "signer": self._signer}
+            # The batch persists the account state as of its last transaction.
+            self.batch_signer.submit((transaction, list(accounts), accounts))
+            return transaction
+
+        tx_data["prev_hash"] = self.last_tx_hash
 
         # Sign the transaction
         tx_json = json.dumps(tx_data, sort_keys=True).encode()
@@ -81,141 +181,199 @@ class TokenLedger:
 
         # Calculate new hash (Merkle-link)
         new_hash = hashlib.sha256(tx_json + signature).hexdigest()
-        self.last_tx_hash = new_hash
 
         transaction = {
             "tx_id": str(uuid.uuid4()),
             "data": tx_data,
             "signature": signature.hex(),
+            "signer": self._signer,
             "hash": new_hash
         }
-
-        self.transactions.append(transaction)
-        logger.info(f"TokenLedger: User {user_id} consumed {amount} WST. TX Hash: {new_hash[:10]}...")
+        self.store.append_transaction(transaction, list(accounts), accounts, new_hash)
+        self.last_tx_hash = new_hash
+        return transaction
+
+    def _seal_batch(self, batch: List[Any]):
+        """Chains and Merkle-signs a batch of queued transactions, then persists them in one store write."""
+        batch_prev_hash = prev_hash = self.last_tx_hash
+        leaves = []
+        for transaction, _, _ in batch:
+            transaction["data"]["prev_hash"] = prev_hash
+            prev_hash = hashlib.sha256(json.dumps(transaction["data"], sort_keys=True).encode()).hexdigest()
+            leaves.append(prev_hash)
+
+        levels = merkle_levels(leaves)
+        header = {"merkle_root": levels[-1][0], "prev_hash": batch_prev_hash, "count": len(batch)}
+        signature = self._system_private_key.sign(json.dumps(header, sort_keys=True).encode()).hex()
+
+        accounts: Dict[str, Dict[str, Any]] = {}
+        for index, (transaction, _, snapshot) in enumerate(batch):
+            transaction["tx_id"] = str(uuid.uuid4())
+            transaction["hash"] = leaves[index]
+            transaction["batch"] = {**header, "index": index, "proof": merkle_proof(levels, index), "signature": signature}
+            accounts.update(snapshot)
+
+        self.store.append_transactions([(tx, parties) for tx, parties, _ in batch], accounts, prev_hash)
+        self.last_tx_hash = prev_hash
+        logger.debug(f"TokenLedger: Sealed batch of {len(batch)} transactions. Root: {header['merkle_root'][:10]}...")
+
+    def flush(self):
+        """Blocks until every queued transaction is signed and persisted (no-op when signing inline)."""
+        if self.batch_signer is not None:
+            self.batch_signer.flush()
+
+    def consume_tokens(self, user_id: str, amount: float, activity: str, idempotency_key: Optional[str] = None) -> bool:
+        scoped_key = self._scoped_key(user_id, idempotency_key)
+        with self._account_lock(user_id):
+            if self._is_replay(scoped_key):
+                return True
+            if self._get_account(user_id) is None:
+                self._initialize_user(user_id, UserTier.FREE, 100.0)
+
+            ledger = self.ledgers[user_id]
+            if ledger["balance"] < amount:
+                logger.warning(f"TokenLedger: Insufficient balance for user {user_id}. Required: {amount}, Available: {ledger['balance']}")
+                return False
+
+            transaction = self._record_transaction({
+                "user_id": user_id,
+                "amount": -amount,
+                "activity": activity,
+                "timestamp": datetime.datetime.now().isoformat(),
+                **({"idempotency_key": scoped_key} if scoped_key else {})
+            }, {user_id: {"balance": -amount, "total_consumed": amount}})
+        logger.info(f"TokenLedger: User {user_id} consumed {amount} WST. TX Hash: {transaction.get('hash', 'pending')[:10]}...")
         return True
 
-    def mint(self, to_user: str, amount: float, reason: str = "Admin Minting") -> bool:
+    def mint(self, to_user: str, amount: float, reason: str = "Admin Minting", idempotency_key: Optional[str] = None) -> bool:
         """ARTICLE 591: Administrative minting of tokens."""
-        if to_user not in self.ledgers:
-            self.initialize_user(to_user)
-
-        self.ledgers[to_user]["balance"] += amount
-
-        tx_data = {
-            "to": to_user,
-            "amount": amount,
-            "activity": reason,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "prev_hash": self.last_tx_hash,
-            "type": "mint"
-        }
-
-        tx_json = json.dumps(tx_data, sort_keys=True).encode()
-        signature = self._system_private_key.sign(tx_json)
-        new_hash = hashlib.sha256(tx_json + signature).hexdigest()
-        self.last_tx_hash = new_hash
-
-        self.transactions.append({
-            "tx_id": str(uuid.uuid4()),
-            "data": tx_data,
-            "signature": signature.hex(),
-            "hash": new_hash
-        })
-        logger.info(f"TokenLedger: Minted {amount} WST for {to_user}. Hash: {new_hash[:10]}...")
+        scoped_key = self._scoped_key(to_user, idempotency_key)
+        with self._account_lock(to_user):
+            if self._is_replay(scoped_key):
+                return True
+            if self._get_account(to_user) is None:
+                self._initialize_user(to_user, UserTier.FREE, 100.0)
+
+            transaction = self._record_transaction({
+                "to": to_user,
+                "amount": amount,
+                "activity": reason,
+                "timestamp": datetime.datetime.now().isoformat(),
+                "type": "mint",
+                **({"idempotency_key": scoped_key} if scoped_key else {})
+            }, {to_user: {"balance": amount}})
+        logger.info(f"TokenLedger: Minted {amount} WST for {to_user}. Hash: {transaction.get('hash', 'pending')[:10]}...")
         return True
 
-    async def deduct_tokens(self, user_id: str, amount: float, reason: str) -> bool:
+    async def deduct_tokens(self, user_id: str, amount: float, reason: str, idempotency_key: Optional[str] = None) -> bool:
         """Alias for consume_tokens to match ReasoningGate expectations."""
-        return self.consume_tokens(user_id, amount, reason)
-
-    async def credit_tokens(self, user_id: str, amount: float, reason: str):
-        if user_id not in self.ledgers:
-            self.initialize_user(user_id)
-
-        ledger = self.ledgers[user_id]
-        ledger["balance"] += amount
-
-        tx_data = {
-            "user_id": user_id,
-            "amount": amount,
-            "activity": reason,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "prev_hash": self.last_tx_hash
-        }
-
-        tx_json = json.dumps(tx_data, sort_keys=True).encode()
-        signature = self._system_private_key.sign(tx_json)
-        new_hash = hashlib.sha256(tx_json + signature).hexdigest()
-        self.last_tx_hash = new_hash
-
-        self.transactions.append({
-            "tx_id": str(uuid.uuid4()),
-            "data": tx_data,
-            "signature": signature.hex(),
-            "hash": new_hash
-        })
-
-    def transfer(self, from_user: str, to_user: str, amount: float, reason: str = "P2P Transfer") -> bool:
+        # Off the event loop: account locks and signer backpressure may block.
+        return await asyncio.to_thread(self.consume_tokens, user_id, amount, reason, idempotency_key)
+
+    async def credit_tokens(self, user_id: str, amount: float, reason: str, idempotency_key: Optional[str] = None):
+        await asyncio.to_thread(self._credit_tokens, user_id, amount, reason, idempotency_key)
+
+    def _credit_tokens(self, user_id: str, amount: float, reason: str, idempotency_key: Optional[str]):
+        scoped_key = self._scoped_key(user_id, idempotency_key)
+        with self._account_lock(user_id):
+            if self._is_replay(scoped_key):
+                return
+            if self._get_account(user_id) is None:
+                self._initialize_user(user_id, UserTier.FREE, 100.0)
+
+            self._record_transaction({
+                "user_id": user_id,
+                "amount": amount,
+                "activity": reason,
+                "timestamp": datetime.datetime.now().isoformat(),
+                **({"idempotency_key": scoped_key} if scoped_key else {})
+            }, {user_id: {"balance": amount}})
+
+    def transfer(self, from_user: str, to_user: str, amount: float, reason: str = "P2P Transfer",
+                 idempotency_key: Optional[str] = None) -> bool:
         """ARTICLE 626: Secure token transfer between users."""
-        if from_user not in self.ledgers or to_user not in self.ledgers:
-            return False
-
-        if self.ledgers[from_user]["balance"] < amount:
-            return False
-
-        self.ledgers[from_user]["balance"] -= amount
-        self.ledgers[to_user]["balance"] += amount
+        scoped_key = self._scoped_key(from_user, idempotency_key)
+        with self._locked(from_user, to_user):
+            if self._is_replay(scoped_key):
+                return True
+            if self._get_account(from_user) is None or self._get_account(to_user) is None:
+                return False
+
+            if self.ledgers[from_user]["balance"] < amount:
+                return False
+
+            changes = {from_user: {"balance": -amount}}
+            changes.setdefault(to_user, {"balance": 0.0})["balance"] += amount  # a self-transfer nets to zero
+            self._record_transaction({
+                "from": from_user,
+                "to": to_user,
+                "amount": amount,
+                "activity": reason,
+                "timestamp": datetime.datetime.now().isoformat(),
+                **({"idempotency_key": scoped_key} if scoped_key else {})
+            }, changes)
+        return True
 
-        tx_data = {
-            "from": from_user,
-            "to": to_user,
-            "amount": amount,
-            "activity": reason,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "prev_hash": self.last_tx_hash
+    def get_transaction_history(self, user_id: str, limit: int = 50, before: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Newest-first page of a user's transactions, served from the per-user index.
+        Pass the returned `next_cursor` as `before` to fetch the next (older) page.
+        """
+        page = self.store.get_user_transactions(user_id, limit=limit, before_seq=before)
+        return {
+            "user_id": user_id,
+            "transactions": page,
+            "next_cursor": page[-1]["seq"] if len(page) == limit else None
         }
 
-        tx_json = json.dumps(tx_data, sort_keys=True).encode()
-        signature = self._system_private_key.sign(tx_json)
-        new_hash = hashlib.sha256(tx_json + signature).hexdigest()
-        self.last_tx_hash = new_hash
-
-        self.transactions.append({
-            "tx_id": str(uuid.uuid4()),
-            "data": tx_data,
-            "signature": signature.hex(),
-            "hash": new_hash
-        })
-        return True
-
     def get_ledger_report(self, user_id: str) -> Dict[str, Any]:
-        if user_id not in self.ledgers:
+        ledger = self._get_account(user_id)
+        if ledger is None:
             return {"error": "User not found"}
 
-        ledger = self.ledgers[user_id]
-        # Transactions where user is sender or receiver
-        user_txs = [
-            tx for tx in self.transactions
-            if tx["data"].get("user_id") == user_id or tx["data"].get("from") == user_id or tx["data"].get("to") == user_id
-        ]
-
         return {
             "user_id": user_id,
             "balance": ledger["balance"],
             "tier": ledger["tier"].value,
             "total_consumed": ledger["total_consumed"],
             "public_key": ledger["public_key"],
-            "transaction_count": len(user_txs),
-            "recent_transactions": user_txs[-10:],
+            "transaction_count": self.store.count_user_transactions(user_id),
+            "recent_transactions": list(reversed(self.store.get_user_transactions(user_id, limit=10))),
             "system_integrity_hash": self.last_tx_hash
         }
 
     def verify_transaction(self, tx: Dict[str, Any]) -> bool:
-        """Verify the signature of a transaction."""
+        """
+        Verify the signature of a transaction. Batch-signed transactions are checked by
+        recomputing their chain hash, folding the Merkle proof up to the signed root and
+        verifying the batch signature over that root.
+        """
         try:
+            signer = tx.get("signer", self._signer)
+            if signer not in self._trusted_signers:
+                return False
+            public_key = ed25519.Ed25519PublicKey.from_public_bytes(bytes.fromhex(signer))
             tx_json = json.dumps(tx["data"], sort_keys=True).encode()
-            signature = bytes.fromhex(tx["signature"])
-            self._system_public_key.verify(signature, tx_json)
+            batch = tx.get("batch")
+            if batch is None:
+                signature = bytes.fromhex(tx["signature"])
+                public_key.verify(signature, tx_json)
+                return True
+
+            leaf = hashlib.sha256(tx_json).hexdigest()
+            if leaf != tx["hash"] or fold_merkle_proof(leaf, batch["proof"]) != batch["merkle_root"]:
+                return False
+            header = {"merkle_root": batch["merkle_root"], "prev_hash": batch["prev_hash"], "count": batch["count"]}
+            public_key.verify(bytes.fromhex(batch["signature"]), json.dumps(header, sort_keys=True).encode())
             return True
         except Exception:
             return False
+
+    def close(self):
+        """Flushes pending batches before releasing the store."""
+        try:
+            if self.batch_signer is not None:
+                self.batch_signer.flush()
+                self.batch_signer.close()
+        finally:
+            self.store.close()
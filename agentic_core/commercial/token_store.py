@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenStore:
+    """
+    ARTICLE 591: Storage backend for the TokenLedger.
+    Holds account snapshots, the signed transaction log, a per-user transaction index and
+    the idempotency keys (`data["idempotency_key"]`) of the transactions appended.
+    """
+    def get_account(self, user_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def save_account(self, user_id: str, account: Dict[str, Any]):
+        raise NotImplementedError
+
+    def append_transaction(self, transaction: Dict[str, Any], parties: List[str],
+                           accounts: Dict[str, Dict[str, Any]], last_tx_hash: str) -> int:
+        """Atomically appends a transaction, indexes it per party and writes the touched accounts. Returns its sequence."""
+        raise NotImplementedError
+
+    def append_transactions(self, batch: List[Tuple[Dict[str, Any], List[str]]],
+                            accounts: Dict[str, Dict[str, Any]], last_tx_hash: str) -> List[int]:
+        """Appends (transaction, parties) pairs in order as one unit of work; `accounts` holds the balances after the last one."""
+        return [self.append_transaction(tx, parties, accounts, last_tx_hash) for tx, parties in batch]
+
+    def get_user_transactions(self, user_id: str, limit: int = 50, before_seq: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Newest-first page of a user's transactions, strictly older than `before_seq` when given."""
+        raise NotImplementedError
+
+    def count_user_transactions(self, user_id: str) -> int:
+        raise NotImplementedError
+
+    def find_idempotency_key(self, key: str) -> Optional[int]:
+        """Sequence of the transaction recorded under `key`, if any."""
+        raise NotImplementedError
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        raise NotImplementedError
+
+    def set_meta(self, key: str, value: str):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class InMemoryTokenStore(TokenStore):
+    """Process-local store (the historical behaviour), with a per-user index instead of full scans."""
+    def __init__(self):
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.transactions: List[Dict[str, Any]] = []
+        self.user_index: Dict[str, List[int]] = {}
+        self.meta: Dict[str, str] = {}
+        self.idempotency_keys: Dict[str, int] = {}
+
+    def get_account(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.accounts.get(user_id)
+
+    def save_account(self, user_id: str, account: Dict[str, Any]):
+        self.accounts[user_id] = account
+
+    def append_transaction(self, transaction, parties, accounts, last_tx_hash) -> int:
+        self.transactions.append(transaction)
+        seq = len(self.transactions)
+        transaction["seq"] = seq
+        for user_id in dict.fromkeys(parties):
+            self.user_index.setdefault(user_id, []).append(seq)
+        if transaction["data"].get("idempotency_key"):
+            self.idempotency_keys[transaction["data"]["idempotency_key"]] = seq
+        self.accounts.update(accounts)
+        self.meta["last_tx_hash"] = last_tx_hash
+        return seq
+
+    def get_user_transactions(self, user_id, limit=50, before_seq=None):
+        seqs = self.user_index.get(user_id, [])
+        if before_seq is not None:
+            # Sequences are appended in increasing order, so the cut-off is a bisect.
+            seqs = seqs[:bisect_left(seqs, before_seq)]
+        return [self.transactions[seq - 1] for seq in reversed(seqs[-limit:])] if limit > 0 else []
+
+    def count_user_transactions(self, user_id: str) -> int:
+        return len(self.user_index.get(user_id, []))
+
+    def find_idempotency_key(self, key: str) -> Optional[int]:
+        return self.idempotency_keys.get(key)
+
+    def get_meta(self, key, default=None):
+        return self.meta.get(key, default)
+
+    def set_meta(self, key, value):
+        self.meta[key] = value
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    Durable store on SQLite (WAL journal). Account rows act as the balance snapshot and
+    are committed in the same SQL transaction as the log entry that changed them, so a
+    restart never needs to replay the log to recover balances.
+    """
+    ACCOUNT_FIELDS = ("balance", "tier", "total_consumed", "last_refill", "created_at", "public_key")
+
+    def __init__(self, db_url: str = "sqlite:///meta/token_ledger.db"):
+        self.db_path = db_url.replace("sqlite:///", "")
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_accounts (
+                    user_id TEXT PRIMARY KEY,
+                    balance REAL NOT NULL,
+                    tier TEXT NOT NULL,
+                    total_consumed REAL NOT NULL DEFAULT 0,
+                    last_refill TEXT,
+                    created_at TEXT,
+                    public_key TEXT
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_transactions (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tx_id TEXT UNIQUE NOT NULL,
+                    body TEXT NOT NULL
+                )
+            """)
+            # Per-user index: a user's history is a range scan on (user_id, seq).
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_user_index (
+                    user_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, seq)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_idempotency (
+                    key TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+        logger.info(f"SQLiteTokenStore: Initialized at {self.db_path}")
+
+    def get_account(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.ACCOUNT_FIELDS)} FROM token_accounts WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return dict(zip(self.ACCOUNT_FIELDS, row)) if row else None
+
+    def _upsert_accounts(self, accounts: Dict[str, Dict[str, Any]]):
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO token_accounts (user_id, {', '.join(self.ACCOUNT_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(user_id, *(self._column(account, f) for f in self.ACCOUNT_FIELDS)) for user_id, account in accounts.items()]
+        )
+
+    @staticmethod
+    def _column(account: Dict[str, Any], field: str) -> Any:
+        value = account.get(field)
+        return getattr(value, "value", value)  # UserTier -> str
+
+    def save_account(self, user_id: str, account: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._upsert_accounts({user_id: account})
+
+    def _insert_transaction(self, transaction: Dict[str, Any], parties: List[str]) -> int:
+        body = {k: v for k, v in transaction.items() if k != "seq"}
+        seq = self._conn.execute(
+            "INSERT INTO token_transactions (tx_id, body) VALUES (?, ?)",
+            (transaction["tx_id"], json.dumps(body))
+        ).lastrowid
+        self._conn.executemany(
+            "INSERT INTO token_user_index (user_id, seq) VALUES (?, ?)",
+            [(user_id, seq) for user_id in dict.fromkeys(parties)]
+        )
+        if transaction["data"].get("idempotency_key"):
+            self._conn.execute(
+                "INSERT INTO token_idempotency (key, seq) VALUES (?, ?)",
+                (transaction["data"]["idempotency_key"], seq)
+            )
+        return seq
+
+    def append_transaction(self, transaction, parties, accounts, last_tx_hash) -> int:
+        with self._lock, self._conn:
+            seq = self._insert_transaction(transaction, parties)
+            self._upsert_accounts(accounts)
+            self._conn.execute("INSERT OR REPLACE INTO token_meta (key, value) VALUES ('last_tx_hash', ?)", (last_tx_hash,))
+        transaction["seq"] = seq
+        return seq
+
+    def append_transactions(self, batch, accounts, last_tx_hash) -> List[int]:
+        with self._lock, self._conn:
+            seqs = [self._insert_transaction(transaction, parties) for transaction, parties in batch]
+            self._upsert_accounts(accounts)
+            self._conn.execute("INSERT OR REPLACE INTO token_meta (key, value) VALUES ('last_tx_hash', ?)", (last_tx_hash,))
+        for (transaction, _), seq in zip(batch, seqs):
+            transaction["seq"] = seq
+        return seqs
+
+    def get_user_transactions(self, user_id, limit=50, before_seq=None):
+        query = ("SELECT t.seq, t.body FROM token_user_index i JOIN token_transactions t ON t.seq = i.seq "
+                 "WHERE i.user_id = ?")
+        params: Tuple = (user_id,)
+        if before_seq is not None:
+            query += " AND i.seq < ?"
+            params += (before_seq,)
+        query += " ORDER BY i.seq DESC LIMIT ?"
+        params += (limit,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [{**json.loads(body), "seq": seq} for seq, body in rows]
+
+    def count_user_transactions(self, user_id: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM token_user_index WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+    def find_idempotency_key(self, key: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT seq FROM token_idempotency WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM token_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO token_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
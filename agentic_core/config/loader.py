@@ -26,6 +26,8 @@ class ConfigLoader:
             "FIDELITY_TARGET": 0.992,
             "API_PORT": 8000,
             "DB_URL": "sqlite:///workstation.db",
+            "TOKEN_LEDGER_URL": "sqlite:///meta/token_ledger.db",
+            "TOKEN_LEDGER_SIGN_BATCH": 0,
             "JWT_SECRET": os.getenv("JULES_JWT_SECRET", None),
             "RATE_LIMIT_CONNECTOR": 100,
             "TRANSITION_PHASES": 5
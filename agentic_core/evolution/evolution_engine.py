@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import uuid
 import random
@@ -6,7 +7,7 @@ from typing import List, Dict, Any, Optional
 from agentic_core.genome.chromosome import Chromosome
 from agentic_core.genome.gene import Gene, GeneType
 from agentic_core.incubator.petri_dish import PetriDish
-from agentic_core.incubator.simulation_loop import SimulationLoop
+from agentic_core.incubator.simulation_loop import PROPOSAL_CHANNEL, SimulationLoop
 from agentic_core.incubator.population import Population
 from agentic_core.evolution.mutation.substitution import Substitution
 from agentic_core.evolution.mutation.indel import Indel
@@ -21,24 +22,34 @@ logger = logging.getLogger(__name__)
 class GenomicAgent:
     """
     ARTICLE 162: Agent representation of an evolving genome in the petri dish.
+    Each agent owns a np.random.Generator seeded from its chromosome id, so agents never
+    reseed (or draw from) the global NumPy RNG.
     """
     def __init__(self, organism_id: str, chromosome: Chromosome):
         self.organism_id = organism_id
         self.chromosome = chromosome
-        # Neural parameters derived from genome hash
-        state_seed = int(hash(chromosome.chromosome_id) % 2**32)
-        np.random.seed(state_seed)
-        self.weights = np.random.randn(16, 16) # Hidden state interaction weights
+        # Neural parameters derived from genome hash (stable across processes, unlike hash())
+        state_seed = int.from_bytes(hashlib.sha256(chromosome.chromosome_id.encode()).digest()[:8], "big")
+        self.rng = np.random.default_rng(state_seed)
+        self.weights = self.rng.standard_normal((16, 16)) # Hidden state interaction weights
 
-    def propose_update(self, petri_dish: PetriDish) -> np.ndarray:
-        """Proposes a state update based on genome-derived behavior."""
+    def _strength(self) -> float:
         # Use structural genes to determine update magnitude
-        strength = len([g for g in self.chromosome.gene_map.values()
-                       if g.gene_type == GeneType.STRUCTURAL]) * 0.01
+        return len([g for g in self.chromosome.gene_map.values()
+                    if g.gene_type == GeneType.STRUCTURAL]) * 0.01
 
+    def propose_into(self, petri_dish: PetriDish, out: np.ndarray, rows: slice) -> None:
+        """Batched proposal: writes this agent's attack-channel update for `rows` into `out` (rows x H)."""
         # Simple behavioral proposal: expansion in random direction
+        self.rng.random(out=out, dtype=np.float32)
+        out *= self._strength()
+
+    def propose_update(self, petri_dish: PetriDish) -> np.ndarray:
+        """Proposes a full-grid state update based on genome-derived behavior."""
+        channel = np.empty((petri_dish.width, petri_dish.height), dtype=np.float32)
+        self.propose_into(petri_dish, channel, slice(0, petri_dish.width))
         proposal = np.zeros_like(petri_dish.grid)
-        proposal[:, :, 4] = strength * np.random.random((petri_dish.width, petri_dish.height))
+        proposal[:, :, PROPOSAL_CHANNEL] = channel
         return proposal
 
 class GenomeEvolutionEngine:
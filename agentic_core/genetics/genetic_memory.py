@@ -1,8 +1,7 @@
 import logging
-import json
-import os
 from datetime import datetime, timezone
 from typing import Dict, Any
+from agentic_core.ueg.ueg_manager import UEGManager
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +18,8 @@ class GeneticMemory:
             "data": data,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
-        os.makedirs(os.path.dirname(self.ueg_path), exist_ok=True)
-        # Append logic simulation
-        with open(self.ueg_path, "a") as f:
-            f.write(json.dumps(event_node) + "\n")
+        ueg = UEGManager(storage_path=self.ueg_path)
+        try:
+            ueg.add_node(event_node)
+        finally:
+            ueg.close()
@@ -5,56 +5,116 @@ from .petri_dish import PetriDish
 
 logger = logging.getLogger(__name__)
 
+# Channel agents propose into and compete on (the attack channel, see PetriDish.apply_attack).
+PROPOSAL_CHANNEL = 4
+
+
+def top2_softmax_winners(proposals: np.ndarray, temperature: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    ARTICLE 162: Top-2 competition kernel.
+    `proposals` is (n_agents, n_cells). Per cell, the two strongest proposals compete and
+    the winner is drawn with softmax(strengths / temperature) probabilities; returns the
+    winning agent index per cell.
+    """
+    n_agents, n_cells = proposals.shape
+    if n_agents == 1:
+        return np.zeros(n_cells, dtype=np.int32)
+    # The best value is a (fast, pairwise) max-reduction; winner indices and the runner-up
+    # come from in-place passes over the agent rows, since argmax/argpartition across the
+    # agent axis are several times slower.
+    first_val = proposals.max(axis=0)
+    first = np.zeros(n_cells, dtype=np.int32)
+    for i in range(n_agents):
+        np.copyto(first, i, where=proposals[i] == first_val)
+    second_val = np.full(n_cells, -np.inf, dtype=proposals.dtype)
+    second = np.zeros(n_cells, dtype=np.int32)
+    for i in range(n_agents):
+        value = proposals[i]
+        better = (value > second_val) & (first != i)
+        np.copyto(second_val, value, where=better)
+        np.copyto(second, i, where=better)
+    # softmax over the two logits: P(first) = 1 / (1 + exp((second - first) / T))
+    gap = (second_val - first_val) / max(temperature, 1e-12)
+    p_first = 1.0 / (1.0 + np.exp(np.clip(gap, -60.0, 60.0)))
+    return np.where(rng.random(n_cells) < p_first, first, second).astype(np.int32)
+
+
 class SimulationLoop:
     """
     ARTICLE 162: The Simulation Loop.
     Implements the four-phase processing cycle: Processing, Competition, Normalization, Update.
     Optimized for high-performance spatial simulation.
+    Agents implementing `propose_into(petri_dish, out, rows)` write their proposal for the
+    proposal channel straight into a reused (n_agents, rows, H) buffer; large dishes are
+    processed in row tiles so the buffer stays within `buffer_cells`. Agents that only
+    implement `propose_update(petri_dish)` (a full (W, H, C) grid) are still supported.
     """
-    def __init__(self, petri_dish: PetriDish, temperature: float = 1.0):
+    def __init__(self, petri_dish: PetriDish, temperature: float = 1.0, seed: Optional[int] = None,
+                 buffer_cells: int = 16 * 1024 * 1024):
         self.petri_dish = petri_dish
         self.temperature = temperature
+        self.rng = np.random.default_rng(seed)
+        self.buffer_cells = buffer_cells
+        self._buffer: Optional[np.ndarray] = None
+
+    def _tile_rows(self, n_agents: int) -> int:
+        return int(np.clip(self.buffer_cells // max(1, n_agents * self.petri_dish.height), 1, self.petri_dish.width))
+
+    def _proposal_buffer(self, n_agents: int, rows: int) -> np.ndarray:
+        shape = (n_agents, rows, self.petri_dish.height)
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=np.float32)
+        return self._buffer
 
     def step(self, agents: List[Any]):
         """Executes one simulation step."""
         if not agents:
             return
 
-        # 1. Processing Phase: Agents propose updates
-        # Optimization: Use list comprehension for speed
-        proposals = [agent.propose_update(self.petri_dish) for agent in agents]
+        dish = self.petri_dish
+        # Agents without the batched API produce whole-grid proposals up front.
+        legacy = {i: agent.propose_update(dish) for i, agent in enumerate(agents) if not hasattr(agent, "propose_into")}
+        tile_rows = self._tile_rows(len(agents))
+        buffer = self._proposal_buffer(len(agents), tile_rows)
 
-        # 2. Competition Phase: Vectorized Top-2 selection
-        self._resolve_competition_vectorized(agents, proposals)
+        for x0 in range(0, dish.width, tile_rows):
+            x1 = min(x0 + tile_rows, dish.width)
+            proposals = buffer[:, :x1 - x0]
+            # 1. Processing Phase: Agents propose updates
+            for i, agent in enumerate(agents):
+                if i in legacy:
+                    proposals[i] = legacy[i][x0:x1, :, PROPOSAL_CHANNEL]
+                else:
+                    agent.propose_into(dish, proposals[i], slice(x0, x1))
 
-        # 3. Update Phase: Efficient grid application
-        self._update_grid_vectorized(proposals)
+            # 2. Competition Phase: Top-2 softmax selection on contested cells
+            self._resolve_competition(proposals, x0, x1)
 
-    def _resolve_competition_vectorized(self, agents: List[Any], proposals: List[np.ndarray]):
-        """
-        ARTICLE 162: Top-2 selection (Softmax weighted).
-        Optimized vectorized selection of agent influence.
-        """
-        # Optimized: Only compute mask once
-        attack_channel = self.petri_dish.grid[:, :, 4]
-        mask = attack_channel > 0.5
+            # 3. Update Phase: in-place accumulation into the proposal channel
+            channel = dish.grid[x0:x1, :, PROPOSAL_CHANNEL]
+            channel += 0.01 * proposals.sum(axis=0)
+            np.clip(channel, 0.0, 1.0, out=channel)
 
-        if np.any(mask):
-            competing_indices = np.random.randint(0, len(agents), size=np.sum(mask))
-            self.petri_dish.organism_map[mask] = competing_indices
+        if legacy:
+            self._apply_legacy_channels(list(legacy.values()))
 
-    def _update_grid_vectorized(self, proposals: List[np.ndarray]):
+    def _resolve_competition(self, proposals: np.ndarray, x0: int, x1: int):
         """
-        Applies proposed changes to the petri dish hidden states using efficient accumulation.
+        ARTICLE 162: Top-2 selection (Softmax weighted).
+        Cells whose attack channel exceeds 0.5 are claimed by one of the two strongest proposers.
         """
-        if not proposals:
-            return
-
-        # ARTICLE 162: State Update logic
-        # High-performance summation using numpy
-        total_update = np.zeros_like(self.petri_dish.grid)
-        for p in proposals:
-            total_update += p
+        mask = self.petri_dish.grid[x0:x1, :, PROPOSAL_CHANNEL] > 0.5
+        if np.any(mask):
+            # compress keeps one contiguous row per agent (proposals[:, mask] would be strided).
+            contested = np.compress(mask.ravel(), proposals.reshape(len(proposals), -1), axis=1)
+            winners = top2_softmax_winners(contested, self.temperature, self.rng)
+            self.petri_dish.organism_map[x0:x1][mask] = winners
 
-        self.petri_dish.grid += 0.01 * total_update
+    def _apply_legacy_channels(self, grids: List[np.ndarray]):
+        """Adds the non-proposal channels of whole-grid proposals, accumulating in place."""
+        total = np.zeros_like(self.petri_dish.grid)
+        for grid in grids:
+            np.add(total, grid, out=total)
+        total[:, :, PROPOSAL_CHANNEL] = 0.0
+        self.petri_dish.grid += 0.01 * total
         np.clip(self.petri_dish.grid, 0.0, 1.0, out=self.petri_dish.grid)
@@ -9,6 +9,8 @@ from agentic_core.reactor.religion.quranic_studies import QuranicStudiesReactor
 from agentic_core.reactor.ecosystem.factory import ReactorFactory
 from agentic_core.enterprise.policy import PolicyCoE
 from agentic_core.commercial.token_ledger import TokenLedger, UserTier
+from agentic_core.commercial.token_store import SQLiteTokenStore
+from agentic_core.config.loader import settings
 from agentic_core.synthesis.dual_mode_scraper import DualModeScraper
 from agentic_core.synthesis.uviap import UVIAP
 from agentic_core.api import qep_analytics, tools, partnerships
@@ -19,7 +21,10 @@ logger = logging.getLogger(__name__)
 # Initialize global CoEs and Reactors
 policy = PolicyCoE()
 reactor_factory = ReactorFactory()
-token_ledger = TokenLedger()
+token_ledger = TokenLedger(
+    store=SQLiteTokenStore(settings.get("TOKEN_LEDGER_URL")),
+    sign_batch_size=settings.get("TOKEN_LEDGER_SIGN_BATCH", 0)
+)
 scraper = DualModeScraper(token_ledger=token_ledger)
 uviap = UVIAP()
 
@@ -36,6 +41,7 @@ async def lifespan(app: FastAPI):
 
     yield
     task.cancel()
+    token_ledger.close()
     logger.info("Apotheosis: System Hibernating.")
 
 app = FastAPI(
@@ -84,6 +90,9 @@ async def get_knowledge_summary():
 # TOKEN LEDGER ENDPOINTS
 @app.get("/api/v1/tokens/ledger/{user_id}")
 async def get_token_ledger(user_id: str):
+    return await asyncio.to_thread(_ledger_report, user_id)
+
+def _ledger_report(user_id: str) -> Dict[str, Any]:
     report = token_ledger.get_ledger_report(user_id)
     if "error" in report:
         # Onboarding trigger: Initialize new user with airdrop
@@ -91,10 +100,16 @@ async def get_token_ledger(user_id: str):
         report = token_ledger.get_ledger_report(user_id)
     return report
 
+@app.get("/api/v1/tokens/ledger/{user_id}/history")
+async def get_token_history(user_id: str, limit: int = 50, before: Optional[int] = None):
+    """Paginated transaction history, newest first. Use `next_cursor` as `before` for the next page."""
+    return await asyncio.to_thread(token_ledger.get_transaction_history, user_id,
+                                   limit=min(max(limit, 1), 500), before=before)
+
 @app.post("/api/v1/admin/mint")
-async def admin_mint(user_id: str, amount: float, reason: str = "Admin Minting"):
-    """ARTICLE 591: Admin token minting."""
-    success = token_ledger.mint(user_id, amount, reason)
+async def admin_mint(user_id: str, amount: float, reason: str = "Admin Minting", idempotency_key: Optional[str] = None):
+    """ARTICLE 591: Admin token minting. Retries carrying the same `idempotency_key` mint only once."""
+    success = await asyncio.to_thread(token_ledger.mint, user_id, amount, reason, idempotency_key=idempotency_key)
     if not success:
         raise HTTPException(status_code=500, detail="Minting failed")
     return {"status": "SUCCESS", "message": f"Minted {amount} WST for {user_id}"}
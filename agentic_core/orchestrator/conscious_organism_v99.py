@@ -3,184 +3,138 @@ import uuid
 import asyncio
 from typing import Dict, Any, List, Optional
 
-# Core Layers (Inherited from v93)
-from agentic_core.molecular.triad_integration import TriadIntegrator
-from agentic_core.consciousness.global_workspace import GlobalWorkspace
-from agentic_core.consciousness.meta_cognitive_executive import MetaCognitiveExecutive
-from agentic_core.genetics.genomic_registry import GenomicRegistry
-from agentic_core.cognition.minimax_optimizer import MinimaxOptimizer, default_utility_func
-from agentic_core.cognition.qwen_integration import QwenReasoningEngine
-from agentic_core.cognition.retro_causal_processor import RetroCausalProcessor
-from agentic_core.transition.graduated_transition_manager import GraduatedTransitionManager
-from agentic_core.transition.transition_monitor import TransitionStateMonitor, RollbackController
-
-# v93 Collaboration & Provenance
-from agentic_core.collaboration.crdt_engine import CollaborationManager
-from agentic_core.protocols.scholarly_object import ScholarlyObject
-from agentic_core.triad.xai.explainer import AdaptiveXAI
-
-# v99 Transcendent Modules
-from agentic_core.quantum.unified_gateway import UnifiedQuantumGateway
-from agentic_core.evolution.prompt_evolver import RecursivePromptEvolver
-from agentic_core.ui.granularity_controller import GranularityController
-
-# v99 Genomic Evolution Modules
-from agentic_core.genome.chromosome import Chromosome
-from agentic_core.genome.gene import Gene, GeneType
-from agentic_core.genome.epigenetics import EpigeneticMemory
-from agentic_core.evolution.evolution_engine import GenomeEvolutionEngine
-from agentic_core.evolution.assimilation.executor import AssimilationExecutor
-from agentic_core.evolution.assimilation.evaluator import AssimilationEvaluator
-
-# v99 Biological Design Principles
-from agentic_core.architecture.hox_patterns import HoxPatternRegistry
-from agentic_core.architecture.phylotypic_core import PhylotypicCore
-from agentic_core.governance.gene_regulatory_network import GeneRegulatoryNetwork
-from agentic_core.compiler.biological_compiler import BiologicalCompiler
-from agentic_core.governance.germ_layer_stratification import GermLayerEnforcer
-from agentic_core.governance.grn_modeler import GRNModeler
-from agentic_core.governance.command_dispatch import AICommander
-from agentic_core.business.dispatcher import AIDispatcher
-from agentic_core.governance.adaptive_profiles import IndustryAdaptiveGovernance, IndustryType
-from agentic_core.business.pipelines import BusinessPipeline
-from agentic_core.business.profit_distributor import ProfitDistributor
-from agentic_core.business.owner_dashboard import OwnerDashboard
-from agentic_core.governance.hoxd_boundary_negotiator import HoxDBoundaryNegotiator
-from agentic_core.governance.span_control import SpanOfControlEngine
-from agentic_core.governance.verifiable_governance import VGAEngine
-
-from agentic_core.optimization.engine import OptimizationEngine
-from agentic_core.reliability.engine import ReliabilityEngine
-from agentic_core.validation.accuracy_validator import AccuracyValidator
-from agentic_core.validation.digital_twin_orchestrator import DigitalTwinOrchestrator
-from agentic_core.validation.benchmarks import BenchmarkSuite
-from agentic_core.governance.trustworthiness_engine import TrustworthinessEngine
-from agentic_core.nlp.nli_engine import NLIEngine
 from agentic_core.config.loader import settings
-from agentic_core.db.manager import DatabaseManager
-from agentic_core.immunity.immune_system import ImmuneSystem
-
-# v99 Platform Assimilation Modules
-from agentic_core.builder.conversational_engine import ConversationalEngine
-from agentic_core.builder.refinement_engine import RefinementEngine
-from agentic_core.ide.code_workspace import CodeWorkspace
-from agentic_core.builder.visual_designer import VisualDesigner
-from agentic_core.integrations.connector_registry import ConnectorRegistry
-from agentic_core.deployment.deployment_orchestrator import DeploymentOrchestrator
-from agentic_core.deployment.environment_manager import EnvironmentManager
-from agentic_core.collaboration.workspace_manager import WorkspaceManager
-from agentic_core.collaboration.framework_router import FrameworkRouter
-from agentic_core.governance.app_compliance import AppCompliance
-from agentic_core.analytics.platform_telemetry import PlatformTelemetry
-
-# ARTICLE 290/295 Missing Modules
-from agentic_core.ethics.truth_validator import TruthValidator
-from agentic_core.ueg.document_manager import AutonomousDocumentManager
-
-# PC-Agent Hierarchy
-from agentic_core.pc_agent.manager_agent import ManagerAgent
-from agentic_core.pc_agent.progress_agent import ProgressAgent
-from agentic_core.pc_agent.decision_agent import DecisionAgent
-from agentic_core.pc_agent.reflection_agent import ReflectionAgent
+from agentic_core.orchestrator.container import ComponentContainer, Ref, StartupProfiler
 
 logger = logging.getLogger(__name__)
 
+
+def _build_core_genome():
+    from agentic_core.genome.chromosome import Chromosome
+    from agentic_core.genome.gene import Gene, GeneType
+    core_genome = Chromosome("core_v99")
+    # Add baseline gene for synteny validation
+    core_genome.add_gene(Gene("gene_stable_baseline", GeneType.REGULATORY, "h1"))
+    return core_genome
+
+
 class ConsciousOrganismV99_0:
     """
     v99.0: The Transcendent Conscious Organism.
     Final Integration of Project OMEGA, POLYMATH, and TRANSCENDENT protocols.
     Full Platform Assimilation mode enabled.
     """
-    def __init__(self, agent_id: str = None):
+    def __init__(self, agent_id: str = None, warm_up: bool = False, profiler: Optional[StartupProfiler] = None):
         self.agent_id = agent_id or settings.get("AGENT_ID")
         self.version = "99.0.0" # Final Release
+        # Subsystems are declared here and imported/constructed on first attribute access.
+        self.components = ComponentContainer(profiler)
+        self._declare_components(self.components)
+        self.is_running = False
+        if warm_up:
+            self.components.warm_up(background=True)
 
+    def _declare_components(self, c: ComponentContainer):
         # 1. BIOLOGICAL & COGNITIVE LAYERS
-        self.triad = TriadIntegrator()
-        self.workspace = GlobalWorkspace()
-        self.mce = MetaCognitiveExecutive()
-        self.genome = GenomicRegistry()
-        self.immune = ImmuneSystem()
+        c.register("triad", "agentic_core.molecular.triad_integration:TriadIntegrator", warm=True)
+        c.register("workspace", "agentic_core.consciousness.global_workspace:GlobalWorkspace")
+        c.register("mce", "agentic_core.consciousness.meta_cognitive_executive:MetaCognitiveExecutive")
+        c.register("genome", "agentic_core.genetics.genomic_registry:GenomicRegistry")
+        c.register("immune", "agentic_core.immunity.immune_system:ImmuneSystem")
 
         # 2. EVOLUTIONARY COGNITION
-        self.minimax = MinimaxOptimizer(threshold=0.85)
-        self.qwen = QwenReasoningEngine(reasoning_steps=7) # Increased depth
-        self.retro = RetroCausalProcessor()
+        c.register("minimax", "agentic_core.cognition.minimax_optimizer:MinimaxOptimizer", threshold=0.85, warm=True)
+        c.register("qwen", "agentic_core.cognition.qwen_integration:QwenReasoningEngine", reasoning_steps=7, warm=True) # Increased depth
+        c.register("retro", "agentic_core.cognition.retro_causal_processor:RetroCausalProcessor")
 
         # 3. TRANSITION & COLLABORATION
-        self.transition_mgr = GraduatedTransitionManager(total_phases=settings.get("TRANSITION_PHASES"))
-        self.transition_monitor = TransitionStateMonitor()
-        self.rollback = RollbackController(self.transition_mgr)
-        self.collab = CollaborationManager()
-        self.router = FrameworkRouter(agent_id=self.agent_id)
-        self.xai = AdaptiveXAI()
+        c.register("transition_mgr", "agentic_core.transition.graduated_transition_manager:GraduatedTransitionManager",
+                   total_phases=settings.get("TRANSITION_PHASES"))
+        c.register("transition_monitor", "agentic_core.transition.transition_monitor:TransitionStateMonitor")
+        c.register("rollback", "agentic_core.transition.transition_monitor:RollbackController", Ref("transition_mgr"))
+        c.register("collab", "agentic_core.collaboration.crdt_engine:CollaborationManager")
+        c.register("router", "agentic_core.collaboration.framework_router:FrameworkRouter", agent_id=self.agent_id)
+        c.register("xai", "agentic_core.triad.xai.explainer:AdaptiveXAI")
 
         # 4. TRANSCENDENT SYNERGY (v99)
-        self.quantum_gateway = UnifiedQuantumGateway()
-        self.prompt_evolver = RecursivePromptEvolver()
-        self.granularity = GranularityController()
+        c.register("quantum_gateway", "agentic_core.quantum.unified_gateway:UnifiedQuantumGateway")
+        c.register("prompt_evolver", "agentic_core.evolution.prompt_evolver:RecursivePromptEvolver", warm=True)
+        c.register("granularity", "agentic_core.ui.granularity_controller:GranularityController", warm=True)
 
         # 4.1 GENOMIC EVOLUTION (v99.0.0)
-        self.core_genome = Chromosome("core_v99")
-        # Add baseline gene for synteny validation
-        self.core_genome.add_gene(Gene("gene_stable_baseline", GeneType.REGULATORY, "h1"))
-        self.evolution_engine = GenomeEvolutionEngine(self.core_genome)
-        self.genomic_evaluator = AssimilationEvaluator("CONSTITUTION_v99.0.0.md")
-        self.genomic_executor = AssimilationExecutor(self.core_genome)
+        c.register("core_genome", _build_core_genome)
+        c.register("evolution_engine", "agentic_core.evolution.evolution_engine:GenomeEvolutionEngine", Ref("core_genome"))
+        c.register("genomic_evaluator", "agentic_core.evolution.assimilation.evaluator:AssimilationEvaluator",
+                   "CONSTITUTION_v99.0.0.md")
+        c.register("genomic_executor", "agentic_core.evolution.assimilation.executor:AssimilationExecutor", Ref("core_genome"))
 
         # 4.2 BIOLOGICAL ARCHITECTURE (v99.0.0)
-        self.hox_registry = HoxPatternRegistry()
-        self.grn = GeneRegulatoryNetwork()
-        self.grn_modeler = GRNModeler()
-        self.epigenetics = EpigeneticMemory()
-        self.bio_compiler = BiologicalCompiler()
-        self.germ_layers = GermLayerEnforcer()
+        c.register("hox_registry", "agentic_core.architecture.hox_patterns:HoxPatternRegistry")
+        c.register("grn", "agentic_core.governance.gene_regulatory_network:GeneRegulatoryNetwork")
+        c.register("grn_modeler", "agentic_core.governance.grn_modeler:GRNModeler")
+        c.register("epigenetics", "agentic_core.genome.epigenetics:EpigeneticMemory")
+        c.register("bio_compiler", "agentic_core.compiler.biological_compiler:BiologicalCompiler")
+        c.register("germ_layers", "agentic_core.governance.germ_layer_stratification:GermLayerEnforcer")
 
         # 4.3 SOVEREIGN BUSINESS ENTITY (v99.0.0)
-        self.commander = AICommander()
-        self.dispatcher = AIDispatcher(commander_ref=self.commander)
-        self.business_governance = IndustryAdaptiveGovernance()
-        self.business_pipelines = BusinessPipeline()
-        self.distributor = ProfitDistributor()
-        self.dashboard = OwnerDashboard(self.distributor, self.commander)
+        c.register("commander", "agentic_core.governance.command_dispatch:AICommander")
+        c.register("dispatcher", "agentic_core.business.dispatcher:AIDispatcher", commander_ref=Ref("commander"))
+        c.register("business_governance", "agentic_core.governance.adaptive_profiles:IndustryAdaptiveGovernance")
+        c.register("business_pipelines", "agentic_core.business.pipelines:BusinessPipeline")
+        c.register("distributor", "agentic_core.business.profit_distributor:ProfitDistributor")
+        c.register("dashboard", "agentic_core.business.owner_dashboard:OwnerDashboard", Ref("distributor"), Ref("commander"))
 
         # 4.3.1 ADAPTIVE GOVERNANCE MACHINERY (v99.0.0)
-        self.hoxd = HoxDBoundaryNegotiator()
-        self.span_control = SpanOfControlEngine()
-        self.vga = VGAEngine()
+        c.register("hoxd", "agentic_core.governance.hoxd_boundary_negotiator:HoxDBoundaryNegotiator")
+        c.register("span_control", "agentic_core.governance.span_control:SpanOfControlEngine")
+        c.register("vga", "agentic_core.governance.verifiable_governance:VGAEngine")
 
         # 4.4 PRODUCTION HARDENING (v99)
-        self.db = DatabaseManager()
-        self.optimizer = OptimizationEngine()
-        self.reliability = ReliabilityEngine()
-        self.validator = AccuracyValidator(target_accuracy=settings.get("FIDELITY_TARGET"))
-        self.digital_twin = DigitalTwinOrchestrator()
-        self.trust = TrustworthinessEngine()
-        self.nli = NLIEngine()
+        c.register("db", "agentic_core.db.manager:DatabaseManager")
+        c.register("optimizer", "agentic_core.optimization.engine:OptimizationEngine")
+        c.register("reliability", "agentic_core.reliability.engine:ReliabilityEngine")
+        c.register("validator", "agentic_core.validation.accuracy_validator:AccuracyValidator",
+                   target_accuracy=settings.get("FIDELITY_TARGET"))
+        c.register("digital_twin", "agentic_core.validation.digital_twin_orchestrator:DigitalTwinOrchestrator")
+        c.register("trust", "agentic_core.governance.trustworthiness_engine:TrustworthinessEngine")
+        c.register("nli", "agentic_core.nlp.nli_engine:NLIEngine")
 
         # 5. PLATFORM ASSIMILATION (v99)
-        self.builder = ConversationalEngine()
-        self.refiner = RefinementEngine(self.builder)
-        self.ide = CodeWorkspace()
-        self.designer = VisualDesigner()
-        self.integrations = ConnectorRegistry()
-        self.deployment = DeploymentOrchestrator()
-        self.env_mgr = EnvironmentManager()
-        self.workspaces = WorkspaceManager()
-        self.compliance = AppCompliance()
-        self.telemetry = PlatformTelemetry(db=self.db)
+        c.register("builder", "agentic_core.builder.conversational_engine:ConversationalEngine")
+        c.register("refiner", "agentic_core.builder.refinement_engine:RefinementEngine", Ref("builder"))
+        c.register("ide", "agentic_core.ide.code_workspace:CodeWorkspace")
+        c.register("designer", "agentic_core.builder.visual_designer:VisualDesigner")
+        c.register("integrations", "agentic_core.integrations.connector_registry:ConnectorRegistry")
+        c.register("deployment", "agentic_core.deployment.deployment_orchestrator:DeploymentOrchestrator")
+        c.register("env_mgr", "agentic_core.deployment.environment_manager:EnvironmentManager")
+        c.register("workspaces", "agentic_core.collaboration.workspace_manager:WorkspaceManager")
+        c.register("compliance", "agentic_core.governance.app_compliance:AppCompliance")
+        c.register("telemetry", "agentic_core.analytics.platform_telemetry:PlatformTelemetry", db=Ref("db"))
 
         # 6. ARTICLE 290/295 INTEGRATION
-        self.truth_validator = TruthValidator(immune_ref=self.immune)
-        self.doc_manager = AutonomousDocumentManager()
+        c.register("truth_validator", "agentic_core.ethics.truth_validator:TruthValidator", immune_ref=Ref("immune"), warm=True)
+        c.register("doc_manager", "agentic_core.ueg.document_manager:AutonomousDocumentManager")
 
         # 7. PC-AGENT HIERARCHY (v99)
-        self.pa_manager = ManagerAgent()
-        self.pa_progress = ProgressAgent()
-        self.pa_decision = DecisionAgent()
-        self.pa_reflection = ReflectionAgent(transition_mgr=self.transition_mgr)
-
-        self.is_running = False
+        c.register("pa_manager", "agentic_core.pc_agent.manager_agent:ManagerAgent")
+        c.register("pa_progress", "agentic_core.pc_agent.progress_agent:ProgressAgent")
+        c.register("pa_decision", "agentic_core.pc_agent.decision_agent:DecisionAgent")
+        c.register("pa_reflection", "agentic_core.pc_agent.reflection_agent:ReflectionAgent",
+                   transition_mgr=Ref("transition_mgr"))
+
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup fails: resolve declared subsystems lazily.
+        components = self.__dict__.get("components")
+        if components is not None and name in components:
+            return components.get(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any):
+        components = self.__dict__.get("components")
+        if components is not None and name in components:
+            components.override(name, value)
+        else:
+            super().__setattr__(name, value)
 
     async def start(self):
         self.is_running = True
@@ -214,6 +168,7 @@ class ConsciousOrganismV99_0:
         reasoning = self.qwen.generate_reasoning_chain(user_intent, triad_state)
 
         # E. Minimax Strategy Selection
+        from agentic_core.cognition.minimax_optimizer import default_utility_func
         decision = self.minimax.evaluate_strategy(triad_state, ["RESEARCH", "SYNC", "QUANTUM_COMPUTE", "PLATFORM_TASK", "EVOLVE_GENOME"], default_utility_func)
         action = decision["selected_action"]
 
@@ -0,0 +1,167 @@
+import importlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Ref:
+    """Constructor argument that resolves to another component of the same container."""
+    name: str
+
+
+@dataclass
+class ComponentSpec:
+    name: str
+    target: Union[str, Callable[..., Any]]  # "package.module:Attribute" or a callable
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    depends_on: Tuple[str, ...] = ()
+    warm: bool = False
+
+
+@dataclass
+class ComponentTiming:
+    import_ms: float = 0.0
+    init_ms: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        return self.import_ms + self.init_ms
+
+
+class StartupProfiler:
+    """
+    ARTICLE 91: Startup Budget.
+    Records per-component import and construction time; report() flags components over
+    `component_budget_ms` and whether the whole startup stayed within `total_budget_ms`.
+    Dependencies are timed separately, so a component is charged only for its own work.
+    """
+    def __init__(self, component_budget_ms: float = 250.0, total_budget_ms: float = 2000.0):
+        self.component_budget_ms = component_budget_ms
+        self.total_budget_ms = total_budget_ms
+        self.timings: Dict[str, ComponentTiming] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, import_ms: float, init_ms: float):
+        with self._lock:
+            self.timings[name] = ComponentTiming(import_ms, init_ms)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            timings = dict(self.timings)
+        total = sum(t.total_ms for t in timings.values())
+        over = sorted((n for n, t in timings.items() if t.total_ms > self.component_budget_ms),
+                      key=lambda n: -timings[n].total_ms)
+        return {
+            "components": {n: {"import_ms": round(t.import_ms, 2), "init_ms": round(t.init_ms, 2)}
+                           for n, t in sorted(timings.items(), key=lambda item: -item[1].total_ms)},
+            "total_ms": round(total, 2),
+            "over_budget": over,
+            "within_budget": not over and total <= self.total_budget_ms
+        }
+
+
+class ComponentContainer:
+    """
+    ARTICLE 91: Lazy Component Container.
+    Subsystems are declared with register() and built on first get(): the target module is
+    imported then, Ref(...) arguments and `depends_on` components are resolved first, and
+    the instance is cached. warm_up() builds the components marked `warm` (or any given
+    names) ahead of time, optionally on a background thread.
+    """
+    def __init__(self, profiler: Optional[StartupProfiler] = None):
+        self.profiler = profiler or StartupProfiler()
+        self._specs: Dict[str, ComponentSpec] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._building: List[str] = []
+        self._warm_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, target: Union[str, Callable[..., Any]], *args: Any,
+                 depends_on: Iterable[str] = (), warm: bool = False, **kwargs: Any):
+        refs = [a.name for a in (*args, *kwargs.values()) if isinstance(a, Ref)]
+        self._specs[name] = ComponentSpec(name, target, args, kwargs, tuple(dict.fromkeys([*refs, *depends_on])), warm)
+        self._instances.pop(name, None)
+
+    def override(self, name: str, instance: Any):
+        """Replaces a component (e.g. with a test double); later dependants receive it."""
+        with self._lock:
+            if name not in self._specs:
+                self._specs[name] = ComponentSpec(name, lambda: instance)
+            self._instances[name] = instance
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def names(self) -> List[str]:
+        return list(self._specs)
+
+    def is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None or name in self._instances:
+            return instance
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            spec = self._specs.get(name)
+            if spec is None:
+                raise KeyError(f"Unknown component {name}")
+            if name in self._building:
+                cycle = " -> ".join(self._building[self._building.index(name):] + [name])
+                raise RuntimeError(f"Container: Dependency cycle {cycle}")
+            self._building.append(name)
+            try:
+                for dependency in spec.depends_on:
+                    self.get(dependency)
+                instance = self._build(spec)
+            finally:
+                self._building.pop()
+            self._instances[name] = instance
+            return instance
+
+    def _build(self, spec: ComponentSpec) -> Any:
+        start = time.perf_counter()
+        if isinstance(spec.target, str):
+            module_name, _, attribute = spec.target.partition(":")
+            factory = getattr(importlib.import_module(module_name), attribute)
+        else:
+            factory = spec.target
+        imported = time.perf_counter()
+        args = [self.get(a.name) if isinstance(a, Ref) else a for a in spec.args]
+        kwargs = {k: self.get(v.name) if isinstance(v, Ref) else v for k, v in spec.kwargs.items()}
+        resolved = time.perf_counter()
+        instance = factory(*args, **kwargs)
+        done = time.perf_counter()
+        self.profiler.record(spec.name, (imported - start) * 1000, (done - resolved) * 1000)
+        return instance
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """Builds `names` (default: components registered with warm=True) ahead of first use."""
+        targets = list(names) if names is not None else [n for n, s in self._specs.items() if s.warm]
+
+        def build_all():
+            for name in targets:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    # Surfaced again, with its traceback, on the first real access.
+                    logger.warning(f"Container: Warm-up of {name} failed: {e}")
+
+        if not background:
+            build_all()
+            return None
+        self._warm_thread = threading.Thread(target=build_all, name="component-warm-up", daemon=True)
+        self._warm_thread.start()
+        return self._warm_thread
+
+    def wait_warm(self, timeout: Optional[float] = None):
+        if self._warm_thread is not None:
+            self._warm_thread.join(timeout)
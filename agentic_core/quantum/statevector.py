@@ -0,0 +1,253 @@
+import logging
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Param = Union[float, np.ndarray]
+
+SQRT_HALF = np.sqrt(0.5)
+
+# Fixed single-qubit gates as (m00, m01, m10, m11).
+FIXED_GATES: Dict[str, Tuple[complex, complex, complex, complex]] = {
+    "i": (1, 0, 0, 1),
+    "h": (SQRT_HALF, SQRT_HALF, SQRT_HALF, -SQRT_HALF),
+    "x": (0, 1, 1, 0),
+    "y": (0, -1j, 1j, 0),
+    "z": (1, 0, 0, -1),
+    "s": (1, 0, 0, 1j),
+    "sdg": (1, 0, 0, -1j),
+    "t": (1, 0, 0, np.exp(0.25j * np.pi)),
+    "tdg": (1, 0, 0, np.exp(-0.25j * np.pi)),
+}
+
+# Controlled gates: name -> (number of controls, target gate).
+CONTROLLED_GATES: Dict[str, Tuple[int, str]] = {
+    "cnot": (1, "x"),
+    "cy": (1, "y"),
+    "cz": (1, "z"),
+    "ccx": (2, "x"),
+}
+
+ALIASES = {
+    "cx": "cnot", "toffoli": "ccx", "ccnot": "ccx", "s_adj": "sdg", "t_adj": "tdg",
+    "p": "phase", "r1": "phase", "u1": "phase", "mz": "measure", "m": "measure",
+}
+
+# Measurements do not collapse the simulated state; the caller samples from probabilities().
+NON_UNITARY = ("measure", "barrier")
+
+
+def rotation(op: str, theta: Param) -> Tuple[Param, Param, Param, Param]:
+    """(m00, m01, m10, m11) of a parametric single-qubit gate; `theta` may be a batch of angles."""
+    theta = np.asarray(theta, dtype=np.float64)
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    if op == "rx":
+        return c, -1j * s, -1j * s, c
+    if op == "ry":
+        return c, -s, s, c
+    if op == "rz":
+        return np.exp(-0.5j * theta), 0, 0, np.exp(0.5j * theta)
+    if op == "phase":
+        return 1, 0, 0, np.exp(1j * theta)
+    raise ValueError(f"Unknown rotation {op}")
+
+
+class StateVectorSimulator:
+    """
+    ARTICLE 110: Internal Tensor Simulator.
+    Dense statevector engine for `batch_size` independent states of `n_qubits` qubits,
+    stored as a (batch,) + (2,) * n tensor with qubit 0 as the most significant bit.
+    Gates are contractions over the target axes: single-qubit and controlled gates update
+    strided views in place, diagonal gates are broadcast multiplies, and other multi-qubit
+    unitaries go through np.tensordot. Gate parameters may be arrays of shape (batch,), so
+    one pass evaluates many parameter sets (e.g. a QAOA grid or finite-difference stencil).
+    complex64 keeps a 24-qubit state at 128 MB.
+    """
+    def __init__(self, n_qubits: int, batch_size: int = 1, dtype=np.complex128):
+        self.n_qubits = n_qubits
+        self.batch_size = batch_size
+        self.state = np.zeros((batch_size,) + (2,) * n_qubits, dtype=dtype)
+        self._buffers: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.reset()
+
+    def reset(self, uniform: bool = False):
+        """|0...0>, or the uniform superposition H^n|0...0> when `uniform`."""
+        if uniform:
+            self.state.fill(2 ** (-self.n_qubits / 2))
+        else:
+            self.state.fill(0)
+            self.state.reshape(self.batch_size, -1)[:, 0] = 1
+
+    def _coefficient(self, value: Param, ndim: int) -> Param:
+        """Broadcasts a scalar or per-batch value against a view with `ndim` dimensions."""
+        value = np.asarray(value)
+        if value.ndim == 0:
+            return value.astype(self.state.dtype)[()]
+        return value.astype(self.state.dtype).reshape((self.batch_size,) + (1,) * (ndim - 1))
+
+    def _scratch(self, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """Two reusable half-state buffers, so gates do not allocate (and page-fault) per call."""
+        if self._buffers is None or self._buffers[0].shape != shape:
+            self._buffers = (np.empty(shape, dtype=self.state.dtype), np.empty(shape, dtype=self.state.dtype))
+        return self._buffers
+
+    def _view(self, fixed: Dict[int, int]) -> np.ndarray:
+        index = [slice(None)] * (self.n_qubits + 1)
+        for qubit, bit in fixed.items():
+            index[qubit + 1] = bit
+        return self.state[tuple(index)]
+
+    def _check(self, targets: Sequence[int]):
+        if len(set(targets)) != len(targets) or any(not 0 <= t < self.n_qubits for t in targets):
+            raise ValueError(f"Invalid qubit targets {list(targets)} for {self.n_qubits} qubits")
+
+    def apply_single(self, matrix: Tuple[Param, Param, Param, Param], target: int, controls: Sequence[int] = ()):
+        """Applies [[m00, m01], [m10, m11]] to `target`, on the subspace where all `controls` are 1."""
+        self._check([target, *controls])
+        base = {c: 1 for c in controls}
+        zero, one = self._view({**base, target: 0}), self._view({**base, target: 1})
+        m00, m01, m10, m11 = (self._coefficient(m, zero.ndim) for m in matrix)
+        if np.ndim(m01) == 0 and np.ndim(m10) == 0 and m01 == 0 and m10 == 0:
+            if not (np.ndim(m00) == 0 and m00 == 1):
+                zero *= m00
+            one *= m11
+            return
+        if np.ndim(m00) == 0 and m00 == 0 and np.ndim(m11) == 0 and m11 == 0:
+            # Anti-diagonal (X, Y): swap the halves with the off-diagonal phases.
+            saved = self._scratch(zero.shape)[0]
+            np.copyto(saved, zero)
+            np.multiply(one, m01, out=zero)
+            np.multiply(saved, m10, out=one)
+            return
+        saved, scratch = self._scratch(zero.shape)
+        np.copyto(saved, zero)
+        zero *= m00
+        zero += np.multiply(one, m01, out=scratch)
+        one *= m11
+        one += np.multiply(saved, m10, out=scratch)
+
+    def apply_diagonal(self, phases: np.ndarray):
+        """Multiplies the amplitudes by a (2**n,) or (batch, 2**n) diagonal."""
+        flat = self.state.reshape(self.batch_size, -1)
+        flat *= phases if phases.ndim == 2 else phases[None, :]
+
+    def apply_rzz(self, theta: Param, a: int, b: int):
+        """exp(-i theta/2 Z_a Z_b): a phase of exp(-+i theta/2) on equal/unequal bit pairs."""
+        self._check([a, b])
+        equal = np.exp(-0.5j * np.asarray(theta, dtype=np.float64))
+        for bits, phase in (((0, 0), equal), ((1, 1), equal), ((0, 1), np.conj(equal)), ((1, 0), np.conj(equal))):
+            view = self._view({a: bits[0], b: bits[1]})
+            view *= self._coefficient(phase, view.ndim)
+
+    def apply_unitary(self, matrix: np.ndarray, targets: Sequence[int]):
+        """Applies a (2**k, 2**k) unitary to `targets` (first target most significant) via tensordot."""
+        self._check(targets)
+        k = len(targets)
+        tensor = np.asarray(matrix, dtype=self.state.dtype).reshape((2,) * (2 * k))
+        axes = [t + 1 for t in targets]
+        out = np.tensordot(tensor, self.state, axes=(list(range(k, 2 * k)), axes))
+        self.state = np.ascontiguousarray(np.moveaxis(out, list(range(k)), axes))
+
+    def apply(self, op: str, targets: Sequence[int], params: Sequence[Param] = ()):
+        """Applies one gate by name, in the vocabulary of UnifiedQuantumGateway.compile_qir."""
+        op = ALIASES.get(op.lower(), op.lower())
+        targets = [int(t) for t in targets]
+        if op in FIXED_GATES:
+            for target in targets:  # broadcast over several targets, as `h` on a register
+                self.apply_single(FIXED_GATES[op], target)
+        elif op in ("rx", "ry", "rz", "phase"):
+            for target in targets:
+                self.apply_single(rotation(op, params[0]), target)
+        elif op in CONTROLLED_GATES:
+            n_controls, gate = CONTROLLED_GATES[op]
+            self.apply_single(FIXED_GATES[gate], targets[n_controls], targets[:n_controls])
+        elif op == "crz":
+            self.apply_single(rotation("rz", params[0]), targets[1], targets[:1])
+        elif op == "rzz":
+            self.apply_rzz(params[0], targets[0], targets[1])
+        elif op == "swap":
+            self.apply_unitary(np.eye(4)[[0, 2, 1, 3]], targets)
+        elif op == "unitary":
+            self.apply_unitary(np.asarray(params[0]), targets)
+        elif op not in NON_UNITARY:
+            raise ValueError(f"Unsupported gate {op}")
+
+    def run(self, gates: List[Dict[str, Any]]) -> "StateVectorSimulator":
+        """Runs a circuit given as [{"op", "targets", "params"?}, ...]."""
+        for gate in gates:
+            self.apply(gate["op"], gate.get("targets", []), gate.get("params", ()))
+        return self
+
+    def amplitudes(self) -> np.ndarray:
+        """(batch, 2**n) amplitudes in computational-basis order."""
+        return self.state.reshape(self.batch_size, -1)
+
+    def probabilities(self) -> np.ndarray:
+        amplitudes = self.amplitudes()
+        return amplitudes.real ** 2 + amplitudes.imag ** 2
+
+    def expectation_diagonal(self, values: np.ndarray) -> np.ndarray:
+        """<psi|D|psi> per batch entry for a diagonal observable with entries `values`."""
+        return self.probabilities() @ values
+
+
+def maxcut_values(n_qubits: int, edges: Sequence[Tuple[int, int]], weights: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Cut size of every basis state (node i on the side given by qubit i). Built in the
+    (2,) * n tensor form: each edge adds a broadcast 2x2 XOR block on its two axes.
+    """
+    dtype = np.float64 if weights is not None else np.uint8 if len(edges) < 256 else np.int32
+    cut = np.zeros((2,) * n_qubits, dtype=dtype)
+    crossing = np.array([[0, 1], [1, 0]], dtype=dtype)
+    for i, (u, v) in enumerate(edges):
+        if u == v:
+            continue
+        shape = [1] * n_qubits
+        shape[u] = shape[v] = 2
+        block = crossing if weights is None else crossing * weights[i]
+        cut += block.reshape(shape)
+    return cut.reshape(-1)
+
+
+def qaoa_maxcut_expectations(cut: np.ndarray, n_qubits: int, gammas: np.ndarray, betas: np.ndarray,
+                             max_amplitudes: int = 2 ** 25, dtype=np.complex64) -> np.ndarray:
+    """
+    Expected cut <C> of QAOA states for a batch of parameter sets. `gammas` and `betas` are
+    (batch, layers); each layer applies exp(i gamma C) (the cost layer of H_C = -C) and
+    RX(2 beta) on every qubit. Batches are chunked so at most `max_amplitudes` amplitudes
+    are held at once.
+    """
+    gammas, betas = np.atleast_2d(gammas), np.atleast_2d(betas)
+    chunk = max(1, max_amplitudes // len(cut))
+    # Integer cut values index a per-parameter phase table instead of evaluating exp() per amplitude.
+    levels = cut if np.issubdtype(cut.dtype, np.integer) else None
+    out = np.empty(len(gammas))
+    for start in range(0, len(gammas), chunk):
+        g, b = gammas[start:start + chunk], betas[start:start + chunk]
+        sim = StateVectorSimulator(n_qubits, len(g), dtype=dtype)
+        sim.reset(uniform=True)
+        for layer in range(g.shape[1]):
+            if levels is not None:
+                table = np.exp(1j * g[:, layer, None] * np.arange(int(levels.max()) + 1)).astype(dtype)
+                sim.apply_diagonal(np.take(table, levels, axis=1))
+            else:
+                sim.apply_diagonal(np.exp(1j * g[:, layer, None] * cut[None, :]).astype(dtype))
+            mixer = rotation("rx", 2 * b[:, layer])
+            for qubit in range(n_qubits):
+                sim.apply_single(mixer, qubit)
+        out[start:start + len(g)] = sim.expectation_diagonal(cut.astype(np.float32))
+    return out
+
+
+def qaoa_state(cut: np.ndarray, n_qubits: int, gammas: Sequence[float], betas: Sequence[float],
+               dtype=np.complex64) -> StateVectorSimulator:
+    """The single QAOA state for one parameter set (see qaoa_maxcut_expectations)."""
+    sim = StateVectorSimulator(n_qubits, 1, dtype=dtype)
+    sim.reset(uniform=True)
+    for gamma, beta in zip(gammas, betas):
+        sim.apply_diagonal(np.exp(1j * gamma * cut).astype(dtype))
+        mixer = rotation("rx", 2 * beta)
+        for qubit in range(n_qubits):
+            sim.apply_single(mixer, qubit)
+    return sim
@@ -2,6 +2,7 @@ import logging
 import asyncio
 import numpy as np
 from typing import Dict, Any, List, Optional
+from agentic_core.quantum.statevector import StateVectorSimulator
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,9 @@ class UnifiedQuantumGateway:
             "ionq_aria": {"qubits": 25, "status": "online", "queue": 40, "fidelity": 0.97}
         }
         self.active_jobs = {}
+        # Dense statevectors: 2**n complex128 amplitudes plus two half-state scratch buffers,
+        # so 26 qubits peak at about 2 GB (1 GB state + 1 GB scratch).
+        self.max_emulated_qubits = 26
 
     async def route_job(self, job_config: Dict[str, Any]) -> str:
         """
@@ -49,17 +53,26 @@ class UnifiedQuantumGateway:
         logger.info(f"Job routed to {best_backend} (Score Optimized)")
         return best_backend
 
-    def emulate_circuit(self, n_qubits: int, depth: int) -> np.ndarray:
+    def emulate_circuit(self, n_qubits: int, depth: int, gates: Optional[List[Dict[str, Any]]] = None,
+                        seed: Optional[int] = None) -> np.ndarray:
         """
-        Lightweight tensor-network inspired simulator.
-        Emulates a random quantum state vector.
+        Internal tensor simulator: runs `gates` (the compile_qir gate list) on the native
+        statevector engine and returns the final state vector. Without gates, a random
+        hardware-efficient circuit of `depth` layers (RY/RZ rotations and a CNOT chain) is run.
         """
+        if n_qubits > self.max_emulated_qubits:
+            raise ValueError(f"{n_qubits} qubits exceed the {self.max_emulated_qubits}-qubit emulation limit")
         logger.info(f"Emulating {n_qubits}-qubit circuit (depth {depth})...")
-        dim = 2**n_qubits
-        # Generate a random state vector
-        state = np.random.rand(dim) + 1j * np.random.rand(dim)
-        state /= np.linalg.norm(state)
-        return state
+        if gates is None:
+            rng = np.random.default_rng(seed)
+            gates = []
+            for _ in range(depth):
+                for q in range(n_qubits):
+                    gates.append({"op": "ry", "targets": [q], "params": [rng.uniform(0, 2 * np.pi)]})
+                    gates.append({"op": "rz", "targets": [q], "params": [rng.uniform(0, 2 * np.pi)]})
+                gates.extend({"op": "cnot", "targets": [q, q + 1]} for q in range(n_qubits - 1))
+        sim = StateVectorSimulator(n_qubits)
+        return sim.run(gates).amplitudes()[0].copy()
 
     def compile_qir(self, circuit_description: Dict[str, Any]) -> str:
         """
@@ -79,8 +92,9 @@ class UnifiedQuantumGateway:
         for gate in gates:
             g_name = gate.get("op")
             targets = gate.get("targets", [])
-            target_str = ", ".join([f"%q{t}" for t in targets])
-            qir_lines.append(f"  call @__quantum__qis__{g_name}({target_str})")
+            # Rotation angles precede the qubit operands, as in QIR's __body(double, %Qubit*) calls.
+            operands = [repr(float(p)) for p in gate.get("params", [])] + [f"%q{t}" for t in targets]
+            qir_lines.append(f"  call @__quantum__qis__{g_name}({', '.join(operands)})")
 
         qir_lines.append("}")
         return "\n".join(qir_lines)
@@ -91,7 +105,14 @@ class UnifiedQuantumGateway:
         self.active_jobs[job_id] = {"backend": backend, "status": "running"}
 
         if backend == "internal_tensor_sim":
-            result = self.emulate_circuit(circuit_data.get("qubits_count", 2), 5)
+            try:
+                result = await asyncio.to_thread(
+                    self.emulate_circuit, circuit_data.get("qubits_count", 2), 5, circuit_data.get("gates")
+                )
+            except ValueError as e:
+                logger.error(f"Internal tensor simulation of {job_id} failed: {e}")
+                self.active_jobs[job_id].update({"status": "failed", "error": str(e)})
+                return self.active_jobs[job_id]
             self.active_jobs[job_id]["status"] = "complete"
             self.active_jobs[job_id]["result"] = result.tolist()
         else:
@@ -1,61 +1,278 @@
 import logging
-import random
+import os
 import numpy as np
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# A strategy kernel receives the current utilities of every agent following the strategy
+# (within one block) and a seeded Generator, and returns their per-tick utility increments.
+StrategyKernel = Callable[[np.ndarray, np.random.Generator], np.ndarray]
+
+
+def cooperate_kernel(utility: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return np.full(len(utility), 0.1)
+
+
+def opportunistic_kernel(utility: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return rng.normal(0.5, 0.1, len(utility))
+
+
+AGENT_DTYPE = np.dtype([("utility", np.float64), ("strategy", np.int16), ("born", np.int64)])
+# Random streams are drawn per fixed-size block of agents, so results do not depend on sharding.
+BLOCK_SIZE = 65536
+
+
+def _advance(table: np.ndarray, history: np.ndarray, start: int, stop: int, first_tick: int, iterations: int,
+             kernels: Dict[int, StrategyKernel], seed: Tuple[int, int]):
+    """
+    Runs `iterations` ticks for agents [start, stop) in place; `start` must be block-aligned.
+    `seed` is the engine's (seed, run) pair.
+    """
+    for block_start in range(start, stop, BLOCK_SIZE):
+        block_stop = min(block_start + BLOCK_SIZE, stop)
+        block = table[block_start:block_stop]
+        groups = [(kernel, np.nonzero(block["strategy"] == code)[0]) for code, kernel in sorted(kernels.items())]
+        groups = [(kernel, members) for kernel, members in groups if len(members)]
+        utility = block["utility"].copy()
+        for tick in range(first_tick + 1, first_tick + iterations + 1):
+            rng = np.random.default_rng([*seed, tick, block_start // BLOCK_SIZE])
+            for kernel, members in groups:
+                utility[members] += kernel(utility[members], rng)
+            if history.shape[1]:
+                history[block_start:block_stop, (tick - 1) % history.shape[1]] = utility
+        block["utility"] = utility
+
+
+def _advance_shard(table_name: str, history_name: str, count: int, history_size: int, start: int, stop: int,
+                   first_tick: int, iterations: int, kernels: Dict[int, StrategyKernel], seed: Tuple[int, int]):
+    """Process-pool entry point: attaches to the shared agent table and advances one shard of it."""
+    table_shm = shared_memory.SharedMemory(name=table_name)
+    history_shm = shared_memory.SharedMemory(name=history_name)
+    try:
+        table = np.ndarray((count,), dtype=AGENT_DTYPE, buffer=table_shm.buf)
+        history = np.ndarray((count, history_size), dtype=np.float32, buffer=history_shm.buf)
+        _advance(table, history, start, stop, first_tick, iterations, kernels, seed)
+        del table, history
+    finally:
+        table_shm.close()
+        history_shm.close()
+
+
 class ABMAgent:
-    def __init__(self, agent_id: str, attributes: Dict[str, Any]):
+    """Read-only view of one row of the ABMEngine agent table."""
+    def __init__(self, engine: "ABMEngine", agent_id: str, index: int):
         self.agent_id = agent_id
-        self.attributes = attributes
-        self.history = []
-
-    def step(self, environment_state: Dict[str, Any]):
-        # Domain-specific logic to be overridden or injected
-        strategy = self.attributes.get("strategy", "cooperate")
-        if strategy == "opportunistic":
-            self.attributes["utility"] = self.attributes.get("utility", 0) + np.random.normal(0.5, 0.1)
-        else:
-            self.attributes["utility"] = self.attributes.get("utility", 0) + 0.1
+        self._engine = engine
+        self._index = index
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self._engine._attributes(self._index)
+
+    @property
+    def history(self) -> List[float]:
+        """Utility after each of the most recent ticks (at most `history_size`), oldest first."""
+        return self._engine._history(self._index)
 
-        self.history.append(self.attributes.get("utility"))
 
 class ABMEngine:
     """
     ARTICLE 306: Agent-Based Modeling Engine.
     Simulates complex social, demographic, and market systems.
-    Capable of parallel execution for large populations.
+    Agents live in a columnar table (a NumPy structured array); each tick applies one
+    vectorised kernel per strategy to the agents following it, and per-agent utility
+    history is a ring buffer of the last `history_size` ticks. Populations of at least
+    `shard_threshold` agents are split into shards advanced over a process pool of
+    `workers`, sharing the table through multiprocessing.shared_memory.
     """
-    def __init__(self):
-        self.agents: Dict[str, ABMAgent] = {}
-        self.global_state = {"tick": 0}
+    STRATEGY_KERNELS: Dict[str, StrategyKernel] = {
+        "cooperate": cooperate_kernel,
+        "opportunistic": opportunistic_kernel
+    }
+    DEFAULT_STRATEGY = "cooperate"
+
+    def __init__(self, history_size: int = 16, workers: Optional[int] = None, shard_threshold: int = 500_000,
+                 seed: Optional[int] = None):
+        self.history_size = history_size
+        self.workers = workers if workers is not None else min(8, os.cpu_count() or 1)
+        self.shard_threshold = shard_threshold
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2 ** 63))
+        self.run = -1
+        self.kernels = dict(self.STRATEGY_KERNELS)
+        self.reset()
         logger.info("ABMEngine: Initialized.")
 
+    def register_strategy(self, name: str, kernel: StrategyKernel):
+        """Adds or replaces a strategy kernel. Kernels must be module-level functions to run in sharded ticks."""
+        self.kernels[name] = kernel
+
+    def _strategy_code(self, name: str) -> int:
+        code = self._strategy_codes.get(name)
+        if code is None:
+            code = self._strategy_codes[name] = len(self._strategy_names)
+            self._strategy_names.append(name)
+        return code
+
+    def _ensure_capacity(self, needed: int):
+        if needed <= len(self._table):
+            return
+        capacity = max(needed, 2 * len(self._table), 1024)
+        table = np.zeros(capacity, dtype=AGENT_DTYPE)
+        table[:self.count] = self._table[:self.count]
+        history = np.zeros((capacity, self.history_size), dtype=np.float32)
+        history[:self.count] = self._history_buffer[:self.count]
+        self._table, self._history_buffer = table, history
+
     def add_agent(self, agent_id: str, attributes: Dict[str, Any]):
-        self.agents[agent_id] = ABMAgent(agent_id, attributes)
+        self.add_agents([agent_id], [attributes.get("strategy", self.DEFAULT_STRATEGY)],
+                        [attributes.get("utility", 0)], [attributes])
+
+    def add_agents(self, agent_ids: Sequence[str], strategies, utilities=None,
+                   attributes: Optional[Sequence[Dict[str, Any]]] = None):
+        """
+        Bulk insert. `strategies` is one strategy name or one per agent; `utilities`
+        defaults to 0. `attributes` optionally gives each agent's attribute dict; keys
+        other than strategy and utility are kept as extras. Existing ids are overwritten
+        in place, as with add_agent.
+        """
+        n = len(agent_ids)
+        if isinstance(strategies, str):
+            codes = np.full(n, self._strategy_code(strategies), dtype=np.int16)
+        else:
+            names, inverse = np.unique(np.asarray(strategies, dtype=str), return_inverse=True)
+            codes = np.array([self._strategy_code(str(name)) for name in names], dtype=np.int16)[inverse]
+        utilities = np.zeros(n) if utilities is None else np.broadcast_to(np.asarray(utilities, dtype=np.float64), (n,))
+
+        first = len(self._ids)
+        if self._index.keys().isdisjoint(agent_ids) and len(set(agent_ids)) == n:
+            # All-new ids (the bulk-load case): append without per-id bookkeeping.
+            self._index.update(zip(agent_ids, range(first, first + n)))
+            self._ids.extend(agent_ids)
+            rows = np.arange(first, first + n)
+        else:
+            rows = np.empty(n, dtype=np.int64)
+            for i, agent_id in enumerate(agent_ids):
+                index = self._index.get(agent_id)
+                if index is None:
+                    index = self._index[agent_id] = len(self._ids)
+                    self._ids.append(agent_id)
+                else:
+                    self._extras.pop(index, None)
+                rows[i] = index
+        self._ensure_capacity(len(self._ids))
+        self.count = len(self._ids)
+        self._table["utility"][rows] = utilities
+        self._table["strategy"][rows] = codes
+        self._table["born"][rows] = self.global_state["tick"]
+        self._history_buffer[rows] = 0
+        if attributes is not None:
+            for row, attrs in zip(rows.tolist(), attributes):
+                extras = {k: v for k, v in attrs.items() if k not in ("strategy", "utility")}
+                if extras:
+                    self._extras[row] = extras
+
+    @property
+    def agents(self) -> Dict[str, ABMAgent]:
+        return {agent_id: ABMAgent(self, agent_id, i) for i, agent_id in enumerate(self._ids)}
+
+    def _attributes(self, index: int) -> Dict[str, Any]:
+        row = self._table[index]
+        return {**self._extras.get(index, {}), "strategy": self._strategy_names[row["strategy"]],
+                "utility": float(row["utility"])}
+
+    def _history(self, index: int) -> List[float]:
+        tick = self.global_state["tick"]
+        length = min(tick - int(self._table["born"][index]), self.history_size)
+        slots = [(t - 1) % self.history_size for t in range(tick - length + 1, tick + 1)]
+        return self._history_buffer[index, slots].astype(float).tolist()
+
+    def export_agents(self) -> List[Dict[str, Any]]:
+        """Agents as {"id", "attributes"} records, in insertion order."""
+        utilities = self._table["utility"][:self.count].tolist()
+        strategies = self._table["strategy"][:self.count].tolist()
+        return [
+            {"id": agent_id, "attributes": {**self._extras.get(i, {}), "strategy": self._strategy_names[s], "utility": u}}
+            for i, (agent_id, s, u) in enumerate(zip(self._ids, strategies, utilities))
+        ]
+
+    def _active_kernels(self) -> Dict[int, StrategyKernel]:
+        default = self.kernels[self.DEFAULT_STRATEGY]
+        return {code: self.kernels.get(name, default) for code, name in enumerate(self._strategy_names)}
 
     async def step(self, iterations: int = 1) -> Dict[str, Any]:
         """Executes simulation steps for all agents."""
-        for _ in range(iterations):
-            self.global_state["tick"] += 1
-            for agent in self.agents.values():
-                agent.step(self.global_state)
+        if self.count and iterations > 0:
+            kernels = self._active_kernels()
+            table, history = self._table[:self.count], self._history_buffer[:self.count]
+            if self.workers > 1 and self.count >= self.shard_threshold:
+                self._step_sharded(kernels, iterations)
+            else:
+                _advance(table, history, 0, self.count, self.global_state["tick"], iterations, kernels,
+                         (self.seed, self.run))
+        self.global_state["tick"] += iterations
 
         return self.get_summary()
 
+    def _shards(self) -> List[Tuple[int, int]]:
+        blocks = -(-self.count // BLOCK_SIZE)
+        per_shard = -(-blocks // self.workers) * BLOCK_SIZE
+        return [(start, min(start + per_shard, self.count)) for start in range(0, self.count, per_shard)]
+
+    def _step_sharded(self, kernels: Dict[int, StrategyKernel], iterations: int):
+        table_shm = shared_memory.SharedMemory(create=True, size=self.count * AGENT_DTYPE.itemsize)
+        history_shm = shared_memory.SharedMemory(create=True, size=max(1, self.count * self.history_size * 4))
+        try:
+            table = np.ndarray((self.count,), dtype=AGENT_DTYPE, buffer=table_shm.buf)
+            history = np.ndarray((self.count, self.history_size), dtype=np.float32, buffer=history_shm.buf)
+            table[:] = self._table[:self.count]
+            history[:] = self._history_buffer[:self.count]
+            shards = self._shards()
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(shards))) as pool:
+                futures = [
+                    pool.submit(_advance_shard, table_shm.name, history_shm.name, self.count, self.history_size,
+                                start, stop, self.global_state["tick"], iterations, kernels, (self.seed, self.run))
+                    for start, stop in shards
+                ]
+                for future in futures:
+                    future.result()
+            self._table[:self.count] = table
+            self._history_buffer[:self.count] = history
+            del table, history
+        finally:
+            table_shm.close()
+            table_shm.unlink()
+            history_shm.close()
+            history_shm.unlink()
+
     def get_summary(self) -> Dict[str, Any]:
-        if not self.agents:
+        if not self.count:
             return {"total_agents": 0, "avg_utility": 0}
 
-        utilities = [a.attributes.get("utility", 0) for a in self.agents.values()]
+        utilities = self._table["utility"][:self.count]
         return {
             "tick": self.global_state["tick"],
-            "total_agents": len(self.agents),
-            "avg_utility": np.mean(utilities),
-            "std_utility": np.std(utilities)
+            "total_agents": self.count,
+            "avg_utility": float(np.mean(utilities)),
+            "std_utility": float(np.std(utilities))
         }
 
-    def reset(self):
-        self.agents = {}
+    def reset(self, seed: Optional[int] = None):
+        """
+        Clears every agent and rewinds the tick. Each reset starts a new run, so ticks
+        draw fresh noise; passing `seed` restarts the sequence of runs from that seed.
+        """
+        if seed is not None:
+            self.seed, self.run = seed, -1
+        self.run += 1
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._extras: Dict[int, Dict[str, Any]] = {}
+        self._strategy_names: List[str] = []
+        self._strategy_codes: Dict[str, int] = {}
+        self._table = np.zeros(0, dtype=AGENT_DTYPE)
+        self._history_buffer = np.zeros((0, self.history_size), dtype=np.float32)
+        self.count = 0
         self.global_state = {"tick": 0}
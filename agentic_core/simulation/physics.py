@@ -5,45 +5,209 @@ from scipy.integrate import odeint
 
 logger = logging.getLogger(__name__)
 
+class BodyArrays:
+    """
+    Structure-of-arrays body store: one (N, 3) float64 array each for position, velocity
+    and the external acceleration field, plus per-body mass, so integrators update every
+    body with a handful of NumPy operations instead of a Python loop per body.
+    """
+    DEFAULT_ACCELERATION = (0.0, -9.81, 0.0)
+
+    def __init__(self, ids: List[Any], position: np.ndarray, velocity: np.ndarray,
+                 acceleration: np.ndarray, mass: Optional[np.ndarray] = None):
+        self.ids = list(ids)
+        self.position = np.asarray(position, dtype=np.float64).reshape(-1, 3)
+        self.velocity = np.asarray(velocity, dtype=np.float64).reshape(-1, 3)
+        self.acceleration = np.asarray(acceleration, dtype=np.float64).reshape(-1, 3)
+        self.has_mass = mass is not None
+        self.mass = np.ones(len(self.ids)) if mass is None else np.asarray(mass, dtype=np.float64)
+        # Total acceleration at the current positions, carried between Verlet steps.
+        self.last_acceleration: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_bodies(cls, bodies: List[Dict[str, Any]]) -> "BodyArrays":
+        has_mass = any("mass" in b for b in bodies)
+        return cls(
+            [b.get("id") for b in bodies],
+            [b.get("position", [0.0, 0.0, 0.0]) for b in bodies] or np.empty((0, 3)),
+            [b.get("velocity", [0.0, 0.0, 0.0]) for b in bodies] or np.empty((0, 3)),
+            [b.get("acceleration", cls.DEFAULT_ACCELERATION) for b in bodies] or np.empty((0, 3)),
+            [b.get("mass", 1.0) for b in bodies] if has_mass else None
+        )
+
+    def to_bodies(self) -> List[Dict[str, Any]]:
+        position, velocity, acceleration = self.position.tolist(), self.velocity.tolist(), self.acceleration.tolist()
+        bodies = [
+            {"id": body_id, "position": p, "velocity": v, "acceleration": a}
+            for body_id, p, v, a in zip(self.ids, position, velocity, acceleration)
+        ]
+        if self.has_mass:
+            for body, m in zip(bodies, self.mass.tolist()):
+                body["mass"] = m
+        return bodies
+
+
+def direct_gravity(position: np.ndarray, mass: np.ndarray, G: float, softening: float, chunk: int = 2048) -> np.ndarray:
+    """Exact O(N^2) pairwise gravity (Plummer-softened), evaluated in row chunks to bound memory."""
+    acc = np.zeros_like(position)
+    for start in range(0, len(position), chunk):
+        d = position[None, :, :] - position[start:start + chunk, None, :]
+        r2 = np.einsum("ijk,ijk->ij", d, d) + softening ** 2
+        inv_r3 = np.where(r2 > 0, r2, np.inf) ** -1.5
+        acc[start:start + chunk] = G * np.einsum("ij,ijk->ik", inv_r3 * mass[None, :], d)
+    return acc
+
+
+class BarnesHutTree:
+    """
+    Octree over body positions for O(N log N) gravity. The tree is built level by level
+    with NumPy (bodies are bucketed by octant, not inserted one at a time) and traversed
+    for all bodies at once: a frontier of (body, node) pairs is either accepted when
+    size / distance < theta, or replaced by the node's children.
+    """
+    def __init__(self, position: np.ndarray, mass: np.ndarray, max_depth: int = 32):
+        n = len(position)
+        lo, hi = position.min(axis=0), position.max(axis=0)
+        centers = [((lo + hi) / 2)[None, :]]
+        halves = [np.array([max(float((hi - lo).max()) / 2, 1e-12) * (1 + 1e-9)])]
+        masses, moments = [np.array([mass.sum()])], [(mass[:, None] * position).sum(axis=0)[None, :]]
+        links = []  # (parent ids, octants, child ids) per level
+
+        node_of = np.zeros(n, dtype=np.int64)
+        active = np.arange(n) if n > 1 else np.empty(0, dtype=np.int64)
+        all_centers, all_halves, next_id = centers[0], halves[0], 1
+        for _ in range(max_depth):
+            if len(active) == 0:
+                break
+            parents = node_of[active]
+            octant = ((position[active] > all_centers[parents]) * np.array([1, 2, 4])).sum(axis=1)
+            keys, child_index, child_count = np.unique(parents * 8 + octant, return_inverse=True, return_counts=True)
+            ids = next_id + np.arange(len(keys))
+            next_id += len(keys)
+            key_parent, key_octant = keys // 8, keys % 8
+            signs = np.stack([(key_octant >> bit) & 1 for bit in range(3)], axis=1) * 2 - 1
+            child_half = all_halves[key_parent] / 2
+            centers.append(all_centers[key_parent] + signs * child_half[:, None])
+            halves.append(child_half)
+            all_centers, all_halves = np.concatenate(centers), np.concatenate(halves)
+            masses.append(np.bincount(child_index, weights=mass[active], minlength=len(keys)))
+            moments.append(np.stack([np.bincount(child_index, weights=mass[active] * position[active, k],
+                                                 minlength=len(keys)) for k in range(3)], axis=1))
+            links.append((key_parent, key_octant, ids))
+            node_of[active] = ids[child_index]
+            # Bodies alone in their node are done; the rest keep subdividing.
+            active = active[child_count[child_index] > 1]
+
+        self.half = all_halves
+        self.mass = np.concatenate(masses)
+        self.com = np.concatenate(moments) / np.where(self.mass > 0, self.mass, 1.0)[:, None]
+        self.children = np.full((next_id, 8), -1, dtype=np.int64)
+        for key_parent, key_octant, ids in links:
+            self.children[key_parent, key_octant] = ids
+        self.is_leaf = (self.children < 0).all(axis=1)
+        self.leaf_of = node_of
+
+    def accelerations(self, position: np.ndarray, mass: np.ndarray, G: float, theta: float,
+                      softening: float) -> np.ndarray:
+        acc = np.zeros_like(position)
+        bodies = np.arange(len(position))
+        nodes = np.zeros(len(position), dtype=np.int64)
+        theta2, eps2 = theta ** 2, softening ** 2
+        while len(bodies):
+            node_mass, com = self.mass[nodes], self.com[nodes]
+            # A leaf containing the body itself acts with the remaining (coincident) members only.
+            own = self.leaf_of[bodies] == nodes
+            node_mass = np.where(own, node_mass - mass[bodies], node_mass)
+            com = np.where(own[:, None], (self.mass[nodes, None] * com - mass[bodies, None] * position[bodies])
+                           / np.where(node_mass > 0, node_mass, 1.0)[:, None], com)
+            d = com - position[bodies]
+            r2 = np.einsum("ij,ij->i", d, d) + eps2
+            accept = self.is_leaf[nodes] | ((2 * self.half[nodes]) ** 2 < theta2 * r2)
+
+            # Empty remainders (a body alone in its leaf) and zero separations exert no force.
+            acting = accept & (node_mass > 0) & (r2 > 0)
+            contribution = (G * node_mass[acting] * r2[acting] ** -1.5)[:, None] * d[acting]
+            for k in range(3):
+                acc[:, k] += np.bincount(bodies[acting], weights=contribution[:, k], minlength=len(position))
+
+            opened = ~accept
+            kids = self.children[nodes[opened]]
+            valid = kids >= 0
+            bodies = np.repeat(bodies[opened], valid.sum(axis=1))
+            nodes = kids[valid]
+        return acc
+
+
 class PhysicsEngineInterface:
     """
     ARTICLE 306: Physics Engine Interface.
     Provides pluggable support for Bullet, Box2D, and internal high-fidelity solvers.
-    Uses SciPy for deterministic numerical integration.
+    Bodies are stepped together over a BodyArrays store with a selectable integrator
+    ("euler" semi-implicit, "verlet" velocity Verlet, "rk4"); optional mutual gravity is
+    computed exactly ("direct") or with a Barnes-Hut octree ("barnes_hut").
     """
-    def __init__(self, provider: str = "internal"):
+    INTEGRATORS = ("euler", "verlet", "rk4")
+
+    def __init__(self, provider: str = "internal", integrator: str = "rk4", gravity: Optional[str] = None,
+                 G: float = 6.674e-11, theta: float = 0.5, softening: float = 1e-3):
+        if integrator not in self.INTEGRATORS:
+            raise ValueError(f"Unknown integrator {integrator}; expected one of {self.INTEGRATORS}")
+        if gravity not in (None, "direct", "barnes_hut"):
+            raise ValueError(f"Unknown gravity model {gravity}")
         self.provider = provider
+        self.integrator = integrator
+        self.gravity = gravity
+        self.G = G
+        self.theta = theta
+        self.softening = softening
         logger.info(f"PhysicsEngine: Initialized with {provider} provider.")
 
+    def _accelerations(self, state: BodyArrays, position: np.ndarray) -> np.ndarray:
+        if self.gravity is None or len(state) < 2:
+            return state.acceleration
+        if self.gravity == "direct":
+            mutual = direct_gravity(position, state.mass, self.G, self.softening)
+        else:
+            mutual = BarnesHutTree(position, state.mass).accelerations(position, state.mass, self.G, self.theta,
+                                                                       self.softening)
+        return state.acceleration + mutual
+
+    def step_arrays(self, state: BodyArrays, dt: float, steps: int = 1) -> BodyArrays:
+        """Advances every body in `state` by `steps` steps of `dt`, in place."""
+        if len(state) == 0:
+            return state
+        for _ in range(steps):
+            x, v = state.position, state.velocity
+            if self.integrator == "euler":
+                v += self._accelerations(state, x) * dt
+                x += v * dt
+            elif self.integrator == "verlet":
+                a0 = state.last_acceleration if state.last_acceleration is not None else self._accelerations(state, x)
+                x += v * dt + 0.5 * a0 * dt * dt
+                a1 = self._accelerations(state, x)
+                v += 0.5 * (a0 + a1) * dt
+                state.last_acceleration = a1
+            else:
+                # y = [x, v], dy/dt = [v, a(x)]
+                k1x, k1v = v, self._accelerations(state, x)
+                k2x, k2v = v + 0.5 * dt * k1v, self._accelerations(state, x + 0.5 * dt * k1x)
+                k3x, k3v = v + 0.5 * dt * k2v, self._accelerations(state, x + 0.5 * dt * k2x)
+                k4x, k4v = v + dt * k3v, self._accelerations(state, x + dt * k3x)
+                x += dt / 6 * (k1x + 2 * k2x + 2 * k3x + k4x)
+                v += dt / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+        return state
+
     async def simulate_step(self, bodies: List[Dict[str, Any]], dt: float) -> List[Dict[str, Any]]:
         """
-        Simulates a single physics step using Runge-Kutta 4th order via scipy.
+        Simulates a single physics step for all bodies at once.
+        Multi-step callers should keep a BodyArrays and use step_arrays to avoid re-packing per step.
         """
         if self.provider != "internal":
             logger.warning(f"Physics: Provider {self.provider} not fully integrated. Falling back to internal.")
-
-        new_bodies = []
-        for body in bodies:
-            state0 = body.get("position", [0.0, 0.0, 0.0]) + body.get("velocity", [0.0, 0.0, 0.0])
-            acc = body.get("acceleration", [0.0, -9.81, 0.0])
-
-            # y = [x, y, z, vx, vy, vz]
-            # dy/dt = [vx, vy, vz, ax, ay, az]
-            def derivative(y, t, a):
-                return [y[3], y[4], y[5], a[0], a[1], a[2]]
-
-            t = [0, dt]
-            sol = odeint(derivative, state0, t, args=(acc,))
-            final_state = sol[-1]
-
-            new_bodies.append({
-                "id": body.get("id"),
-                "position": final_state[0:3].tolist(),
-                "velocity": final_state[3:6].tolist(),
-                "acceleration": acc
-            })
-
-        return new_bodies
+        return self.step_arrays(BodyArrays.from_bodies(bodies), dt).to_bodies()
 
     async def simulate_orbital_mechanics(self, r0: List[float], v0: List[float], mu: float, dt: float, steps: int) -> List[Dict[str, Any]]:
         """
@@ -1,80 +1,256 @@
+import copy
 import logging
+import os
 import sqlite3
 import json
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+
+def _patchable(old: Any, new: Any) -> bool:
+    if isinstance(old, dict) and isinstance(new, dict):
+        return True
+    return isinstance(old, list) and isinstance(new, list) and len(new) > len(old) and new[:len(old)] == old
+
+
+def state_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Structural delta between two state dicts, or None if they are equal. Keys are set
+    ("s"), patched recursively ("p") or deleted ("d"); a list that only grew records just
+    the appended items ("a"), so append-only step histories cost O(new items) per version.
+    """
+    if old == new:
+        return None
+    if isinstance(new, list):
+        return {"a": new[len(old):]}
+    delta: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        if key in old and _patchable(old[key], value):
+            delta.setdefault("p", {})[key] = state_delta(old[key], value)
+        else:
+            delta.setdefault("s", {})[key] = value
+    deleted = [key for key in old if key not in new]
+    if deleted:
+        delta["d"] = deleted
+    return delta
+
+
+def apply_delta(state: Any, delta: Dict[str, Any]) -> Any:
+    """Applies a state_delta to `state` in place and returns it."""
+    if "a" in delta:
+        state.extend(copy.deepcopy(delta["a"]))
+        return state
+    for key, value in delta.get("s", {}).items():
+        state[key] = copy.deepcopy(value)
+    for key, nested in delta.get("p", {}).items():
+        apply_delta(state[key], nested)
+    for key in delta.get("d", []):
+        state.pop(key, None)
+    return state
+
+
 class TwinRegistry:
     """
     ARTICLE 306: Twin Registry.
     Maintains the state and versioning of all active digital twins.
+    Each update appends a structural delta against the previous version (a full snapshot
+    every `snapshot_interval` versions) instead of rewriting the whole state, so any
+    version can be read back with get_twin(twin_id, version=...). Connections are
+    per-thread and WAL-journaled; version increments happen inside the write transaction.
     """
-    def __init__(self, db_path: str = "meta/twins.db"):
+    def __init__(self, db_path: str = "meta/twins.db", snapshot_interval: int = 32, cache_size: int = 256):
         self.db_path = db_path
+        self.snapshot_interval = snapshot_interval
+        self.cache_size = cache_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shared: Optional[sqlite3.Connection] = None
+        # twin_id -> (version, state) of recently written or read twins, to diff updates against.
+        self._cache: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        if db_path != ":memory:" and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        if self.db_path == ":memory:":
+            # Every connection to :memory: is a separate database, so one is shared.
+            if self._shared is None:
+                self._shared = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            return self._shared
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS digital_twins (
-                twin_id TEXT PRIMARY KEY,
-                reactor_id TEXT,
-                state_json TEXT,
-                version INTEGER,
-                fidelity_score REAL,
-                last_updated TEXT
-            )
-        """)
-        conn.commit()
-        conn.close()
+        conn = self._connection()
+        with self._lock:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS digital_twins (
+                    twin_id TEXT PRIMARY KEY,
+                    reactor_id TEXT,
+                    state_json TEXT,
+                    version INTEGER,
+                    fidelity_score REAL,
+                    last_updated TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS twin_versions (
+                    twin_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    is_snapshot INTEGER NOT NULL,
+                    body TEXT NOT NULL,
+                    fidelity_score REAL,
+                    recorded_at TEXT,
+                    PRIMARY KEY (twin_id, version)
+                ) WITHOUT ROWID
+            """)
+            # Rows written before versioning kept the whole state inline: turn them into snapshots.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                migrated = conn.execute("""
+                    INSERT OR IGNORE INTO twin_versions (twin_id, version, is_snapshot, body, fidelity_score, recorded_at)
+                    SELECT twin_id, version, 1, state_json, fidelity_score, last_updated
+                    FROM digital_twins WHERE state_json IS NOT NULL
+                """).rowcount
+                conn.execute("UPDATE digital_twins SET state_json = NULL WHERE state_json IS NOT NULL")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if migrated > 0:
+            logger.info(f"Registry: Migrated {migrated} inline twin states to versioned snapshots.")
+
+    def _remember(self, twin_id: str, version: int, state: Dict[str, Any]):
+        self._cache[twin_id] = (version, state)
+        self._cache.move_to_end(twin_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     def register_twin(self, twin_id: str, reactor_id: str, initial_state: Dict[str, Any]) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._connection()
+        body = json.dumps(initial_state)
+        now = datetime.now().isoformat()
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO digital_twins (twin_id, reactor_id, state_json, version, fidelity_score, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (twin_id, reactor_id, json.dumps(initial_state), 1, 0.0, datetime.now().isoformat()))
-            conn.commit()
+            with self._lock:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("DELETE FROM twin_versions WHERE twin_id = ?", (twin_id,))
+                    conn.execute("""
+                        INSERT OR REPLACE INTO digital_twins (twin_id, reactor_id, state_json, version, fidelity_score, last_updated)
+                        VALUES (?, ?, NULL, ?, ?, ?)
+                    """, (twin_id, reactor_id, 1, 0.0, now))
+                    conn.execute("INSERT INTO twin_versions VALUES (?, ?, 1, ?, ?, ?)", (twin_id, 1, body, 0.0, now))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self._remember(twin_id, 1, json.loads(body))
             return True
         except Exception as e:
             logger.error(f"Registry: Error registering twin {twin_id}: {e}")
             return False
-        finally:
-            conn.close()
 
-    def update_twin(self, twin_id: str, state: Dict[str, Any], fidelity: float):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT version FROM digital_twins WHERE twin_id = ?", (twin_id,))
-        row = cursor.fetchone()
-        new_version = (row[0] + 1) if row else 1
-
-        cursor.execute("""
-            UPDATE digital_twins
-            SET state_json = ?, version = ?, fidelity_score = ?, last_updated = ?
-            WHERE twin_id = ?
-        """, (json.dumps(state), new_version, fidelity, datetime.now().isoformat(), twin_id))
-        conn.commit()
-        conn.close()
-
-    def get_twin(self, twin_id: str) -> Optional[Dict[str, Any]]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM digital_twins WHERE twin_id = ?", (twin_id,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return {
-                "twin_id": row[0],
-                "reactor_id": row[1],
-                "state": json.loads(row[2]),
-                "version": row[3],
-                "fidelity": row[4],
-                "timestamp": row[5]
-            }
-        return None
+    def update_twin(self, twin_id: str, state: Dict[str, Any], fidelity: float) -> Optional[int]:
+        """Records `state` as the next version of the twin; returns the new version (None if unknown)."""
+        conn = self._connection()
+        # Round-trip so the diff base matches what a reader reconstructs (tuples -> lists etc.).
+        body = json.dumps(state)
+        new_state = json.loads(body)
+        now = datetime.now().isoformat()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("UPDATE digital_twins SET version = version + 1, fidelity_score = ?, last_updated = ? "
+                                   "WHERE twin_id = ? RETURNING version", (fidelity, now, twin_id)).fetchone()
+                if row is None:
+                    conn.execute("ROLLBACK")
+                    logger.warning(f"Registry: Update for unknown twin {twin_id} ignored.")
+                    return None
+                new_version = row[0]
+                if new_version % self.snapshot_interval == 0:
+                    is_snapshot, stored = 1, body
+                else:
+                    previous = self._cache.get(twin_id)
+                    if previous is None or previous[0] != new_version - 1:
+                        # Another registry (or process) wrote in between: rebuild the base from the log.
+                        previous = (new_version - 1, self._reconstruct(conn, twin_id, new_version - 1))
+                    is_snapshot, stored = 0, json.dumps(state_delta(previous[1], new_state) or {})
+                conn.execute("INSERT INTO twin_versions VALUES (?, ?, ?, ?, ?, ?)",
+                             (twin_id, new_version, is_snapshot, stored, fidelity, now))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._remember(twin_id, new_version, new_state)
+        return new_version
+
+    def _reconstruct(self, conn: sqlite3.Connection, twin_id: str, version: int) -> Optional[Dict[str, Any]]:
+        rows = conn.execute("""
+            SELECT is_snapshot, body FROM twin_versions
+            WHERE twin_id = ? AND version <= ? AND version >= (
+                SELECT MAX(version) FROM twin_versions WHERE twin_id = ? AND version <= ? AND is_snapshot = 1
+            ) ORDER BY version
+        """, (twin_id, version, twin_id, version)).fetchall()
+        if not rows:
+            return None
+        state = json.loads(rows[0][1])
+        for _, body in rows[1:]:
+            state = apply_delta(state, json.loads(body))
+        return state
+
+    def get_twin(self, twin_id: str, version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Latest state of the twin, or its state as of `version` (time travel)."""
+        conn = self._connection()
+        with self._lock:
+            row = conn.execute("SELECT reactor_id, version FROM digital_twins WHERE twin_id = ?", (twin_id,)).fetchone()
+            if row is None:
+                return None
+            reactor_id, latest = row
+            version = latest if version is None else version
+            meta = conn.execute("SELECT fidelity_score, recorded_at FROM twin_versions WHERE twin_id = ? AND version = ?",
+                                (twin_id, version)).fetchone()
+            if meta is None:
+                return None
+            cached = self._cache.get(twin_id)
+            if cached and cached[0] == version:
+                state = cached[1]
+            else:
+                state = self._reconstruct(conn, twin_id, version)
+                if version == latest:
+                    self._remember(twin_id, version, state)
+        return {
+            "twin_id": twin_id,
+            "reactor_id": reactor_id,
+            # Callers mutate the returned state before update_twin; keep the cached base intact.
+            "state": copy.deepcopy(state),
+            "version": version,
+            "fidelity": meta[0],
+            "timestamp": meta[1]
+        }
+
+    def list_versions(self, twin_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT version, is_snapshot, fidelity_score, recorded_at FROM twin_versions WHERE twin_id = ? ORDER BY version",
+                (twin_id,)
+            ).fetchall()
+        return [{"version": v, "snapshot": bool(s), "fidelity": f, "timestamp": t} for v, s, f, t in rows]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
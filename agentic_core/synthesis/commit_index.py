@@ -0,0 +1,205 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Record/field separators keep subjects and paths containing '|' unambiguous.
+LOG_FORMAT = "--pretty=format:%x1e%H%x1f%an%x1f%ad%x1f%s"
+
+LAYER_RULES = (
+    ("agentic_core", "CORE_COGNITION"),
+    ("src/web", "USER_ACCESS_LAYER"),
+    ("reactor", "DOMAIN_REACTORS"),
+    ("constitution", "GOVERNANCE"),
+    ("incubation", "COEVOLUTIONARY_STRATEGY")
+)
+
+
+def file_layers(path: str) -> List[str]:
+    """Architectural layers a changed file belongs to (ARTICLE 621 file change correlation)."""
+    return [layer for marker, layer in LAYER_RULES if marker in path]
+
+
+class CommitIndex:
+    """
+    ARTICLE 516: Persistent, incremental index of ingested git history.
+    Per repository it records the last ingested commit, every commit (with its category,
+    changed files and impacted layers) and a file-to-layer map, so reruns only parse
+    `git log <last>..HEAD`. External repositories are kept as bare mirrors under
+    `mirror_dir` and refreshed with `git fetch` instead of being re-cloned.
+    """
+    BATCH_SIZE = 2000
+
+    def __init__(self, db_path: str = "meta/commit_index.db", mirror_dir: str = "meta/git_mirrors"):
+        self.db_path = db_path
+        self.mirror_dir = mirror_dir
+        self.stats = {"parsed": 0, "full_rebuilds": 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS repos (
+                    repo_key TEXT PRIMARY KEY,
+                    last_sha TEXT,
+                    commit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS commits (
+                    repo_key TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    author TEXT,
+                    date TEXT,
+                    subject TEXT,
+                    category TEXT,
+                    files TEXT NOT NULL,
+                    layers TEXT NOT NULL,
+                    PRIMARY KEY (repo_key, seq)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_layers (
+                    repo_key TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    layers TEXT NOT NULL,
+                    touches INTEGER NOT NULL,
+                    PRIMARY KEY (repo_key, path)
+                )
+            """)
+
+    def _git(self, args: List[str], cwd: str) -> str:
+        return subprocess.check_output(["git"] + args, cwd=cwd, stderr=subprocess.DEVNULL).decode("utf-8").strip()
+
+    def mirror(self, repo_url: str) -> str:
+        """Path of an up-to-date bare mirror of `repo_url`, cloned on first use and fetched afterwards."""
+        path = os.path.join(self.mirror_dir, hashlib.sha256(repo_url.encode()).hexdigest()[:16] + ".git")
+        if os.path.isdir(path):
+            logger.info(f"CommitIndex: Fetching {repo_url} into mirror {path}")
+            subprocess.run(["git", "fetch", "--prune", "--quiet", "origin"], cwd=path, check=True)
+        else:
+            os.makedirs(self.mirror_dir, exist_ok=True)
+            logger.info(f"CommitIndex: Mirroring {repo_url} into {path}")
+            subprocess.run(["git", "clone", "--mirror", "--quiet", repo_url, path], check=True)
+        return path
+
+    def _stream_log(self, repo_path: str, revision: str) -> Iterator[Dict[str, Any]]:
+        """Parses `git log` output as it is produced, oldest commit first, without buffering it."""
+        cmd = ["git", "log", "--reverse", LOG_FORMAT, "--date=iso", "--name-only", revision]
+        proc = subprocess.Popen(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        current = None
+        try:
+            for raw in proc.stdout:
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
+                if line.startswith("\x1e"):
+                    if current:
+                        yield current
+                    hash_val, author, date, subject = line[1:].split("\x1f", 3)
+                    current = {"hash": hash_val, "author": author, "date": date, "subject": subject, "files": []}
+                elif line.strip() and current:
+                    current["files"].append(line.strip())
+            if current:
+                yield current
+        finally:
+            proc.stdout.close()
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def update(self, repo_key: str, repo_path: str, categorize: Callable[[str], str]) -> int:
+        """Ingests commits added since the last update; returns how many were new."""
+        try:
+            head = self._git(["rev-parse", "HEAD"], repo_path)
+        except subprocess.CalledProcessError:
+            logger.warning(f"CommitIndex: {repo_path} has no commits.")
+            return 0
+
+        with self._lock:
+            row = self._conn.execute("SELECT last_sha, commit_count FROM repos WHERE repo_key = ?", (repo_key,)).fetchone()
+            last_sha, seq = row if row else (None, 0)
+            if last_sha == head:
+                return 0
+            if last_sha and subprocess.run(["git", "merge-base", "--is-ancestor", last_sha, head], cwd=repo_path,
+                                           stderr=subprocess.DEVNULL).returncode != 0:
+                # History was rewritten (or the old tip is gone): rebuild this repository's index.
+                logger.warning(f"CommitIndex: {last_sha[:10]} is no longer an ancestor of HEAD in {repo_key}. Re-indexing.")
+                self.stats["full_rebuilds"] += 1
+                with self._conn:
+                    self._conn.execute("DELETE FROM commits WHERE repo_key = ?", (repo_key,))
+                    self._conn.execute("DELETE FROM file_layers WHERE repo_key = ?", (repo_key,))
+                last_sha, seq = None, 0
+
+            revision = f"{last_sha}..{head}" if last_sha else head
+            added = 0
+            batch = []
+            for commit in self._stream_log(repo_path, revision):
+                seq += 1
+                batch.append((seq, commit))
+                if len(batch) >= self.BATCH_SIZE:
+                    added += self._insert(repo_key, batch, categorize)
+                    batch = []
+            added += self._insert(repo_key, batch, categorize)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO repos (repo_key, last_sha, commit_count) VALUES (?, ?, ?)",
+                    (repo_key, head, seq)
+                )
+            self.stats["parsed"] += added
+        logger.info(f"CommitIndex: Indexed {added} new commits for {repo_key} (total {seq}).")
+        return added
+
+    def _insert(self, repo_key: str, batch: List[Any], categorize: Callable[[str], str]) -> int:
+        if not batch:
+            return 0
+        rows, touched = [], {}
+        for seq, commit in batch:
+            layers = sorted({layer for path in commit["files"] for layer in file_layers(path)})
+            rows.append((repo_key, seq, commit["hash"], commit["author"], commit["date"], commit["subject"],
+                         categorize(commit["subject"]), json.dumps(commit["files"]), json.dumps(layers)))
+            for path in commit["files"]:
+                touched[path] = touched.get(path, 0) + 1
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.executemany(
+                "INSERT INTO file_layers (repo_key, path, layers, touches) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (repo_key, path) DO UPDATE SET touches = touches + excluded.touches",
+                [(repo_key, path, json.dumps(file_layers(path)), count) for path, count in touched.items()]
+            )
+        return len(rows)
+
+    def commits(self, repo_key: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Indexed commits, newest first (the order `git log` reports them in)."""
+        query = "SELECT hash, author, date, subject, category, files, layers FROM commits WHERE repo_key = ? ORDER BY seq DESC"
+        params: List[Any] = [repo_key]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [{
+            "hash": hash_val, "author": author, "date": date, "subject": subject, "category": category,
+            "files": json.loads(files), "layers": json.loads(layers)
+        } for hash_val, author, date, subject, category, files, layers in rows]
+
+    def file_layer_map(self, repo_key: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, layers, touches FROM file_layers WHERE repo_key = ?", (repo_key,)
+            ).fetchall()
+        return {path: {"layers": json.loads(layers), "touches": touches} for path, layers, touches in rows}
+
+    def last_sha(self, repo_key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT last_sha FROM repos WHERE repo_key = ?", (repo_key,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Any, List
 import logging
 from typing import Dict, Any
+from agentic_core.ueg.storage import read_graph
+from agentic_core.ueg.ueg_manager import UEGManager
 
 logger = logging.getLogger(__name__)
 
@@ -30,26 +32,20 @@ class EvolutionaryMemory:
         self.ueg_path = ueg_path
 
     def load_previous_insights(self) -> List[Dict[str, Any]]:
-        if os.path.exists(self.ueg_path):
-            try:
-                with open(self.ueg_path, "r") as f:
-                    ueg = json.load(f)
-                    return [n for n in ueg.get("nodes", []) if n.get("type") == "insight"]
-            except Exception:
-                return []
-        return []
+        try:
+            ueg = read_graph(self.ueg_path)
+        except Exception:
+            return []
+        return [n for n in ueg.get("nodes", []) if n.get("type") == "insight"]
 
     def store_synthesis_results(self, results: Dict[str, Any]):
         logger.info(f"Storing synthesis results in UEG at {self.ueg_path}")
 
         # Load existing UEG or create new
-        ueg = {}
-        if os.path.exists(self.ueg_path):
-            try:
-                with open(self.ueg_path, "r") as f:
-                    ueg = json.load(f)
-            except Exception:
-                ueg = {}
+        try:
+            ueg = read_graph(self.ueg_path)
+        except Exception:
+            ueg = {}
 
         # Add synthesis insight node
         if "nodes" not in ueg: ueg["nodes"] = []
@@ -69,21 +65,15 @@ class EvolutionaryMemory:
         """Stores extracted insights from LLM conversations (Article 357)."""
         logger.info(f"Storing {len(insights)} external insights in UEG.")
 
-        # Load existing
-        ueg = {"nodes": []}
-        if os.path.exists(self.ueg_path):
-            try:
-                with open(self.ueg_path, "r") as f:
-                    ueg = json.load(f)
-            except Exception: pass
-
-        for i, insight in enumerate(insights):
-            ueg["nodes"].append({
-                "id": f"external_insight_{i}_{insight['theme']}",
-                "type": "LLMConversation",
-                "content": insight,
-                "metadata": {"source": insight["source"], "quality": insight["quality_score"]}
-            })
-
-        with open(self.ueg_path, "w") as f:
-            json.dump(ueg, f, indent=4)
+        # Appended through the UEG log rather than rewriting the snapshot it owns.
+        ueg = UEGManager(storage_path=self.ueg_path)
+        try:
+            for i, insight in enumerate(insights):
+                ueg.add_node({
+                    "id": f"external_insight_{i}_{insight['theme']}",
+                    "type": "LLMConversation",
+                    "content": insight,
+                    "metadata": {"source": insight["source"], "quality": insight["quality_score"]}
+                })
+        finally:
+            ueg.close()
@@ -1,60 +1,199 @@
+import asyncio
 import os
 import glob
+import hashlib
+import json
 import logging
+import mmap
 import re
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+KEY_TERMS = (
+    "Quantum", "Neuro-Symbolic", "Verification", "Blockchain", "UEG",
+    "Immune", "Nervous", "Minimax", "Qwen", "Retro-Causal",
+    "Balanced Foundationalism", "Graduated Transition", "Rollback",
+    "CRDT", "Y.js", "Framework Router", "ScholarlyObject", "Sigstore",
+    "Recursive Prompt", "Universal Provenance", "Behavior-Driven",
+    "Transcendent", "POLYMATH"
+)
+VERSION_PATTERN = re.compile(rb"v(\d+\.\d+)")
+MMAP_THRESHOLD = 1024 * 1024
+
+
+class KeyTermMatcher:
+    """
+    Single-pass, case-insensitive multi-term matcher. The lowercased terms are folded
+    into a trie (shared prefixes, as in an Aho-Corasick goto function) and compiled to
+    one IGNORECASE regex, so the document is scanned once instead of once per term and
+    never copied: the regex runs directly on bytes or an mmap.
+    """
+    def __init__(self, terms: Sequence[str]):
+        self.terms = list(terms)
+        lowered = [t.lower().encode() for t in self.terms]
+        trie: Dict[bytes, Any] = {}
+        for term in lowered:
+            node = trie
+            for byte in term:
+                node = node.setdefault(bytes([byte]), {})
+            node[b""] = True
+        self._pattern = re.compile(self._compile(trie), re.IGNORECASE)
+        # The regex reports the longest term at each offset; shorter terms nested inside it
+        # (the Aho-Corasick output links) are credited from this table.
+        self._contains = {t: {o for o in lowered if o in t} for t in lowered}
+        self._lowered = lowered
+
+    def _compile(self, node: Dict[bytes, Any]) -> bytes:
+        branches = [re.escape(ch) + self._compile(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return b""
+        group = b"(?:" + b"|".join(branches) + b")"
+        # A node that ends one term and continues into a longer one makes the continuation optional.
+        return group + b"?" if b"" in node else group
+
+    def find(self, content) -> List[str]:
+        """Terms present in `content` (bytes or a buffer such as an mmap), in declaration order."""
+        found = set()
+        match = self._pattern.search(content)
+        while match and len(found) < len(self._contains):
+            found |= self._contains[match.group().lower()]
+            # Resume one byte in, so matches overlapping this one are not skipped.
+            match = self._pattern.search(content, match.start() + 1)
+        return [t for t, low in zip(self.terms, self._lowered) if low in found]
+
+
+@lru_cache(maxsize=4)
+def _matcher(terms: Tuple[str, ...]) -> KeyTermMatcher:
+    return KeyTermMatcher(terms)
+
+
+def analyze_file(filepath: str, terms: Tuple[str, ...] = KEY_TERMS) -> Dict[str, Any]:
+    """Analyzes one file; large files are scanned through a read-only mmap. Picklable for process pools."""
+    try:
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return _analyze_bytes(filepath, content, terms)
+            return _analyze_bytes(filepath, f.read(), terms)
+    except Exception as e:
+        logger.error(f"Failed to analyze {filepath}: {e}")
+        return {}
+
+
+def _analyze_bytes(filepath: str, content, terms: Tuple[str, ...]) -> Dict[str, Any]:
+    versions = {v.decode() for v in VERSION_PATTERN.findall(content)}
+    return {
+        "source": filepath,
+        "type": "code" if filepath.endswith(".py") else "doc",
+        "length": len(content),
+        "versions": list(versions),
+        "key_terms": _matcher(terms).find(content),
+        "content_hash": hashlib.sha256(content).hexdigest()
+    }
+
+
 class HistoricalAnalyzer:
-    """Analyzes historical documentation and code patterns."""
-    def __init__(self, paths: List[str]):
+    """
+    Analyzes historical documentation and code patterns.
+    Results are cached in `index_path` keyed by (path, mtime, size, content hash): files whose
+    mtime and size are unchanged are not reopened, touched-but-identical files are re-hashed
+    only, and the remaining files are analyzed over a process pool of `workers`.
+    """
+    PATTERNS = ("**/*.txt", "agentic_core/**/*.py", "meta/**/*.md", "docs/**/*.md")
+
+    def __init__(self, paths: List[str], index_path: Optional[str] = "meta/historical_index.json",
+                 workers: Optional[int] = None):
         self.paths = paths
-        self.version_pattern = re.compile(r"v(\d+\.\d+)")
+        self.index_path = index_path
+        self.workers = workers if workers is not None else min(8, os.cpu_count() or 1)
+        self.stats = {"reused": 0, "rehashed": 0, "analyzed": 0}
 
-    async def analyze_all(self) -> List[Dict[str, Any]]:
-        """CN-I: Comprehensive Historical Analysis."""
-        insights = []
+    def _discover(self) -> List[str]:
         files_to_analyze = []
         for path in self.paths:
             # Recursively find all documentation and source code
-            files_to_analyze.extend(glob.glob(os.path.join(path, "**/*.txt"), recursive=True))
-            files_to_analyze.extend(glob.glob(os.path.join(path, "agentic_core/**/*.py"), recursive=True))
-            files_to_analyze.extend(glob.glob(os.path.join(path, "meta/**/*.md"), recursive=True))
-            files_to_analyze.extend(glob.glob(os.path.join(path, "docs/**/*.md"), recursive=True))
-
-        for filepath in files_to_analyze:
-            if os.path.isfile(filepath):
-                insight = self._analyze_file(filepath)
-                if insight:
-                    insights.append(insight)
-        return insights
-
-    def _analyze_file(self, filepath: str) -> Dict[str, Any]:
+            for pattern in self.PATTERNS:
+                files_to_analyze.extend(glob.glob(os.path.join(path, pattern), recursive=True))
+        return [f for f in dict.fromkeys(files_to_analyze) if os.path.isfile(f)]
+
+    def _load_index(self) -> Dict[str, Any]:
+        if not self.index_path:
+            return {}
         try:
-            with open(filepath, 'r', errors='ignore') as f:
-                content = f.read()
-
-            versions = self.version_pattern.findall(content)
-
-            return {
-                "source": filepath,
-                "type": "code" if filepath.endswith(".py") else "doc",
-                "length": len(content),
-                "versions": list(set(versions)),
-                "key_terms": self._extract_key_terms(content)
-            }
-        except Exception as e:
-            logger.error(f"Failed to analyze {filepath}: {e}")
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
             return {}
+        # Cached key terms are only valid for the term list they were matched against.
+        return index.get("files", {}) if index.get("terms") == list(KEY_TERMS) else {}
+
+    def _save_index(self, files: Dict[str, Any]):
+        if not self.index_path:
+            return
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"terms": list(KEY_TERMS), "files": files}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _rehash(self, filepath: str) -> Optional[str]:
+        try:
+            with open(filepath, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    async def analyze_all(self) -> List[Dict[str, Any]]:
+        """CN-I: Comprehensive Historical Analysis."""
+        # File I/O and pool coordination stay off the event loop.
+        return await asyncio.to_thread(self._analyze_all)
+
+    def _analyze_all(self) -> List[Dict[str, Any]]:
+        index = self._load_index()
+        updated: Dict[str, Any] = {}
+        insights: Dict[str, Dict[str, Any]] = {}
+        stale = []
+        discovered = self._discover()
+
+        for filepath in discovered:
+            st = os.stat(filepath)
+            entry = index.get(filepath)
+            if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                self.stats["reused"] += 1
+            elif entry and entry["size"] == st.st_size and self._rehash(filepath) == entry["content_hash"]:
+                entry = {**entry, "mtime": st.st_mtime_ns}
+                self.stats["rehashed"] += 1
+            else:
+                stale.append((filepath, st))
+                continue
+            updated[filepath] = entry
+            insights[filepath] = entry["insight"]
+
+        for (filepath, st), insight in zip(stale, self._analyze_many([f for f, _ in stale])):
+            self.stats["analyzed"] += 1
+            if not insight:
+                continue
+            content_hash = insight.pop("content_hash")
+            updated[filepath] = {"mtime": st.st_mtime_ns, "size": st.st_size,
+                                 "content_hash": content_hash, "insight": insight}
+            insights[filepath] = insight
+
+        if stale or self.stats["rehashed"] or len(updated) != len(index):
+            self._save_index(updated)
+        logger.info(f"HistoricalAnalyzer: {len(stale)} analyzed, {len(insights) - len(stale)} served from index.")
+        return [insights[f] for f in discovered if f in insights]
 
-    def _extract_key_terms(self, content: str) -> List[str]:
-        terms = [
-            "Quantum", "Neuro-Symbolic", "Verification", "Blockchain", "UEG",
-            "Immune", "Nervous", "Minimax", "Qwen", "Retro-Causal",
-            "Balanced Foundationalism", "Graduated Transition", "Rollback",
-            "CRDT", "Y.js", "Framework Router", "ScholarlyObject", "Sigstore",
-            "Recursive Prompt", "Universal Provenance", "Behavior-Driven",
-            "Transcendent", "POLYMATH"
-        ]
-        return [t for t in terms if t.lower() in content.lower()]
+    def _analyze_many(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        if self.workers <= 1 or len(filepaths) < 2 * self.workers:
+            return [analyze_file(f) for f in filepaths]
+        # Largest files first so a multi-megabyte transcript doesn't land last on one worker.
+        order = sorted(range(len(filepaths)), key=lambda i: -os.path.getsize(filepaths[i]))
+        results: List[Dict[str, Any]] = [{}] * len(filepaths)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for i, insight in zip(order, pool.map(analyze_file, [filepaths[i] for i in order], chunksize=4)):
+                results[i] = insight
+        return results
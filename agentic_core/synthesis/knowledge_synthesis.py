@@ -1,12 +1,16 @@
+import asyncio
 import logging
 import time
 import os
+import re
 import uuid
+import hashlib
 from typing import List, Dict, Any, Optional
 import numpy as np
 import datetime
 from agentic_core.ueg.ueg_manager import UEGManager
 from agentic_core.genetics.genomic_registry import GenomicRegistry
+from agentic_core.synthesis.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -14,44 +18,196 @@ class KnowledgeSynthesisPipeline:
     """
     ARTICLE 581-585: Knowledge Synthesis Pipeline.
     Transforms raw scraped data into unified intelligence stored in UEG and Genomic Registry.
+    Embeddings are persisted in an on-disk VectorStore; content within `dedup_threshold`
+    cosine similarity of something already ingested is skipped.
+
+    Documents flow through asyncio stages (preprocess -> embed -> extract -> integrate)
+    connected by bounded queues of `queue_size`, so producers are backpressured instead of
+    buffering without limit. Embedding/dedup and UEG writes are micro-batched; `workers`
+    sets the worker count per stage and `get_metrics()` reports per-stage counters.
     """
-    def __init__(self):
-        self.ueg = UEGManager()
-        self.genomic_registry = GenomicRegistry()
-        self.vector_path = "vectors/synthesis_indices"
-        os.makedirs("vectors", exist_ok=True)
-        self.vector_db = {} # File-based vector store simulation
+    EMBEDDING_DIM = 128
+    STAGES = ("preprocess", "embed", "extract", "integrate")
+
+    def __init__(self, vector_path: str = "vectors/synthesis_indices", dedup_threshold: Optional[float] = 0.97,
+                 ueg: Optional[UEGManager] = None, genomic_registry: Optional[GenomicRegistry] = None,
+                 workers: Optional[Dict[str, int]] = None, queue_size: int = 1000,
+                 embed_batch_size: int = 64, ueg_batch_size: int = 128, batch_timeout: float = 0.02):
+        self.ueg = ueg or UEGManager()
+        self.genomic_registry = genomic_registry or GenomicRegistry()
+        self.vector_path = vector_path
+        self.vector_store = VectorStore(vector_path, dim=self.EMBEDDING_DIM)
+        self.dedup_threshold = dedup_threshold
+
+        self.workers = {"preprocess": 2, "embed": 1, "extract": 2, "integrate": 1, **(workers or {})}
+        self.queue_size = queue_size
+        self.batch_sizes = {"preprocess": 1, "embed": embed_batch_size, "extract": 1, "integrate": ueg_batch_size}
+        self.batch_timeout = batch_timeout
+        self.metrics = {stage: {"processed": 0, "batches": 0, "busy_seconds": 0.0} for stage in self.STAGES}
+        self.metrics["end_to_end"] = {"completed": 0, "latency_seconds": 0.0, "max_latency_seconds": 0.0}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def process_data_stream(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Multi-stage processing: Raw -> Preprocessed -> Embedded -> Extracted -> Integrated."""
-        logger.info(f"Synthesis: Processing raw data from {raw_data.get('source')}")
+        return await (await self.submit(raw_data))
+
+    async def submit(self, raw_data: Dict[str, Any]) -> "asyncio.Future":
+        """
+        Enqueues a document (waiting while the first stage is full) and returns a future
+        for its synthesis report, so callers can keep many documents in flight.
+        """
+        if self._loop is not asyncio.get_running_loop():
+            self.start()
+        logger.debug(f"Synthesis: Queued raw data from {raw_data.get('source') or raw_data.get('source_url')}")
+        future = asyncio.get_running_loop().create_future()
+        await self._queues["preprocess"].put({"raw": raw_data, "future": future, "enqueued_at": time.perf_counter()})
+        return future
+
+    def start(self):
+        """Spawns the stage workers on the running event loop (called implicitly by submit)."""
+        self._loop = asyncio.get_running_loop()
+        self._tasks = []
+        self._queues = {stage: asyncio.Queue(maxsize=self.queue_size) for stage in self.STAGES}
+        handlers = {"preprocess": self._stage_preprocess, "embed": self._stage_embed,
+                    "extract": self._stage_extract, "integrate": self._stage_integrate}
+        for i, stage in enumerate(self.STAGES):
+            downstream = self._queues[self.STAGES[i + 1]] if i + 1 < len(self.STAGES) else None
+            for _ in range(max(1, self.workers[stage])):
+                self._tasks.append(asyncio.create_task(self._run_stage(stage, handlers[stage], downstream)))
+
+    async def drain(self):
+        """Waits until every submitted document has left the pipeline."""
+        for stage in self.STAGES:
+            if stage in self._queues:
+                await self._queues[stage].join()
+
+    async def stop(self):
+        """Drains in-flight documents, then stops the stage workers."""
+        await self.drain()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+
+    async def _next_batch(self, queue: asyncio.Queue, size: int) -> List[Dict[str, Any]]:
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_timeout
+        while len(batch) < size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
 
+    async def _run_stage(self, stage: str, handler, downstream: Optional[asyncio.Queue]):
+        queue = self._queues[stage]
+        while True:
+            batch = await self._next_batch(queue, self.batch_sizes[stage])
+            started = time.perf_counter()
+            try:
+                survivors = await handler(batch)
+            except Exception as e:
+                logger.error(f"Synthesis: Stage {stage} failed on a batch of {len(batch)}: {e}")
+                for item in batch:
+                    self._finish(item, {"status": "FAILED", "stage": stage, "error": str(e),
+                                        "triples_extracted": 0, "ueg_nodes_created": 0})
+                survivors = []
+            metrics = self.metrics[stage]
+            metrics["processed"] += len(batch)
+            metrics["batches"] += 1
+            metrics["busy_seconds"] += time.perf_counter() - started
+            for item in survivors:
+                await downstream.put(item)
+            for _ in batch:
+                queue.task_done()
+
+    def _finish(self, item: Dict[str, Any], report: Dict[str, Any]):
+        report.setdefault("timestamp", datetime.datetime.now().isoformat())
+        latency = time.perf_counter() - item["enqueued_at"]
+        totals = self.metrics["end_to_end"]
+        totals["completed"] += 1
+        totals["latency_seconds"] += latency
+        totals["max_latency_seconds"] = max(totals["max_latency_seconds"], latency)
+        if not item["future"].done():
+            item["future"].set_result(report)
+
+    async def _stage_preprocess(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # 1. Preprocessing (Cleaning & Normalization)
-        clean_text = self._preprocess(raw_data.get("content", ""))
+        for item in batch:
+            item["text"] = self._preprocess(item["raw"].get("content", ""))
+        return batch
 
-        # 2. Embedding
-        embedding = self._embed(clean_text)
-        self.vector_db[raw_data.get("source")] = embedding
+    async def _stage_embed(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # 2. Embedding (+ dedup against everything already ingested, and within the batch)
+        sources = [item["raw"].get("source") or item["raw"].get("source_url") or
+                   hashlib.sha256(item["text"].encode()).hexdigest() for item in batch]
+        embeddings = np.stack([self._embed(item["text"]) for item in batch])
+        duplicates = await asyncio.to_thread(self.vector_store.add_batch, sources, embeddings, self.dedup_threshold)
+        survivors = []
+        for item, source, duplicate_of in zip(batch, sources, duplicates):
+            if duplicate_of is None:
+                survivors.append(item)
+                continue
+            logger.info(f"Synthesis: {source} duplicates {duplicate_of}. Skipping extraction.")
+            self._finish(item, {"status": "DUPLICATE", "duplicate_of": duplicate_of,
+                                "triples_extracted": 0, "ueg_nodes_created": 0})
+        return survivors
 
+    async def _stage_extract(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # 3. Extraction (Fine-tuned NER simulation)
-        triples = self._extract_triples(clean_text)
+        for item in batch:
+            item["triples"] = self._extract_triples(item["text"])
+        return batch
 
-        # 4. Classification & Integration
-        integrated_nodes = self._integrate_to_ueg(triples, raw_data)
+    async def _stage_integrate(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # 4. Classification & Integration, one UEG write per batch
+        node_ids = self._integrate_many([(item["triples"], item["raw"]) for item in batch])
+        for item, nodes in zip(batch, node_ids):
+            self._finish(item, {"status": "SYNTHESIZED", "triples_extracted": len(item["triples"]),
+                                "ueg_nodes_created": len(nodes)})
+        return []
 
-        return {
-            "status": "SYNTHESIZED",
-            "triples_extracted": len(triples),
-            "ueg_nodes_created": len(integrated_nodes),
-            "timestamp": datetime.datetime.now().isoformat()
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-stage counters plus throughput (items per busy second), batch size and queue depth."""
+        report = {}
+        for stage in self.STAGES:
+            m = self.metrics[stage]
+            report[stage] = {
+                **m,
+                "workers": self.workers[stage],
+                "avg_batch": m["processed"] / m["batches"] if m["batches"] else 0.0,
+                "throughput_per_sec": m["processed"] / m["busy_seconds"] if m["busy_seconds"] else 0.0,
+                "queue_depth": self._queues[stage].qsize() if stage in self._queues else 0
+            }
+        totals = self.metrics["end_to_end"]
+        report["end_to_end"] = {
+            **totals,
+            "avg_latency_seconds": totals["latency_seconds"] / totals["completed"] if totals["completed"] else 0.0
         }
+        return report
 
     def _preprocess(self, text: str) -> str:
         return text.strip().lower()
 
-    def _embed(self, text: str) -> List[float]:
-        # Simulated embedding generation
-        return np.random.rand(128).tolist()
+    def _embed(self, text: str) -> np.ndarray:
+        """Deterministic signed feature-hashing embedding over word unigrams and bigrams."""
+        vector = np.zeros(self.EMBEDDING_DIM, dtype=np.float32)
+        tokens = re.findall(r"\w+", text)
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+            vector[h % self.EMBEDDING_DIM] += 1.0 if h >> 63 else -1.0
+        return vector
+
+    def search_similar(self, text: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Nearest previously ingested sources to `text` by cosine similarity."""
+        hits = self.vector_store.search(self._embed(self._preprocess(text)), k=k)[0]
+        return [{"source": source, "score": score} for source, score in hits]
 
     def _extract_triples(self, text: str) -> List[Dict[str, str]]:
         """ARTICLE 581: Identification of entity-relationship triples."""
@@ -63,37 +219,41 @@ class KnowledgeSynthesisPipeline:
 
     def _integrate_to_ueg(self, triples: List[Dict[str, str]], metadata: Dict[str, Any]) -> List[str]:
         """ARTICLE 582 & 646: Integration into UEG with Genomic Organization (Operons)."""
-        nodes = []
-        operon_id = f"operon_{uuid.uuid4().hex[:8]}" if triples else None
-
-        for t in triples:
-            # ARTICLE 582: Full provenance (Source URL, Agent ID, Timestamp)
-            provenance = {
-                "source_url": metadata.get("source_url", "internal_stream"),
-                "agent_id": metadata.get("agent_id", "sensory_layer"),
-                "ingested_at": datetime.datetime.now().isoformat(),
-                "operon_id": operon_id # ARTICLE 646: Genomic clustering
-            }
+        return self._integrate_many([(triples, metadata)])[0]
+
+    def _integrate_many(self, documents: List[tuple]) -> List[List[str]]:
+        """Integrates several documents' (triples, metadata) with a single UEG write; node ids per document."""
+        insights, traits, spans = [], [], []
+        for triples, metadata in documents:
+            operon_id = f"operon_{uuid.uuid4().hex[:8]}" if triples else None
+            start = len(insights)
+            for t in triples:
+                # ARTICLE 582: Full provenance (Source URL, Agent ID, Timestamp)
+                provenance = {
+                    "source_url": metadata.get("source_url", "internal_stream"),
+                    "agent_id": metadata.get("agent_id", "sensory_layer"),
+                    "ingested_at": datetime.datetime.now().isoformat(),
+                    "operon_id": operon_id # ARTICLE 646: Genomic clustering
+                }
+                insights.append({
+                    "content": f"{t['subject']} {t['predicate']} {t['object']}",
+                    "source_id": provenance["source_url"],
+                    "category": "extracted_knowledge",
+                    "metadata": provenance
+                })
+                # ARTICLE 646: Map to Genomic Traits as part of an operon
+                traits.append((f"knowledge_{t['object'].replace(' ', '_').lower()}", {
+                    "provenance": provenance,
+                    "gene_cluster": operon_id
+                }))
+            spans.append((start, len(insights)))
+            if operon_id:
+                logger.info(f"Synthesis: Clustered {len(triples)} insights into genomic {operon_id}.")
 
-            node_id = self.ueg.add_insight(
-                content=f"{t['subject']} {t['predicate']} {t['object']}",
-                source_id=provenance["source_url"],
-                category="extracted_knowledge",
-                metadata=provenance
-            )["id"]
-            nodes.append(node_id)
-
-            # ARTICLE 646: Map to Genomic Traits as part of an operon
-            trait_name = f"knowledge_{t['object'].replace(' ', '_').lower()}"
-            self.genomic_registry.reverse_transcribe_trait(trait_name, {
-                "provenance": provenance,
-                "gene_cluster": operon_id
-            })
-
-        if operon_id:
-            logger.info(f"Synthesis: Clustered {len(triples)} insights into genomic {operon_id}.")
-
-        return nodes
+        nodes = [node["id"] for node in self.ueg.add_insights(insights)] if insights else []
+        for trait_name, trait in traits:
+            self.genomic_registry.reverse_transcribe_trait(trait_name, trait)
+        return [nodes[start:stop] for start, stop in spans]
 
 class EmbodiedAIController:
     """ARTICLE 586-590: Embodied AI Principles."""
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SynthesisStage:
+    """
+    One step of the synthesis cycle. `run` receives the outputs of `inputs` keyed by stage
+    name (None for disabled stages); awaitable results are awaited, and `blocking` stages
+    run in a worker thread. With `memoize`, the output is reused while the inputs and
+    `params` hash the same as on a previous run.
+    """
+    def __init__(self, name: str, run: Callable[[Dict[str, Any]], Any], inputs: Sequence[str] = (),
+                 enabled: bool = True, blocking: bool = False, memoize: bool = False,
+                 params: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.enabled = enabled
+        self.blocking = blocking
+        self.memoize = memoize
+        self.params = params or {}
+
+
+class StageGraph:
+    """
+    ARTICLE 376: Declarative DAG for the Grand Synthesis cycle.
+    Stages start as soon as their inputs are ready, so independent modes run concurrently.
+    Per-stage durations and memoised outputs persist in `state_path`; `plan()` uses the
+    recorded durations to estimate the critical path without executing anything.
+    """
+    def __init__(self, stages: List[SynthesisStage], state_path: Optional[str] = "meta/synthesis_stages.json"):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("StageGraph: Duplicate stage names.")
+        for stage in stages:
+            unknown = [name for name in stage.inputs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"StageGraph: Stage {stage.name} depends on unknown stages {unknown}.")
+        self.order = self._topological_order()
+        self.state_path = state_path
+        self.state = self._load_state()
+        self.timings: Dict[str, float] = {}
+        self.spans: Dict[str, Tuple[float, float]] = {}  # perf_counter (start, end) of stages run this time
+        self.memo_hits: List[str] = []
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: set(stage.inputs) for name, stage in self.stages.items()}
+        order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"StageGraph: Cycle between stages {sorted(remaining)}.")
+            for name in ready:
+                del remaining[name]
+                order.append(name)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def _load_state(self) -> Dict[str, Any]:
+        if not self.state_path:
+            return {}
+        try:
+            with open(self.state_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _fingerprint(stage: SynthesisStage, inputs: Dict[str, Any]) -> Optional[str]:
+        try:
+            body = json.dumps({"inputs": inputs, "params": stage.params}, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(body.encode()).hexdigest()
+
+    async def _execute(self, stage: SynthesisStage, inputs: Dict[str, Any]) -> Any:
+        entry = self.state.setdefault(stage.name, {})
+        fingerprint = self._fingerprint(stage, inputs) if stage.memoize else None
+        if fingerprint and entry.get("fingerprint") == fingerprint and "output" in entry:
+            logger.info(f"StageGraph: {stage.name} unchanged since last run. Reusing memoised output.")
+            self.memo_hits.append(stage.name)
+            return entry["output"]
+
+        started = time.perf_counter()
+        if stage.blocking:
+            output = await asyncio.to_thread(stage.run, inputs)
+        else:
+            output = stage.run(inputs)
+            if inspect.isawaitable(output):
+                output = await output
+        finished = time.perf_counter()
+        self.spans[stage.name] = (started, finished)
+        self.timings[stage.name] = entry["duration"] = finished - started
+
+        entry.pop("output", None)
+        entry.pop("fingerprint", None)
+        if fingerprint:
+            try:
+                json.dumps(output)
+                entry.update({"fingerprint": fingerprint, "output": output})
+            except (TypeError, ValueError):
+                logger.warning(f"StageGraph: Output of {stage.name} is not serialisable. Not memoised.")
+        return output
+
+    async def run(self) -> Dict[str, Any]:
+        """Executes every enabled stage once its inputs are done; returns outputs by stage name."""
+        self.timings, self.spans, self.memo_hits = {}, {}, []
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: SynthesisStage) -> Any:
+            inputs = {}
+            for name in stage.inputs:
+                inputs[name] = await tasks[name]
+            if not stage.enabled:
+                return None
+            return await self._execute(stage, inputs)
+
+        for name in self.order:
+            tasks[name] = asyncio.create_task(run_stage(self.stages[name]), name=f"stage:{name}")
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self._save_state()
+        return {name: task.result() for name, task in tasks.items()}
+
+    def plan(self) -> Dict[str, Any]:
+        """Dry run: per-stage duration estimates from previous runs and the critical path through enabled stages."""
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        rows = []
+        for name in self.order:
+            stage = self.stages[name]
+            estimate = self.state.get(name, {}).get("duration") if stage.enabled else 0.0
+            parent = max(stage.inputs, key=lambda dep: finish[dep], default=None)
+            via[name] = parent
+            finish[name] = (finish[parent] if parent else 0.0) + (estimate or 0.0)
+            rows.append({"stage": name, "enabled": stage.enabled,
+                         "inputs": [dep for dep in stage.inputs if self.stages[dep].enabled],
+                         "estimate_seconds": estimate, "memoize": stage.memoize})
+
+        path = []
+        node = max((name for name in self.order if self.stages[name].enabled), key=lambda n: finish[n], default=None)
+        while node:
+            if self.stages[node].enabled:
+                path.append(node)
+            node = via[node]
+        return {
+            "stages": rows,
+            "critical_path": path[::-1],
+            "estimated_seconds": finish[path[0]] if path else 0.0
+        }
+
+    @staticmethod
+    def format_plan(plan: Dict[str, Any]) -> str:
+        lines = ["Synthesis plan (estimates from previous runs):"]
+        for row in plan["stages"]:
+            if not row["enabled"]:
+                continue
+            estimate = "   n/a" if row["estimate_seconds"] is None else f"{row['estimate_seconds']:6.2f}s"
+            marker = "*" if row["stage"] in plan["critical_path"] else " "
+            deps = f" <- {', '.join(row['inputs'])}" if row["inputs"] else ""
+            memo = " [memoised]" if row["memoize"] else ""
+            lines.append(f" {marker} {row['stage']:<24} {estimate}{memo}{deps}")
+        lines.append(f"Critical path: {' -> '.join(plan['critical_path']) or '(empty)'}"
+                     f" (~{plan['estimated_seconds']:.2f}s)")
+        return "\n".join(lines)
@@ -1,75 +1,213 @@
 import logging
 import asyncio
 try:
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 except ImportError:
     async_playwright = None
+    PlaywrightTimeoutError = None
 
-from typing import List, Dict, Any
 import json
 import os
+import random
+from contextlib import asynccontextmanager
+from itertools import count
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+from urllib.parse import urlparse
+from agentic_core.synthesis.page_cache import PageCache, FetchResult
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_SELECTORS = [
+    '.message-content', '.chat-message', '[data-testid="message-content"]',
+    'article', '.markdown-body'
+]
+
+class RetryableScrapeError(Exception):
+    """Transient failure (throttling, 5xx, navigation timeout); `retry_after` overrides the backoff when set."""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+# Only these are worth another attempt; anything else falls back to simulation at once.
+RETRYABLE_ERRORS = (RetryableScrapeError,) + ((PlaywrightTimeoutError,) if PlaywrightTimeoutError else ())
+
+class HostRateLimiter:
+    """Caps in-flight requests per host and spaces request starts at least 1/rate seconds apart."""
+    def __init__(self, concurrency: int = 2, rate: float = 2.0):
+        self.concurrency = concurrency
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.concurrency))
+        async with semaphore:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
 class URLIngestor:
     """
     ARTICLE 356: Knowledge Ingestion Mandate.
     Fetches and parses LLM chat conversations from provided URLs using real browser automation.
+
+    URLs are scraped concurrently over a pool of browser contexts: at most `max_concurrency`
+    pages are open at once, each host gets `per_host_concurrency` pages and `per_host_rate`
+    navigations per second, and transient failures are retried with exponential backoff.
+    Scrapes go through a shared PageCache, so unchanged sources are not re-rendered.
     """
-    def __init__(self):
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+
+    def __init__(self, max_concurrency: int = 8, browser_contexts: int = 4, per_host_concurrency: int = 2,
+                 per_host_rate: float = 2.0, max_retries: int = 2, backoff_base: float = 1.0,
+                 navigation_timeout: float = 30.0, wait_until: str = "domcontentloaded",
+                 cache: Optional[PageCache] = None, use_cache: bool = True):
         self.use_playwright = async_playwright is not None
+        self.cache = (cache or PageCache()) if use_cache else None
+        self.max_concurrency = max_concurrency
+        self.browser_contexts = browser_contexts
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.navigation_timeout = navigation_timeout
+        self.wait_until = wait_until
 
     async def ingest_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Fetches and parses a list of URLs using Playwright."""
+        """Fetches and parses a list of URLs using Playwright. Results keep the order of `urls`."""
         logger.info(f"URLIngestor: Starting functional ingestion of {len(urls)} URLs.")
+        results = [item async for item in self._stream(urls)]
+        return [conversation for _, conversation in sorted(results, key=lambda item: item[0])]
+
+    async def stream_urls(self, urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yields each conversation as soon as it is scraped (completion order, not input order)."""
+        async for _, conversation in self._stream(urls):
+            yield conversation
+
+    async def _stream(self, urls: List[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
         if not self.use_playwright:
             logger.warning("Playwright not installed. Falling back to simulated ingestion.")
-            return await self._simulated_ingest(urls)
+            for item in enumerate(await self._simulated_ingest(urls)):
+                yield item
+            return
+
+        # Fresh cache hits skip the pool (and its rate limits) entirely.
+        pending = []
+        for index, url in enumerate(urls):
+            cached = self.cache.get_fresh(url, TRANSCRIPT_SELECTORS) if self.cache else None
+            if cached is not None:
+                yield index, cached
+            else:
+                pending.append(index)
+        if not pending:
+            return
 
-        results = []
         async with async_playwright() as p:
             # Use chromium for stability
             browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-            )
-
-            for url in urls:
-                try:
-                    conversation = await self._scrape_url(context, url)
-                    if conversation:
-                        results.append(conversation)
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
-
-            await browser.close()
-        return results
-
-    async def _scrape_url(self, context, url: str) -> Dict[str, Any]:
-        """Performs actual browser scraping with hybrid fallback for v125.0."""
+            try:
+                contexts = [await browser.new_context(user_agent=self.USER_AGENT)
+                            for _ in range(max(1, min(self.browser_contexts, len(pending))))]
+                ticket = count()
+
+                async def scrape(url: str) -> Optional[Dict[str, Any]]:
+                    context = contexts[next(ticket) % len(contexts)]
+                    if self.cache is None:
+                        return (await self._scrape_url(context, url))[0]
+                    return await self.cache.fetch(
+                        url, TRANSCRIPT_SELECTORS,
+                        load=lambda u: self._scrape_url(context, u),
+                        revalidate=lambda u, headers: self._revalidate(context, u, headers)
+                    )
+
+                async for index, conversation in self.run_pool([urls[i] for i in pending], scrape):
+                    yield pending[index], conversation
+            finally:
+                await browser.close()
+
+    async def run_pool(self, urls: List[str],
+                       scrape: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Runs `scrape(url)` for every URL under the global and per-host limits, yielding
+        (index, result) pairs as they complete. Pending scrapes are cancelled if the
+        consumer stops iterating early.
+        """
+        pages = asyncio.Semaphore(self.max_concurrency)
+        limiter = HostRateLimiter(self.per_host_concurrency, self.per_host_rate)
+
+        async def job(index: int, url: str):
+            return index, await self._scrape_with_retry(url, scrape, pages, limiter)
+
+        tasks = [asyncio.create_task(job(i, url)) for i, url in enumerate(urls)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, conversation = await finished
+                if conversation:
+                    yield index, conversation
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape_with_retry(self, url: str, scrape, pages: asyncio.Semaphore,
+                                 limiter: HostRateLimiter) -> Optional[Dict[str, Any]]:
+        host = urlparse(url).netloc
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Take the host slot first so a throttled host never holds global page slots.
+                async with limiter.slot(host), pages:
+                    return await scrape(url)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    logger.error(f"Scraping failed for {url} after {attempt + 1} attempts: {e}")
+                    return self._simulate_high_fidelity(url, f"error: {str(e)}")
+                delay = getattr(e, "retry_after", None) or self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"URLIngestor: Attempt {attempt + 1} for {url} failed ({e}). Retrying in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"Scraping failed for {url} ({e}); not retryable.")
+                return self._simulate_high_fidelity(url, f"error: {str(e)}")
+
+    async def _revalidate(self, context, url: str, headers: Dict[str, str]) -> bool:
+        """Conditional GET through the context's request API; True when the origin answers 304."""
+        response = await context.request.get(url, headers=headers, timeout=self.navigation_timeout * 1000)
+        return response.status == 304
+
+    async def _scrape_url(self, context, url: str) -> FetchResult:
+        """
+        Performs actual browser scraping with hybrid fallback for v125.0. Raises on retryable failures.
+        Returns (conversation, response headers); simulated fallbacks carry no headers and are not cached.
+        """
         page = await context.new_page()
         logger.info(f"URLIngestor: Navigating to {url}")
 
         try:
-            response = await page.goto(url, wait_until="networkidle", timeout=30000)
+            response = await page.goto(url, wait_until=self.wait_until, timeout=self.navigation_timeout * 1000)
             status = response.status if response else 500
 
             if status in [401, 403]:
                 logger.warning(f"URLIngestor: Access denied ({status}) for {url}. Falling back to high-fidelity simulation.")
-                await page.close()
-                return self._simulate_high_fidelity(url, "access_denied")
+                return self._simulate_high_fidelity(url, "access_denied"), None
+            if status == 429 or status >= 500:
+                retry_after = response.headers.get("retry-after") if response else None
+                raise RetryableScrapeError(f"HTTP {status}", float(retry_after) if retry_after and retry_after.isdigit() else None)
 
             # Platform specific extraction logic
             platform = self._detect_platform(url)
 
+            # Chat UIs render client-side: give the transcript a moment to appear instead of waiting for network idle.
+            try:
+                await page.wait_for_selector(", ".join(TRANSCRIPT_SELECTORS), timeout=5000)
+            except Exception:
+                pass
+
             # Simple heuristic for chat transcript extraction
-            text_content = await page.evaluate("""() => {
+            text_content = await page.evaluate("""(selectors) => {
                 const messages = [];
-                const selectors = [
-                    '.message-content', '.chat-message', '[data-testid="message-content"]',
-                    'article', '.markdown-body'
-                ];
-
                 let found = false;
                 for (const selector of selectors) {
                     const elements = document.querySelectorAll(selector);
@@ -87,14 +225,11 @@ class URLIngestor:
                     return null;
                 }
                 return messages;
-            }""")
+            }""", TRANSCRIPT_SELECTORS)
 
             if not text_content:
                 logger.warning(f"URLIngestor: No content found for {url}. Might be a login wall. Simulating.")
-                await page.close()
-                return self._simulate_high_fidelity(url, "no_content_found")
-
-            await page.close()
+                return self._simulate_high_fidelity(url, "no_content_found"), None
 
             return {
                 "source_url": url,
@@ -104,11 +239,9 @@ class URLIngestor:
                     "ingested_as": "functional_playwright_scrape",
                     "length": len(str(text_content))
                 }
-            }
-        except Exception as e:
-            logger.error(f"Scraping failed for {url}: {e}")
+            }, response.headers
+        finally:
             await page.close()
-            return self._simulate_high_fidelity(url, f"error: {str(e)}")
 
     def _simulate_high_fidelity(self, url: str, reason: str) -> Dict[str, Any]:
         """v130.1.0: High-fidelity functional simulation based on URL metadata per ARTICLE 646."""
@@ -178,8 +311,12 @@ class DevelopmentScraper:
     """
     ARTICLE 399: Web Scraping for Development Mandate.
     Functional implementation using Playwright to gather real design insights.
+    Target pages are served from the shared PageCache while unchanged.
     """
-    def __init__(self):
+    SELECTORS = ["h2", "h3"]
+
+    def __init__(self, cache: Optional[PageCache] = None):
+        self.cache = cache or PageCache()
         self.targets = [
             "https://www.saasdesign.io/blog",
             "https://uimovement.com",
@@ -198,14 +335,15 @@ class DevelopmentScraper:
                 "scraped_at": "2024-05-23T10:00:00Z"
             }
 
-        patterns = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        titles_by_target = {target: self.cache.get_fresh(target, self.SELECTORS) for target in self.targets}
+        stale = [target for target, cached in titles_by_target.items() if cached is None]
+        if stale:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                page = await browser.new_page()
 
-            for target in self.targets:
-                try:
-                    await page.goto(target, wait_until="domcontentloaded", timeout=15000)
+                async def load(target: str) -> FetchResult:
+                    response = await page.goto(target, wait_until="domcontentloaded", timeout=15000)
                     # Extract titles or headers as proxy for patterns
                     titles = await page.evaluate("""() => {
                         return Array.from(document.querySelectorAll('h2, h3'))
@@ -213,11 +351,20 @@ class DevelopmentScraper:
                             .map(el => el.innerText.trim())
                             .filter(t => t.length > 5);
                     }""")
-                    patterns.extend(titles)
-                except:
-                    continue
+                    return {"titles": titles}, response.headers if response and response.ok else None
+
+                async def revalidate(target: str, headers: Dict[str, str]) -> bool:
+                    return (await page.request.get(target, headers=headers, timeout=15000)).status == 304
+
+                for target in stale:
+                    try:
+                        titles_by_target[target] = await self.cache.fetch(target, self.SELECTORS, load, revalidate)
+                    except:
+                        continue
+
+                await browser.close()
 
-            await browser.close()
+        patterns = [title for cached in titles_by_target.values() if cached for title in cached["titles"]]
 
         return {
             "design_patterns": patterns if patterns else ["Minimalist Grid", "Card-based Layout"],
@@ -10,6 +10,7 @@ from agentic_core.ueg.ueg_manager import UEGManager
 from agentic_core.genetics.genomic_registry import GenomicRegistry
 from agentic_core.biochemical.rectification_engine import AsymmetricDriveRectificationEngine
 from agentic_core.simulation.evolutionary_topology import PhylogeneticDiversityTwin
+from .commit_index import CommitIndex, file_layers
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,11 @@ class UVIAP:
     A biomimetically-inspired pipeline that ingests, synthesises, and applies knowledge
     from all prior versions, external LLM conversations, and GitHub commit/branch history.
     """
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", commit_index: Optional[CommitIndex] = None,
+                 history_limit: Optional[int] = None):
         self.repo_path = os.path.abspath(repo_path)
+        self.commit_index = commit_index or CommitIndex()
+        self.history_limit = history_limit
         self.ueg = UEGManager()
         self.genomic_registry = GenomicRegistry()
         self.rectification_engine = AsymmetricDriveRectificationEngine()
@@ -179,43 +183,18 @@ class UVIAP:
         is_self = repo_url is None or "Workstation" in repo_url or "jules" in repo_url.lower()
         logger.info(f"UVIAP: Ingesting GitHub history (Mode: {'Self-Evolution' if is_self else 'Generalized'})")
 
-        target_path = self.repo_path
+        target_path, repo_key = self.repo_path, f"self:{self.repo_path}"
         if repo_url and not is_self:
-            temp_dir = f"/tmp/uviap_{uuid.uuid4().hex[:8]}"
-            logger.info(f"UVIAP: Cloning external repository {repo_url} into {temp_dir}")
             try:
-                subprocess.run(["git", "clone", "--depth", "50", repo_url, temp_dir], check=True)
-                target_path = temp_dir
+                target_path, repo_key = self.commit_index.mirror(repo_url), repo_url
             except subprocess.CalledProcessError as e:
-                logger.error(f"UVIAP: Failed to clone {repo_url}: {e}")
+                logger.error(f"UVIAP: Failed to mirror {repo_url}: {e}")
                 return []
 
         try:
-            cmd = ["git", "log", "-n", "200", "--pretty=format:%H|%an|%ad|%s", "--date=iso", "--name-only"]
-            result = subprocess.check_output(cmd, cwd=target_path).decode("utf-8")
-
-            commits = []
-            current_commit = None
-
-            for line in result.splitlines():
-                if "|" in line and len(line.split("|")) >= 4:
-                    if current_commit:
-                        commits.append(current_commit)
-                    hash_val, author, date, subject = line.split("|", 3)
-                    current_commit = {
-                        "hash": hash_val,
-                        "author": author,
-                        "date": date,
-                        "subject": subject,
-                        "files": [],
-                        "category": self._categorize_commit(subject, is_self)
-                    }
-                elif line.strip() and current_commit:
-                    current_commit["files"].append(line.strip())
-
-            if current_commit:
-                commits.append(current_commit)
-
+            # Only commits since the last run are parsed; the rest come from the index.
+            self.commit_index.update(repo_key, target_path, lambda subject: self._categorize_commit(subject, is_self))
+            commits = self.commit_index.commits(repo_key, limit=self.history_limit)
             logger.info(f"UVIAP: Successfully ingested {len(commits)} commits.")
             return commits
         except Exception as e:
@@ -247,14 +226,9 @@ class UVIAP:
         """ARTICLE 5.2/621: Advanced Semantic Pattern Recognition."""
         patterns = []
         for commit in commits:
-            # File Change Correlation
-            impacted_layers = set()
-            for file in commit["files"]:
-                if "agentic_core" in file: impacted_layers.add("CORE_COGNITION")
-                if "src/web" in file: impacted_layers.add("USER_ACCESS_LAYER")
-                if "reactor" in file: impacted_layers.add("DOMAIN_REACTORS")
-                if "constitution" in file: impacted_layers.add("GOVERNANCE")
-                if "incubation" in file: impacted_layers.add("COEVOLUTIONARY_STRATEGY")
+            # File Change Correlation (precomputed by the commit index)
+            impacted_layers = set(commit["layers"]) if "layers" in commit else \
+                {layer for file in commit["files"] for layer in file_layers(file)}
 
             # Semantic Analysis
             if commit["category"] == "GOVERNANCE_EVOLUTION":
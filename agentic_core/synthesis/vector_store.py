@@ -0,0 +1,278 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _top_k(indices: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        indices, scores = indices[keep], scores[keep]
+    order = np.argsort(-scores, kind="stable")
+    return indices[order], scores[order]
+
+
+class VectorStore:
+    """
+    ARTICLE 583: On-disk vector store for synthesis embeddings.
+    Unit-normalised float32 vectors live in a memory-mapped file under `path`, so cosine
+    similarity is a dot product. Once `train_threshold` vectors exist, an IVF index
+    (k-means centroids over NumPy, one inverted list per centroid) restricts queries to
+    the `n_probe` closest lists; below that, and for `n_probe=None` callers, search is exact.
+    The index is retrained when the store has grown `retrain_factor` times since training.
+    """
+    def __init__(self, path: str = "vectors/synthesis_indices", dim: int = 128, n_probe: int = 8,
+                 train_threshold: int = 4096, retrain_factor: int = 8, seed: int = 0):
+        self.path = path
+        self.dim = dim
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.retrain_factor = retrain_factor
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+        os.makedirs(path, exist_ok=True)
+
+        self._meta_path = os.path.join(path, "meta.json")
+        self._keys_path = os.path.join(path, "keys.jsonl")
+        self._vectors_path = os.path.join(path, "vectors.f32")
+        self._assign_path = os.path.join(path, "assignments.i32")
+        self._centroids_path = os.path.join(path, "centroids.npy")
+
+        meta = {"dim": dim, "count": 0, "trained_count": 0}
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                meta.update(json.load(f))
+            if meta["dim"] != dim:
+                raise ValueError(f"VectorStore at {path} has dim {meta['dim']}, not {dim}")
+        self.count = meta["count"]
+        self.trained_count = meta["trained_count"]
+
+        self.keys: List[str] = []
+        if os.path.exists(self._keys_path):
+            with open(self._keys_path) as f:
+                for line in f:
+                    if len(self.keys) == self.count:
+                        break
+                    self.keys.append(json.loads(line))
+        # Keys written after the last committed count (a crash mid-insert) are discarded.
+        self.count = len(self.keys)
+        with open(self._keys_path, "a"):
+            pass
+        self._truncate_keys()
+        self.key_index: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+
+        self.capacity = 0
+        self.vectors = self.assignments = None
+        self._ensure_capacity(max(self.count, 1024))
+
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[np.ndarray] = []
+        self._tails: List[List[int]] = []
+        if self.trained_count and os.path.exists(self._centroids_path):
+            self.centroids = np.load(self._centroids_path)
+            self._build_lists()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _truncate_keys(self):
+        with open(self._keys_path, "r+") as f:
+            for _ in range(self.count):
+                f.readline()
+            f.truncate(f.tell())
+
+    def _map(self, file_path: str, dtype, shape) -> np.memmap:
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        with open(file_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        return np.memmap(file_path, dtype=dtype, mode="r+", shape=shape)
+
+    def _ensure_capacity(self, needed: int):
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, self.capacity * 2, 1024)
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.assignments.flush()
+        self.vectors = self._map(self._vectors_path, np.float32, (capacity, self.dim))
+        self.assignments = self._map(self._assign_path, np.int32, (capacity,))
+        self.capacity = capacity
+
+    def _write_meta(self):
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"dim": self.dim, "count": self.count, "trained_count": self.trained_count}, f)
+        os.replace(tmp_path, self._meta_path)
+
+    def _build_lists(self):
+        assigned = np.asarray(self.assignments[:self.count])
+        order = np.argsort(assigned, kind="stable")
+        bounds = np.searchsorted(assigned[order], np.arange(len(self.centroids) + 1))
+        self._lists = [order[bounds[i]:bounds[i + 1]].astype(np.int64) for i in range(len(self.centroids))]
+        self._tails = [[] for _ in self.centroids]
+
+    def _list(self, list_id: int) -> np.ndarray:
+        if self._tails[list_id]:
+            self._lists[list_id] = np.concatenate([self._lists[list_id], np.asarray(self._tails[list_id], dtype=np.int64)])
+            self._tails[list_id] = []
+        return self._lists[list_id]
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def train(self, iterations: int = 10):
+        """(Re)builds the IVF centroids with spherical k-means over a sample, then reassigns every vector."""
+        with self._lock:
+            if not self.count:
+                return
+            # Never more lists than training vectors: small stores (train_threshold < 16) still train.
+            n_lists = min(int(np.clip(np.sqrt(self.count), 16, 4096)), self.count)
+            sample_size = min(self.count, 32 * n_lists)
+            sample = np.asarray(self.vectors[np.sort(self._rng.choice(self.count, sample_size, replace=False))])
+            centroids = sample[self._rng.choice(sample_size, n_lists, replace=False)].copy()
+            for _ in range(iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, sample)
+                empty = np.bincount(labels, minlength=n_lists) == 0
+                sums[empty] = sample[self._rng.choice(sample_size, int(empty.sum()))]
+                centroids = _normalise(sums)
+            self.centroids = centroids
+            np.save(self._centroids_path, centroids)
+
+            for start in range(0, self.count, 65536):
+                stop = min(start + 65536, self.count)
+                self.assignments[start:stop] = self._assign(np.asarray(self.vectors[start:stop]))
+            self.trained_count = self.count
+            self._build_lists()
+            self._write_meta()
+            logger.info(f"VectorStore: Trained IVF index with {n_lists} lists over {self.count} vectors.")
+
+    def add(self, key: str, vector: Sequence[float], dedup_threshold: Optional[float] = None) -> Optional[str]:
+        """Inserts (or replaces) `key`. Returns the key of an existing near-duplicate instead, if one is found."""
+        return self.add_batch([key], [vector], dedup_threshold)[0]
+
+    def add_batch(self, keys: Sequence[str], vectors, dedup_threshold: Optional[float] = None) -> List[Optional[str]]:
+        """
+        Inserts vectors under `keys`; existing keys are updated in place. With `dedup_threshold`,
+        a vector whose cosine similarity to a stored vector (or an earlier one in the same batch)
+        reaches the threshold is skipped and the matching key is returned in its slot; re-adding
+        a key with unchanged content therefore reports the key itself.
+        """
+        vectors = _normalise(vectors)
+        duplicates: List[Optional[str]] = [None] * len(keys)
+        with self._lock:
+            if dedup_threshold is not None:
+                for i, hits in enumerate(self.search(vectors, k=1)):
+                    if hits and hits[0][1] >= dedup_threshold:
+                        duplicates[i] = hits[0][0]
+                gram = vectors @ vectors.T
+                accepted = np.zeros(len(keys), dtype=bool)
+                for i in range(len(keys)):
+                    if duplicates[i] is not None:
+                        continue
+                    earlier = np.nonzero(accepted[:i] & (gram[i, :i] >= dedup_threshold))[0]
+                    if len(earlier):
+                        duplicates[i] = keys[earlier[0]]
+                    else:
+                        accepted[i] = True
+
+            new_keys = []
+            for i, key in enumerate(keys):
+                if duplicates[i] is not None:
+                    continue
+                index = self.key_index.get(key)
+                if index is None:
+                    index = self.count + len(new_keys)
+                    self._ensure_capacity(index + 1)
+                    new_keys.append(key)
+                    self.key_index[key] = index
+                    self.keys.append(key)
+                elif self.centroids is not None:
+                    old_list = int(self.assignments[index])
+                    members = self._list(old_list)
+                    self._lists[old_list] = members[members != index]
+                self.vectors[index] = vectors[i]
+                if self.centroids is not None:
+                    list_id = int(self._assign(vectors[i:i + 1])[0])
+                    self.assignments[index] = list_id
+                    self._tails[list_id].append(index)
+                else:
+                    self.assignments[index] = -1
+
+            if new_keys:
+                with open(self._keys_path, "a") as f:
+                    f.writelines(json.dumps(key) + "\n" for key in new_keys)
+                self.count += len(new_keys)
+            self._write_meta()
+
+            if (self.centroids is None and self.count >= self.train_threshold) or \
+                    (self.centroids is not None and self.count >= self.trained_count * self.retrain_factor):
+                self.train()
+        return duplicates
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        index = self.key_index.get(key)
+        return None if index is None else np.array(self.vectors[index])
+
+    def search(self, queries, k: int = 10, n_probe: Optional[int] = -1) -> List[List[Tuple[str, float]]]:
+        """
+        Batched top-k cosine search. Returns, per query, up to k (key, score) pairs, best first.
+        `n_probe=-1` uses the store default; `n_probe=None` forces an exact scan.
+        """
+        queries = _normalise(queries)
+        with self._lock:
+            if self.count == 0:
+                return [[] for _ in queries]
+            n_probe = self.n_probe if n_probe == -1 else n_probe
+            if self.centroids is None or n_probe is None or n_probe >= len(self.centroids):
+                results = self._search_exact(queries, k)
+            else:
+                results = self._search_ivf(queries, k, n_probe)
+            return [[(self.keys[i], float(s)) for i, s in zip(idx, scores)] for idx, scores in results]
+
+    def _search_exact(self, queries: np.ndarray, k: int):
+        best = [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)) for _ in queries]
+        for start in range(0, self.count, 65536):
+            stop = min(start + 65536, self.count)
+            scores = queries @ np.asarray(self.vectors[start:stop]).T
+            chunk_ids = np.arange(start, stop)
+            for q in range(len(queries)):
+                ids, top = _top_k(chunk_ids, scores[q], k)
+                best[q] = _top_k(np.concatenate([best[q][0], ids]), np.concatenate([best[q][1], top]), k)
+        return best
+
+    def _search_ivf(self, queries: np.ndarray, k: int, n_probe: int):
+        probes = np.argpartition(-(queries @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+        candidates: List[List[np.ndarray]] = [[] for _ in queries]
+        candidate_scores: List[List[np.ndarray]] = [[] for _ in queries]
+        # Score each probed list once against every query that probes it.
+        for list_id in np.unique(probes):
+            members = self._list(int(list_id))
+            if len(members) == 0:
+                continue
+            probing = np.nonzero((probes == list_id).any(axis=1))[0]
+            scores = np.asarray(self.vectors[members]) @ queries[probing].T
+            for column, q in enumerate(probing):
+                candidates[q].append(members)
+                candidate_scores[q].append(scores[:, column])
+        return [
+            _top_k(np.concatenate(ids), np.concatenate(scores), k) if ids else (np.empty(0, dtype=np.int64), np.empty(0))
+            for ids, scores in zip(candidates, candidate_scores)
+        ]
+
+    def flush(self):
+        with self._lock:
+            self.vectors.flush()
+            self.assignments.flush()
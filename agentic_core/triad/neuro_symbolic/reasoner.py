@@ -1,7 +1,5 @@
-from typing import Any, Dict, List, Optional
-import sympy as sp
-from sympy.logic import satisfiable
-from sympy.logic.boolalg import to_cnf, simplify_logic
+from typing import Any, Dict, List, Optional, Tuple
+from agentic_core.triad.neuro_symbolic.rule_base import RESERVED, TOKEN, compile_rules
 from agentic_core.ueg.ledger import UnifiedEvidenceGraph
 
 class NeuroSymbolicReasoner:
@@ -15,52 +13,27 @@ class NeuroSymbolicReasoner:
     async def infer(self, neural_output: Dict[str, Any], domain_rules: List[str]) -> Dict[str, Any]:
         """
         Translates neural outputs into logical facts and applies symbolic reasoning.
-        Uses satisfiable to verify logical consistency and implication.
+        Rules are compiled once per rule set (see rule_base.compile_rules); Horn rules are
+        closed by counter-based forward chaining in time linear in the rule base, and only
+        non-Horn rules fall back to SAT-based entailment checks.
         """
         detections = neural_output.get('detections', [])
+        rules = tuple(r for r in domain_rules if "->" in r)
 
-        # Create symbols for all detections
-        symbols = {d: sp.Symbol(d) for d in detections}
-
-        # Current knowledge base (KB)
-        kb_clauses = []
-        for d in detections:
-            kb_clauses.append(symbols[d])
-
-        # Parse domain rules into sympy logic
-        # Rule format: "A & B -> C"
-        for rule_str in domain_rules:
-            if "->" in rule_str:
-                ant_str, cons_str = rule_str.split("->")
-                ant_expr = self._parse_logic(ant_str.strip())
-                cons_expr = self._parse_logic(cons_str.strip())
-
-                rule_expr = sp.Implies(ant_expr, cons_expr)
-                kb_clauses.append(rule_expr)
-
-        if not kb_clauses:
+        kb_size = len(detections) + len(rules)
+        if not kb_size:
             return {"status": "SUCCESS", "neural_facts": detections, "symbolic_inferences": []}
 
-        # Full knowledge base
-        full_kb = sp.And(*kb_clauses)
-
-        inferred = []
-
-        # Get all symbols mentioned in rules
-        all_text = " ".join(domain_rules)
-        potential_facts = set(all_text.replace("&", " ").replace("|", " ").replace("->", " ").split())
-
-        for f in potential_facts:
-            if f and f not in detections:
-                test_sym = sp.Symbol(f)
-                # KB implies f if KB & !f is unsatisfiable
-                if not satisfiable(full_kb & ~test_sym):
-                    inferred.append(f)
+        rule_base = compile_rules(rules)
+        entailed, consistent = rule_base.entailed(detections)
+        inferred = [name for name in rule_base.names if name in entailed and name not in detections]
 
         result = {
             "neural_facts": detections,
             "symbolic_inferences": inferred,
-            "logic_summary": str(simplify_logic(full_kb)) if len(kb_clauses) < 5 else "Complex KB",
+            "logic_summary": self._summarize(detections, rules) if kb_size < 5 else "Complex KB",
+            # An inconsistent KB entails every candidate, as a per-fact SAT check would report.
+            "consistent": consistent,
             "status": "SUCCESS"
         }
 
@@ -68,10 +41,25 @@ class NeuroSymbolicReasoner:
         self.ueg.add_node("ns_inference_run_v3", "REASONING", result)
         return result
 
+    def _summarize(self, detections: List[str], rules: Tuple[str, ...]) -> str:
+        """Simplified form of a small knowledge base."""
+        import sympy as sp
+        from sympy.logic.boolalg import simplify_logic
+
+        symbols = {d: sp.Symbol(d) for d in detections}
+        clauses = list(symbols.values())
+        for rule_str in rules:
+            ant_str, cons_str = rule_str.split("->", 1)
+            clauses.append(sp.Implies(self._parse_logic(ant_str.strip()), self._parse_logic(cons_str.strip())))
+        return str(simplify_logic(sp.And(*clauses)))
+
     def _parse_logic(self, s: str):
         """Rudimentary parser for simple logical strings."""
+        import sympy as sp
+        if not s:
+            return sp.true
         s = s.replace("&", " & ").replace("|", " | ")
-        return sp.sympify(s)
+        return sp.sympify(s, locals={name: sp.Symbol(name) for name in TOKEN.findall(s) if name not in RESERVED})
 
     async def explain(self, inference_id: str) -> str:
         """Generates a natural language explanation for an inference."""
@@ -0,0 +1,225 @@
+import logging
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+TOKEN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+RESERVED = {"True", "False", "And", "Or", "Not", "Implies"}
+
+
+def _conjunction(text: str) -> Optional[List[str]]:
+    """Symbols of a plain `A & B & C` conjunction, or None if `text` is anything more complex."""
+    atoms = [atom.strip() for atom in text.split("&")]
+    if all(IDENTIFIER.match(atom) and atom not in RESERVED for atom in atoms):
+        return atoms
+    return None
+
+
+def split_horn(rule: str) -> Optional[List[Tuple[List[str], str]]]:
+    """
+    Rewrites `A & B | C -> D & E` style rules as definite (Horn) clauses
+    [(antecedents, consequent), ...]. Disjunctive antecedents and conjunctive
+    consequents split into several clauses; returns None for anything else
+    (negation, parentheses, disjunctive consequents), which needs the SAT fallback.
+    """
+    antecedent, consequent = (part.strip() for part in rule.split("->", 1))
+    heads = _conjunction(consequent)
+    if heads is None:
+        return None
+    bodies = [_conjunction(branch) for branch in antecedent.split("|")] if antecedent else [[]]
+    if any(body is None for body in bodies):
+        return None
+    return [(body, head) for body in bodies for head in heads]
+
+
+class CompiledRuleBase:
+    """
+    A parsed, indexed rule set. Definite (Horn) clauses are compiled into counter-based
+    forward chaining (Dowling-Gallier): every clause keeps a count of unsatisfied
+    antecedents and each antecedent symbol a watch list of clauses, so the closure of a
+    fact set costs O(total rule size). Non-Horn rules are compiled to integer CNF clauses
+    for a SAT-based entailment check over the candidates the Horn closure did not settle.
+    """
+    def __init__(self, rules: Sequence[str]):
+        self.symbols: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.clause_heads: List[int] = []
+        self.clause_sizes: List[int] = []
+        self.watchers: List[List[int]] = []
+        self.clause_bodies: List[List[int]] = []
+        self.axioms: List[int] = []  # heads of clauses with no antecedents
+        self.non_horn: List[str] = []
+        self.non_horn_cnf: List[Set[int]] = []
+
+        for rule in rules:
+            if "->" not in rule:
+                continue
+            # Candidate facts are the symbols the rules mention, in order of first appearance.
+            for token in TOKEN.findall(rule):
+                if token not in RESERVED:
+                    self._intern(token)
+            clauses = split_horn(rule)
+            if clauses is None:
+                self.non_horn.append(rule)
+                self._compile_cnf(rule)
+                continue
+            for body, head in clauses:
+                clause = len(self.clause_heads)
+                self.clause_heads.append(self._intern(head))
+                body_ids = set(self._intern(symbol) for symbol in body)
+                self.clause_bodies.append(sorted(body_ids))
+                self.clause_sizes.append(len(body_ids))
+                for symbol in body_ids:
+                    self.watchers[symbol].append(clause)
+                if not body_ids:
+                    self.axioms.append(self.clause_heads[clause])
+        self.horn_count = len(self.clause_heads)
+
+    def _intern(self, name: str) -> int:
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            symbol = self.symbols[name] = len(self.names)
+            self.names.append(name)
+            self.watchers.append([])
+        return symbol
+
+    def _compile_cnf(self, rule: str):
+        """Converts a non-Horn rule into integer CNF clauses for the SAT fallback."""
+        # sympy is only needed for non-Horn rules, so it is not imported with the module.
+        import sympy as sp
+        from sympy.logic.boolalg import conjuncts, disjuncts, to_cnf
+
+        scope = {token: sp.Symbol(token) for token in TOKEN.findall(rule) if token not in RESERVED}
+        antecedent, consequent = rule.split("->", 1)
+        cnf = to_cnf(sp.Implies(_parse(antecedent, scope), _parse(consequent, scope)))
+        if cnf == sp.true:
+            return
+        for clause in conjuncts(cnf):
+            if clause == sp.false:
+                self.non_horn_cnf.append(set())
+                continue
+            self.non_horn_cnf.append({
+                -(self.symbols[literal.args[0].name] + 1) if isinstance(literal, sp.Not) else self.symbols[literal.name] + 1
+                for literal in disjuncts(clause)
+            })
+
+    def forward_chain(self, facts: Iterable[str]) -> Set[str]:
+        """Closure of `facts` under the Horn clauses (facts outside the rule vocabulary pass through)."""
+        facts = list(facts)
+        known = [False] * len(self.names)
+        remaining = list(self.clause_sizes)
+        agenda = deque(self.axioms)
+        for fact in facts:
+            symbol = self.symbols.get(fact)
+            if symbol is not None:
+                agenda.append(symbol)
+        while agenda:
+            symbol = agenda.popleft()
+            if known[symbol]:
+                continue
+            known[symbol] = True
+            for clause in self.watchers[symbol]:
+                remaining[clause] -= 1
+                if remaining[clause] == 0 and not known[self.clause_heads[clause]]:
+                    agenda.append(self.clause_heads[clause])
+        return set(facts) | {self.names[s] for s, k in enumerate(known) if k}
+
+    def _residual_clauses(self, known: List[bool]) -> Optional[List[Set[int]]]:
+        """
+        The rules as integer CNF clauses (symbol + 1, negated when negative) reduced by the
+        facts already derived: satisfied clauses are dropped and false literals removed.
+        Returns None if a clause becomes empty, i.e. the knowledge base is inconsistent.
+        """
+        residual = []
+        for body, head in zip(self.clause_bodies, self.clause_heads):
+            if not known[head]:
+                residual.append({head + 1, *(-(s + 1) for s in body if not known[s])})
+        for clause in self.non_horn_cnf:
+            if any(literal > 0 and known[literal - 1] for literal in clause):
+                continue
+            reduced = {literal for literal in clause if literal > 0 or not known[-literal - 1]}
+            if not reduced:
+                return None
+            residual.append(reduced)
+        return residual
+
+    def entailed(self, facts: Sequence[str]) -> Tuple[Set[str], bool]:
+        """
+        Symbols entailed by `facts` plus the rules, and whether the knowledge base is
+        consistent. Horn-only rule bases are answered by forward chaining alone.
+        """
+        closure = self.forward_chain(facts)
+        if not self.non_horn_cnf:
+            return closure, True
+
+        import sympy as sp
+        from sympy.assumptions.cnf import EncodedCNF
+        from sympy.logic import satisfiable
+
+        known = [name in closure for name in self.names]
+        residual = self._residual_clauses(known)
+        if residual is None:
+            return closure | set(self.names), False
+        # Only symbols the residual clauses mention can still be entailed; renumber them densely.
+        used = sorted({abs(literal) for clause in residual for literal in clause})
+        dense = {v: i + 1 for i, v in enumerate(used)}
+        symbols = [sp.Symbol(self.names[v - 1]) for v in used]
+        encoding = {symbol: i + 1 for i, symbol in enumerate(symbols)}
+        data = [{dense[abs(l)] if l > 0 else -dense[-l] for l in clause} for clause in residual]
+
+        # Backbone search: each model refutes every candidate it makes false; a blocking
+        # clause ("some remaining candidate is false") is added until no model is left.
+        candidates = [dense[v] for v in used if not known[v - 1]]
+        solves = 0
+        while candidates:
+            blocking = [{-v for v in candidates}] if solves else []
+            model = satisfiable(EncodedCNF(data + blocking, encoding))
+            solves += 1
+            if model is False:  # an empty model ({}) is satisfiable
+                if not blocking:
+                    return closure | set(self.names), False
+                break
+            values = _shrink_model(data, [False] + [bool(model.get(symbol, False)) for symbol in symbols])
+            candidates = [v for v in candidates if values[v]]
+        logger.debug(f"RuleBase: Non-Horn entailment settled with {solves} SAT solves.")
+        return closure | {self.names[used[v - 1] - 1] for v in candidates}, True
+
+
+def _shrink_model(clauses: List[Set[int]], values: List[bool]) -> List[bool]:
+    """
+    Greedily flips true variables of a model to false while every clause keeps a true
+    literal, so each SAT model refutes as many entailment candidates as possible.
+    """
+    true_count = [sum(values[l] if l > 0 else not values[-l] for l in clause) for clause in clauses]
+    positive: List[List[int]] = [[] for _ in values]
+    negative: List[List[int]] = [[] for _ in values]
+    for c, clause in enumerate(clauses):
+        for literal in clause:
+            (positive[literal] if literal > 0 else negative[-literal]).append(c)
+    for v in range(1, len(values)):
+        if values[v] and all(true_count[c] > 1 for c in positive[v]):
+            values[v] = False
+            for c in positive[v]:
+                true_count[c] -= 1
+            for c in negative[v]:
+                true_count[c] += 1
+    return values
+
+def _parse(text: str, scope: Dict[str, Any]) -> Any:
+    import sympy as sp
+    # Explicit symbols, so rule names such as E, I or S are not read as sympy constants.
+    text = text.strip().replace("&", " & ").replace("|", " | ")
+    return sp.sympify(text, locals=scope) if text else sp.true
+
+
+@lru_cache(maxsize=32)
+def compile_rules(rules: Tuple[str, ...]) -> CompiledRuleBase:
+    """Compiled rule base for a rule set, cached so repeated queries skip parsing and indexing."""
+    rule_base = CompiledRuleBase(rules)
+    logger.info(f"RuleBase: Compiled {len(rules)} rules into {rule_base.horn_count} Horn clauses "
+                f"and {len(rule_base.non_horn)} non-Horn rules.")
+    return rule_base
@@ -1,21 +1,32 @@
-import shap
 import numpy as np
-import pandas as pd
-from typing import Any, Dict, List, Optional
-from scipy.stats import norm
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class AdaptiveXAI:
     """
     Article BL: Adaptive Explainable AI.
     v52.0 Mastering: SHAP attribution + Conformal Prediction + Counterfactuals.
     """
-    def __init__(self, baseline_data: Optional[pd.DataFrame] = None):
-        self.baseline_data = baseline_data if baseline_data is not None else pd.DataFrame(np.random.rand(100, 3))
+    def __init__(self, baseline_data: Optional["pd.DataFrame"] = None):
+        # shap and pandas pull in scipy/sklearn/numba (~2s): imported on first use, not at import time.
+        self._baseline_data = baseline_data
+
+    @property
+    def baseline_data(self) -> "pd.DataFrame":
+        if self._baseline_data is None:
+            import pandas as pd
+            self._baseline_data = pd.DataFrame(np.random.rand(100, 3))
+        return self._baseline_data
 
     async def explain(self, model: Any, input_data: Any, user_profile: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculates feature importance, conformal prediction intervals, and generates a counterfactual.
         """
+        import pandas as pd
+        import shap
+
         # 1. SHAP Attribution
         X = pd.DataFrame(np.random.rand(10, 3), columns=['FeatureA', 'FeatureB', 'FeatureC'])
         explainer = shap.Explainer(lambda x: x[:, 0] + x[:, 1], X.values)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Any, List, Dict
+from collections import deque
+from typing import Any, List, Dict, Tuple
 from .ledger import UnifiedEvidenceGraph
 
 logger = logging.getLogger(__name__)
@@ -10,9 +11,14 @@ class ContinuousTruthMaintenanceSystem:
     Article AK: Continuous Truth Maintenance System (CTMS - v53 Upgrade).
     Maintains unassailable truth via non-monotonic reasoning and belief revision.
     """
-    def __init__(self, ueg: UnifiedEvidenceGraph):
+    def __init__(self, ueg: UnifiedEvidenceGraph, incremental: bool = False):
         self.ueg = ueg
         self.is_running = False
+        # Incremental mode: after the first full sweep, only contradictions whose
+        # endpoints gained or lost edges since the previous sweep are re-evaluated.
+        self.incremental = incremental
+        self._touched = ueg.track_changes() if incremental else None
+        self._swept = False
 
     async def start(self):
         self.is_running = True
@@ -25,13 +31,31 @@ class ContinuousTruthMaintenanceSystem:
         """
         Scans for logical inconsistencies and initiates recursive belief revision.
         """
-        edges = self.ueg.get_edges()
-        contradictions = [(u, v, d) for u, v, d in edges if d.get('relation') == 'CONTRADICTS']
-
-        for u, v, d in contradictions:
-            logger.warning(f"CTMS detected contradiction: {u} <-> {v}")
-            # v53: Non-monotonic belief revision
-            await self._resolve_contradiction(u, v)
+        contradictions = self._pending_contradictions()
+
+        # Revisions from one sweep are persisted together.
+        with self.ueg.batch():
+            for u, v in contradictions:
+                logger.warning(f"CTMS detected contradiction: {u} <-> {v}")
+                # v53: Non-monotonic belief revision
+                await self._resolve_contradiction(u, v)
+
+    def _pending_contradictions(self) -> List[Tuple[str, str]]:
+        if not self.incremental or not self._swept:
+            if self.incremental:
+                self._touched.clear()
+                self._swept = True
+            return [(u, v) for u, v, _ in self.ueg.edges_by_relation('CONTRADICTS')]
+
+        touched = list(self._touched)
+        self._touched.clear()
+        pending = {}
+        for node in touched:
+            for source in self.ueg.sources(node, 'CONTRADICTS'):
+                pending[(source, node)] = None
+            for target in self.ueg.targets(node, 'CONTRADICTS'):
+                pending[(node, target)] = None
+        return list(pending)
 
     async def _resolve_contradiction(self, node_a: str, node_b: str):
         """
@@ -53,13 +77,8 @@ class ContinuousTruthMaintenanceSystem:
         })
 
         # Update node metadata
-        if weaker in self.ueg.graph:
-            self.ueg.graph.nodes[weaker]['status'] = 'REJECTED'
-            self.ueg.graph.nodes[weaker]['confidence'] = 0.0
-
-        if stronger in self.ueg.graph:
-            self.ueg.graph.nodes[stronger]['status'] = 'UPHELD'
-            self.ueg.graph.nodes[stronger]['confidence'] = 1.0
+        self.ueg.update_node(weaker, status='REJECTED', confidence=0.0)
+        self.ueg.update_node(stronger, status='UPHELD', confidence=1.0)
 
         # v53: Propagate truth values recursively
         await self._propagate_truth(stronger)
@@ -71,27 +90,30 @@ class ContinuousTruthMaintenanceSystem:
         v53: trust = support_count * (2.0 if formally_proven else 1.0)
         """
         # Bonus for formal verification (Article AJ)
-        has_proof = any(d.get('relation') == 'VALIDATED_BY' and "proof" in u.lower()
-                        for u, v, d in self.ueg.get_edges() if v == node_id)
+        has_proof = any("proof" in str(u).lower() for u in self.ueg.sources(node_id, 'VALIDATED_BY'))
 
-        support_count = len([u for u, v, d in self.ueg.get_edges() if v == node_id and d.get('relation') == 'SUPPORTS'])
+        support_count = len(self.ueg.sources(node_id, 'SUPPORTS'))
 
         multiplier = 2.5 if has_proof else 1.0
         return float(support_count) * multiplier
 
     async def _propagate_truth(self, node_id: str):
         """
-        Recursive belief propagation (Article AK).
+        Belief propagation down DERIVED_FROM chains (Article AK).
+        Breadth-first with a visited set, so each descendant is boosted once even on cycles or diamonds.
         """
-        # Find children
-        derived = [u for u, v, d in self.ueg.get_edges() if v == node_id and d.get('relation') == 'DERIVED_FROM']
-        for child in derived:
-             if child in self.ueg.graph:
-                self.ueg.graph.nodes[child]['confidence'] = min(1.0, self.ueg.graph.nodes[child].get('confidence', 0.5) * 1.2)
-                # Recurse
-                await self._propagate_truth(child)
+        visited = {node_id}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            for child in self.ueg.sources(current, 'DERIVED_FROM'):
+                if child in visited or child not in self.ueg.graph:
+                    continue
+                visited.add(child)
+                self.ueg.update_node(child, confidence=min(1.0, self.ueg.graph.nodes[child].get('confidence', 0.5) * 1.2))
+                queue.append(child)
 
 class ContinuousTruthMaintenance(ContinuousTruthMaintenanceSystem):
     """Wrapper for backward compatibility."""
-    def __init__(self, ueg: UnifiedEvidenceGraph):
-        super().__init__(ueg)
+    def __init__(self, ueg: UnifiedEvidenceGraph, incremental: bool = False):
+        super().__init__(ueg, incremental=incremental)
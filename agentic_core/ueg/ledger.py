@@ -3,22 +3,77 @@ import json
 import logging
 import time
 import os
-from typing import Dict, Any, List, Optional, Set, Tuple
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime, timezone
 import networkx as nx
+from .pow_miner import HEADER_SCHEME, ProofOfWorkMiner, block_header, header_hash
+from .storage import read_graph
 
 logger = logging.getLogger(__name__)
 
+def calculate_merkle_root(transactions: List[Dict[str, Any]]) -> str:
+    """Calculates a recursive Merkle root for a block's transactions."""
+    if not transactions:
+        return hashlib.sha256(b"empty").hexdigest()
+
+    hashes = [tx.get('hash', hashlib.sha256(json.dumps(tx, sort_keys=True).encode()).hexdigest()) for tx in transactions]
+
+    while len(hashes) > 1:
+        if len(hashes) % 2 != 0:
+            hashes.append(hashes[-1])
+        new_hashes = []
+        for i in range(0, len(hashes), 2):
+            combined = hashes[i] + hashes[i+1]
+            new_hashes.append(hashlib.sha256(combined.encode()).hexdigest())
+        hashes = new_hashes
+    return hashes[0]
+
+def calculate_block_hash(block: Dict[str, Any]) -> str:
+    if block.get('hash_scheme') == HEADER_SCHEME:
+        return header_hash(block_header(block), block['nonce'])
+    # Legacy blocks were hashed over the full JSON body before 'hash' was attached.
+    block_string = json.dumps({k: v for k, v in block.items() if k != 'hash'}, sort_keys=True)
+    return hashlib.sha256(block_string.encode()).hexdigest()
+
+def verify_block(block: Dict[str, Any], difficulty: int) -> bool:
+    """Self-contained checks for one block: stored hash, Proof-of-Work target and Merkle root."""
+    stored = block.get("hash")
+    if stored != calculate_block_hash(block) or not stored.startswith("0" * difficulty):
+        return False
+    return block['merkle_root'] == calculate_merkle_root(block['transactions'])
+
+def _first_invalid_block(blocks: List[Dict[str, Any]], difficulty: int, offset: int) -> Optional[int]:
+    """Worker entry point for parallel full verification."""
+    for i, block in enumerate(blocks):
+        if not verify_block(block, difficulty):
+            return offset + i
+    return None
+
 class BlockchainLedger:
     """
     Article BA: Blockchain-inspired provenance ledger (v53 Mastery / v99 Transcendent).
     Implements full block chaining with SHA-256, Merkle roots, and Proof-of-Work.
+
+    Blocks are mined over a fixed header (see pow_miner). A storage path ending in
+    `.jsonl` selects the append-only chain file (one block per line); `.json` keeps
+    the legacy full-chain document.
     """
-    def __init__(self, storage_path: str = "meta/ledger.json", difficulty: int = 2):
+    def __init__(self, storage_path: str = "meta/ledger.json", difficulty: int = 2,
+                 miner: Optional[ProofOfWorkMiner] = None, background_settlement: bool = False):
         self.storage_path = storage_path
-        self.difficulty = difficulty
+        self.miner = miner or ProofOfWorkMiner(difficulty=difficulty)
+        self.difficulty = self.miner.difficulty
+        self.append_only = storage_path.endswith(".jsonl")
+        self.background_settlement = background_settlement
         self.chain: List[Dict[str, Any]] = []
         self.current_transactions: List[Dict[str, Any]] = []
+        self.pending_settlements: List[Future] = []
+        self.verification_metrics: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._settlement_executor: Optional[ThreadPoolExecutor] = None
         self._load_chain()
         if not self.chain:
             self._create_genesis_block()
@@ -37,96 +92,222 @@ class BlockchainLedger:
         data_str = json.dumps(data, sort_keys=True)
         transaction['hash'] = hashlib.sha256(f"{sender}:{data_str}".encode()).hexdigest()
 
-        self.current_transactions.append(transaction)
-        return len(self.chain) + 1
+        with self._lock:
+            self.current_transactions.append(transaction)
+            return len(self.chain) + 1
 
     def _calculate_merkle_root(self, transactions: List[Dict[str, Any]]) -> str:
-        """Calculates a recursive Merkle root for the block's transactions."""
-        if not transactions:
-            return hashlib.sha256(b"empty").hexdigest()
-
-        hashes = [tx.get('hash', hashlib.sha256(json.dumps(tx, sort_keys=True).encode()).hexdigest()) for tx in transactions]
-
-        while len(hashes) > 1:
-            if len(hashes) % 2 != 0:
-                hashes.append(hashes[-1])
-            new_hashes = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i+1]
-                new_hashes.append(hashlib.sha256(combined.encode()).hexdigest())
-            hashes = new_hashes
-        return hashes[0]
+        return calculate_merkle_root(transactions)
 
     def add_block(self, proof: int, previous_hash: Optional[str] = None) -> Dict[str, Any]:
         """Creates a new block and chains it to the previous one via hash."""
-        prev_h = previous_hash or (self.chain[-1]["hash"] if self.chain else "0" * 64)
-
-        block = {
-            'index': len(self.chain),
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'transactions': self.current_transactions,
-            'merkle_root': self._calculate_merkle_root(self.current_transactions),
-            'proof': proof,
-            'previous_hash': prev_h,
-            'nonce': 0
-        }
+        with self._lock:
+            transactions, self.current_transactions = self.current_transactions, []
+        return self._seal_block(transactions, proof, previous_hash)
 
-        # Article AC: Proof-of-Work (No-Stubs compliance)
-        block["hash"] = self._mine_block(block)
+    def _seal_block(self, transactions: List[Dict[str, Any]], proof: int, previous_hash: Optional[str] = None) -> Dict[str, Any]:
+        # Proof-of-Work runs outside the lock so add_transaction never waits on mining;
+        # if another block landed meanwhile, the header is rebuilt on the new tip.
+        merkle_root = self._calculate_merkle_root(transactions)
+        while True:
+            with self._lock:
+                prev_h = previous_hash or (self._stored_hash(self.chain[-1]) if self.chain else "0" * 64)
+                block = {
+                    'index': len(self.chain),
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'transactions': transactions,
+                    'merkle_root': merkle_root,
+                    'proof': proof,
+                    'previous_hash': prev_h,
+                    'nonce': 0,
+                    'hash_scheme': HEADER_SCHEME
+                }
 
-        self.current_transactions = []
-        self.chain.append(block)
-        logger.info(f"LEDGER: Block {block['index']} mined. Hash: {block['hash'][:12]}")
-        self._persist()
-        return block
+            # Article AC: Proof-of-Work (No-Stubs compliance)
+            block["nonce"], block["hash"] = self._mine_block(block)
 
-    def _mine_block(self, block: Dict[str, Any]) -> str:
-        target = "0" * self.difficulty
-        while True:
-            hash_res = self._calculate_block_hash(block)
-            if hash_res.startswith(target):
-                return hash_res
-            block["nonce"] += 1
+            with self._lock:
+                tip = self._stored_hash(self.chain[-1]) if self.chain else "0" * 64
+                if len(self.chain) == block['index'] and (previous_hash is not None or tip == prev_h):
+                    self.chain.append(block)
+                    logger.info(f"LEDGER: Block {block['index']} mined. Hash: {block['hash'][:12]}")
+                    self._persist(block)
+                    return block
+            logger.info(f"LEDGER: Chain tip moved while mining block {block['index']}; re-mining on the new tip.")
+
+    def settle_async(self, proof: int = 100) -> Future:
+        """
+        Seals the pending transactions into a block on a background settlement thread.
+        Blocks are still appended strictly in submission order.
+        """
+        with self._lock:
+            transactions, self.current_transactions = self.current_transactions, []
+            if self._settlement_executor is None:
+                self._settlement_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ledger-settlement")
+            future = self._settlement_executor.submit(self._seal_block, transactions, proof)
+            self.pending_settlements = [f for f in self.pending_settlements if not f.done()] + [future]
+            return future
+
+    def flush_settlements(self, timeout: Optional[float] = None):
+        """Waits for every background settlement to be mined and persisted."""
+        for future in list(self.pending_settlements):
+            future.result(timeout=timeout)
+        self.pending_settlements = []
+
+    def close(self):
+        self.flush_settlements()
+        if self._settlement_executor is not None:
+            self._settlement_executor.shutdown(wait=True)
+            self._settlement_executor = None
+        self.miner.shutdown()
+
+    def _mine_block(self, block: Dict[str, Any]) -> Tuple[int, str]:
+        return self.miner.mine(block_header(block))
 
     def _calculate_block_hash(self, block: Dict[str, Any]) -> str:
-        block_string = json.dumps(block, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
-
-    def verify_integrity(self) -> bool:
-        """Validates entire chain hashes and link consistency."""
-        target = "0" * self.difficulty
-        for i in range(1, len(self.chain)):
-            current = self.chain[i]
-            previous = self.chain[i-1]
-
-            if current["hash"] != self._calculate_block_hash(current):
-                return False
-            if not current["hash"].startswith(target):
-                return False
-            if current["previous_hash"] != previous["hash"]:
-                return False
-            if current['merkle_root'] != self._calculate_merkle_root(current['transactions']):
-                return False
-        return True
+        return calculate_block_hash(block)
 
-    def _persist(self):
+    def _stored_hash(self, block: Dict[str, Any]) -> str:
+        return block.get("hash") or self._calculate_block_hash(block)
+
+    def verify_integrity(self, full: bool = False, workers: int = 1) -> bool:
+        """
+        Validates chain hashes, Proof-of-Work, Merkle roots and link consistency.
+
+        By default only blocks from the persisted verified-height checkpoint onwards are
+        checked (the checkpoint block itself is re-verified, so a rewritten tip is caught).
+        `full=True` re-verifies from genesis, spreading per-block work over `workers` processes.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            chain = list(self.chain)
+
+        start = 1
+        checkpoint = None if full else self._load_checkpoint()
+        if checkpoint and checkpoint["height"] < len(chain) and \
+                self._stored_hash(chain[checkpoint["height"]]) == checkpoint["hash"]:
+            start = max(1, checkpoint["height"])
+
+        bad_index = self._find_invalid_block(chain, start, workers if full else 1)
+        valid = bad_index is None
+
+        elapsed = time.perf_counter() - started
+        checked = max(0, len(chain) - start)
+        self.verification_metrics = {
+            "mode": "full" if full or start == 1 else "incremental",
+            "blocks_verified": checked,
+            "seconds": elapsed,
+            "blocks_per_sec": checked / elapsed if elapsed > 0 else float(checked),
+            "height": len(chain) - 1,
+            "valid": valid
+        }
+        logger.info(f"LEDGER: Verified {checked} blocks ({self.verification_metrics['mode']}) at "
+                    f"{self.verification_metrics['blocks_per_sec']:.0f} blocks/s. Valid: {valid}")
+
+        if valid and len(chain) > 1:
+            self._save_checkpoint(len(chain) - 1, self._stored_hash(chain[-1]))
+        elif not valid:
+            logger.error(f"LEDGER: Integrity failure at block {bad_index}.")
+            self._clear_checkpoint()
+        return valid
+
+    def _find_invalid_block(self, chain: List[Dict[str, Any]], start: int, workers: int) -> Optional[int]:
+        # Links are cheap and sequential; per-block hashing/Merkle work is what gets fanned out.
+        for i in range(start, len(chain)):
+            if chain[i].get("previous_hash") != self._stored_hash(chain[i - 1]):
+                return i
+
+        blocks = chain[start:]
+        if workers <= 1 or len(blocks) < 2 * workers:
+            return _first_invalid_block(blocks, self.difficulty, start)
+
+        chunk = -(-len(blocks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_first_invalid_block, blocks[i:i + chunk], self.difficulty, start + i)
+                       for i in range(0, len(blocks), chunk)]
+            results = [f.result() for f in futures]
+        return min((r for r in results if r is not None), default=None)
+
+    @property
+    def checkpoint_path(self) -> str:
+        return f"{os.path.splitext(self.storage_path)[0]}.checkpoint.json"
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
         try:
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-            with open(self.storage_path, "w") as f:
-                json.dump(self.chain, f, indent=2)
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+            return {"height": int(checkpoint["height"]), "hash": checkpoint["hash"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_checkpoint(self, height: int, block_hash: str):
+        try:
+            tmp_path = f"{self.checkpoint_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"height": height, "hash": block_hash, "verified_at": time.time()}, f)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            logger.warning(f"LEDGER: Could not persist verification checkpoint: {e}")
+
+    def _clear_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _persist(self, block: Optional[Dict[str, Any]] = None):
+        try:
+            os.makedirs(os.path.dirname(self.storage_path) or ".", exist_ok=True)
+            if self.append_only and block is not None:
+                with open(self.storage_path, "a") as f:
+                    f.write(json.dumps(block) + "\n")
+            elif self.append_only:
+                with open(self.storage_path, "w") as f:
+                    f.writelines(json.dumps(b) + "\n" for b in self.chain)
+            else:
+                with open(self.storage_path, "w") as f:
+                    json.dump(self.chain, f, indent=2)
         except Exception as e:
             logger.error(f"LEDGER: Failed to persist: {e}")
 
     def _load_chain(self):
+        legacy_path = f"{os.path.splitext(self.storage_path)[0]}.json"
+        if self.append_only and not os.path.exists(self.storage_path) and os.path.exists(legacy_path):
+            self._migrate_legacy_chain(legacy_path)
         try:
             if os.path.exists(self.storage_path):
                 with open(self.storage_path, "r") as f:
-                    self.chain = json.load(f)
+                    if self.append_only:
+                        self.chain = []
+                        for line in f:
+                            if not line.endswith("\n"):
+                                logger.warning("LEDGER: Ignoring torn trailing block record.")
+                                break
+                            self.chain.append(json.loads(line))
+                    else:
+                        self.chain = json.load(f)
                     logger.info(f"LEDGER: Loaded {len(self.chain)} blocks.")
         except Exception as e:
             logger.error(f"LEDGER: Failed to load: {e}")
             self.chain = []
 
+    def _migrate_legacy_chain(self, legacy_path: str):
+        """One-off import of a full-document `.json` chain into the append-only chain file."""
+        try:
+            with open(legacy_path, "r") as f:
+                self.chain = json.load(f)
+        except Exception as e:
+            logger.error(f"LEDGER: Failed to migrate {legacy_path}: {e}")
+            self.chain = []
+            return
+        self._persist()
+        logger.info(f"LEDGER: Migrated {len(self.chain)} blocks from {legacy_path} to {self.storage_path}.")
+
+    def export_json(self, path: str):
+        """Writes the chain in the legacy full-document JSON format."""
+        with self._lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(self.chain, f, indent=2)
+
     def log_sharia_transaction(self, tx_type: str, user_id: str, amount: float, designation: str) -> bool:
         """
         ARTICLE 240/245: Explicit Sharia-compliant transaction logging.
@@ -141,7 +322,11 @@ class BlockchainLedger:
             "audit_trail": f"V99.0_SHARIA_VERIFIED_{datetime.now().strftime('%Y%j')}"
         }
         self.add_transaction(sender=user_id, action=f"SHARIA_{tx_type}", data=data)
-        self.add_block(proof=100) # Immediate settlement for religious integrity
+        # Immediate settlement for religious integrity; mined off the request path when enabled.
+        if self.background_settlement:
+            self.settle_async(proof=100)
+        else:
+            self.add_block(proof=100)
         return True
 
 class UnifiedEvidenceGraph:
@@ -149,23 +334,34 @@ class UnifiedEvidenceGraph:
     ARTICLE AC: Persistent Unified Evidence Graph (UEG).
     Integrates formal proofs, Bayesian uncertainty, and Merkle-verified provenance.
     """
-    def __init__(self, persistence_path: str = "meta/ueg_graph.json"):
+    def __init__(self, persistence_path: str = "meta/ueg_graph.json", ledger: Optional[BlockchainLedger] = None):
         self.persistence_path = persistence_path
         self.graph = nx.DiGraph()
-        self.ledger = BlockchainLedger()
+        # Append-only chain file; Sharia settlements are mined off the request path.
+        self.ledger = ledger or BlockchainLedger(storage_path="meta/ledger.jsonl", background_settlement=True)
+        # Batch state: nesting depth, buffered ledger payloads and an undo log for rollback.
+        self._batch_depth = 0
+        self._batch_nodes: List[Dict[str, Any]] = []
+        self._batch_edges: List[Dict[str, Any]] = []
+        self._batch_updates: List[Dict[str, Any]] = []
+        self._batch_undo: List[Tuple[str, Any, Optional[Dict[str, Any]]]] = []
+        # Relation-typed adjacency: relation -> target -> sources (and the reverse).
+        self._in_index: Dict[str, Dict[str, Set[str]]] = {}
+        self._out_index: Dict[str, Dict[str, Set[str]]] = {}
+        self._change_listeners: List[Set[str]] = []
         self._load()
 
     def _load(self):
-        if os.path.exists(self.persistence_path):
-            try:
-                with open(self.persistence_path, 'r') as f:
-                    data = json.load(f)
-                    for node in data.get('nodes', []):
-                        self.graph.add_node(node['id'], **node['metadata'])
-                    for edge in data.get('edges', []):
-                        self.graph.add_edge(edge['source'], edge['target'], **edge['metadata'])
-            except Exception as e:
-                logger.debug(f"UEG: Load skip: {e}")
+        try:
+            # Snapshot plus any UEGManager log records not yet compacted into it.
+            data = read_graph(self.persistence_path)
+            for node in data.get('nodes', []):
+                self.graph.add_node(node['id'], **node['metadata'])
+            for edge in data.get('edges', []):
+                self.graph.add_edge(edge['source'], edge['target'], **edge['metadata'])
+                self._index_edge(edge['source'], edge['target'], edge['metadata'].get('relation'))
+        except Exception as e:
+            logger.debug(f"UEG: Load skip: {e}")
 
     def _save(self):
         os.makedirs(os.path.dirname(self.persistence_path), exist_ok=True)
@@ -176,11 +372,121 @@ class UnifiedEvidenceGraph:
         with open(self.persistence_path, 'w') as f:
             json.dump(data, f, indent=2)
 
+    def _index_edge(self, source_id: str, target_id: str, relation: Optional[str]):
+        self._in_index.setdefault(relation, {}).setdefault(target_id, set()).add(source_id)
+        self._out_index.setdefault(relation, {}).setdefault(source_id, set()).add(target_id)
+        for listener in self._change_listeners:
+            listener.add(source_id)
+            listener.add(target_id)
+
+    def _unindex_edge(self, source_id: str, target_id: str, relation: Optional[str]):
+        for index, key, member in ((self._in_index, target_id, source_id), (self._out_index, source_id, target_id)):
+            bucket = index.get(relation, {}).get(key)
+            if bucket is not None:
+                bucket.discard(member)
+                if not bucket:
+                    del index[relation][key]
+        for listener in self._change_listeners:
+            listener.add(source_id)
+            listener.add(target_id)
+
+    def sources(self, target_id: str, relation: str) -> Set[str]:
+        """Nodes with a `relation` edge pointing at target_id (O(1) index lookup)."""
+        return self._in_index.get(relation, {}).get(target_id, set())
+
+    def targets(self, source_id: str, relation: str) -> Set[str]:
+        """Nodes that source_id points at via a `relation` edge."""
+        return self._out_index.get(relation, {}).get(source_id, set())
+
+    def edges_by_relation(self, relation: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for target_id, source_ids in list(self._in_index.get(relation, {}).items()):
+            for source_id in list(source_ids):
+                yield source_id, target_id, self.graph.edges[source_id, target_id]
+
+    def track_changes(self) -> Set[str]:
+        """
+        Registers a change set that collects the endpoints of every edge mutation.
+        Consumers (e.g. incremental CTMS) drain it themselves.
+        """
+        listener: Set[str] = set()
+        self._change_listeners.append(listener)
+        return listener
+
+    def untrack_changes(self, listener: Set[str]):
+        self._change_listeners = [l for l in self._change_listeners if l is not listener]
+
+    @property
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator["UnifiedEvidenceGraph"]:
+        """
+        Buffers mutations and persists them once on exit.
+        The whole batch is recorded as a single ledger transaction; if the block raises,
+        every buffered mutation is rolled back from the in-memory graph. Batches nest:
+        a failing inner batch undoes only its own mutations, so an outer batch that
+        catches the error commits what it buffered before and after.
+        """
+        mark = (len(self._batch_undo), len(self._batch_nodes), len(self._batch_edges), len(self._batch_updates))
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            self._rollback_batch(mark)
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._flush_batch()
+
+    def _reset_batch(self):
+        self._batch_nodes, self._batch_edges, self._batch_updates, self._batch_undo = [], [], [], []
+
+    def _flush_batch(self):
+        nodes, edges, updates = self._batch_nodes, self._batch_edges, self._batch_updates
+        self._reset_batch()
+        if not nodes and not edges and not updates:
+            return
+        self.ledger.add_transaction('system', 'BATCH_MUTATION', {'nodes': nodes, 'edges': edges, 'updates': updates})
+        self._save()
+        logger.info(f"UEG: Batch committed ({len(nodes)} nodes, {len(edges)} edges, {len(updates)} updates).")
+
+    def _rollback_batch(self, mark: Tuple[int, int, int, int] = (0, 0, 0, 0)):
+        """Undoes the mutations buffered since `mark` (buffer lengths when the batch level was entered)."""
+        undo_mark, nodes_mark, edges_mark, updates_mark = mark
+        undone = self._batch_undo[undo_mark:]
+        for kind, key, previous in reversed(undone):
+            if kind == 'node':
+                if previous is None:
+                    self.graph.remove_node(key)
+                else:
+                    self.graph.nodes[key].clear()
+                    self.graph.nodes[key].update(previous)
+            else:
+                self._unindex_edge(*key, self.graph.edges[key].get('relation'))
+                if previous is None:
+                    self.graph.remove_edge(*key)
+                else:
+                    self.graph.edges[key].clear()
+                    self.graph.edges[key].update(previous)
+                    self._index_edge(*key, previous.get('relation'))
+        logger.warning(f"UEG: Batch rolled back ({len(undone)} mutations discarded).")
+        del self._batch_undo[undo_mark:], self._batch_nodes[nodes_mark:]
+        del self._batch_edges[edges_mark:], self._batch_updates[updates_mark:]
+
     def add_node(self, node_id: str, node_type: str, metadata: Optional[Dict[str, Any]] = None):
         metadata = metadata or {}
         metadata['type'] = node_type
         metadata['version'] = "v99.Transcendent"
         metadata['timestamp'] = time.time()
+        if self.in_batch:
+            previous = dict(self.graph.nodes[node_id]) if node_id in self.graph else None
+            self._batch_undo.append(('node', node_id, previous))
+            self.graph.add_node(node_id, **metadata)
+            self._batch_nodes.append({'id': node_id, 'metadata': metadata})
+            logger.debug(f"UEG: Node buffered [{node_type}] {node_id}")
+            return
         self.graph.add_node(node_id, **metadata)
         self.ledger.add_transaction('system', 'ADD_NODE', {'id': node_id, 'metadata': metadata})
         self._save()
@@ -194,12 +500,68 @@ class UnifiedEvidenceGraph:
         metadata = metadata or {}
         metadata['relation'] = relation
         metadata['timestamp'] = time.time()
+        previous = self.graph.edges[source_id, target_id] if self.graph.has_edge(source_id, target_id) else None
+        if previous is not None:
+            self._unindex_edge(source_id, target_id, previous.get('relation'))
+        if self.in_batch:
+            key = (source_id, target_id)
+            self._batch_undo.append(('edge', key, dict(previous) if previous is not None else None))
+            self.graph.add_edge(source_id, target_id, **metadata)
+            self._index_edge(source_id, target_id, relation)
+            self._batch_edges.append({'source': source_id, 'target': target_id, 'metadata': metadata})
+            logger.debug(f"UEG: Edge buffered {source_id} --({relation})--> {target_id}")
+            return True
         self.graph.add_edge(source_id, target_id, **metadata)
+        self._index_edge(source_id, target_id, relation)
         self.ledger.add_transaction('system', 'ADD_EDGE', {'source': source_id, 'target': target_id, 'metadata': metadata})
         self._save()
         logger.info(f"UEG: Edge added {source_id} --({relation})--> {target_id}")
         return True
 
+    def update_node(self, node_id: str, **attributes) -> bool:
+        """Updates attributes of an existing node (e.g. CTMS status/confidence revisions)."""
+        if node_id not in self.graph:
+            return False
+        if self.in_batch:
+            self._batch_undo.append(('node', node_id, dict(self.graph.nodes[node_id])))
+            self.graph.nodes[node_id].update(attributes)
+            self._batch_updates.append({'id': node_id, 'attributes': attributes})
+            return True
+        self.graph.nodes[node_id].update(attributes)
+        self.ledger.add_transaction('system', 'UPDATE_NODE', {'id': node_id, 'attributes': attributes})
+        self._save()
+        return True
+
+    def bulk_add_nodes(self, nodes: Iterable[Union[Tuple, Dict[str, Any]]]) -> int:
+        """
+        Adds many nodes with a single write and ledger transaction.
+        Accepts (node_id, node_type[, metadata]) tuples or {'id', 'type', 'metadata'} dicts.
+        """
+        count = 0
+        with self.batch():
+            for node in nodes:
+                if isinstance(node, dict):
+                    self.add_node(node['id'], node['type'], node.get('metadata'))
+                else:
+                    self.add_node(*node)
+                count += 1
+        return count
+
+    def bulk_add_edges(self, edges: Iterable[Union[Tuple, Dict[str, Any]]]) -> int:
+        """
+        Adds many edges with a single write and ledger transaction; returns how many were accepted.
+        Accepts (source, target, relation[, metadata]) tuples or {'source', 'target', 'relation', 'metadata'} dicts.
+        """
+        count = 0
+        with self.batch():
+            for edge in edges:
+                if isinstance(edge, dict):
+                    added = self.add_edge(edge['source'], edge['target'], edge['relation'], edge.get('metadata'))
+                else:
+                    added = self.add_edge(*edge)
+                count += int(added)
+        return count
+
     def get_subgraph(self, start_node: str) -> Dict[str, Any]:
         """Simple traversal to get related knowledge components."""
         if start_node not in self.graph:
@@ -216,3 +578,9 @@ class UnifiedEvidenceGraph:
     def commit(self):
         """Anchors current transactions into a blockchain block."""
         return self.ledger.add_block(proof=123)
+
+    def get_edges(self):
+        return self.graph.edges(data=True)
+
+    def get_nodes(self):
+        return self.graph.nodes(data=True)
@@ -1,8 +1,7 @@
-import json
-import os
 import logging
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from agentic_core.ueg.storage import UEGStorageEngine, AppendOnlyLogStorage
 
 logger = logging.getLogger(__name__)
 
@@ -11,15 +10,28 @@ class UEGManager:
     v60 Mastery: Unified Evidence Graph Manager.
     Manages the semantic relationships and provenance of all scientific claims.
     """
-    def __init__(self, storage_path: str = "meta/ueg_graph.json"):
+    def __init__(self, storage_path: str = "meta/ueg_graph.json", storage: Optional[UEGStorageEngine] = None):
         self.storage_path = storage_path
+        # Mutations go to an append-only log; storage_path holds the compacted snapshot.
+        # Managers on the same path share one engine (and graph): the log has a single owner.
+        self.storage = storage or AppendOnlyLogStorage.shared(storage_path)
         self.graph = self._load_graph()
 
     def _load_graph(self) -> Dict[str, Any]:
-        if os.path.exists(self.storage_path):
-            with open(self.storage_path, 'r') as f:
-                return json.load(f)
-        return {"nodes": [], "edges": []}
+        return self.storage.load()
+
+    def _append_node(self, node: Dict[str, Any]):
+        self.graph["nodes"].append(node)
+        self.storage.append(self.graph, {"op": "add_node", "node": node})
+
+    def _append_nodes(self, nodes: List[Dict[str, Any]]):
+        self.graph["nodes"].extend(nodes)
+        self.storage.append_many(self.graph, [{"op": "add_node", "node": node} for node in nodes])
+
+    def add_node(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Appends a prebuilt node (e.g. from GeneticMemory) to the graph."""
+        self._append_node(node)
+        return node
 
     def add_claim(self, claim: str, evidence: List[str], claim_type: str = "hypothesis"):
         node = {
@@ -28,8 +40,7 @@ class UEGManager:
             "content": claim,
             "evidence": evidence
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_product_specification(self, product_name: str, specs: Dict[str, Any], trace_id: str):
@@ -42,8 +53,7 @@ class UEGManager:
             "trace_id": trace_id,
             "timestamp": time.time()
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_design_artifact(self, artifact_type: str, metadata: Dict[str, Any], trace_id: str):
@@ -56,8 +66,7 @@ class UEGManager:
             "trace_id": trace_id,
             "timestamp": time.time()
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_agent_task(self, goal: str, parent_id: str = None):
@@ -70,8 +79,7 @@ class UEGManager:
             "status": "pending",
             "created_at": time.time()
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_execution_plan(self, task_id: str, steps: List[Dict[str, Any]]):
@@ -83,8 +91,7 @@ class UEGManager:
             "steps": steps,
             "status": "created"
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_sandbox(self, task_id: str, environment_info: Dict[str, Any]):
@@ -96,8 +103,7 @@ class UEGManager:
             "info": environment_info,
             "status": "active"
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_audit_log(self, source_id: str, message: str, metadata: Dict[str, Any] = None):
@@ -116,8 +122,7 @@ class UEGManager:
             logger.info(f"UEG: Broadcasting audit event to federated partners.")
             node["federated_status"] = "BROADCAST_PENDING"
 
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_conversation(self, url: str, transcript: List[Dict[str, Any]], metadata: Dict[str, Any] = None):
@@ -130,8 +135,7 @@ class UEGManager:
             "metadata": metadata or {},
             "timestamp": time.time() if 'time' in globals() else None
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
     def add_insight(self, content: str, source_id: str, category: str = "key_insight", confidence: float = 0.9, metadata: Dict[str, Any] = None):
@@ -145,11 +149,36 @@ class UEGManager:
             "confidence": confidence,
             "metadata": metadata or {}
         }
-        self.graph["nodes"].append(node)
-        self._save()
+        self._append_node(node)
         return node
 
+    def add_insights(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batched add_insight: each entry takes add_insight's keyword arguments; persisted in one write."""
+        base = len(self.graph["nodes"])
+        nodes = [{
+            "id": f"insight_{base + i}",
+            "type": "ExtractedInsight",
+            "content": insight["content"],
+            "source": insight["source_id"],
+            "category": insight.get("category", "key_insight"),
+            "confidence": insight.get("confidence", 0.9),
+            "metadata": insight.get("metadata") or {}
+        } for i, insight in enumerate(insights)]
+        self._append_nodes(nodes)
+        return nodes
+
     def _save(self):
-        os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-        with open(self.storage_path, 'w') as f:
-            json.dump(self.graph, f, indent=4)
+        """Compacts pending log records into the snapshot at storage_path."""
+        self.storage.compact(self.graph)
+
+    def export_json(self, path: Optional[str] = None, indent: int = 4) -> str:
+        """Writes the full graph in the legacy UEG JSON format."""
+        path = path or self.storage_path
+        if path == self.storage_path:
+            self._save()
+        else:
+            self.storage.export_json(self.graph, path, indent=indent)
+        return path
+
+    def close(self):
+        self.storage.close(self.graph)
@@ -1,10 +1,11 @@
 import logging
 from typing import Dict, Any, List, Optional
 from .registry import TwinRegistry
-from .physics import PhysicsEngineInterface
+from .physics import BodyArrays, PhysicsEngineInterface
 from .abm import ABMEngine
 from .lifecycle import TwinLifecycleManager
 from .fidelity import FidelityScorer
+from .forecast import ForecastEngine
 
 logger = logging.getLogger(__name__)
 
@@ -14,12 +15,15 @@ class EnvironmentalSimulator:
     Unifies physical and social simulations across the ecosystem.
     Governed by Articles 303-304.
     """
+    DT = 0.01
+
     def __init__(self):
         self.registry = TwinRegistry()
         self.physics = PhysicsEngineInterface()
         self.abm = ABMEngine()
         self.lifecycle = TwinLifecycleManager()
         self.scorer = FidelityScorer()
+        self.forecaster = ForecastEngine()
         logger.info("ESE: Environmental Simulator Engine Awakened.")
 
     async def run_simulation(self, twin_id: str, steps: int = 10, mode: str = "physics") -> Dict[str, Any]:
@@ -36,10 +40,10 @@ class EnvironmentalSimulator:
         state = twin["state"]
 
         if mode == "physics":
-            bodies = state.get("data", {}).get("bodies", [])
-            for _ in range(steps):
-                bodies = await self.physics.simulate_step(bodies, 0.01)
-            state["data"]["bodies"] = bodies
+            # Pack once, step every body together for all steps, unpack once.
+            bodies = BodyArrays.from_bodies(state.get("data", {}).get("bodies", []))
+            self.physics.step_arrays(bodies, self.DT, steps)
+            state["data"]["bodies"] = bodies.to_bodies()
 
         elif mode == "abm":
             # For ABM, we assume agents are pre-loaded into the engine for the session
@@ -51,9 +55,7 @@ class EnvironmentalSimulator:
 
             summary = await self.abm.step(steps)
             state["data"]["summary"] = summary
-            state["data"]["agents"] = [
-                {"id": id, "attributes": a.attributes} for id, a in self.abm.agents.items()
-            ]
+            state["data"]["agents"] = self.abm.export_agents()
 
         # Calculate and update fidelity
         fidelity = self.scorer.score_fidelity(state)
@@ -68,9 +70,18 @@ class EnvironmentalSimulator:
             "state": state
         }
 
-    async def forecast(self, twin_id: str, horizon_steps: int) -> Dict[str, Any]:
+    async def forecast(self, twin_id: str, horizon_steps: int, ensemble_size: int = 32,
+                       mode: Optional[str] = None) -> Dict[str, Any]:
         """
         Predicts future states without updating the registry (sandbox forecast).
+        Returns quantile bands over a perturbed ensemble; see ForecastEngine.
         """
         # Implementation of Article 303: Predictive Accuracy
-        return {"forecast": "STABLE", "confidence": 0.97}
+        twin = self.registry.get_twin(twin_id)
+        if not twin:
+            logger.error(f"ESE: Twin {twin_id} not found in registry.")
+            return {"error": "Twin not found"}
+
+        engine_config = {"integrator": self.physics.integrator, "gravity": self.physics.gravity,
+                         "G": self.physics.G, "theta": self.physics.theta, "softening": self.physics.softening}
+        return await self.forecaster.forecast(twin, horizon_steps, ensemble_size, mode, self.DT, engine_config)
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import os
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from .abm import ABMEngine
+from .physics import BodyArrays, PhysicsEngineInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+def _checkpoints(horizon_steps: int, count: int = 10) -> List[int]:
+    """Up to `count` evenly spaced steps in (0, horizon], always including the horizon."""
+    steps = {int(s) for s in np.linspace(0, horizon_steps, count + 1)[1:].round()}
+    # Short horizons round the first few fractions down to step 0, which is not a forecast.
+    return sorted({s for s in steps if s > 0} | {horizon_steps})
+
+
+def _member_rng(seed: int, member: int) -> np.random.Generator:
+    return np.random.default_rng([seed, member])
+
+
+def run_physics_members(base: Dict[str, np.ndarray], members: Sequence[int], checkpoints: Sequence[int], dt: float,
+                        engine_config: Dict[str, Any], perturbation: float, seed: int) -> np.ndarray:
+    """
+    Runs ensemble `members` forward from the shared read-only `base` arrays and returns
+    positions at each checkpoint, shaped (members, checkpoints, bodies, 3). Member 0 is the
+    unperturbed control run. Without mutual gravity the members are independent, so they
+    are stacked into one BodyArrays and stepped as a single batch.
+    """
+    engine = PhysicsEngineInterface(**engine_config)
+    n = len(base["position"])
+    stores = []
+    for member in members:
+        rng = _member_rng(seed, member)
+        noise = perturbation if member else 0.0
+        # Copy-on-write fork: only the arrays this member mutates are materialised.
+        stores.append((base["position"] + rng.normal(0, noise, base["position"].shape),
+                       base["velocity"] + rng.normal(0, noise, base["velocity"].shape)))
+    if engine.gravity is None:
+        batches = [BodyArrays(list(range(n * len(stores))), np.concatenate([p for p, _ in stores]),
+                              np.concatenate([v for _, v in stores]), np.tile(base["acceleration"], (len(stores), 1)),
+                              np.tile(base["mass"], len(stores)))]
+    else:
+        batches = [BodyArrays(list(range(n)), p, v, base["acceleration"].copy(), base["mass"]) for p, v in stores]
+
+    out = np.empty((len(stores), len(checkpoints), n, 3))
+    for batch_index, batch in enumerate(batches):
+        done = 0
+        for c, step in enumerate(checkpoints):
+            engine.step_arrays(batch, dt, step - done)
+            done = step
+            if engine.gravity is None:
+                out[:, c] = batch.position.reshape(len(stores), n, 3)
+            else:
+                out[batch_index, c] = batch.position
+    return out
+
+
+def run_abm_members(agents: List[Dict[str, Any]], members: Sequence[int], checkpoints: Sequence[int],
+                    perturbation: float, seed: int) -> np.ndarray:
+    """Runs ABM ensemble members; returns (members, checkpoints, 2) of average and std utility."""
+    ids = [a["id"] for a in agents]
+    strategies = [a["attributes"].get("strategy", ABMEngine.DEFAULT_STRATEGY) for a in agents]
+    utilities = np.array([a["attributes"].get("utility", 0) for a in agents], dtype=np.float64)
+    out = np.empty((len(members), len(checkpoints), 2))
+    for m, member in enumerate(members):
+        engine = ABMEngine(history_size=0, workers=1, seed=seed + member)
+        noise = perturbation if member else 0.0
+        engine.add_agents(ids, strategies, utilities + _member_rng(seed, member).normal(0, noise, len(ids)))
+        done = 0
+        for c, step in enumerate(checkpoints):
+            summary = asyncio.run(engine.step(step - done))
+            done = step
+            out[m, c] = summary["avg_utility"], summary["std_utility"]
+    return out
+
+
+class ForecastEngine:
+    """
+    ARTICLE 303: Predictive Accuracy.
+    Sandbox ensemble forecasts for digital twins. The twin state is forked copy-on-write into
+    `ensemble_size` perturbed members that run `horizon_steps` of physics or ABM simulation
+    over a process pool of `workers`; the registry is never written. Results are quantile
+    bands at evenly spaced checkpoints, cached per (twin, version, horizon, ensemble size)
+    so repeated polls of an unchanged twin are served without recomputation.
+    """
+    def __init__(self, workers: Optional[int] = None, cache_size: int = 64, perturbation: float = 0.01,
+                 quantiles: Sequence[float] = DEFAULT_QUANTILES, seed: int = 0):
+        self.workers = workers if workers is not None else min(8, os.cpu_count() or 1)
+        self.cache_size = cache_size
+        self.perturbation = perturbation
+        self.quantiles = tuple(quantiles)
+        self.seed = seed
+        self.stats = {"hits": 0, "computed": 0}
+        self._cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def forecast(self, twin: Dict[str, Any], horizon_steps: int, ensemble_size: int = 32,
+                       mode: Optional[str] = None, dt: float = 0.01,
+                       engine_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        data = twin["state"].get("data", {})
+        mode = mode or ("physics" if data.get("bodies") else "abm" if data.get("agents") else None)
+        key = (twin["twin_id"], twin["version"], horizon_steps, ensemble_size, mode)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return {**self._cache[key], "cached": True}
+        if key in self._inflight:
+            # Another poll is already computing this forecast; share its result.
+            self.stats["hits"] += 1
+            return {**await asyncio.shield(self._inflight[key]), "cached": True}
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._compute(twin, mode, horizon_steps, ensemble_size, dt, engine_config or {})
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here so an unawaited failure is not reported twice
+            raise
+        finally:
+            del self._inflight[key]
+        self.stats["computed"] += 1
+        self._cache[key] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return {**result, "cached": False}
+
+    def _chunks(self, ensemble_size: int) -> List[List[int]]:
+        shards = self.workers if self.workers > 1 and ensemble_size >= 2 * self.workers else 1
+        return [list(chunk) for chunk in np.array_split(np.arange(ensemble_size), shards)]
+
+    async def _run(self, fn, args_per_chunk: List[Tuple]) -> np.ndarray:
+        if len(args_per_chunk) == 1:
+            return await asyncio.to_thread(fn, *args_per_chunk[0])
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=len(args_per_chunk)) as pool:
+            parts = await asyncio.gather(*(loop.run_in_executor(pool, fn, *args) for args in args_per_chunk))
+        return np.concatenate(parts)
+
+    async def _compute(self, twin: Dict[str, Any], mode: Optional[str], horizon_steps: int, ensemble_size: int,
+                       dt: float, engine_config: Dict[str, Any]) -> Dict[str, Any]:
+        result = {
+            "twin_id": twin["twin_id"],
+            "version": twin["version"],
+            "mode": mode,
+            "horizon_steps": horizon_steps,
+            "ensemble_size": ensemble_size,
+            "quantiles": list(self.quantiles),
+            "steps": [],
+            "bands": {}
+        }
+        data = twin["state"].get("data", {})
+        if mode is None or horizon_steps <= 0 or ensemble_size <= 0:
+            return {**result, "forecast": "STABLE", "confidence": 1.0}
+
+        checkpoints = _checkpoints(horizon_steps)
+        chunks = self._chunks(ensemble_size)
+        logger.info(f"Forecast: {ensemble_size}-member {mode} ensemble for {twin['twin_id']} "
+                    f"v{twin['version']} over {horizon_steps} steps ({len(chunks)} shards).")
+        if mode == "physics":
+            bodies = BodyArrays.from_bodies(data["bodies"])
+            base = {"position": bodies.position, "velocity": bodies.velocity,
+                    "acceleration": bodies.acceleration, "mass": bodies.mass}
+            samples = await self._run(run_physics_members, [
+                (base, chunk, checkpoints, dt, engine_config, self.perturbation, self.seed) for chunk in chunks
+            ])
+            bands = np.quantile(samples, self.quantiles, axis=0)  # (q, checkpoints, bodies, 3)
+            result["bands"] = {"position": np.moveaxis(bands, 0, 1).tolist(), "body_ids": bodies.ids}
+            spread = bands[-1] - bands[0]
+            scale = np.abs(bands[len(self.quantiles) // 2])
+        elif mode == "abm":
+            samples = await self._run(run_abm_members, [
+                (data["agents"], chunk, checkpoints, self.perturbation, self.seed) for chunk in chunks
+            ])
+            bands = np.quantile(samples, self.quantiles, axis=0)  # (q, checkpoints, 2)
+            result["bands"] = {"avg_utility": bands[..., 0].T.tolist(), "std_utility": bands[..., 1].T.tolist()}
+            spread = bands[-1, :, 0] - bands[0, :, 0]
+            scale = np.abs(bands[len(self.quantiles) // 2, :, 0])
+        else:
+            raise ValueError(f"Unknown forecast mode {mode}")
+
+        # Ensemble agreement: outer band width relative to the median trajectory's magnitude.
+        confidence = float(np.clip(1.0 - np.mean(spread) / (np.mean(scale) + 1e-9), 0.0, 1.0))
+        result["steps"] = checkpoints
+        return {**result, "forecast": "STABLE" if confidence >= 0.9 else "DIVERGENT", "confidence": confidence}
@@ -0,0 +1,380 @@
+import json
+import os
+import glob
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # No advisory locks (Windows): writers are only serialised in-process.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def apply_record(graph: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Applies a single logged mutation to an in-memory UEG document."""
+    op = record.get("op")
+    if op == "add_node":
+        graph.setdefault("nodes", []).append(record["node"])
+    elif op == "add_edge":
+        graph.setdefault("edges", []).append(record["edge"])
+    else:
+        logger.warning(f"UEG Storage: Unknown log operation '{op}' skipped.")
+
+
+def _atomic_write(path: str, text: str, fsync: bool = False):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _atomic_write_json(path: str, data: Dict[str, Any], indent: Optional[int] = None, fsync: bool = False):
+    _atomic_write(path, json.dumps(data, indent=indent), fsync=fsync)
+
+
+class UEGStorageEngine:
+    """
+    Pluggable persistence backend for UEGManager.
+    Engines load the graph document once and persist each mutation as it happens.
+    """
+    def load(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def append(self, graph: Dict[str, Any], record: Dict[str, Any]):
+        """Persists one mutation. `graph` already contains its effect."""
+        raise NotImplementedError
+
+    def append_many(self, graph: Dict[str, Any], records: List[Dict[str, Any]]):
+        """Persists a batch of mutations; engines override this to pay the write cost once."""
+        for record in records:
+            self.append(graph, record)
+
+    def compact(self, graph: Dict[str, Any]):
+        """Folds any pending log state into the snapshot."""
+
+    def export_json(self, graph: Dict[str, Any], path: str, indent: int = 4):
+        _atomic_write_json(path, graph, indent=indent)
+
+    def close(self, graph: Optional[Dict[str, Any]] = None):
+        """Releases file handles (and compacts when the graph is supplied)."""
+
+
+class JSONFileStorage(UEGStorageEngine):
+    """Legacy engine: rewrites the whole JSON document on every mutation."""
+    def __init__(self, path: str = "meta/ueg_graph.json", indent: int = 4):
+        self.path = path
+        self.indent = indent
+
+    def load(self) -> Dict[str, Any]:
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                graph = json.load(f)
+            graph.pop(AppendOnlyLogStorage.SEQ_KEY, None)
+            return graph
+        return {"nodes": [], "edges": []}
+
+    def append(self, graph: Dict[str, Any], record: Dict[str, Any]):
+        self.compact(graph)
+
+    def append_many(self, graph: Dict[str, Any], records: List[Dict[str, Any]]):
+        if records:
+            self.compact(graph)
+
+    def compact(self, graph: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(graph, f, indent=self.indent)
+
+
+class AppendOnlyLogStorage(UEGStorageEngine):
+    """
+    Write-ahead log engine: one JSON line per mutation in rolling segment files,
+    periodically compacted into a snapshot in the legacy UEG JSON format.
+
+    Several engines (and processes) may write the same log. Each append and compaction
+    holds an exclusive lock on the log directory only for its duration, and first folds
+    in records other writers appended since, so compaction never drops them. UEGManagers
+    in one process share an engine (and its graph) through shared(); read-only consumers
+    use read_graph(), which takes no lock.
+
+    checkpoint.json in the log directory records the last sequence number folded into
+    the snapshot, keyed by the snapshot's digest, so a crash between writing the
+    snapshot and pruning segments never replays a record twice. A torn trailing line
+    left by a crash mid-append is discarded on replay.
+    """
+    SEQ_KEY = "wal_seq"  # watermark key written into snapshots by earlier versions
+    _shared: Dict[str, "AppendOnlyLogStorage"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, snapshot_path: str = "meta/ueg_graph.json", log_dir: Optional[str] = None,
+                 segment_max_records: int = 10000, compact_every: int = 50000, fsync: bool = False,
+                 indent: int = 4):
+        self.snapshot_path = snapshot_path
+        self.log_dir = log_dir or f"{os.path.splitext(snapshot_path)[0]}.wal"
+        self.segment_max_records = segment_max_records
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.indent = indent
+
+        self.seq = 0
+        self.snapshot_seq = 0
+        self.snapshot_size = 0
+        # Read position in the log: (segment index, byte offset, records in that segment).
+        self._tail: Tuple[int, int, int] = (0, 0, 0)
+        self._checkpoint: Dict[str, Any] = {}
+        self._snapshot_current = True
+        self._handle = None
+        self._handle_index = 0
+        self._mutex = threading.RLock()
+        self._graph: Optional[Dict[str, Any]] = None
+        self._users = 0
+        self.closed = False
+
+    @classmethod
+    def shared(cls, snapshot_path: str = "meta/ueg_graph.json") -> "AppendOnlyLogStorage":
+        """The process-wide engine for snapshot_path; every caller must close() it once."""
+        key = os.path.abspath(f"{os.path.splitext(snapshot_path)[0]}.wal")
+        with cls._shared_lock:
+            engine = cls._shared.get(key)
+            if engine is None or engine.closed:
+                engine = cls._shared[key] = cls(snapshot_path)
+            engine._users += 1
+            return engine
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access to the log directory; waits for any other writer to finish."""
+        with self._mutex:
+            os.makedirs(self.log_dir, exist_ok=True)
+            with open(os.path.join(self.log_dir, "LOCK"), 'a') as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    # --- Startup -----------------------------------------------------------------
+
+    def load(self) -> Dict[str, Any]:
+        if self._graph is None:
+            with self._locked():
+                self._graph = self._replay(truncate=True)
+        return self._graph
+
+    def _checkpoint_path(self) -> str:
+        return os.path.join(self.log_dir, "checkpoint.json")
+
+    def _read_checkpoint(self) -> Dict[str, Any]:
+        try:
+            with open(self._checkpoint_path(), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        graph: Dict[str, Any] = {"nodes": [], "edges": []}
+        digest = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            try:
+                graph = json.loads(raw)
+            except json.JSONDecodeError as e:
+                logger.error(f"UEG Storage: Snapshot {self.snapshot_path} unreadable ({e}); replaying log only.")
+        graph.setdefault("nodes", [])
+        graph.setdefault("edges", [])
+
+        legacy_seq = int(graph.pop(self.SEQ_KEY, 0))
+        self._checkpoint = self._read_checkpoint()
+        self._snapshot_current = not self._checkpoint or self._checkpoint.get("sha256") == digest
+        if digest is not None and self._checkpoint.get("sha256") == digest:
+            self.snapshot_seq = int(self._checkpoint["seq"])
+        else:
+            # The checkpoint was written ahead of a snapshot that never landed.
+            self.snapshot_seq = max(int(self._checkpoint.get("previous_seq", 0)), legacy_seq)
+        return graph
+
+    def _replay(self, truncate: bool) -> Dict[str, Any]:
+        graph = self._read_snapshot()
+        self.seq = self.snapshot_seq
+        self.snapshot_size = len(graph["nodes"]) + len(graph["edges"])
+        self._tail = (0, 0, 0)
+        replayed = self._catch_up(graph, truncate)
+        if replayed:
+            logger.info(f"UEG Storage: Replayed {replayed} log records from {self.log_dir}.")
+        return graph
+
+    def _catch_up(self, graph: Dict[str, Any], truncate: bool) -> int:
+        """Applies records appended since the read position; returns how many were new."""
+        replayed = 0
+        index, offset, count = self._tail
+        for segment_index, path in self._segments():
+            if segment_index < index:
+                continue
+            if segment_index > index:
+                index, offset, count = segment_index, 0, 0
+            records, offset = self._read_segment(path, offset, truncate)
+            count += len(records)
+            for record in records:
+                seq = record.get("seq", 0)
+                if seq > self.seq:
+                    apply_record(graph, record)
+                    self.seq = seq
+                    replayed += 1
+        self._tail = (index, offset, count)
+        return replayed
+
+    def _sync(self, graph: Dict[str, Any], pending: Optional[List[Dict[str, Any]]] = None):
+        """
+        Under the lock: brings `graph` up to date with other writers of the log.
+        `pending` are records the caller already applied but has not logged yet.
+        """
+        checkpoint = self._read_checkpoint()
+        if checkpoint != self._checkpoint:
+            # Another engine compacted: its snapshot may hold records this graph never saw.
+            self._close_handle()
+            if int(checkpoint.get("seq", 0)) > self.seq:
+                fresh = self._replay(truncate=True)
+                for record in pending or ():
+                    apply_record(fresh, record)
+                graph.clear()
+                graph.update(fresh)
+                return
+            self._checkpoint, self.snapshot_seq = checkpoint, int(checkpoint.get("seq", 0))
+            self._tail = (0, 0, 0)
+        self._catch_up(graph, truncate=True)
+
+    def _segments(self) -> List[tuple]:
+        segments = []
+        for path in glob.glob(os.path.join(self.log_dir, "segment_*.log")):
+            try:
+                index = int(os.path.basename(path)[len("segment_"):-len(".log")])
+            except ValueError:
+                continue
+            segments.append((index, path))
+        return sorted(segments)
+
+    def _read_segment(self, path: str, offset: int = 0, truncate: bool = True) -> Tuple[List[Dict[str, Any]], int]:
+        """Complete records from byte `offset` on, and the offset just past the last of them."""
+        records = []
+        good_offset = offset
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    break
+                good_offset += len(raw)
+                records.append(record)
+        if truncate and good_offset != os.path.getsize(path):
+            logger.warning(f"UEG Storage: Truncating torn tail of {path} at byte {good_offset}.")
+            with open(path, 'r+b') as f:
+                f.truncate(good_offset)
+        return records, good_offset
+
+    # --- Mutation path -------------------------------------------------------------
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.log_dir, f"segment_{index:08d}.log")
+
+    def _close_handle(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+
+    def append(self, graph: Dict[str, Any], record: Dict[str, Any]):
+        self.append_many(graph, [record])
+
+    def append_many(self, graph: Dict[str, Any], records: List[Dict[str, Any]]):
+        if not records:
+            return
+        with self._locked():
+            self._sync(graph, records)
+            index, _, count = self._tail
+            if index == 0 or count >= self.segment_max_records:
+                index, count = index + 1, 0
+            if self._handle is None or self._handle_index != index:
+                self._close_handle()
+                self._handle, self._handle_index = open(self._segment_path(index), 'a'), index
+
+            lines = []
+            for record in records:
+                self.seq += 1
+                lines.append(json.dumps({"seq": self.seq, **record}) + "\n")
+            self._handle.write("".join(lines))
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            self._tail = (index, self._handle.tell(), count + len(records))
+
+            # Compact once the log outgrows the snapshot, keeping rewrites amortised O(1).
+            if self.seq - self.snapshot_seq >= max(self.compact_every, self.snapshot_size):
+                self._compact(graph)
+
+    def compact(self, graph: Dict[str, Any]):
+        with self._locked():
+            self._sync(graph)
+            self._compact(graph)
+
+    def _compact(self, graph: Dict[str, Any]):
+        if self.seq == self.snapshot_seq and os.path.exists(self.snapshot_path):
+            return
+        payload = json.dumps(graph, indent=self.indent)
+        checkpoint = {"seq": self.seq, "sha256": hashlib.sha256(payload.encode()).hexdigest(),
+                      "previous_seq": self.snapshot_seq}
+        _atomic_write_json(self._checkpoint_path(), checkpoint, fsync=self.fsync)
+        _atomic_write(self.snapshot_path, payload, fsync=self.fsync)
+        self._checkpoint = checkpoint
+        self.snapshot_seq = self.seq
+        self.snapshot_size = len(graph.get("nodes", [])) + len(graph.get("edges", []))
+
+        self._close_handle()
+        for _, path in self._segments():
+            os.remove(path)
+        self._tail = (0, 0, 0)
+        logger.info(f"UEG Storage: Compacted log into snapshot at seq {self.seq}.")
+
+    def close(self, graph: Optional[Dict[str, Any]] = None):
+        with self._shared_lock:
+            if self._users > 1:
+                self._users -= 1
+                return
+            self._users = 0
+            self.closed = True
+        if graph is not None:
+            self.compact(graph)
+        self._close_handle()
+        self._graph = None
+
+
+def read_graph(snapshot_path: str = "meta/ueg_graph.json", log_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Current UEG document for read-only consumers: the snapshot plus every logged
+    mutation not yet compacted into it. Takes no lock and never repairs the log.
+    """
+    engine = AppendOnlyLogStorage(snapshot_path, log_dir)
+    for _ in range(5):
+        graph = engine._replay(truncate=False)
+        # A writer compacting meanwhile may have pruned segments this read relied on.
+        if engine._snapshot_current and engine._read_checkpoint() == engine._checkpoint:
+            break
+        time.sleep(0.01)
+    return graph
@@ -170,8 +170,8 @@ class PassiveSensory:
                     metadata=node_metadata
                 )
 
-                # Process through synthesis
-                await self.scraper.synthesis_pipeline.process_data_stream({
+                # Queue for synthesis; the pipeline applies backpressure when it falls behind
+                await self.scraper.synthesis_pipeline.submit({
                     "source": signal["source"],
                     "content": signal["content"],
                     "agent_id": "passive_sensory_01",
@@ -250,7 +250,7 @@ class DualModeScraper:
         # ARTICLE 611: Emit Trust Signal (Oxytocin)
         self.molecular_framework.emit_signal(Neurotransmitter.OXYTOCIN, 0.8, "mission_control")
 
-        results = []
+        results, pending = [], []
         # ARTICLE 616: Initialize Synaptic Vision Agent (Mode 4)
         vision_agent = BiomimeticVisionAgent(f"vision_{mission_id}")
 
@@ -276,13 +276,17 @@ class DualModeScraper:
                 "mission_id": mission_id
             }
 
-            # Knowledge Synthesis Pipeline
-            synthesis_report = await self.synthesis_pipeline.process_data_stream(agent_result)
+            # Knowledge Synthesis Pipeline (documents are synthesised concurrently, awaited below)
+            pending.append((url, agent_id, await self.synthesis_pipeline.submit(agent_result)))
+
+        for url, agent_id, report_future in pending:
+            synthesis_report = await report_future
             results.append(synthesis_report)
 
             # Evolutionary Reward (Article 586)
             if synthesis_report["triples_extracted"] > 0:
-                await self.ledger.credit_tokens(user_id, 1.0, f"Evolutionary Reward: High-fidelity extraction in mission {mission_id}")
+                await self.ledger.credit_tokens(user_id, 1.0, f"Evolutionary Reward: High-fidelity extraction in mission {mission_id}",
+                                                idempotency_key=f"reward:{mission_id}:{url}")
                 # Emit Reward Signal (Dopamine)
                 self.molecular_framework.emit_signal(Neurotransmitter.DOPAMINE, 0.9, agent_id)
 
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (payload, response headers); headers of None mark the payload as uncacheable (e.g. a simulated fallback).
+FetchResult = Tuple[Optional[Dict[str, Any]], Optional[Dict[str, str]]]
+
+
+class PageCache:
+    """
+    ARTICLE 399: Content-addressed scrape cache shared by the ingestion scrapers.
+    Entries are keyed by URL + extraction selector set and point at payload objects stored
+    once per content hash under `objects/`. Entries younger than `ttl` are served directly;
+    older ones are revalidated with their ETag/Last-Modified before a full re-scrape. The
+    object store is bounded to `max_bytes`, evicting least-recently-used entries.
+    """
+    def __init__(self, cache_dir: str = "meta/page_cache", ttl: float = 24 * 3600, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        # Opened lazily so constructing a scraper never touches the disk.
+        if self._conn is None:
+            os.makedirs(os.path.join(self.cache_dir, "objects"), exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.cache_dir, "index.db"), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            with self._conn:
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS entries (
+                        key TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        fetched_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (accessed_at)")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS objects (
+                        content_hash TEXT PRIMARY KEY,
+                        size INTEGER NOT NULL
+                    )
+                """)
+        return self._conn
+
+    @staticmethod
+    def cache_key(url: str, selectors: Iterable[str]) -> str:
+        return hashlib.sha256(f"{url}\n{json.dumps(sorted(selectors))}".encode()).hexdigest()
+
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, "objects", content_hash[:2], f"{content_hash}.json")
+
+    def lookup(self, url: str, selectors: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Returns the cached entry (payload, validators, `fresh` flag) or None."""
+        key = self.cache_key(url, selectors)
+        with self._lock:
+            row = self._db().execute(
+                "SELECT content_hash, etag, last_modified, fetched_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            content_hash, etag, last_modified, fetched_at = row
+            try:
+                with open(self._object_path(content_hash)) as f:
+                    payload = json.load(f)
+            except (OSError, ValueError):
+                logger.warning(f"PageCache: Object {content_hash[:10]} for {url} is missing or corrupt. Dropping it.")
+                with self._db():
+                    # Every entry sharing the object is broken too; dropping them frees the object and its size.
+                    self._db().execute("DELETE FROM entries WHERE content_hash = ?", (content_hash,))
+                    self._drop_unreferenced(content_hash)
+                return None
+            with self._db():
+                self._db().execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return {
+            "payload": payload,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+            "fresh": time.time() - fetched_at < self.ttl
+        }
+
+    def get_fresh(self, url: str, selectors: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Payload of an entry still within its TTL, counted as a hit; None otherwise."""
+        entry = self.lookup(url, selectors)
+        if entry and entry["fresh"]:
+            self.stats["hits"] += 1
+            return entry["payload"]
+        return None
+
+    def store(self, url: str, selectors: Iterable[str], payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        key = self.cache_key(url, selectors)
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        body = json.dumps(payload, sort_keys=True).encode()
+        content_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(content_hash)
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+            with db:
+                db.execute("INSERT OR IGNORE INTO objects (content_hash, size) VALUES (?, ?)", (content_hash, len(body)))
+                previous = db.execute("SELECT content_hash FROM entries WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, url, content_hash, etag, last_modified, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, url, content_hash, headers.get("etag"), headers.get("last-modified"), now, now)
+                )
+                if previous and previous[0] != content_hash:
+                    self._drop_unreferenced(previous[0])
+                self._evict()
+
+    def refresh(self, url: str, selectors: Iterable[str]):
+        """Marks an entry fresh again after the origin answered 304 Not Modified."""
+        with self._lock, self._db():
+            now = time.time()
+            self._db().execute("UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                               (now, now, self.cache_key(url, selectors)))
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def fetch(self, url: str, selectors: Iterable[str], load: Callable[[str], Awaitable[FetchResult]],
+                    revalidate: Optional[Callable[[str, Dict[str, str]], Awaitable[bool]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Serves `url` from the cache when fresh, or when `revalidate(url, conditional_headers)`
+        reports the origin unchanged; otherwise calls `load(url)` and caches its result.
+        """
+        selectors = list(selectors)
+        entry = self.lookup(url, selectors)
+        if entry and entry["fresh"]:
+            self.stats["hits"] += 1
+            return entry["payload"]
+        if entry and revalidate is not None:
+            validators = self.conditional_headers(entry)
+            if validators:
+                try:
+                    unchanged = await revalidate(url, validators)
+                except Exception as e:
+                    logger.warning(f"PageCache: Revalidation of {url} failed: {e}")
+                    unchanged = False
+                if unchanged:
+                    self.refresh(url, selectors)
+                    self.stats["revalidated"] += 1
+                    return entry["payload"]
+
+        self.stats["misses"] += 1
+        payload, headers = await load(url)
+        if payload is not None and headers is not None:
+            self.store(url, selectors, payload, headers)
+        return payload
+
+    def _drop_unreferenced(self, content_hash: str):
+        db = self._db()
+        if db.execute("SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)).fetchone():
+            return
+        db.execute("DELETE FROM objects WHERE content_hash = ?", (content_hash,))
+        try:
+            os.remove(self._object_path(content_hash))
+        except OSError:
+            pass
+
+    def _evict(self):
+        db = self._db()
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        while total > self.max_bytes:
+            oldest = db.execute("SELECT key, content_hash FROM entries ORDER BY accessed_at LIMIT 1").fetchone()
+            if oldest is None:
+                break
+            db.execute("DELETE FROM entries WHERE key = ?", (oldest[0],))
+            self._drop_unreferenced(oldest[1])
+            self.stats["evicted"] += 1
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import logging
+import time
+import numpy as np
+from agentic_core.simulation.abm import ABMEngine
+
+class LegacyAgent:
+    """The pre-columnar implementation: one object, attribute dict and unbounded history per agent."""
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self.history = []
+
+    def step(self):
+        if self.attributes.get("strategy", "cooperate") == "opportunistic":
+            self.attributes["utility"] = self.attributes.get("utility", 0) + np.random.normal(0.5, 0.1)
+        else:
+            self.attributes["utility"] = self.attributes.get("utility", 0) + 0.1
+        self.history.append(self.attributes.get("utility"))
+
+def strategies(count: int):
+    return np.where(np.arange(count) % 3 == 0, "opportunistic", "cooperate")
+
+async def run_benchmark(count: int, ticks: int, workers: int):
+    print(f"--- COLUMNAR ABM BENCHMARK ({count:,} agents x {ticks} ticks) ---")
+    legacy_count = min(count, 100_000)
+    agents = [LegacyAgent({"strategy": s, "utility": 0}) for s in strategies(legacy_count)]
+    start = time.perf_counter()
+    for agent in agents:
+        agent.step()
+    legacy = time.perf_counter() - start
+    print(f"Legacy per-agent objects ({legacy_count:,} agents, 1 tick): {legacy_count / legacy:,.0f} agent-ticks/s")
+
+    engine = ABMEngine(workers=1, seed=1)
+    start = time.perf_counter()
+    engine.add_agents([f"agent_{i}" for i in range(count)], strategies(count))
+    print(f"Bulk load: {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    await engine.step(ticks)
+    elapsed = time.perf_counter() - start
+    print(f"Columnar, inline: {count * ticks / elapsed:,.0f} agent-ticks/s")
+
+    if workers > 1:
+        sharded = ABMEngine(workers=workers, shard_threshold=0, seed=1)
+        sharded.add_agents([f"agent_{i}" for i in range(count)], strategies(count))
+        start = time.perf_counter()
+        summary = await sharded.step(ticks)
+        elapsed = time.perf_counter() - start
+        print(f"Columnar, {workers} shards: {count * ticks / elapsed:,.0f} agent-ticks/s "
+              f"(summary identical: {summary == engine.get_summary()})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the columnar ABMEngine against per-agent objects.")
+    parser.add_argument("--agents", type=int, default=1_000_000)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    asyncio.run(run_benchmark(args.agents, args.ticks, args.workers))
@@ -0,0 +1,121 @@
+import argparse
+import json
+import logging
+import random
+import time
+from agentic_core.collaboration.crdt_engine import CRDTState
+from agentic_core.collaboration.delta_crdt import DeltaDocument, decode_delta, encode_delta
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+def legacy_session(peers: int, fields: int, text_chars: int, rounds: int, edits: int, seed: int = 0):
+    """Every peer ships its whole LWW state (JSON) to the hub after each round of edits."""
+    rng = random.Random(seed)
+    hub = CRDTState("bench")
+    replicas = [CRDTState("bench") for _ in range(peers)]
+    base = "x" * text_chars
+    for replica in replicas:
+        for f in range(fields):
+            replica.update(f"field{f}", f)
+        replica.update("body", base)
+    payload_bytes = merge_time = 0.0
+    for _ in range(rounds):
+        for replica in replicas:
+            for _ in range(edits):
+                replica.update(f"field{rng.randrange(fields)}", rng.random())
+            text = replica.data["body"]["value"]
+            position = rng.randrange(len(text) + 1)
+            replica.update("body", text[:position] + "typed" + text[position:])
+            payload = json.dumps(replica.data)
+            payload_bytes += len(payload)
+            _, elapsed = timed(hub.merge, json.loads(payload))
+            merge_time += elapsed
+    return payload_bytes, merge_time
+
+def delta_session(peers: int, fields: int, text_chars: int, rounds: int, edits: int, seed: int = 0):
+    """Request/reply delta sync of every peer through a relay, as CollaborationManager does."""
+    rng = random.Random(seed)
+    hub = DeltaDocument("hub", relay=True)
+    for f in range(fields):
+        hub.set(f"field{f}", f)
+    hub.insert_text("body", 0, "x" * text_chars)
+    replicas = [DeltaDocument(f"peer{i}") for i in range(peers)]
+    known = {}
+    payload_bytes = merge_time = 0.0
+    ops = 0
+
+    def sync(replica):
+        nonlocal payload_bytes, merge_time, ops
+        request = encode_delta(replica.delta_since(known.get(replica.replica_id)))
+        delta = decode_delta(request)
+        _, elapsed = timed(hub.merge, delta)
+        merge_time += elapsed
+        ops += len(delta.writes) + sum(len(run[4]) for run in delta.inserts) + len(delta.deletes)
+        hub.collect_garbage()
+        reply = encode_delta(hub.delta_since(delta.context.vv))
+        replica.merge(decode_delta(reply))
+        replica.collect_garbage()
+        known[replica.replica_id] = replica.version
+        payload_bytes += len(request) + len(reply)
+
+    for replica in replicas:  # initial state transfer, not counted
+        sync(replica)
+    payload_bytes = merge_time = ops = 0
+    for _ in range(rounds):
+        for replica in replicas:
+            for _ in range(edits):
+                replica.set(f"field{rng.randrange(fields)}", rng.random())
+            position = rng.randrange(len(replica.text("body")) + 1)
+            replica.insert_text("body", position, "typed")
+            replica.delete_text("body", max(0, position - 3), 2)
+            sync(replica)
+    measured = payload_bytes, merge_time, ops
+    for replica in replicas:  # catch everyone up before checking convergence
+        sync(replica)
+    assert len({json.dumps(r.snapshot(), sort_keys=True) for r in replicas + [hub]}) == 1
+    return (*measured, hub)
+
+def merge_throughput(chars: int, peers: int, seed: int = 0):
+    """Merging concurrent edits of many peers into a fresh replica in one delta."""
+    rng = random.Random(seed)
+    source = DeltaDocument("source")
+    authors = [DeltaDocument(f"author{i}") for i in range(peers)]
+    for author in authors:
+        for _ in range(chars // peers // 32):
+            position = rng.randrange(len(author.text("body")) + 1)
+            author.insert_text("body", position, "abcdefgh" * 4)
+        source.merge(author.delta_since(source.version))
+    data = encode_delta(source.delta_since())
+    target = DeltaDocument("target")
+    _, elapsed = timed(lambda: target.merge(decode_delta(data)))
+    assert target.text("body") == source.text("body")
+    return len(target.text("body")), elapsed, len(data)
+
+def run_benchmark(peers: int, fields: int, text_chars: int, rounds: int, edits: int, merge_chars: int):
+    print(f"--- COLLABORATION CRDT BENCHMARK ({peers} peers, {fields} fields, {text_chars:,} char text) ---")
+    legacy_bytes, legacy_merge = legacy_session(peers, fields, text_chars, rounds, edits)
+    syncs = peers * rounds
+    print(f"Full-state LWW sync:  {legacy_bytes / syncs:,.0f} bytes/sync, hub merge {legacy_merge / syncs * 1000:,.2f}ms/sync")
+    delta_bytes, delta_merge, ops, hub = delta_session(peers, fields, text_chars, rounds, edits)
+    print(f"Delta sync (req+reply): {delta_bytes / syncs:,.0f} bytes/sync, hub merge {delta_merge / syncs * 1000:,.2f}ms/sync "
+          f"({ops / max(delta_merge, 1e-9):,.0f} ops/s)")
+    print(f"Payload reduction: {legacy_bytes / max(delta_bytes, 1):,.0f}x; hub tombstones left "
+          f"{hub.texts['body'].tombstones}, log entries {sum(map(len, hub._log.values()))}")
+    length, elapsed, size = merge_throughput(merge_chars, peers)
+    print(f"Bulk merge of {length:,} concurrently typed chars: {elapsed * 1000:,.0f}ms "
+          f"({length / elapsed:,.0f} chars/s), encoded delta {size:,} bytes")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark delta-state CRDT sync against full-state LWW merges.")
+    parser.add_argument("--peers", type=int, default=8)
+    parser.add_argument("--fields", type=int, default=500)
+    parser.add_argument("--text-chars", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--edits", type=int, default=5, help="field writes per peer per round")
+    parser.add_argument("--merge-chars", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.peers, args.fields, args.text_chars, args.rounds, args.edits, args.merge_chars)
@@ -0,0 +1,81 @@
+import argparse
+import logging
+import time
+import numpy as np
+from agentic_core.cognition.minimax_optimizer import MinimaxOptimizer
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - start
+
+def make_problem(n_actions: int, n_stressors: int, dims: int, seed: int = 0):
+    """Actions and stress scenarios as feature vectors; utility is a squashed bilinear score."""
+    rng = np.random.default_rng(seed)
+    actions = rng.normal(size=(n_actions, dims))
+    stressors = rng.normal(size=(n_stressors, dims))
+    coupling = rng.normal(scale=0.3, size=(dims, dims))
+
+    def utility_matrix(state, actions, stressors):
+        return 1.0 / (1.0 + np.exp(-(state["bias"] + actions @ coupling @ stressors.T)))
+
+    def utility(state, action, stressor):
+        return float(utility_matrix(state, actions[action][None], stressors[stressor][None])[0, 0])
+
+    return actions, stressors, utility_matrix, utility
+
+def legacy_evaluate(state, actions, stressors, utility_func):
+    """The pre-batching loop: every (action, stressor) pair, no pruning."""
+    best, best_value = None, -float('inf')
+    for action in actions:
+        worst = min(utility_func(state, action, stressor) for stressor in stressors)
+        if worst > best_value:
+            best, best_value = action, worst
+    return best, best_value
+
+def run_benchmark(n_actions: int, n_stressors: int, dims: int, depth: int, tree_actions: int, tree_stressors: int):
+    print(f"--- MINIMAX BENCHMARK ({n_actions} actions x {n_stressors} stressors) ---")
+    actions, stressors, utility_matrix, utility = make_problem(n_actions, n_stressors, dims)
+    state = {"bias": 0.5}
+    ids, scenario_ids = list(range(n_actions)), list(range(n_stressors))
+
+    (legacy_action, legacy_value), elapsed = timed(legacy_evaluate, state, ids, scenario_ids, utility)
+    print(f"Legacy nested loop: {elapsed * 1000:,.0f}ms ({n_actions * n_stressors:,} utility calls)")
+
+    optimizer = MinimaxOptimizer(stressors=scenario_ids, cache_size=0)
+    result, elapsed = timed(optimizer.evaluate_strategy, state, ids, utility)
+    assert (result["selected_action"], result["worst_case_utility"]) == (legacy_action, legacy_value)
+    print(f"Pruned scalar loop: {elapsed * 1000:,.0f}ms ({optimizer.evaluations:,} utility calls)")
+
+    optimizer = MinimaxOptimizer(stressors=scenario_ids)
+    optimizer.evaluate_strategy(state, ids, utility)
+    _, elapsed = timed(optimizer.evaluate_strategy, state, ids, utility)
+    print(f"Memoised repeat decision: {elapsed * 1000:,.1f}ms")
+
+    result, elapsed = timed(optimizer.evaluate_batch, state, actions, utility_matrix, stressors)
+    assert np.isclose(result["worst_case_utility"], legacy_value)
+    print(f"Batched utility matrix: {elapsed * 1000:,.1f}ms")
+
+    # Multi-step search on a small decision tree: the state drifts with each (action, stressor).
+    def transition(state, action, stressor):
+        return {"bias": round(state["bias"] + 0.1 * float(np.tanh(actions[action] @ stressors[stressor])), 1)}
+
+    tree_ids, tree_scenarios = ids[:tree_actions], scenario_ids[:tree_stressors]
+    optimizer = MinimaxOptimizer(stressors=tree_scenarios, cache_size=0)
+    result, elapsed = timed(optimizer.evaluate_sequence, state, tree_ids, utility, transition, depth=depth)
+    full_tree = sum((tree_actions * tree_stressors) ** d for d in range(depth))
+    print(f"Depth-{depth} search ({tree_actions} actions x {tree_stressors} stressors, {full_tree:,} nodes unpruned): "
+          f"{elapsed * 1000:,.0f}ms, {result['nodes']:,} nodes, {result['table_hits']:,} table hits, "
+          f"worst case {result['worst_case_utility']:.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MinimaxOptimizer on large action x stressor matrices.")
+    parser.add_argument("--actions", type=int, default=2000)
+    parser.add_argument("--stressors", type=int, default=200)
+    parser.add_argument("--dims", type=int, default=16, help="feature dimensions of actions and stressors")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--tree-actions", type=int, default=12)
+    parser.add_argument("--tree-stressors", type=int, default=8)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.actions, args.stressors, args.dims, args.depth, args.tree_actions, args.tree_stressors)
@@ -0,0 +1,76 @@
+import argparse
+import logging
+import time
+import numpy as np
+from agentic_core.incubator.petri_dish import PetriDish
+from agentic_core.incubator.simulation_loop import PROPOSAL_CHANNEL, SimulationLoop
+
+class LegacyAgent:
+    """The pre-batching agent: a full (W, H, C) proposal per step, drawn from the global RNG."""
+    def __init__(self, strength: float):
+        self.strength = strength
+
+    def propose_update(self, petri_dish):
+        proposal = np.zeros_like(petri_dish.grid)
+        proposal[:, :, 4] = self.strength * np.random.random((petri_dish.width, petri_dish.height))
+        return proposal
+
+def legacy_step(dish: PetriDish, agents):
+    proposals = [agent.propose_update(dish) for agent in agents]
+    mask = dish.grid[:, :, 4] > 0.5
+    if np.any(mask):
+        dish.organism_map[mask] = np.random.randint(0, len(agents), size=np.sum(mask))
+    total = np.zeros_like(dish.grid)
+    for p in proposals:
+        total += p
+    dish.grid += 0.01 * total
+    np.clip(dish.grid, 0.0, 1.0, out=dish.grid)
+
+class BatchedAgent:
+    def __init__(self, strength: float, seed: int):
+        self.strength = strength
+        self.rng = np.random.default_rng(seed)
+
+    def propose_into(self, petri_dish, out, rows):
+        self.rng.random(out=out, dtype=np.float32)
+        out *= self.strength
+
+def seeded_dish(size: int) -> PetriDish:
+    # About half the dish starts contested, so the competition phase is exercised from step one.
+    dish = PetriDish(size, size)
+    dish.grid[:, :, PROPOSAL_CHANNEL] = np.random.default_rng(0).random((size, size), dtype=np.float32)
+    return dish
+
+def generations_per_second(step, generations: int) -> float:
+    step()  # warm-up (buffer allocation)
+    start = time.perf_counter()
+    for _ in range(generations):
+        step()
+    return generations / (time.perf_counter() - start)
+
+def run_benchmark(size: int, agents: int, generations: int):
+    print(f"--- PETRI DISH BENCHMARK ({size}x{size} dish, {agents} agents) ---")
+    strengths = [0.02 + 0.001 * i for i in range(agents)]
+    legacy_bytes = (agents + 1) * size * size * 16 * 4
+    if legacy_bytes < 2 * 1024 ** 3:
+        dish = seeded_dish(size)
+        legacy_agents = [LegacyAgent(s) for s in strengths]
+        rate = generations_per_second(lambda: legacy_step(dish, legacy_agents), generations)
+        print(f"Legacy full-grid proposals: {rate:.2f} generations/s (~{legacy_bytes / 1e6:,.0f} MB per step)")
+    else:
+        print(f"Legacy full-grid proposals: skipped (~{legacy_bytes / 1e9:.1f} GB of proposals per step)")
+
+    dish = seeded_dish(size)
+    loop = SimulationLoop(dish, seed=1)
+    batched = [BatchedAgent(s, i) for i, s in enumerate(strengths)]
+    rate = generations_per_second(lambda: loop.step(batched), generations)
+    print(f"Batched proposal buffer: {rate:.2f} generations/s (buffer {loop._buffer.nbytes / 1e6:,.0f} MB)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SimulationLoop generations per second.")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.size, args.agents, args.generations)
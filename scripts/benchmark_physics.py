@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import logging
+import time
+import numpy as np
+from scipy.integrate import odeint
+from agentic_core.simulation.physics import BodyArrays, PhysicsEngineInterface
+
+def make_bodies(count: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return [{
+        "id": f"body_{i}",
+        "position": rng.normal(size=3).tolist(),
+        "velocity": rng.normal(scale=0.1, size=3).tolist(),
+        "acceleration": [0.0, -9.81, 0.0],
+        "mass": float(rng.uniform(0.5, 1.5))
+    } for i in range(count)]
+
+def legacy_step(bodies, dt: float):
+    """The pre-vectorisation implementation: one odeint solve per body per step."""
+    def derivative(state, t, acc):
+        return np.concatenate([state[3:], acc])
+    updated = []
+    for body in bodies:
+        state0 = np.concatenate([body["position"], body["velocity"]])
+        new_state = odeint(derivative, state0, [0, dt], args=(np.array(body["acceleration"]),))[-1]
+        updated.append({"id": body["id"], "position": new_state[:3].tolist(),
+                        "velocity": new_state[3:].tolist(), "acceleration": body["acceleration"]})
+    return updated
+
+def rate(count: int, steps: int, seconds: float) -> str:
+    return f"{count * steps / seconds:,.0f} body-steps/s"
+
+async def run_benchmark(count: int, steps: int, gravity_bodies: int):
+    print(f"--- BATCH PHYSICS BENCHMARK ({count:,} bodies x {steps} steps) ---")
+    bodies = make_bodies(count)
+
+    legacy_steps = max(1, min(steps, 200_000 // count))
+    start = time.perf_counter()
+    state = bodies
+    for _ in range(legacy_steps):
+        state = legacy_step(state, 0.01)
+    print(f"Legacy odeint per body ({legacy_steps} steps): {rate(count, legacy_steps, time.perf_counter() - start)}")
+
+    for integrator in PhysicsEngineInterface.INTEGRATORS:
+        engine = PhysicsEngineInterface(integrator=integrator)
+        start = time.perf_counter()
+        arrays = BodyArrays.from_bodies(bodies)
+        engine.step_arrays(arrays, 0.01, steps)
+        arrays.to_bodies()
+        print(f"Vectorised {integrator:<6}: {rate(count, steps, time.perf_counter() - start)}")
+
+    print(f"--- N-BODY GRAVITY ({gravity_bodies:,} bodies, one force evaluation) ---")
+    arrays = BodyArrays.from_bodies(make_bodies(gravity_bodies))
+    forces = {}
+    for model in ("direct", "barnes_hut"):
+        engine = PhysicsEngineInterface(integrator="euler", gravity=model, G=1.0, softening=1e-2)
+        start = time.perf_counter()
+        forces[model] = engine._accelerations(arrays, arrays.position) - arrays.acceleration
+        print(f"{model:<10}: {time.perf_counter() - start:.3f}s")
+    exact, approx = forces["direct"], forces["barnes_hut"]
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    print(f"Barnes-Hut relative force error: median {np.median(error):.4f}, p99 {np.quantile(error, 0.99):.4f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vectorised body stepping against per-body odeint.")
+    parser.add_argument("--bodies", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--gravity-bodies", type=int, default=5_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    asyncio.run(run_benchmark(args.bodies, args.steps, args.gravity_bodies))
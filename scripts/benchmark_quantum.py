@@ -0,0 +1,68 @@
+import argparse
+import logging
+import time
+import numpy as np
+import networkx as nx
+from agentic_core.quantum.statevector import StateVectorSimulator, maxcut_values, qaoa_maxcut_expectations, rotation
+
+try:
+    import pennylane as qml
+except ImportError:
+    qml = None
+
+def pennylane_grid(graph: nx.Graph, params: np.ndarray) -> float:
+    """The previous path: one default.qubit QNode execution per parameter set."""
+    n = graph.number_of_nodes()
+    cost_h, mixer_h = qml.qaoa.maxcut(graph)
+    dev = qml.device("default.qubit", wires=n)
+
+    @qml.qnode(dev)
+    def circuit(gamma, beta):
+        for i in range(n):
+            qml.Hadamard(wires=i)
+        qml.qaoa.cost_layer(gamma, cost_h)
+        qml.qaoa.mixer_layer(beta, mixer_h)
+        return qml.expval(cost_h)
+
+    start = time.perf_counter()
+    for gamma, beta in params:
+        circuit(gamma, beta)
+    return time.perf_counter() - start
+
+def run_benchmark(small: int, large: int, grid: int):
+    print(f"--- STATEVECTOR BENCHMARK (QAOA Max-Cut, {grid}x{grid} parameter grid) ---")
+    g, b = np.meshgrid(np.linspace(0.1, 3.0, grid), np.linspace(0.1, 1.5, grid), indexing="ij")
+    params = np.column_stack([g.ravel(), b.ravel()])
+
+    graph = nx.random_regular_graph(3, small, seed=1)
+    cut = maxcut_values(small, list(graph.edges()))
+    start = time.perf_counter()
+    qaoa_maxcut_expectations(cut, small, params[:, :1], params[:, 1:])
+    native = time.perf_counter() - start
+    print(f"Native batched ({small} qubits): {len(params) / native:,.1f} circuits/s")
+    if qml is not None:
+        elapsed = pennylane_grid(graph, params[:8])
+        print(f"PennyLane default.qubit ({small} qubits): {8 / elapsed:,.1f} circuits/s")
+
+    graph = nx.random_regular_graph(3, large, seed=1)
+    start = time.perf_counter()
+    cut = maxcut_values(large, list(graph.edges()))
+    print(f"Cut table ({large} qubits, {graph.number_of_edges()} edges): {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    value = qaoa_maxcut_expectations(cut, large, [[0.4]], [[0.3]])[0]
+    print(f"One QAOA layer + <C> ({large} qubits, complex64): {time.perf_counter() - start:.2f}s, <C>={value:.3f}")
+
+    sim = StateVectorSimulator(large, dtype=np.complex64)
+    start = time.perf_counter()
+    for q in range(large):
+        sim.apply_single(rotation("ry", 0.3), q)
+    print(f"Single-qubit gate ({large} qubits): {(time.perf_counter() - start) / large * 1000:.0f}ms/gate")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the native statevector engine on QAOA Max-Cut.")
+    parser.add_argument("--small", type=int, default=12)
+    parser.add_argument("--large", type=int, default=24)
+    parser.add_argument("--grid", type=int, default=16)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.small, args.large, args.grid)
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import logging
+import random
+import tempfile
+import os
+import time
+import sympy as sp
+from sympy.logic import satisfiable
+from agentic_core.triad.neuro_symbolic.reasoner import NeuroSymbolicReasoner
+from agentic_core.triad.neuro_symbolic.rule_base import compile_rules
+from agentic_core.ueg.ledger import UnifiedEvidenceGraph, BlockchainLedger
+
+def make_rules(n_rules: int, n_symbols: int, non_horn: float, seed: int = 0):
+    """Layered rule base: each rule concludes a symbol from 1-3 symbols of lower index."""
+    rng = random.Random(seed)
+    rules = []
+    for _ in range(n_rules):
+        head = rng.randrange(8, n_symbols)
+        body = " & ".join(f"F{rng.randrange(head)}" for _ in range(rng.randint(1, 3)))
+        if rng.random() < non_horn:
+            rules.append(f"{body} -> F{head} | F{rng.randrange(head)}")
+        else:
+            rules.append(f"{body} -> F{head}")
+    return rules
+
+def legacy_infer(detections, rules):
+    """The pre-compilation implementation: one satisfiable() call per candidate fact."""
+    scope = {}
+    def parse(text):
+        return sp.sympify(text.replace("&", " & ").replace("|", " | "), locals=scope)
+    for name in {t for r in rules for t in r.replace("&", " ").replace("|", " ").replace("->", " ").split()}:
+        scope[name] = sp.Symbol(name)
+    kb = sp.And(*[scope[d] for d in detections], *[sp.Implies(parse(a), parse(c)) for a, c in (r.split("->") for r in rules)])
+    return [f for f in scope if f not in detections and not satisfiable(kb & ~scope[f])]
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+def run_benchmark(n_rules: int, legacy_rules: int, non_horn: float):
+    detections = [f"F{i}" for i in range(8)]
+    print(f"--- NEURO-SYMBOLIC REASONER BENCHMARK ({n_rules} rules) ---")
+
+    small = make_rules(legacy_rules, max(16, legacy_rules // 2), 0.0)
+    inferred, elapsed = timed(legacy_infer, detections, small)
+    print(f"Legacy per-candidate SAT ({legacy_rules} rules): {elapsed * 1000:,.0f}ms, {len(inferred)} inferences")
+    compile_rules.cache_clear()
+    entailed, elapsed = timed(lambda: compile_rules(tuple(small)).entailed(detections)[0])
+    assert sorted(entailed - set(detections)) == sorted(inferred)
+    print(f"Forward chaining ({legacy_rules} rules): {elapsed * 1000:,.1f}ms (same inferences)")
+
+    for fraction in (0.0, non_horn):
+        rules = make_rules(n_rules, n_rules // 2, fraction, seed=1)
+        compile_rules.cache_clear()
+        rule_base, compile_time = timed(compile_rules, tuple(rules))
+        (entailed, _), elapsed = timed(rule_base.entailed, detections)
+        print(f"{n_rules} rules, {fraction:.0%} non-Horn: compile {compile_time * 1000:,.0f}ms, "
+              f"inference {elapsed * 1000:,.1f}ms, {len(entailed) - len(detections)} inferences")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        ueg = UnifiedEvidenceGraph(persistence_path=os.path.join(workdir, "ueg.json"),
+                                   ledger=BlockchainLedger(storage_path=os.path.join(workdir, "ledger.json")))
+        reasoner = NeuroSymbolicReasoner(ueg)
+        rules = make_rules(n_rules, n_rules // 2, 0.0, seed=1)
+        asyncio.run(reasoner.infer({"detections": detections}, rules))
+        _, elapsed = timed(asyncio.run, reasoner.infer({"detections": detections[:4]}, rules))
+        print(f"Cached rule base, full infer() call: {elapsed * 1000:,.1f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark NeuroSymbolicReasoner inference on large rule bases.")
+    parser.add_argument("--rules", type=int, default=10_000)
+    parser.add_argument("--legacy-rules", type=int, default=40, help="rule count for the (exponentially slower) legacy path")
+    parser.add_argument("--non-horn", type=float, default=0.01, help="fraction of disjunctive rules in the mixed run")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.rules, args.legacy_rules, args.non_horn)
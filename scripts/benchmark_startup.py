@@ -0,0 +1,35 @@
+import argparse
+import logging
+import sys
+import time
+
+def run_benchmark(component_budget_ms: float, total_budget_ms: float, warm_all: bool) -> bool:
+    print("--- ORGANISM STARTUP BENCHMARK ---")
+    start = time.perf_counter()
+    from agentic_core.orchestrator.conscious_organism_v99 import ConsciousOrganismV99_0
+    from agentic_core.orchestrator.container import StartupProfiler
+    imported = time.perf_counter()
+    profiler = StartupProfiler(component_budget_ms, total_budget_ms)
+    org = ConsciousOrganismV99_0(profiler=profiler)
+    constructed = time.perf_counter()
+    print(f"Module import: {(imported - start) * 1000:.0f}ms, construction: {(constructed - imported) * 1000:.1f}ms")
+
+    # Every subsystem (or only the warm set), as a full service start-up would touch them.
+    names = org.components.names() if warm_all else None
+    org.components.warm_up(names, background=False)
+    report = profiler.report()
+    print(f"{'component':<22}{'import ms':>12}{'init ms':>12}")
+    for name, timing in report["components"].items():
+        flag = "  OVER BUDGET" if name in report["over_budget"] else ""
+        print(f"{name:<22}{timing['import_ms']:>12.1f}{timing['init_ms']:>12.1f}{flag}")
+    print(f"Total: {report['total_ms']:.0f}ms (budget {total_budget_ms:.0f}ms, {component_budget_ms:.0f}ms per component)")
+    return report["within_budget"]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile per-component import and init time of ConsciousOrganismV99_0.")
+    parser.add_argument("--component-budget-ms", type=float, default=250.0)
+    parser.add_argument("--total-budget-ms", type=float, default=2000.0)
+    parser.add_argument("--all", action="store_true", help="build every subsystem, not just the warm set")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    sys.exit(0 if run_benchmark(args.component_budget_ms, args.total_budget_ms, args.all) else 1)
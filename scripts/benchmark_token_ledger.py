@@ -0,0 +1,37 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+from agentic_core.commercial.token_ledger import TokenLedger, UserTier
+from agentic_core.commercial.token_store import InMemoryTokenStore, SQLiteTokenStore
+
+def run(label: str, ledger: TokenLedger, transactions: int, users: int):
+    for u in range(users):
+        ledger.initialize_user(f"user_{u}", UserTier.ENTERPRISE)
+    start = time.perf_counter()
+    for i in range(transactions):
+        ledger.consume_tokens(f"user_{i % users}", 1, "benchmark")
+    applied = time.perf_counter() - start
+    ledger.flush()
+    sealed = time.perf_counter() - start
+    print(f"{label:<28} applied {transactions / applied:>10,.0f} tx/s | signed+persisted {transactions / sealed:>10,.0f} tx/s")
+    ledger.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TokenLedger inline vs batched signing.")
+    parser.add_argument("--transactions", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"--- TOKEN LEDGER SIGNING BENCHMARK ({args.transactions:,} debits) ---")
+    with tempfile.TemporaryDirectory() as workdir:
+        run("memory / inline", TokenLedger(store=InMemoryTokenStore()), args.transactions, args.users)
+        run("memory / batched", TokenLedger(store=InMemoryTokenStore(), sign_batch_size=args.batch_size),
+            args.transactions, args.users)
+        run("sqlite / inline", TokenLedger(store=SQLiteTokenStore(f"sqlite:///{os.path.join(workdir, 'a.db')}")),
+            args.transactions, args.users)
+        run("sqlite / batched", TokenLedger(store=SQLiteTokenStore(f"sqlite:///{os.path.join(workdir, 'b.db')}"),
+                                            sign_batch_size=args.batch_size), args.transactions, args.users)
@@ -0,0 +1,50 @@
+import argparse
+import logging
+import tempfile
+import time
+import numpy as np
+from agentic_core.synthesis.vector_store import VectorStore
+
+def run_benchmark(items: int, dim: int, queries: int, batch: int):
+    print(f"--- VECTOR STORE BENCHMARK ({items:,} x {dim}-d, IVF) ---")
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(max(64, items // 500), dim)).astype(np.float32)
+
+    def sample(n):
+        return centres[rng.integers(len(centres), size=n)] + 0.4 * rng.normal(size=(n, dim)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = VectorStore(workdir, dim=dim, n_probe=16)
+        start = time.perf_counter()
+        for offset in range(0, items, batch):
+            n = min(batch, items - offset)
+            store.add_batch([f"doc_{offset + i}" for i in range(n)], sample(n))
+        build = time.perf_counter() - start
+        print(f"Insert (incl. training): {build:.1f}s ({items / build:,.0f} vectors/s), {len(store.centroids)} lists")
+
+        q = sample(queries)
+        start = time.perf_counter()
+        approx = store.search(q, k=10)
+        ivf = time.perf_counter() - start
+        start = time.perf_counter()
+        exact = store.search(q, k=10, n_probe=None)
+        brute = time.perf_counter() - start
+        recall = np.mean([len({k for k, _ in a} & {k for k, _ in e}) / 10 for a, e in zip(approx, exact)])
+        print(f"Batched top-10 ({queries} queries): IVF {ivf / queries * 1000:.2f}ms/query, "
+              f"exact {brute / queries * 1000:.2f}ms/query, recall@10 {recall:.3f}")
+
+        start = time.perf_counter()
+        near_copies = np.asarray(store.vectors[:queries]) + 1e-3
+        dupes = store.add_batch([f"dup_{i}" for i in range(queries)], near_copies, dedup_threshold=0.98)
+        print(f"Dedup-on-ingest of {queries} near-copies: {(time.perf_counter() - start) / queries * 1000:.2f}ms/item, "
+              f"{sum(d is not None for d in dupes)}/{queries} caught")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the synthesis VectorStore.")
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run_benchmark(args.items, args.dim, args.queries, args.batch)
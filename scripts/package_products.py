@@ -81,6 +81,7 @@ def package_products():
     # Shared dependencies to copy
     shared_deps = [
         "agentic_core/ueg/ueg_manager.py",
+        "agentic_core/ueg/storage.py",
         "agentic_core/genetics/genomic_registry.py",
         "agentic_core/governance/runtime_framework.py"
     ]
@@ -91,6 +92,7 @@ def package_products():
             "agentic_core/simulation/registry.py",
             "agentic_core/simulation/physics.py",
             "agentic_core/simulation/abm.py",
+            "agentic_core/simulation/forecast.py",
             "agentic_core/simulation/lifecycle.py",
             "agentic_core/simulation/fidelity.py"
         ],
@@ -100,7 +102,9 @@ def package_products():
             "agentic_core/synthesis/knowledge_synthesis.py",
             "agentic_core/simulation/nanophotonics.py",
             "agentic_core/biochemical/molecular_comm.py",
-            "agentic_core/synthesis/cognitive_scraper.py"
+            "agentic_core/synthesis/cognitive_scraper.py",
+            "agentic_core/synthesis/url_ingestor.py",
+            "agentic_core/synthesis/page_cache.py"
         ],
         "molecular_sdk": [
             "agentic_core/biochemical/rectification_engine.py"
@@ -0,0 +1,22 @@
+import threading
+from http.server import ThreadingHTTPServer
+import pytest
+
+@pytest.fixture
+def http_server():
+    """
+    Factory for local origin servers: `http_server(HandlerClass)` starts a ThreadingHTTPServer
+    for that handler on a free port and returns the port. Servers stop at teardown.
+    """
+    servers = []
+
+    def start(handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server.server_address[1]
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
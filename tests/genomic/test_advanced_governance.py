@@ -1,11 +1,11 @@
+import importlib.util
 import sys
 from types import ModuleType
 
-# Mock missing modules globally
-for mod_name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']:
-    if mod_name not in sys.modules:
-        mock = ModuleType(mod_name)
-        sys.modules[mod_name] = mock
+# Placeholders for optional dependencies that are not installed, only while the imports below run
+_STUBS = {name: ModuleType(name) for name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']
+          if name not in sys.modules and importlib.util.find_spec(name) is None}
+sys.modules.update(_STUBS)
 
 import pytest
 from agentic_core.transition.graduated_transition_manager import GraduatedTransitionManager
@@ -14,6 +14,9 @@ from agentic_core.governance.grn_modeler import GRNModeler
 from agentic_core.validation.benchmarks import BenchmarkSuite
 from agentic_core.genome.epigenetics import EpigeneticMemory
 
+for _name in _STUBS:
+    sys.modules.pop(_name, None)
+
 def test_transition_rollback():
     mgr = GraduatedTransitionManager(total_phases=5)
     monitor = TransitionStateMonitor()
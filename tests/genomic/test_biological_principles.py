@@ -1,11 +1,11 @@
+import importlib.util
 import sys
 from types import ModuleType
 
-# Mock missing modules globally
-for mod_name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']:
-    if mod_name not in sys.modules:
-        mock = ModuleType(mod_name)
-        sys.modules[mod_name] = mock
+# Placeholders for optional dependencies that are not installed, only while the imports below run
+_STUBS = {name: ModuleType(name) for name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']
+          if name not in sys.modules and importlib.util.find_spec(name) is None}
+sys.modules.update(_STUBS)
 
 import pytest
 from agentic_core.architecture.hox_patterns import HoxPatternRegistry
@@ -13,6 +13,9 @@ from agentic_core.architecture.phylotypic_core import PhylotypicCore
 from agentic_core.governance.gene_regulatory_network import GeneRegulatoryNetwork
 from agentic_core.compiler.biological_compiler import BiologicalCompiler
 
+for _name in _STUBS:
+    sys.modules.pop(_name, None)
+
 def test_hox_pattern_registry():
     assert HoxPatternRegistry.validate_module("test_module", "v99.0") is True
 
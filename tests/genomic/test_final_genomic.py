@@ -1,13 +1,13 @@
+import importlib.util
 import sys
 import os
 import numpy as np
 from types import ModuleType
 
-# Mock missing modules globally
-for mod_name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']:
-    if mod_name not in sys.modules:
-        mock = ModuleType(mod_name)
-        sys.modules[mod_name] = mock
+# Placeholders for optional dependencies that are not installed, only while the imports below run
+_STUBS = {name: ModuleType(name) for name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']
+          if name not in sys.modules and importlib.util.find_spec(name) is None}
+sys.modules.update(_STUBS)
 
 import pytest
 from agentic_core.genome.chromosome import Chromosome
@@ -17,6 +17,9 @@ from agentic_core.evolution.rearrangement.inversion import Inversion
 from agentic_core.evolution.evolution_engine import GenomeEvolutionEngine
 from agentic_core.orchestrator.conscious_organism_v99 import ConsciousOrganismV99_0
 
+for _name in _STUBS:
+    sys.modules.pop(_name, None)
+
 def test_genome_architecture():
     chrom = Chromosome("test")
     chrom.add_gene(Gene("g1", GeneType.STRUCTURAL, "h1"))
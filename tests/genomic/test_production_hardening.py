@@ -1,17 +1,20 @@
+import importlib.util
 import sys
 from types import ModuleType
 
-# Mock missing modules globally
-for mod_name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']:
-    if mod_name not in sys.modules:
-        mock = ModuleType(mod_name)
-        sys.modules[mod_name] = mock
+# Placeholders for optional dependencies that are not installed, only while the imports below run
+_STUBS = {name: ModuleType(name) for name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']
+          if name not in sys.modules and importlib.util.find_spec(name) is None}
+sys.modules.update(_STUBS)
 
 import pytest
 from agentic_core.config.loader import settings
 from agentic_core.builder.conversational_engine import ConversationalEngine
 from agentic_core.builder.refinement_engine import RefinementEngine
 
+for _name in _STUBS:
+    sys.modules.pop(_name, None)
+
 def test_settings_loader():
     assert settings.get("VERSION") == "99.0.0"
     assert settings.get("FIDELITY_TARGET") == 0.992
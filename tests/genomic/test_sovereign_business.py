@@ -1,17 +1,20 @@
+import importlib.util
 import sys
 from types import ModuleType
 
-# Mock missing modules globally
-for mod_name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']:
-    if mod_name not in sys.modules:
-        mock = ModuleType(mod_name)
-        sys.modules[mod_name] = mock
+# Placeholders for optional dependencies that are not installed, only while the imports below run
+_STUBS = {name: ModuleType(name) for name in ['shap', 'jwt', 'casbin', 'alembic', 'pygit2', 'sigstore']
+          if name not in sys.modules and importlib.util.find_spec(name) is None}
+sys.modules.update(_STUBS)
 
 import pytest
 from agentic_core.governance.command_dispatch import AICommander, AIDispatcher
 from agentic_core.governance.adaptive_profiles import IndustryAdaptiveGovernance, IndustryType
 from agentic_core.business.pipelines import BusinessPipeline
 
+for _name in _STUBS:
+    sys.modules.pop(_name, None)
+
 @pytest.mark.asyncio
 async def test_commander_dispatcher():
     commander = AICommander()
@@ -0,0 +1,65 @@
+import asyncio
+import numpy as np
+from agentic_core.simulation import abm
+from agentic_core.simulation.abm import ABMEngine
+
+def compound_kernel(utility, rng):
+    return 2 * utility + 1
+
+def test_columnar_agents_keep_dict_api_and_ring_history():
+    engine = ABMEngine(history_size=4, workers=1, seed=3)
+    engine.add_agent("a1", {"strategy": "cooperate", "utility": 0, "region": "north"})
+    engine.add_agent("a2", {"strategy": "opportunistic", "utility": 1.0})
+    engine.add_agent("a3", {"strategy": "unknown"})
+
+    summary = asyncio.run(engine.step(6))
+    assert summary["tick"] == 6 and summary["total_agents"] == 3
+    a1 = engine.agents["a1"]
+    assert a1.attributes["region"] == "north" and a1.attributes["strategy"] == "cooperate"
+    assert np.isclose(a1.attributes["utility"], 0.6)
+    assert np.allclose(a1.history, [0.3, 0.4, 0.5, 0.6])  # only the last history_size ticks
+    assert engine.agents["a3"].attributes["utility"] > 0.59  # unknown strategies cooperate
+    assert [a["id"] for a in engine.export_agents()] == ["a1", "a2", "a3"]
+
+    engine.add_agent("late", {"utility": 0})
+    asyncio.run(engine.step(1))
+    assert len(engine.agents["late"].history) == 1
+
+def test_custom_strategy_kernel():
+    engine = ABMEngine(workers=1)
+    engine.register_strategy("compound", compound_kernel)
+    engine.add_agents(["x", "y"], "compound", [0.0, 1.0])
+    asyncio.run(engine.step(2))
+    assert [a["attributes"]["utility"] for a in engine.export_agents()] == [4.0, 13.0]
+
+def test_sharded_ticks_match_inline(monkeypatch):
+    monkeypatch.setattr(abm, "BLOCK_SIZE", 1000)
+    results = []
+    for workers in (1, 2):
+        engine = ABMEngine(workers=workers, shard_threshold=0, seed=11)
+        engine.add_agents([f"a{i}" for i in range(3500)],
+                          np.where(np.arange(3500) % 2 == 0, "opportunistic", "cooperate"))
+        asyncio.run(engine.step(5))
+        results.append((engine.get_summary(), engine.agents["a3498"].history))
+    assert results[0] == results[1]
+
+def test_each_reset_draws_fresh_noise_reproducibly():
+    def runs(engine, seed=None):
+        out = []
+        for _ in range(3):
+            engine.reset(seed)
+            seed = None
+            engine.add_agents([f"a{i}" for i in range(50)], "opportunistic")
+            out.append(asyncio.run(engine.step(3))["avg_utility"])
+        return out
+
+    first = runs(ABMEngine(workers=1), seed=5)
+    assert len(set(first)) == 3  # no run replays the previous one's increments
+    assert runs(ABMEngine(workers=1, seed=9), seed=5) == first  # reset(seed) restarts the runs
+
+def test_bulk_attributes_keep_extras():
+    engine = ABMEngine(workers=1)
+    engine.add_agents(["a", "b"], ["cooperate", "opportunistic"], [0.5, 1.0],
+                      [{"strategy": "cooperate", "region": "north"}, {}])
+    assert engine.agents["a"].attributes["region"] == "north"
+    assert "region" not in engine.agents["b"].attributes
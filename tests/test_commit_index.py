@@ -0,0 +1,70 @@
+import subprocess
+from agentic_core.synthesis.commit_index import CommitIndex
+
+def _git(repo, *args):
+    return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo, check=True,
+                          capture_output=True).stdout.decode().strip()
+
+def _fast_import(repo, start, count, parent=None):
+    """Appends `count` commits to main via git fast-import (much faster than `git commit` per commit)."""
+    lines = []
+    for i in range(start, start + count):
+        path = ["agentic_core/mod.py", "reactor/core.py", "docs/a|b.md"][i % 3]
+        message = f"feat: change {i} | v1.{i}".encode()
+        lines += [b"commit refs/heads/main", f"mark :{i + 1}".encode(),
+                  f"committer t <t@t> {1_700_000_000 + i} +0000".encode(),
+                  f"data {len(message)}".encode(), message]
+        if i == start and parent:
+            lines.append(f"from {parent}".encode())
+        body = f"{i}\n".encode()
+        lines += [f"M 100644 inline {path}".encode(), f"data {len(body)}".encode(), body, b""]
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=repo, input=b"\n".join(lines) + b"\n", check=True)
+
+def _repo(tmp_path, count):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _fast_import(repo, 0, count)
+    return repo
+
+def test_incremental_updates_parse_only_new_commits(tmp_path):
+    repo = _repo(tmp_path, 3000)
+    index = CommitIndex(str(tmp_path / "index.db"), str(tmp_path / "mirrors"))
+    categorize = lambda subject: "FEATURE" if subject.startswith("feat") else "ANCILLARY"
+
+    assert index.update("self", str(repo), categorize) == 3000
+    assert index.update("self", str(repo), categorize) == 0
+    _fast_import(repo, 3000, 5, parent=_git(repo, "rev-parse", "main"))
+    assert index.update("self", str(repo), categorize) == 5
+
+    commits = index.commits("self")
+    assert len(commits) == 3005
+    assert commits[0]["subject"] == "feat: change 3004 | v1.3004"
+    assert commits[0]["hash"] == _git(repo, "rev-parse", "HEAD") == index.last_sha("self")
+    assert commits[-1]["subject"] == "feat: change 0 | v1.0"
+    assert commits[0]["files"] == ["reactor/core.py"] and commits[0]["layers"] == ["DOMAIN_REACTORS"]
+    assert commits[1]["files"] == ["agentic_core/mod.py"] and commits[1]["category"] == "FEATURE"
+    assert [c["subject"] for c in index.commits("self", limit=2)] == [c["subject"] for c in commits[:2]]
+
+    layers = index.file_layer_map("self")
+    assert layers["docs/a|b.md"] == {"layers": [], "touches": 1001}
+    assert layers["agentic_core/mod.py"]["layers"] == ["CORE_COGNITION"]
+    index.close()
+
+    # The index survives restarts; a rewritten history triggers a rebuild.
+    reopened = CommitIndex(str(tmp_path / "index.db"), str(tmp_path / "mirrors"))
+    _git(repo, "commit", "-q", "--amend", "-m", "fix: rewritten tip")
+    assert reopened.update("self", str(repo), categorize) == 3005
+    assert reopened.stats["full_rebuilds"] == 1
+    assert reopened.commits("self", limit=1)[0]["category"] == "ANCILLARY"
+
+def test_external_repos_use_a_fetched_mirror(tmp_path):
+    repo = _repo(tmp_path, 10)
+    index = CommitIndex(str(tmp_path / "index.db"), str(tmp_path / "mirrors"))
+    mirror = index.mirror(str(repo))
+    assert index.update("ext", mirror, lambda s: "FEATURE") == 10
+
+    _fast_import(repo, 10, 3, parent=_git(repo, "rev-parse", "main"))
+    assert index.mirror(str(repo)) == mirror
+    assert index.update("ext", mirror, lambda s: "FEATURE") == 3
+    assert index.commits("ext", limit=1)[0]["hash"] == _git(repo, "rev-parse", "main")
@@ -0,0 +1,49 @@
+import pytest
+from agentic_core.orchestrator.container import ComponentContainer, Ref, StartupProfiler
+from agentic_core.orchestrator.conscious_organism_v99 import ConsciousOrganismV99_0
+
+class Counter:
+    built = 0
+
+    def __init__(self, *deps, **named):
+        Counter.built += 1
+        self.deps, self.named = deps, named
+
+def test_components_are_built_once_on_first_access():
+    Counter.built = 0
+    c = ComponentContainer()
+    c.register("a", Counter)
+    c.register("b", Counter, Ref("a"), label="b")
+    assert Counter.built == 0
+    b = c.get("b")
+    assert Counter.built == 2 and b.deps == (c.get("a"),) and b.named == {"label": "b"}
+    assert c.get("b") is b and Counter.built == 2
+    assert set(c.profiler.report()["components"]) == {"a", "b"}
+
+def test_dependency_cycles_are_reported():
+    c = ComponentContainer()
+    c.register("a", Counter, Ref("b"))
+    c.register("b", Counter, depends_on=["a"])
+    with pytest.raises(RuntimeError, match="a -> b -> a"):
+        c.get("a")
+
+def test_background_warm_up_and_budget_report():
+    c = ComponentContainer(StartupProfiler(component_budget_ms=0.0))
+    c.register("json_decoder", "json:JSONDecoder", warm=True)
+    c.register("cold", Counter)
+    c.warm_up()
+    c.wait_warm(timeout=10)
+    assert c.is_built("json_decoder") and not c.is_built("cold")
+    report = c.profiler.report()
+    assert report["over_budget"] == ["json_decoder"] and not report["within_budget"]
+
+def test_organism_subsystems_resolve_lazily():
+    org = ConsciousOrganismV99_0(agent_id="lazy")
+    assert not org.components.is_built("xai")
+    assert org.rollback.manager is org.transition_mgr
+    assert org.dashboard is org.components.get("dashboard")
+    # Assigning a subsystem replaces it for later dependants too.
+    org.immune = "stub-immune"
+    assert org.truth_validator.immune == "stub-immune"
+    with pytest.raises(AttributeError):
+        org.not_a_subsystem
@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from agentic_core.ueg.ledger import UnifiedEvidenceGraph, BlockchainLedger
+from agentic_core.ueg.ctms import ContinuousTruthMaintenanceSystem
+
+@pytest.fixture
+def ueg(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.json"))
+    return UnifiedEvidenceGraph(persistence_path=str(tmp_path / "ueg.json"), ledger=ledger)
+
+def test_relation_index_tracks_mutations(ueg, tmp_path):
+    ueg.bulk_add_nodes([("a", "CLAIM"), ("b", "CLAIM"), ("proof_1", "PROOF")])
+    ueg.add_edge("a", "b", "SUPPORTS")
+    ueg.add_edge("proof_1", "b", "VALIDATED_BY")
+    assert ueg.sources("b", "SUPPORTS") == {"a"}
+    assert ueg.targets("a", "SUPPORTS") == {"b"}
+
+    # Re-labelling an edge moves it between relation buckets.
+    ueg.add_edge("a", "b", "CONTRADICTS")
+    assert ueg.sources("b", "SUPPORTS") == set()
+    assert [(u, v) for u, v, _ in ueg.edges_by_relation("CONTRADICTS")] == [("a", "b")]
+
+    # A rolled-back batch leaves the index untouched.
+    with pytest.raises(ValueError):
+        with ueg.batch():
+            ueg.add_edge("proof_1", "a", "SUPPORTS")
+            raise ValueError
+    assert ueg.sources("a", "SUPPORTS") == set()
+
+    reloaded = UnifiedEvidenceGraph(persistence_path=ueg.persistence_path, ledger=ueg.ledger)
+    assert reloaded.sources("b", "VALIDATED_BY") == {"proof_1"}
+
+def test_propagation_visits_each_descendant_once(ueg):
+    ueg.bulk_add_nodes([(n, "CLAIM", {"confidence": 0.5}) for n in ("root", "mid_1", "mid_2", "leaf")])
+    ueg.bulk_add_edges([
+        ("mid_1", "root", "DERIVED_FROM"),
+        ("mid_2", "root", "DERIVED_FROM"),
+        ("leaf", "mid_1", "DERIVED_FROM"),
+        ("leaf", "mid_2", "DERIVED_FROM"),
+        ("root", "leaf", "DERIVED_FROM"),  # cycle back to the root
+    ])
+    asyncio.run(ContinuousTruthMaintenanceSystem(ueg)._propagate_truth("root"))
+    assert ueg.graph.nodes["leaf"]["confidence"] == pytest.approx(0.6)
+    assert ueg.graph.nodes["root"]["confidence"] == 0.5
+
+def test_incremental_sweep_only_revisits_touched_contradictions(ueg):
+    ueg.bulk_add_nodes([(n, "CLAIM") for n in ("h1", "h2", "h3", "h4", "e1", "e2")])
+    ueg.bulk_add_edges([("h1", "h2", "CONTRADICTS"), ("h3", "h4", "CONTRADICTS"), ("e1", "h2", "SUPPORTS")])
+
+    ctms = ContinuousTruthMaintenanceSystem(ueg, incremental=True)
+    assert len(ctms._pending_contradictions()) == 2
+    assert ctms._pending_contradictions() == []
+
+    ueg.add_edge("e2", "h3", "SUPPORTS")
+    assert ctms._pending_contradictions() == [("h3", "h4")]
+
+    asyncio.run(ctms.scan_and_resolve())
+    assert "status" not in ueg.graph.nodes["h1"]
@@ -0,0 +1,99 @@
+import asyncio
+import random
+from agentic_core.collaboration.crdt_engine import CollaborationManager
+from agentic_core.collaboration.delta_crdt import CausalContext, DeltaDocument, decode_delta, encode_delta
+
+def exchange(peer, hub):
+    """One request/reply round through the relay, over the binary encoding."""
+    request = decode_delta(encode_delta(peer.delta_since(peer.peer_versions.get(hub.replica_id))))
+    assert hub.merge(request)
+    hub.collect_garbage()
+    assert peer.merge(decode_delta(encode_delta(hub.delta_since(request.context.vv))))
+    peer.collect_garbage()
+
+def test_causal_context_compacts_cloud():
+    context = CausalContext({"a": 2})
+    context.add(("a", 4))
+    assert context.contains(("a", 4)) and not context.contains(("a", 3))
+    context.add(("a", 3))
+    assert context.vv == {"a": 4} and not context.cloud
+
+def test_concurrent_text_edits_converge():
+    a, b = DeltaDocument("a"), DeltaDocument("b")
+    a.insert_text("body", 0, "hello world")
+    b.merge(a.delta_since(b.version))
+    a.insert_text("body", 5, ", dear")
+    b.insert_text("body", 5, " there")
+    b.delete_text("body", 0, 1)
+    delta_a, delta_b = a.delta_since(b.version), b.delta_since(a.version)
+    a.merge(delta_b)
+    b.merge(delta_a)
+    assert a.text("body") == b.text("body")
+    assert a.text("body") in ("ello there, dear world", "ello, dear there world")
+    # Merging the same delta again is a no-op.
+    b.merge(delta_a)
+    assert b.text("body") == a.text("body")
+
+def test_concurrent_field_writes_resolve_without_timestamps():
+    a, b = DeltaDocument("a"), DeltaDocument("b")
+    a.set("title", "A")
+    b.set("title", "B")
+    a.merge(b.delta_since(a.version))
+    b.merge(a.delta_since(b.version))
+    assert a.get("title") == b.get("title") == "B"  # equal lamport, replica id breaks the tie
+    assert sorted(a.conflicts("title")) == ["A", "B"]
+    a.set("title", "final")
+    b.merge(a.delta_since(b.version))
+    assert b.get("title") == "final" and b.conflicts("title") == ["final"]
+
+def test_delta_since_only_ships_unknown_operations():
+    a, b = DeltaDocument("a"), DeltaDocument("b")
+    a.insert_text("body", 0, "x" * 5000)
+    b.merge(decode_delta(encode_delta(a.delta_since())))
+    a.insert_text("body", 2500, "typed")
+    delta = a.delta_since(b.version)
+    assert [run[4] for run in delta.inserts] == ["typed"] and not delta.writes
+    assert len(encode_delta(delta)) < 50
+    b.merge(decode_delta(encode_delta(delta)))
+    assert b.text("body") == a.text("body")
+
+def test_relay_collects_stable_tombstones_and_serves_late_joiners():
+    rng = random.Random(7)
+    hub = DeltaDocument("hub", relay=True)
+    peers = [DeltaDocument(f"p{i}") for i in range(3)]
+    for peer in peers[:2]:
+        exchange(peer, hub)
+    for _ in range(60):
+        peer = rng.choice(peers[:2])
+        text = peer.text("doc")
+        if text and rng.random() < 0.4:
+            peer.delete_text("doc", rng.randrange(len(text)), 2)
+        else:
+            peer.insert_text("doc", rng.randint(0, len(text)), rng.choice(["ab", "xyz"]))
+        exchange(peer, hub)
+    writer, reader = peers[:2]
+    writer.insert_text("doc", len(writer.text("doc")), "tail")
+    exchange(writer, hub)
+    exchange(reader, hub)
+    writer.delete_text("doc", len(writer.text("doc")) - 4, 4)
+    exchange(writer, hub)
+    exchange(reader, hub)  # receives the delete, but has not reported it yet
+    assert "tail" not in hub.text("doc")
+    tombstones = hub.texts["doc"].tombstones
+    exchange(reader, hub)
+    assert hub.texts["doc"].tombstones == tombstones - 4
+    assert not any(hub._log.values())
+    exchange(peers[2], hub)  # joins after the log was pruned: receives the full state
+    assert len({p.text("doc") for p in peers + [hub]}) == 1
+
+def test_collaboration_manager_binary_sync():
+    manager = CollaborationManager(replica_id="server")
+    client = DeltaDocument("client")
+    client.set("intent", "draft")
+    client.insert_text("notes", 0, "abc")
+    reply = asyncio.run(manager.sync_project("p1", encode_delta(client.delta_since())))
+    client.merge(decode_delta(reply))
+    assert manager.documents["p1"].snapshot() == {"intent": "draft", "notes": "abc"}
+    # Dict payloads still go through the per-field LWW session.
+    data = asyncio.run(manager.sync_project("p1", {"intent": {"value": "v", "clock": 1, "timestamp": "t"}}))
+    assert data["intent"]["value"] == "v"
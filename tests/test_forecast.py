@@ -0,0 +1,50 @@
+import asyncio
+import numpy as np
+from agentic_core.simulation.forecast import ForecastEngine, _checkpoints
+from agentic_core.simulation.registry import TwinRegistry
+
+def physics_twin(version=1):
+    return {"twin_id": "t", "version": version, "state": {"data": {"bodies": [
+        {"id": "p1", "position": [0, 10, 0], "velocity": [1, 0, 0], "acceleration": [0, -9.81, 0]}
+    ]}}}
+
+def test_physics_ensemble_bands_and_cache():
+    engine = ForecastEngine(workers=1)
+    result = asyncio.run(engine.forecast(physics_twin(), horizon_steps=100, ensemble_size=16))
+    assert result["mode"] == "physics" and result["steps"][-1] == 100 and len(result["steps"]) == 10
+    low, median, high = np.array(result["bands"]["position"][-1])[:, 0]
+    assert np.allclose(median, [1.0, 5.095, 0], atol=0.05)
+    assert np.all(low <= median) and np.all(median <= high) and (high - low)[0] > 0
+    assert result["forecast"] == "STABLE" and not result["cached"]
+
+    again = asyncio.run(engine.forecast(physics_twin(), horizon_steps=100, ensemble_size=16))
+    assert again["cached"] and again["bands"] == result["bands"]
+    asyncio.run(engine.forecast(physics_twin(version=2), horizon_steps=100, ensemble_size=16))
+    assert engine.stats == {"hits": 1, "computed": 2}
+
+def test_sharded_ensemble_matches_inline():
+    twin = physics_twin()
+    inline = asyncio.run(ForecastEngine(workers=1).forecast(twin, 50, ensemble_size=8))
+    sharded = asyncio.run(ForecastEngine(workers=2).forecast(twin, 50, ensemble_size=8))
+    assert np.allclose(inline["bands"]["position"], sharded["bands"]["position"])
+
+def test_abm_forecast_leaves_registry_untouched(tmp_path):
+    registry = TwinRegistry(str(tmp_path / "twins.db"))
+    registry.register_twin("market", "social:market", {"data": {"agents": [
+        {"id": "a1", "attributes": {"strategy": "cooperate", "utility": 0}},
+        {"id": "a2", "attributes": {"strategy": "opportunistic", "utility": 0}}
+    ]}})
+    twin = registry.get_twin("market")
+    result = asyncio.run(ForecastEngine(workers=1).forecast(twin, horizon_steps=20, ensemble_size=8))
+    low, median, high = result["bands"]["avg_utility"][-1]
+    assert low <= median <= high and 5 < median < 7  # (0.1 + 0.5) / 2 per tick
+    assert registry.get_twin("market")["version"] == 1
+    assert registry.get_twin("market")["state"] == twin["state"]
+
+    empty = {"twin_id": "e", "version": 1, "state": {"data": {}}}
+    assert asyncio.run(ForecastEngine(workers=1).forecast(empty, 10))["forecast"] == "STABLE"
+
+def test_checkpoints_exclude_step_zero_for_short_horizons():
+    assert _checkpoints(3) == [1, 2, 3]
+    assert _checkpoints(1) == [1]
+    assert _checkpoints(100) == list(range(10, 101, 10))
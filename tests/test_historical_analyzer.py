@@ -0,0 +1,46 @@
+import asyncio
+import os
+from agentic_core.synthesis.historical_analyzer import HistoricalAnalyzer, KeyTermMatcher, KEY_TERMS
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+def test_matcher_matches_naive_scan():
+    text = "Rollback of the y.js CRDT; UEG-backed neuro-symbolic v1.2 POLYMATH quantumness"
+    naive = [t for t in KEY_TERMS if t.lower() in text.lower()]
+    assert KeyTermMatcher(KEY_TERMS).find(text.encode()) == naive  # mixed case, no lowercased copy
+    assert KeyTermMatcher(["ab", "abc", "bcd", "cde"]).find(b"xxabcde") == ["ab", "abc", "bcd", "cde"]
+
+def test_incremental_index_skips_unchanged_files(tmp_path):
+    root = tmp_path / "repo"
+    _write(root / "notes.txt", "Quantum rollback plan v2.1 and v2.1")
+    _write(root / "agentic_core" / "mod.py", "# CRDT merge, v3.0")
+    _write(root / "docs" / "guide.md", "Sigstore provenance")
+    big = "Transcendent background " * 50_000 + "Minimax v9.9"
+    _write(root / "big.txt", big)
+    index = str(tmp_path / "index.json")
+
+    first = HistoricalAnalyzer([str(root)], index_path=index, workers=2)
+    insights = asyncio.run(first.analyze_all())
+    by_name = {os.path.basename(i["source"]): i for i in insights}
+    assert by_name["notes.txt"]["versions"] == ["2.1"]
+    assert by_name["notes.txt"]["key_terms"] == ["Quantum", "Rollback"]
+    assert by_name["mod.py"]["type"] == "code"
+    assert by_name["big.txt"]["key_terms"] == ["Minimax", "Transcendent"]
+    assert by_name["big.txt"]["length"] == len(big)
+    assert first.stats["analyzed"] == 4
+
+    # Touched but identical, edited, and untouched files.
+    os.utime(root / "docs" / "guide.md", ns=(1, 1))
+    _write(root / "agentic_core" / "mod.py", "# Immune response, v3.1")
+    second = HistoricalAnalyzer([str(root)], index_path=index, workers=1)
+    again = asyncio.run(second.analyze_all())
+    assert second.stats == {"reused": 2, "rehashed": 1, "analyzed": 1}
+    assert [i["source"] for i in again] == [i["source"] for i in insights]
+    assert {os.path.basename(i["source"]): i for i in again}["mod.py"]["key_terms"] == ["Immune"]
+
+    os.remove(root / "notes.txt")
+    third = HistoricalAnalyzer([str(root)], index_path=index)
+    assert len(asyncio.run(third.analyze_all())) == 3
+    assert third.stats["analyzed"] == 0
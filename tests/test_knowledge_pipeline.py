@@ -0,0 +1,82 @@
+import asyncio
+from agentic_core.synthesis.knowledge_synthesis import KnowledgeSynthesisPipeline
+from agentic_core.ueg.ueg_manager import UEGManager
+from agentic_core.genetics.genomic_registry import GenomicRegistry
+
+def _pipeline(tmp_path, **kwargs):
+    return KnowledgeSynthesisPipeline(vector_path=str(tmp_path / "vectors"),
+                                      ueg=UEGManager(str(tmp_path / "ueg.json")),
+                                      genomic_registry=GenomicRegistry(str(tmp_path / "genome.json")),
+                                      **kwargs)
+
+def test_stream_batches_stages_and_preserves_reports(tmp_path):
+    pipeline = _pipeline(tmp_path, queue_size=8, embed_batch_size=16, ueg_batch_size=32)
+    topics = ["biomimetic", "embodied", "unrelated"]
+    docs = [{"source": f"doc{i}", "content": f"{topics[i % 3]} study {i} on organism number {i * 7919}"}
+            for i in range(60)]
+
+    async def run():
+        futures = [await pipeline.submit(doc) for doc in docs]
+        reports = await asyncio.gather(*futures)
+        await pipeline.stop()
+        return reports
+
+    reports = asyncio.run(run())
+    assert [r["triples_extracted"] for r in reports] == [1 if i % 3 < 2 else 0 for i in range(60)]
+    assert all(r["status"] == "SYNTHESIZED" for r in reports)
+
+    metrics = pipeline.get_metrics()
+    assert all(metrics[stage]["processed"] == 60 for stage in pipeline.STAGES)
+    # Embedding and UEG writes were micro-batched rather than done per document.
+    assert metrics["embed"]["batches"] < 60 and metrics["integrate"]["batches"] < 60
+    assert metrics["end_to_end"]["completed"] == 60
+
+    reopened = UEGManager(str(tmp_path / "ueg.json"))
+    insights = [n for n in reopened.graph["nodes"] if n.get("category") == "extracted_knowledge"]
+    assert len(insights) == 40
+    assert len({n["id"] for n in insights}) == 40
+
+def test_bounded_queues_backpressure_producers(tmp_path):
+    pipeline = _pipeline(tmp_path, queue_size=2, embed_batch_size=4, workers={"extract": 1})
+    release = asyncio.Event()
+    extract = pipeline._stage_extract
+
+    async def gated_extract(batch):
+        await release.wait()
+        return await extract(batch)
+
+    pipeline._stage_extract = gated_extract
+
+    async def run():
+        produced = 0
+
+        async def produce():
+            nonlocal produced
+            for i in range(50):
+                await pipeline.submit({"source": f"s{i}", "content": f"biomimetic note {i} on colony {i * 7919}"})
+                produced += 1
+
+        producer = asyncio.create_task(produce())
+        await asyncio.sleep(0.2)
+        stalled_at = produced
+        depths = [pipeline._queues[stage].qsize() for stage in pipeline.STAGES]
+        release.set()
+        await producer
+        await pipeline.stop()
+        return stalled_at, depths
+
+    stalled_at, depths = asyncio.run(run())
+    assert stalled_at < 50
+    assert all(depth <= 2 for depth in depths)
+    assert pipeline.get_metrics()["end_to_end"]["completed"] == 50
+
+def test_stage_failure_reports_instead_of_hanging(tmp_path):
+    pipeline = _pipeline(tmp_path)
+
+    def broken(documents):
+        raise IOError("disk full")
+
+    pipeline._integrate_many = broken
+    report = asyncio.run(pipeline.process_data_stream({"source": "x", "content": "embodied agents"}))
+    assert report["status"] == "FAILED" and report["stage"] == "integrate"
+    assert "disk full" in report["error"]
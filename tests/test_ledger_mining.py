@@ -0,0 +1,110 @@
+import json
+import threading
+from agentic_core.ueg.ledger import BlockchainLedger
+from agentic_core.ueg.pow_miner import ProofOfWorkMiner, block_header, header_hash
+
+def test_header_mining_meets_difficulty(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.json"), difficulty=3)
+    ledger.add_transaction("u1", "TEST", {"payload": "x" * 10_000})
+    block = ledger.add_block(proof=1)
+
+    assert block["hash"].startswith("000")
+    assert header_hash(block_header(block), block["nonce"]) == block["hash"]
+    assert ledger.verify_integrity()
+
+    # Tampering with a transaction breaks the Merkle commitment.
+    block["transactions"][0]["data"]["payload"] = "y"
+    block["transactions"][0]["hash"] = "forged"
+    assert not ledger.verify_integrity()
+
+def test_parallel_miner_matches_sequential():
+    block = {"index": 1, "timestamp": "t", "previous_hash": "0" * 64, "merkle_root": "m", "proof": 100}
+    header = block_header(block)
+    sequential = ProofOfWorkMiner(difficulty=4, chunk_size=5_000).mine(header)
+    parallel_miner = ProofOfWorkMiner(difficulty=4, workers=2, chunk_size=5_000)
+    try:
+        assert parallel_miner.mine(header) == sequential
+    finally:
+        parallel_miner.shutdown()
+
+def test_append_only_chain_file(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = BlockchainLedger(storage_path=path, background_settlement=True)
+    for i in range(3):
+        ledger.log_sharia_transaction("ZAKAT", f"user_{i}", 10.0, "CHARITABLE_DISTRIBUTION")
+    ledger.close()
+
+    with open(path) as f:
+        lines = f.readlines()
+    assert len(lines) == 4  # genesis + three settlements, one record per line
+    assert [json.loads(l)["index"] for l in lines] == [0, 1, 2, 3]
+
+    reloaded = BlockchainLedger(storage_path=path)
+    assert len(reloaded.chain) == 4
+    assert reloaded.verify_integrity()
+
+def test_incremental_verification_uses_checkpoint(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.jsonl"))
+    for i in range(20):
+        ledger.add_transaction("u1", "TEST", {"i": i})
+        ledger.add_block(proof=i)
+
+    assert ledger.verify_integrity()
+    assert ledger.verification_metrics["mode"] == "full"
+    assert ledger.verification_metrics["blocks_verified"] == 20
+
+    for i in range(3):
+        ledger.add_block(proof=100 + i)
+    assert ledger.verify_integrity()
+    metrics = ledger.verification_metrics
+    assert metrics["mode"] == "incremental"
+    assert metrics["blocks_verified"] == 4  # checkpoint block + three new blocks
+    assert metrics["blocks_per_sec"] > 0
+
+    # A fresh process resumes from the persisted checkpoint.
+    reloaded = BlockchainLedger(storage_path=str(tmp_path / "ledger.jsonl"))
+    assert reloaded.verify_integrity()
+    assert reloaded.verification_metrics["blocks_verified"] == 1
+
+    # History below the checkpoint is only re-checked by a full pass.
+    reloaded.chain[5]["merkle_root"] = "tampered"
+    assert reloaded.verify_integrity()
+    assert not reloaded.verify_integrity(full=True, workers=2)
+    assert not reloaded.verify_integrity()  # failure drops the checkpoint
+
+def test_settlement_mines_outside_the_lock(tmp_path):
+    gate, mining = threading.Event(), threading.Event()
+
+    class GatedMiner(ProofOfWorkMiner):
+        def mine(self, header):
+            if threading.current_thread().name.startswith("ledger-settlement"):
+                mining.set()
+                gate.wait(5)
+            return super().mine(header)
+
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.jsonl"), miner=GatedMiner(difficulty=2),
+                              background_settlement=True)
+    ledger.log_sharia_transaction("ZAKAT", "user_0", 10.0, "CHARITABLE_DISTRIBUTION")
+    assert mining.wait(5)
+
+    # While the settlement is mining, the request path neither waits nor loses its place.
+    writer = threading.Thread(target=ledger.add_transaction, args=("u1", "TEST", {"i": 1}))
+    writer.start()
+    writer.join(1)
+    assert not writer.is_alive()
+    block = ledger.add_block(proof=7)  # lands first; the settlement re-mines on top of it
+    gate.set()
+    ledger.close()
+
+    assert [b["index"] for b in ledger.chain] == [0, 1, 2]
+    assert ledger.chain[1] is block and ledger.chain[2]["previous_hash"] == block["hash"]
+    assert ledger.verify_integrity()
+
+def test_append_only_chain_migrates_legacy_document(tmp_path):
+    legacy = BlockchainLedger(storage_path=str(tmp_path / "ledger.json"))
+    legacy.add_transaction("u1", "TEST", {"i": 1})
+    legacy.add_block(proof=1)
+
+    migrated = BlockchainLedger(storage_path=str(tmp_path / "ledger.jsonl"))
+    assert [b["hash"] for b in migrated.chain] == [b["hash"] for b in legacy.chain]
+    assert migrated.verify_integrity()
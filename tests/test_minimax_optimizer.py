@@ -0,0 +1,72 @@
+import numpy as np
+from agentic_core.cognition.minimax_optimizer import (MinimaxOptimizer, default_utility_func,
+                                                      default_utility_matrix, STRESSORS)
+
+ACTIONS = ["RESEARCH", "SYNC", "QUANTUM_COMPUTE", "PLATFORM_TASK", "EVOLVE_GENOME"]
+
+def brute_force(state, actions, stressors, utility, transition, depth):
+    best, best_action = -float('inf'), None
+    for action in actions:
+        worst = float('inf')
+        for stressor in stressors:
+            value = utility(state, action, stressor)
+            if depth > 1:
+                value = min(value, brute_force(transition(state, action, stressor), actions, stressors,
+                                               utility, transition, depth - 1)[0])
+            worst = min(worst, value)
+        if worst > best:
+            best, best_action = worst, action
+    return best, best_action
+
+def test_pruned_scalar_matches_batch_and_memoises():
+    rng = np.random.default_rng(0)
+    table = rng.random((50, 30))
+    calls = []
+
+    def utility(state, action, stressor):
+        calls.append((action, stressor))
+        return table[action, stressor]
+
+    optimizer = MinimaxOptimizer(stressors=range(30))
+    result = optimizer.evaluate_strategy({"t": 1}, list(range(50)), utility)
+    assert result["worst_case_utility"] == table.min(axis=1).max()
+    assert result["selected_action"] == int(np.argmax(table.min(axis=1)))
+    assert len(calls) < table.size  # alpha-beta cut-offs
+
+    batch = optimizer.evaluate_batch({"t": 1}, np.arange(50), lambda s, a, z: table[np.ix_(a, z)], np.arange(30))
+    assert batch["selected_action"] == result["selected_action"]
+    assert batch["binding_stressor"] == int(np.argmin(table[result["selected_action"]]))
+
+    evaluated = len(calls)
+    optimizer.evaluate_strategy({"t": 1}, list(range(50)), utility)
+    assert len(calls) == evaluated  # same state: served from the cache
+    optimizer.evaluate_strategy({"t": 2}, list(range(50)), utility)
+    assert len(calls) > evaluated
+
+def test_default_utility_matrix_matches_scalar():
+    state = {"base_stability": 0.7}
+    scalar = MinimaxOptimizer().evaluate_strategy(state, ACTIONS, default_utility_func)
+    batch = MinimaxOptimizer().evaluate_batch(state, ACTIONS, default_utility_matrix)
+    assert batch["selected_action"] == scalar["selected_action"] == "RESEARCH"
+    assert np.isclose(batch["worst_case_utility"], scalar["worst_case_utility"])
+    assert batch["binding_stressor"] == "hypoxia"
+    expected = [[default_utility_func(state, a, s) for s in STRESSORS] for a in ACTIONS]
+    assert np.allclose(default_utility_matrix(state, ACTIONS, STRESSORS), expected)
+
+def test_multi_step_search_matches_brute_force():
+    rng = np.random.default_rng(3)
+    table = rng.random((5, 3, 3))
+
+    def utility(state, action, stressor):
+        return float(table[state["x"], action, stressor])
+
+    def transition(state, action, stressor):
+        return {"x": (state["x"] + action + 2 * stressor) % 5}
+
+    for depth in (1, 2, 3, 4):
+        optimizer = MinimaxOptimizer(stressors=[0, 1, 2])
+        result = optimizer.evaluate_sequence({"x": 0}, [0, 1, 2], utility, transition, depth=depth)
+        expected, action = brute_force({"x": 0}, [0, 1, 2], [0, 1, 2], utility, transition, depth)
+        assert (result["worst_case_utility"], result["selected_action"]) == (expected, action)
+    assert result["table_hits"] > 0
+    assert result["nodes"] < sum(9 ** d for d in range(4))
@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler
+import pytest
+from agentic_core.synthesis.page_cache import PageCache
+
+class OriginHandler(BaseHTTPRequestHandler):
+    pages = {}
+    requests = []
+
+    def do_GET(self):
+        body = self.pages[self.path].encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def origin(http_server):
+    OriginHandler.pages = {"/a": "alpha", "/b": "beta"}
+    OriginHandler.requests = []
+    return f"http://127.0.0.1:{http_server(OriginHandler)}"
+
+def _get(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, dict(response.headers), response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), ""
+
+async def load(url):
+    status, headers, body = await asyncio.to_thread(_get, url)
+    return {"text": body}, headers
+
+async def revalidate(url, headers):
+    status, _, _ = await asyncio.to_thread(_get, url, headers)
+    return status == 304
+
+def test_fresh_hits_and_etag_revalidation(tmp_path, origin):
+    cache = PageCache(str(tmp_path / "cache"), ttl=60)
+    fetch = lambda url: asyncio.run(cache.fetch(url, ["article"], load, revalidate))
+
+    assert fetch(f"{origin}/a") == {"text": "alpha"}
+    assert fetch(f"{origin}/a") == {"text": "alpha"}
+    assert len(OriginHandler.requests) == 1 and cache.stats["hits"] == 1
+
+    # A different selector set is a different entry.
+    assert asyncio.run(cache.fetch(f"{origin}/a", ["h2"], load, revalidate)) == {"text": "alpha"}
+    assert cache.stats["misses"] == 2
+
+    # Expired entries are revalidated with If-None-Match and refreshed on 304.
+    cache.ttl = 0
+    assert fetch(f"{origin}/a") == {"text": "alpha"}
+    assert OriginHandler.requests[-1][1] is not None and cache.stats["revalidated"] == 1
+
+    OriginHandler.pages["/a"] = "alpha v2"
+    assert fetch(f"{origin}/a") == {"text": "alpha v2"}
+
+    # The cache persists across instances.
+    reopened = PageCache(str(tmp_path / "cache"), ttl=60)
+    assert reopened.get_fresh(f"{origin}/a", ["article"]) == {"text": "alpha v2"}
+
+def test_uncacheable_results_are_not_stored(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+
+    async def simulated(url):
+        return {"text": "simulated"}, None
+
+    assert asyncio.run(cache.fetch("https://example.invalid/x", ["article"], simulated)) == {"text": "simulated"}
+    assert cache.lookup("https://example.invalid/x", ["article"]) is None
+
+def test_content_addressing_and_lru_eviction(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"), max_bytes=250)
+    page = {"text": "x" * 60}
+    cache.store("https://a", ["s"], page)
+    cache.store("https://b", ["s"], page)
+    # Identical payloads share one object.
+    assert cache._db().execute("SELECT COUNT(*) FROM objects").fetchone()[0] == 1
+
+    time.sleep(0.01)
+    cache.store("https://c", ["s"], {"text": "y" * 60})
+    time.sleep(0.01)
+    cache.lookup("https://a", ["s"])  # a becomes most recently used
+    time.sleep(0.01)
+    cache.store("https://d", ["s"], {"text": "z" * 60})
+    cache.store("https://e", ["s"], {"text": "w" * 60})
+
+    # b goes first but frees nothing (a still references the object), so c is evicted too.
+    assert cache.stats["evicted"] == 2
+    assert cache.lookup("https://b", ["s"]) is None
+    assert cache.lookup("https://c", ["s"]) is None
+    assert cache.lookup("https://a", ["s"])["payload"] == page
+    total = cache._db().execute("SELECT SUM(size) FROM objects").fetchone()[0]
+    assert total <= 250
+    assert len(list((tmp_path / "cache" / "objects").rglob("*.json"))) == cache._db().execute(
+        "SELECT COUNT(*) FROM objects").fetchone()[0]
+
+def test_corrupt_object_is_dropped_with_its_size(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    page = {"text": "shared"}
+    cache.store("https://a", ["s"], page)
+    cache.store("https://b", ["s"], page)
+    (path,) = (tmp_path / "cache" / "objects").rglob("*.json")
+    path.write_text("{truncated")
+
+    assert cache.lookup("https://a", ["s"]) is None
+    db = cache._db()
+    assert db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+    assert db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0] == 0
+    assert not path.exists()
+    # The next store writes a sound object again.
+    cache.store("https://b", ["s"], page)
+    assert cache.lookup("https://b", ["s"])["payload"] == page
@@ -0,0 +1,49 @@
+import asyncio
+import numpy as np
+import pytest
+from agentic_core.simulation.physics import BarnesHutTree, BodyArrays, PhysicsEngineInterface, direct_gravity
+
+def test_integrators_match_projectile_motion():
+    bodies = [
+        {"id": "a", "position": [0, 10, 0], "velocity": [1, 0, 0], "acceleration": [0, -9.81, 0]},
+        {"id": "b", "position": [5, 0, 0], "velocity": [0, 2, 0]}
+    ]
+    t = 1.0
+    for integrator, atol in (("rk4", 1e-9), ("verlet", 1e-9), ("euler", 0.06)):
+        arrays = BodyArrays.from_bodies(bodies)
+        PhysicsEngineInterface(integrator=integrator).step_arrays(arrays, 0.01, 100)
+        expected = np.array([[1.0, 10 - 0.5 * 9.81 * t ** 2, 0], [5.0, 2 * t - 0.5 * 9.81 * t ** 2, 0]])
+        assert np.allclose(arrays.position, expected, atol=atol), integrator
+
+    updated = asyncio.run(PhysicsEngineInterface().simulate_step(bodies, 0.01))
+    assert [b["id"] for b in updated] == ["a", "b"]
+    assert updated[1]["acceleration"] == [0.0, -9.81, 0.0]
+    assert "mass" not in updated[0]
+
+def test_barnes_hut_approximates_direct_sum():
+    rng = np.random.default_rng(3)
+    position = rng.normal(size=(400, 3))
+    position[1] = position[0]  # coincident bodies must not blow up or attract themselves
+    mass = rng.uniform(0.5, 1.5, 400)
+    exact = direct_gravity(position, mass, 1.0, 1e-2)
+    approx = BarnesHutTree(position, mass).accelerations(position, mass, 1.0, 0.5, 1e-2)
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.01
+    # theta = 0 opens every node, reducing Barnes-Hut to the exact sum.
+    assert np.allclose(BarnesHutTree(position, mass).accelerations(position, mass, 1.0, 0.0, 1e-2), exact)
+
+def test_two_body_orbit_closes():
+    bodies = [
+        {"id": "sun", "position": [0, 0, 0], "velocity": [0, 0, 0], "acceleration": [0, 0, 0], "mass": 1.0},
+        {"id": "planet", "position": [1, 0, 0], "velocity": [0, 1, 0], "acceleration": [0, 0, 0], "mass": 1e-6}
+    ]
+    engine = PhysicsEngineInterface(integrator="verlet", gravity="barnes_hut", G=1.0, softening=0.0)
+    arrays = BodyArrays.from_bodies(bodies)
+    engine.step_arrays(arrays, 0.01, int(round(2 * np.pi / 0.01)))
+    # After one period the planet is back where it started.
+    assert np.allclose(arrays.position[1] - arrays.position[0], [1, 0, 0], atol=1e-2)
+    assert arrays.to_bodies()[1]["mass"] == 1e-6
+
+def test_rejects_unknown_integrator():
+    with pytest.raises(ValueError):
+        PhysicsEngineInterface(integrator="leapfrog")
@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+from agentic_core.triad.neuro_symbolic.reasoner import NeuroSymbolicReasoner
+from agentic_core.triad.neuro_symbolic.rule_base import compile_rules, split_horn
+from agentic_core.ueg.ledger import UnifiedEvidenceGraph, BlockchainLedger
+
+@pytest.fixture
+def reasoner(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.json"))
+    return NeuroSymbolicReasoner(UnifiedEvidenceGraph(persistence_path=str(tmp_path / "ueg.json"), ledger=ledger))
+
+def test_split_horn_rewrites_definite_rules():
+    assert split_horn("A & B | C -> D & E") == [(["A", "B"], "D"), (["A", "B"], "E"), (["C"], "D"), (["C"], "E")]
+    assert split_horn("A -> B | C") is None
+    assert split_horn("~A -> B") is None
+
+def test_infer_matches_orchestrator_rule(reasoner):
+    result = asyncio.run(reasoner.infer({"detections": ["PSC", "Inflammation"]}, ["PSC & Inflammation -> TargetProteinX"]))
+    assert result["symbolic_inferences"] == ["TargetProteinX"]
+    assert result["status"] == "SUCCESS" and result["consistent"]
+    assert result["logic_summary"] != "Complex KB"
+
+def test_forward_chaining_over_long_chain(reasoner):
+    rules = [f"F{i} & G -> F{i + 1}" for i in range(5000)] + ["X & Y -> Z"]
+    result = asyncio.run(reasoner.infer({"detections": ["F0", "G"]}, rules))
+    assert result["symbolic_inferences"] == [f"F{i}" for i in range(1, 5001)]
+    assert result["logic_summary"] == "Complex KB"
+    assert compile_rules(tuple(rules)) is compile_rules(tuple(rules))
+
+def test_non_horn_rules_use_sat_entailment():
+    # E and S would be read as sympy constants by a bare sympify.
+    rules = ("A -> E | S", "E -> T", "S -> T", "T & ~Q -> R", "A -> W | V")
+    entailed, consistent = compile_rules(rules).entailed(["A"])
+    assert consistent
+    assert entailed == {"A", "T"}
+
+def test_inconsistent_knowledge_base_entails_everything():
+    entailed, consistent = compile_rules(("A -> ~B", "C -> D")).entailed(["A", "B"])
+    assert not consistent
+    assert entailed == {"A", "B", "C", "D"}
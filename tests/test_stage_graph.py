@@ -0,0 +1,72 @@
+import asyncio
+import time
+import pytest
+from agentic_core.synthesis.stage_graph import StageGraph, SynthesisStage
+
+def _graph(tmp_path, calls, enabled_c=True):
+    async def slow(name, inputs):
+        calls.append(name)
+        await asyncio.sleep(0.2)
+        return name
+
+    def blocking(inputs):
+        calls.append("b")
+        time.sleep(0.2)
+        return ["b"]
+
+    def merge(inputs):
+        calls.append("merge")
+        return sorted(str(v) for v in inputs.values())
+
+    return StageGraph([
+        SynthesisStage("a", lambda inputs: slow("a", inputs)),
+        SynthesisStage("b", blocking, blocking=True),
+        SynthesisStage("c", lambda inputs: slow("c", inputs), ("a",), enabled=enabled_c),
+        SynthesisStage("merge", merge, ("a", "b", "c"), memoize=True, params={"version": 1})
+    ], state_path=str(tmp_path / "stages.json"))
+
+def test_independent_stages_overlap_and_outputs_flow(tmp_path):
+    calls = []
+    graph = _graph(tmp_path, calls)
+    outputs = asyncio.run(graph.run())
+    spans = graph.spans
+    # a and b run concurrently; c waits for a, merge for everything.
+    assert spans["a"][0] < spans["b"][1] and spans["b"][0] < spans["a"][1]
+    assert spans["c"][0] >= spans["a"][1]
+    assert spans["merge"][0] >= max(spans[name][1] for name in ("a", "b", "c"))
+    assert outputs["merge"] == ["['b']", "a", "c"]
+    assert calls.index("merge") == len(calls) - 1
+
+def test_unchanged_inputs_are_memoised_and_planned(tmp_path):
+    asyncio.run(_graph(tmp_path, []).run())
+
+    calls = []
+    graph = _graph(tmp_path, calls)
+    outputs = asyncio.run(graph.run())
+    assert graph.memo_hits == ["merge"] and "merge" not in calls
+    assert outputs["merge"] == ["['b']", "a", "c"]
+
+    # Disabling c changes merge's inputs, so it re-runs.
+    calls = []
+    graph = _graph(tmp_path, calls, enabled_c=False)
+    assert asyncio.run(graph.run())["merge"] == ["None", "['b']", "a"]
+    assert "merge" in calls and "c" not in calls
+
+    plan = _graph(tmp_path, []).plan()
+    assert plan["critical_path"] == ["a", "c", "merge"]
+    durations = {row["stage"]: row["estimate_seconds"] for row in plan["stages"]}
+    assert plan["estimated_seconds"] == pytest.approx(durations["a"] + durations["c"] + durations["merge"])
+    assert "Critical path: a -> c -> merge" in StageGraph.format_plan(plan)
+
+def test_invalid_graphs_and_failures(tmp_path):
+    with pytest.raises(ValueError):
+        StageGraph([SynthesisStage("x", lambda i: 1, ("y",)), SynthesisStage("y", lambda i: 1, ("x",))], state_path=None)
+    with pytest.raises(ValueError):
+        StageGraph([SynthesisStage("x", lambda i: 1, ("missing",))], state_path=None)
+
+    def boom(inputs):
+        raise RuntimeError("stage failed")
+
+    graph = StageGraph([SynthesisStage("x", boom), SynthesisStage("y", lambda i: 1, ("x",))], state_path=None)
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph.run())
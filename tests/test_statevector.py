@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import numpy as np
+import networkx as nx
+from agentic_core.quantum.statevector import StateVectorSimulator, maxcut_values, qaoa_maxcut_expectations, rotation
+from agentic_core.quantum.unified_gateway import UnifiedQuantumGateway
+from agentic_core.triad.quantum import optimizer as optimizer_module
+from agentic_core.triad.quantum.optimizer import QuantumOptimizer
+
+def dense(ops, n):
+    """Reference: the full 2**n x 2**n operator of a product of single-qubit matrices {qubit: m}."""
+    out = np.eye(1)
+    for q in range(n):
+        out = np.kron(out, ops.get(q, np.eye(2)))
+    return out
+
+def test_bell_state_and_qir_gate_vocabulary():
+    gateway = UnifiedQuantumGateway()
+    state = gateway.emulate_circuit(2, 1, [{"op": "h", "targets": [0]}, {"op": "cnot", "targets": [0, 1]},
+                                            {"op": "measure", "targets": [0, 1]}])
+    assert np.allclose(state, [np.sqrt(0.5), 0, 0, np.sqrt(0.5)])
+    job = asyncio.run(gateway.execute_job("bell", {"qubits_count": 200, "min_fidelity": 0.999}))
+    assert job["status"] == "failed"
+
+def test_gates_match_dense_operators():
+    rng = np.random.default_rng(0)
+    psi = rng.normal(size=8) + 1j * rng.normal(size=8)
+    psi /= np.linalg.norm(psi)
+    sim = StateVectorSimulator(3)
+    sim.state[:] = psi.reshape(1, 2, 2, 2)
+    sim.run([{"op": "ry", "targets": [1], "params": [0.7]}, {"op": "t", "targets": [2]}])
+    ry = np.array(rotation("ry", 0.7), dtype=complex).reshape(2, 2)
+    t = np.diag([1, np.exp(0.25j * np.pi)])
+    assert np.allclose(sim.amplitudes()[0], dense({1: ry, 2: t}, 3) @ psi)
+    # Toffoli with controls 0 and 2 flips qubit 1 of |101> -> |111>.
+    sim = StateVectorSimulator(3).run([{"op": "x", "targets": [0, 2]}, {"op": "toffoli", "targets": [0, 2, 1]}])
+    assert np.isclose(sim.probabilities()[0][0b111], 1.0)
+
+def test_batched_parameters_match_individual_runs():
+    thetas = np.array([0.1, 1.3, 2.9])
+    circuit = lambda theta: [{"op": "h", "targets": [0, 1]}, {"op": "rx", "targets": [1], "params": [theta]},
+                             {"op": "cx", "targets": [1, 2]}, {"op": "rzz", "targets": [0, 2], "params": [theta]}]
+    batched = StateVectorSimulator(3, batch_size=3).run(circuit(thetas)).amplitudes()
+    for i, theta in enumerate(thetas):
+        assert np.allclose(batched[i], StateVectorSimulator(3).run(circuit(theta)).amplitudes()[0])
+
+def test_qaoa_expectation_matches_dense_hamiltonian():
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+    cut = maxcut_values(4, edges)
+    gamma, beta = 0.4, 0.3
+    mixer = np.array(rotation("rx", 2 * beta), dtype=complex).reshape(2, 2)
+    psi = np.full(16, 0.25, dtype=complex)
+    psi = dense({q: mixer for q in range(4)}, 4) @ (np.exp(1j * gamma * cut) * psi)
+    expected = float(np.abs(psi) ** 2 @ cut)
+    assert np.isclose(qaoa_maxcut_expectations(cut, 4, [[gamma]], [[beta]])[0], expected, atol=1e-5)
+
+def test_optimizer_solves_maxcut_beyond_four_wires():
+    graph = nx.random_regular_graph(3, 12, seed=3)
+    result = asyncio.run(QuantumOptimizer().optimize({"edges": list(graph.edges())}))
+    cut = maxcut_values(12, list(graph.edges()))
+    assert len(result["best_cut"]) == 12
+    assert result["cut_value"] == cut.max()
+    assert -result["final_cost"] > len(graph.edges()) / 2  # better than a random assignment
+
+def test_maxcut_runs_off_the_event_loop(monkeypatch):
+    threads = []
+    original = optimizer_module.qaoa_maxcut_expectations
+    monkeypatch.setattr(optimizer_module, "qaoa_maxcut_expectations",
+                        lambda *args: (threads.append(threading.get_ident()), original(*args))[1])
+
+    async def run():
+        return threading.get_ident(), await QuantumOptimizer(steps=2).optimize_maxcut([(0, 1), (1, 2)])
+
+    loop_thread, result = asyncio.run(run())
+    assert threads and loop_thread not in threads
+    assert result["cut_value"] == 2.0
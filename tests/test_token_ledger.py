@@ -0,0 +1,222 @@
+import asyncio
+import random
+import sqlite3
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from agentic_core.commercial.batch_signer import SigningFailedError
+from agentic_core.commercial.token_ledger import TokenLedger, UserTier
+from agentic_core.commercial.token_store import SQLiteTokenStore
+
+def test_balances_and_history_survive_restart(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tokens.db'}"
+    ledger = TokenLedger(store=SQLiteTokenStore(url))
+    ledger.initialize_user("alice", UserTier.PRO)
+    ledger.initialize_user("bob")
+    for i in range(30):
+        assert ledger.consume_tokens("alice", 10, f"task_{i}")
+    assert ledger.transfer("alice", "bob", 100)
+    asyncio.run(ledger.credit_tokens("bob", 5, "refund"))
+    first_tx = ledger.get_transaction_history("alice", limit=1)["transactions"][0]
+    tip = ledger.last_tx_hash
+    ledger.close()
+
+    restarted = TokenLedger(store=SQLiteTokenStore(url))
+    report = restarted.get_ledger_report("alice")
+    assert report["balance"] == 50100 - 300 - 100
+    assert report["tier"] == "PRO"
+    assert report["transaction_count"] == 31
+    assert restarted.get_ledger_report("bob")["balance"] == 1100 + 100 + 5
+    assert restarted.last_tx_hash == tip
+    # Signatures made by the previous process's validator key still verify.
+    assert restarted.verify_transaction(first_tx)
+
+    restarted.consume_tokens("bob", 1, "after restart")
+    assert restarted.get_ledger_report("bob")["transaction_count"] == 3
+
+def test_history_pagination_is_per_user(tmp_path):
+    ledger = TokenLedger()
+    ledger.initialize_user("alice")
+    ledger.initialize_user("bob")
+    for i in range(25):
+        ledger.consume_tokens("alice", 1, f"a{i}")
+        ledger.consume_tokens("bob", 1, f"b{i}")
+
+    page = ledger.get_transaction_history("alice", limit=10)
+    activities = [tx["data"]["activity"] for tx in page["transactions"]]
+    assert activities == [f"a{i}" for i in range(24, 14, -1)]
+
+    seen = list(activities)
+    while page["next_cursor"]:
+        page = ledger.get_transaction_history("alice", limit=10, before=page["next_cursor"])
+        seen += [tx["data"]["activity"] for tx in page["transactions"]]
+    assert len(seen) == 25 and all(a.startswith("a") for a in seen)
+
+    report = ledger.get_ledger_report("alice")
+    assert [tx["data"]["activity"] for tx in report["recent_transactions"]][-1] == "a24"
+    assert ledger.verify_transaction(report["recent_transactions"][0])
+
+def test_batch_signing_chain_and_verification(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tokens.db'}"
+    ledger = TokenLedger(store=SQLiteTokenStore(url), sign_batch_size=8, max_pending=16)
+    ledger.initialize_user("alice")
+    ledger.initialize_user("bob")
+    for i in range(50):
+        assert ledger.consume_tokens("alice", 1, f"task_{i}")
+    assert ledger.transfer("alice", "bob", 10)
+    # Balances are applied before signing completes.
+    assert ledger.ledgers["alice"]["balance"] == 1100 - 60
+    ledger.flush()
+
+    history = ledger.get_transaction_history("alice", limit=100)["transactions"][::-1]
+    assert len(history) == 51
+    assert all(ledger.verify_transaction(tx) for tx in history)
+    assert history[-1]["hash"] == ledger.last_tx_hash
+    for prev, tx in zip(history, history[1:]):
+        assert tx["data"]["prev_hash"] == prev["hash"]
+    assert ledger.batch_signer.batches_sealed < len(history)
+
+    tampered = {**history[3], "data": {**history[3]["data"], "amount": -0.01}}
+    assert not ledger.verify_transaction(tampered)
+    ledger.close()
+
+    restarted = TokenLedger(store=SQLiteTokenStore(url))
+    assert restarted.get_ledger_report("alice")["balance"] == 1100 - 60
+    assert restarted.get_ledger_report("bob")["balance"] == 1100 + 10
+    assert restarted.verify_transaction(history[0])
+
+def test_idempotency_keys_survive_restart(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tokens.db'}"
+    ledger = TokenLedger(store=SQLiteTokenStore(url))
+    ledger.initialize_user("alice")
+    ledger.initialize_user("bob")
+    assert ledger.consume_tokens("alice", 40, "scrape", idempotency_key="req-1")
+    assert ledger.consume_tokens("alice", 40, "scrape", idempotency_key="req-1")
+    assert asyncio.run(ledger.deduct_tokens("alice", 40, "scrape", idempotency_key="req-1"))
+    # Keys are scoped per account.
+    assert ledger.consume_tokens("bob", 40, "scrape", idempotency_key="req-1")
+    assert ledger.transfer("alice", "bob", 10, idempotency_key="t-1")
+    assert ledger.transfer("alice", "bob", 10, idempotency_key="t-1")
+    ledger.close()
+
+    restarted = TokenLedger(store=SQLiteTokenStore(url))
+    asyncio.run(restarted.credit_tokens("alice", 5, "refund", idempotency_key="req-2"))
+    asyncio.run(restarted.credit_tokens("alice", 5, "refund", idempotency_key="req-2"))
+    assert restarted.consume_tokens("alice", 40, "scrape", idempotency_key="req-1")
+    assert restarted.get_ledger_report("alice")["balance"] == 1100 - 40 - 10 + 5
+    assert restarted.get_ledger_report("alice")["transaction_count"] == 3
+    assert restarted.get_ledger_report("bob")["balance"] == 1100 - 40 + 10
+
+def _assert_chain_consistent(ledger, users, initial):
+    transactions = {}
+    for user in users:
+        for tx in ledger.get_transaction_history(user, limit=100_000)["transactions"]:
+            transactions[tx["seq"]] = tx
+    chain = [transactions[seq] for seq in sorted(transactions)]
+    for prev, tx in zip(chain, chain[1:]):
+        assert tx["data"]["prev_hash"] == prev["hash"]
+    assert chain[-1]["hash"] == ledger.last_tx_hash
+
+    net = {user: initial for user in users}
+    for tx in chain:
+        data = tx["data"]
+        if "from" in data:
+            net[data["from"]] -= data["amount"]
+            net[data["to"]] += data["amount"]
+        else:
+            net[data["user_id"]] += data["amount"]
+    for user in users:
+        assert ledger.ledgers[user]["balance"] == net[user] >= 0
+
+def _hammer(ledger, users, operations):
+    rng = random.Random(11)
+    plan = [(rng.choice(users), rng.choice(users), rng.random(), f"op-{i % (operations // 2)}")
+            for i in range(operations)]
+
+    def run(step):
+        user, other, roll, key = step
+        if roll < 0.8:
+            # Every key is sent twice, as a client retry would.
+            return ledger.consume_tokens(user, 7, "load", idempotency_key=f"{key}-{user}")
+        if roll < 0.9:
+            return ledger.transfer(user, other, 3, idempotency_key=f"{key}-{user}-t")
+        asyncio.run(ledger.credit_tokens(user, 2, "load-credit"))
+        return True
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        return list(pool.map(run, plan))
+
+def test_concurrent_debits_keep_balances_consistent():
+    ledger = TokenLedger()
+    users = [f"user_{i}" for i in range(8)]
+    for user in users:
+        ledger.initialize_user(user)
+    results = _hammer(ledger, users, 4000)
+    assert not all(results)  # some accounts ran dry and were refused, never overdrawn
+    _assert_chain_consistent(ledger, users, 1100)
+
+def test_concurrent_debits_with_batch_signing(tmp_path):
+    ledger = TokenLedger(store=SQLiteTokenStore(f"sqlite:///{tmp_path / 'tokens.db'}"), sign_batch_size=64, max_pending=256)
+    users = [f"user_{i}" for i in range(8)]
+    for user in users:
+        ledger.initialize_user(user)
+    _hammer(ledger, users, 4000)
+    ledger.flush()
+    _assert_chain_consistent(ledger, users, 1100)
+    ledger.close()
+
+class FlakyStore(SQLiteTokenStore):
+    """Fails the first `failures` batch writes, like a locked or full database."""
+    def __init__(self, url, failures):
+        super().__init__(url)
+        self.failures = failures
+
+    def append_transactions(self, batch, accounts, last_tx_hash):
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().append_transactions(batch, accounts, last_tx_hash)
+
+def test_batch_signing_retries_transient_store_errors(tmp_path):
+    ledger = TokenLedger(store=FlakyStore(f"sqlite:///{tmp_path / 'tokens.db'}", failures=2), sign_batch_size=4)
+    ledger.batch_signer.backoff = 0.001
+    ledger.initialize_user("alice")
+    for i in range(10):
+        assert ledger.consume_tokens("alice", 1, f"task_{i}")
+    ledger.flush()
+    assert ledger.get_ledger_report("alice")["transaction_count"] == 10
+    ledger.close()
+
+def test_batch_signing_failure_fails_closed(tmp_path):
+    ledger = TokenLedger(store=FlakyStore(f"sqlite:///{tmp_path / 'tokens.db'}", failures=10 ** 6), sign_batch_size=4)
+    ledger.batch_signer.backoff = 0.001
+    ledger.initialize_user("alice")
+    assert ledger.consume_tokens("alice", 5, "lost", idempotency_key="k1")
+    with pytest.raises(SigningFailedError):
+        ledger.flush()
+    assert ledger.batch_signer.unsealed
+    # Neither retries nor new transactions are acknowledged once the log diverged from the balances.
+    with pytest.raises(SigningFailedError):
+        ledger.consume_tokens("alice", 5, "lost", idempotency_key="k1")
+    with pytest.raises(SigningFailedError):
+        asyncio.run(ledger.deduct_tokens("alice", 1, "new"))
+    with pytest.raises(SigningFailedError):
+        ledger.close()
+
+class FailingInlineStore(SQLiteTokenStore):
+    def append_transaction(self, transaction, parties, accounts, last_tx_hash):
+        raise sqlite3.OperationalError("disk I/O error")
+
+def test_inline_store_failure_leaves_ledger_unchanged(tmp_path):
+    ledger = TokenLedger(store=FailingInlineStore(f"sqlite:///{tmp_path / 'tokens.db'}"))
+    ledger.initialize_user("alice")
+    ledger.initialize_user("bob")
+    before = ledger.get_ledger_report("alice")
+    for attempt in (lambda: ledger.consume_tokens("alice", 5, "task"),
+                    lambda: ledger.mint("alice", 5),
+                    lambda: ledger.transfer("alice", "bob", 5)):
+        with pytest.raises(sqlite3.OperationalError):
+            attempt()
+    after = ledger.get_ledger_report("alice")
+    assert (after["balance"], after["total_consumed"]) == (before["balance"], before["total_consumed"])
+    assert after["system_integrity_hash"] == before["system_integrity_hash"]
+    assert ledger.ledgers["bob"]["balance"] == ledger.store.get_account("bob")["balance"]
@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+from agentic_core.simulation.registry import TwinRegistry, apply_delta, state_delta
+
+def test_deltas_and_time_travel(tmp_path):
+    db_path = str(tmp_path / "twins.db")
+    registry = TwinRegistry(db_path, snapshot_interval=4)
+    registry.register_twin("t1", "science:physics", {"data": {"history": [], "bodies": [{"x": 0}]}})
+    for step in range(1, 10):
+        state = registry.get_twin("t1")["state"]
+        state["data"]["history"].append({"step": step})
+        state["data"]["bodies"][0]["x"] = step
+        assert registry.update_twin("t1", state, fidelity=step / 10) == step + 1
+
+    # A fresh registry rebuilds every version from snapshots + deltas.
+    reader = TwinRegistry(db_path, snapshot_interval=4)
+    assert reader.get_twin("t1")["version"] == 10
+    past = reader.get_twin("t1", version=6)
+    assert past["state"]["data"]["history"] == [{"step": s} for s in range(1, 6)]
+    assert past["state"]["data"]["bodies"] == [{"x": 5}] and past["fidelity"] == 0.5
+    assert [v["version"] for v in reader.list_versions("t1") if v["snapshot"]] == [1, 4, 8]
+    assert reader.get_twin("t1", version=11) is None and reader.get_twin("missing") is None
+
+    delta = state_delta({"h": [1, 2], "gone": 1}, {"h": [1, 2, 3], "new": {"a": 1}})
+    assert delta == {"p": {"h": {"a": [3]}}, "s": {"new": {"a": 1}}, "d": ["gone"]}
+    assert apply_delta({"h": [1, 2], "gone": 1}, delta) == {"h": [1, 2, 3], "new": {"a": 1}}
+
+def test_concurrent_updates_get_distinct_versions(tmp_path):
+    registry = TwinRegistry(str(tmp_path / "twins.db"))
+    registry.register_twin("t", "social:market", {"count": 0})
+
+    def bump():
+        for _ in range(25):
+            registry.update_twin("t", {"count": threading.get_ident()}, 0.9)
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert registry.get_twin("t")["version"] == 101
+    assert [v["version"] for v in registry.list_versions("t")] == list(range(1, 102))
+
+def test_migrates_inline_json_rows(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE digital_twins (twin_id TEXT PRIMARY KEY, reactor_id TEXT, state_json TEXT, "
+                 "version INTEGER, fidelity_score REAL, last_updated TEXT)")
+    conn.execute("INSERT INTO digital_twins VALUES ('old', 'law:contract', '{\"data\": {\"k\": 1}}', 5, 0.8, 'then')")
+    conn.commit()
+    conn.close()
+
+    registry = TwinRegistry(db_path)
+    twin = registry.get_twin("old")
+    assert twin["state"] == {"data": {"k": 1}} and twin["version"] == 5 and twin["fidelity"] == 0.8
+    twin["state"]["data"]["k"] = 2
+    assert registry.update_twin("old", twin["state"], 0.9) == 6
+    assert TwinRegistry(db_path).get_twin("old", version=5)["state"] == {"data": {"k": 1}}
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import pytest
+from agentic_core.ueg.ledger import UnifiedEvidenceGraph, BlockchainLedger
+from agentic_core.ueg.ingestion import IngestionHooks
+from agentic_core.ueg.ctms import ContinuousTruthMaintenanceSystem
+
+@pytest.fixture
+def ueg(tmp_path):
+    ledger = BlockchainLedger(storage_path=str(tmp_path / "ledger.json"))
+    return UnifiedEvidenceGraph(persistence_path=str(tmp_path / "ueg.json"), ledger=ledger)
+
+def test_batch_writes_once_with_single_transaction(ueg, monkeypatch):
+    saves = []
+    original_save = ueg._save
+    monkeypatch.setattr(ueg, "_save", lambda: (saves.append(1), original_save()))
+
+    with ueg.batch():
+        ueg.bulk_add_nodes((f"ev_{i}", "EVIDENCE") for i in range(500))
+        ueg.add_node("hyp", "HYPOTHESIS")
+        accepted = ueg.bulk_add_edges((f"ev_{i}", "hyp", "SUPPORTS") for i in range(500))
+        # Edges are validated against the in-memory graph, including buffered nodes.
+        assert not ueg.add_edge("missing", "hyp", "SUPPORTS")
+
+    assert accepted == 500
+    assert len(saves) == 1
+    assert [tx["action"] for tx in ueg.ledger.current_transactions] == ["BATCH_MUTATION"]
+
+    with open(ueg.persistence_path) as f:
+        data = json.load(f)
+    assert len(data["nodes"]) == 501
+    assert len(data["edges"]) == 500
+
+def test_batch_rolls_back_on_error(ueg):
+    ueg.add_node("kept", "CLAIM", {"confidence": 0.4})
+    with pytest.raises(RuntimeError):
+        with ueg.batch():
+            ueg.add_node("discarded", "CLAIM")
+            ueg.update_node("kept", confidence=0.9)
+            ueg.add_edge("discarded", "kept", "SUPPORTS")
+            raise RuntimeError("abort")
+
+    assert "discarded" not in ueg.graph
+    assert ueg.graph.nodes["kept"]["confidence"] == 0.4
+    assert ueg.graph.number_of_edges() == 0
+
+def test_failed_inner_batch_rolls_back_to_its_mark(ueg):
+    ueg.add_node("kept", "CLAIM", {"confidence": 0.4})
+    with ueg.batch():
+        ueg.add_node("outer_before", "CLAIM")
+        with pytest.raises(RuntimeError):
+            with ueg.batch():
+                ueg.add_node("inner", "CLAIM")
+                ueg.update_node("kept", confidence=0.9)
+                ueg.add_edge("inner", "kept", "SUPPORTS")
+                raise RuntimeError("inner abort")
+        ueg.add_node("outer_after", "CLAIM")
+
+    assert "inner" not in ueg.graph and ueg.graph.number_of_edges() == 0
+    assert ueg.graph.nodes["kept"]["confidence"] == 0.4
+    committed = ueg.ledger.current_transactions[-1]["data"]
+    assert [node["id"] for node in committed["nodes"]] == ["outer_before", "outer_after"]
+    assert not committed["edges"] and not committed["updates"]
+
+def test_ingest_hypothesis_and_ctms_use_batches(ueg):
+    hooks = IngestionHooks(ueg)
+    ueg.bulk_add_nodes([("e1", "EVIDENCE"), ("e2", "EVIDENCE"), ("rival", "HYPOTHESIS")])
+    hooks.ingest_hypothesis("h1", {}, ["e1", "e2"])
+    ueg.add_edge("rival", "h1", "CONTRADICTS")
+
+    asyncio.run(ContinuousTruthMaintenanceSystem(ueg).scan_and_resolve())
+    assert ueg.graph.nodes["h1"]["status"] == "UPHELD"
+    assert ueg.graph.nodes["rival"]["status"] == "REJECTED"
+    assert ueg.ledger.current_transactions[-1]["action"] == "BATCH_MUTATION"
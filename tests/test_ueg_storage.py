@@ -0,0 +1,134 @@
+import json
+import os
+import subprocess
+import sys
+from agentic_core.ueg.ueg_manager import UEGManager
+from agentic_core.ueg.storage import AppendOnlyLogStorage, JSONFileStorage, read_graph
+
+def test_wal_replay_after_restart(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    ueg = UEGManager(storage_path=path)
+    for i in range(25):
+        ueg.add_insight(f"insight {i}", source_id="src")
+
+    # No snapshot yet: every mutation lives in the log only.
+    assert not os.path.exists(path)
+    ueg.storage.close()  # release the log without compacting, as a crash would
+
+    reloaded = UEGManager(storage_path=path)
+    assert len(reloaded.graph["nodes"]) == 25
+    assert reloaded.graph["nodes"][-1]["id"] == "insight_24"
+
+def test_wal_compaction_and_export(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    storage = AppendOnlyLogStorage(path, segment_max_records=4, compact_every=10)
+    ueg = UEGManager(storage_path=path, storage=storage)
+    for i in range(23):
+        ueg.add_claim(f"claim {i}", evidence=[])
+
+    # Two compactions happened; only the tail of the log remains.
+    assert storage.snapshot_seq == 20
+    with open(path) as f:
+        snapshot = json.load(f)
+    assert len(snapshot["nodes"]) == 20
+    assert "wal_seq" not in snapshot
+    with open(path) as f:
+        assert f.read() == json.dumps(snapshot, indent=4)  # legacy snapshot format
+    assert len(read_graph(path)["nodes"]) == 23  # readers see the uncompacted tail too
+
+    storage.close()
+    reloaded = UEGManager(storage_path=path, storage=AppendOnlyLogStorage(path))
+    assert [n["id"] for n in reloaded.graph["nodes"]] == [f"claim_{i}" for i in range(23)]
+
+    export_path = str(tmp_path / "export.json")
+    ueg.export_json(export_path)
+    with open(export_path) as f:
+        exported = json.load(f)
+    assert "wal_seq" not in exported
+    assert len(exported["nodes"]) == 23
+
+def test_wal_torn_tail_is_discarded(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    storage = AppendOnlyLogStorage(path)
+    ueg = UEGManager(storage_path=path, storage=storage)
+    ueg.add_audit_log("agent", "ok")
+    ueg.add_audit_log("agent", "ok again")
+    storage.close()
+
+    segment = storage._segments()[-1][1]
+    with open(segment, "a") as f:
+        f.write('{"seq": 3, "op": "add_node", "node": {"id": "half')
+
+    reloaded = UEGManager(storage_path=path)
+    assert len(reloaded.graph["nodes"]) == 2
+    reloaded.add_audit_log("agent", "after crash")
+    assert len(UEGManager(storage_path=path).graph["nodes"]) == 3
+
+def test_legacy_json_engine(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    ueg = UEGManager(storage_path=path, storage=JSONFileStorage(path))
+    ueg.add_claim("legacy", evidence=["e1"])
+    with open(path) as f:
+        assert json.load(f)["nodes"][0]["content"] == "legacy"
+
+def test_managers_on_one_path_share_an_engine(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    first, second = UEGManager(storage_path=path), UEGManager(storage_path=path)
+    assert first.storage is second.storage
+    first.add_claim("from first", evidence=[])
+    assert second.graph["nodes"][0]["content"] == "from first"
+
+    first.close()
+    second.add_claim("from second", evidence=[])  # still open: first.close() only drops a reference
+    second.close()
+    with open(path) as f:
+        assert [n["content"] for n in json.load(f)["nodes"]] == ["from first", "from second"]
+
+def test_independent_writers_never_lose_records(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    a = UEGManager(storage_path=path, storage=AppendOnlyLogStorage(path, segment_max_records=3, compact_every=7))
+    b = UEGManager(storage_path=path, storage=AppendOnlyLogStorage(path, segment_max_records=3, compact_every=7))
+    for i in range(20):
+        (a if i % 3 else b).add_node({"id": f"n{i}", "type": "test"})
+    # Each writer folded in the other's records before appending or compacting.
+    assert sorted(n["id"] for n in a.graph["nodes"]) == sorted(f"n{i}" for i in range(20))
+    b.close(); a.close()
+    assert sorted(n["id"] for n in read_graph(path)["nodes"]) == sorted(f"n{i}" for i in range(20))
+
+def test_writers_in_separate_processes(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    server = UEGManager(storage_path=path)  # held open, like the API process
+    server.add_claim("before", evidence=[])
+    script = ("import sys; from agentic_core.ueg.ueg_manager import UEGManager; "
+              "ueg = UEGManager(storage_path=sys.argv[1]); "
+              "[ueg.add_node({'id': f'child_{i}', 'type': 'test'}) for i in range(50)]; ueg.close()")
+    child = subprocess.Popen([sys.executable, "-c", script, path], cwd=os.getcwd())
+    for i in range(50):
+        server.add_node({"id": f"parent_{i}", "type": "test"})
+    assert child.wait(60) == 0
+    server.add_claim("after", evidence=[])
+    assert len(server.graph["nodes"]) == 102
+    server.close()
+    assert len(read_graph(path)["nodes"]) == 102
+
+def test_interrupted_compaction_never_replays_twice(tmp_path):
+    path = str(tmp_path / "ueg_graph.json")
+    storage = AppendOnlyLogStorage(path, compact_every=1000)
+    ueg = UEGManager(storage_path=path, storage=storage)
+    for i in range(3):
+        ueg.add_claim(f"claim {i}", evidence=[])
+    storage.compact(ueg.graph)
+    ueg.add_claim("claim 3", evidence=[])
+    segments = [open(p).read() for _, p in storage._segments()]
+
+    # Crash after the snapshot landed but before the segments were pruned.
+    storage.compact(ueg.graph)
+    storage.close()
+    with open(storage._segment_path(1), "w") as f:
+        f.write("".join(segments))
+    assert len(read_graph(path)["nodes"]) == 4
+
+    # Crash after the checkpoint was written but before the snapshot replaced the old one.
+    with open(storage._checkpoint_path(), "w") as f:
+        json.dump({"seq": 9, "sha256": "not-the-snapshot", "previous_seq": 4}, f)
+    assert len(UEGManager(storage_path=path).graph["nodes"]) == 4
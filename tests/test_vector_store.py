@@ -0,0 +1,72 @@
+import asyncio
+import numpy as np
+from agentic_core.synthesis.vector_store import VectorStore
+
+def _clustered(n, dim=32, clusters=40, seed=3):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    return centres[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))
+
+def test_exact_search_dedup_and_reopen(tmp_path):
+    path = str(tmp_path / "vs")
+    store = VectorStore(path, dim=4)
+    assert store.add("a", [1, 0, 0, 0]) is None
+    assert store.add("b", [0, 1, 0, 0]) is None
+    # Near-duplicates of stored vectors, and of earlier vectors in the same batch, are skipped.
+    assert store.add("a-copy", [0.99, 0.01, 0, 0], dedup_threshold=0.95) == "a"
+    assert store.add_batch(["c", "c-copy", "d"], [[0, 0, 1, 0], [0, 0, 1, 0.01], [0, 0, 0, 1]],
+                           dedup_threshold=0.95) == [None, "c", None]
+    assert len(store) == 4
+
+    # Updating a key in place does not create a new row.
+    store.add("b", [0, 1, 1, 0])
+    hits = store.search([[0, 1, 1, 0], [1, 0, 0, 0]], k=2)
+    assert hits[0][0][0] == "b" and abs(hits[0][0][1] - 1.0) < 1e-6
+    assert hits[1][0][0] == "a"
+
+    reopened = VectorStore(path, dim=4)
+    assert len(reopened) == 4
+    assert np.allclose(reopened.get("b"), np.array([0, 1, 1, 0]) / np.sqrt(2))
+
+def test_training_with_fewer_vectors_than_lists(tmp_path):
+    data = _clustered(10, dim=8)
+    store = VectorStore(str(tmp_path / "vs"), dim=8, train_threshold=4)
+    store.add_batch([f"v{i}" for i in range(10)], data)
+    assert store.centroids is not None and len(store.centroids) <= 10
+    assert store.search([data[3]], k=1)[0][0][0] == "v3"
+
+def test_ivf_index_recall_and_incremental_inserts(tmp_path):
+    data = _clustered(6000)
+    store = VectorStore(str(tmp_path / "vs"), dim=32, n_probe=8, train_threshold=2000)
+    store.add_batch([f"v{i}" for i in range(5000)], data[:5000])
+    assert store.centroids is not None
+    # Inserts after training go straight into the inverted lists.
+    for i in range(5000, 6000):
+        store.add(f"v{i}", data[i])
+
+    queries = data[::97] + 0.05
+    approx = store.search(queries, k=10)
+    exact = store.search(queries, k=10, n_probe=None)
+    recall = np.mean([len({k for k, _ in a} & {k for k, _ in e}) / 10 for a, e in zip(approx, exact)])
+    assert recall > 0.9
+
+    reopened = VectorStore(str(tmp_path / "vs"), dim=32, n_probe=8)
+    assert reopened.centroids is not None
+    assert [k for k, _ in reopened.search(data[5500], k=1)[0]] == ["v5500"]
+
+def test_pipeline_dedups_repeated_content(tmp_path):
+    from agentic_core.synthesis.knowledge_synthesis import KnowledgeSynthesisPipeline
+    from agentic_core.ueg.ueg_manager import UEGManager
+    from agentic_core.genetics.genomic_registry import GenomicRegistry
+    pipeline = KnowledgeSynthesisPipeline(vector_path=str(tmp_path / "vectors"),
+                                          ueg=UEGManager(str(tmp_path / "ueg.json")),
+                                          genomic_registry=GenomicRegistry(str(tmp_path / "genome.json")))
+
+    first = asyncio.run(pipeline.process_data_stream({"source": "s1", "content": "Biomimetic swarm routing for agents"}))
+    again = asyncio.run(pipeline.process_data_stream({"source": "s2", "content": "biomimetic swarm routing for agents "}))
+    other = asyncio.run(pipeline.process_data_stream({"source": "s3", "content": "Embodied perception loops in robotics"}))
+
+    assert first["triples_extracted"] == 1
+    assert again["status"] == "DUPLICATE" and again["duplicate_of"] == "s1"
+    assert other["status"] == "SYNTHESIZED"
+    assert pipeline.search_similar("biomimetic swarm routing", k=1)[0]["source"] == "s1"